@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Measure loading of coin definitions with a cold and a warm cache."""
+from __future__ import annotations
+
+import tempfile
+import time
+from pathlib import Path
+
+import click
+
+import coin_info
+
+
+def load(cache_file: Path) -> tuple[float, coin_info.CoinsInfo, coin_info.FidoApps]:
+    # a new cache object reads the cache file like a freshly started process does
+    coin_info._json_cache = coin_info.JsonCache(cache_file)
+    start = time.perf_counter()
+    defs = coin_info.coin_info()
+    fido = coin_info.fido_info()
+    elapsed = time.perf_counter() - start
+    coin_info._json_cache.save()
+    return elapsed, defs, fido
+
+
+@click.command()
+@click.option("-n", "--rounds", type=int, default=5, help="Number of warm loads")
+def cli(rounds: int) -> None:
+    """Compare cold, incremental and warm loads of all definitions."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_file = Path(tmp) / "coin_info_cache.pickle"
+
+        cold, defs, fido = load(cache_file)
+        click.echo(f"cold:        {cold * 1000:8.1f} ms")
+
+        # one changed definition is parsed again, the rest comes from the cache
+        touched = next(coin_info.DEFS_DIR.glob("bitcoin/*.json"))
+        touched.touch()
+        incremental, *result = load(cache_file)
+        assert result == [defs, fido]
+        click.echo(f"incremental: {incremental * 1000:8.1f} ms  ({touched.name})")
+
+        warm = []
+        for _ in range(rounds):
+            elapsed, *result = load(cache_file)
+            assert result == [defs, fido]
+            warm.append(elapsed)
+        click.echo(f"warm:        {min(warm) * 1000:8.1f} ms  (best of {rounds})")
+
+
+if __name__ == "__main__":
+    cli()
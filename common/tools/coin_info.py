@@ -1,11 +1,15 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import atexit
+import hashlib
 import json
 import logging
 import os
+import pickle
 import re
 from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict  # for python38 support, must be used in type aliases
 from typing import List  # for python38 support, must be used in type aliases
@@ -30,6 +34,14 @@ if os.environ.get("DEFS_DIR"):
 else:
     DEFS_DIR = ROOT / "defs"
 
+if os.environ.get("COIN_INFO_CACHE"):
+    CACHE_FILE = Path(os.environ.get("COIN_INFO_CACHE")).resolve()
+else:
+    CACHE_FILE = Path(__file__).resolve().parent / "coin_info_cache.pickle"
+
+# Below this number of changed files, parsing them is faster than starting workers.
+PARALLEL_PARSE_THRESHOLD = 64
+
 
 class SupportItemBool(TypedDict):
     supported: dict[str, bool]
@@ -152,6 +164,96 @@ class FidoApp(TypedDict):
 FidoApps = List[FidoApp]
 
 
+def _parse_json(contents: bytes) -> bytes:
+    data = json.loads(contents, object_pairs_hook=OrderedDict)
+    return pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+
+
+class JsonCache:
+    """Parsed JSON files, kept on disk between runs.
+
+    Every entry is keyed by the file path and remembers the mtime, size and sha256
+    of the file. A file whose mtime or size changed is hashed again, and it is only
+    parsed again if its contents changed. The parsed data is stored pickled, so that
+    every load returns a fresh copy which the caller is free to modify.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        # path -> (mtime_ns, size, sha256, pickled data)
+        self.entries: dict[str, tuple[int, int, bytes, bytes]] = {}
+        self.dirty = False
+        try:
+            with open(path, "rb") as f:
+                version, entries = pickle.load(f)
+            if version == self.VERSION:
+                self.entries = entries
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log.warning(f"Ignoring unreadable cache {path}: {e}")
+
+    def load(self, files: list[Path]) -> list[Any]:
+        changed: dict[str, tuple[int, int, bytes, bytes]] = {}
+        for file in files:
+            key = str(file)
+            stat = file.stat()
+            entry = self.entries.get(key)
+            if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+                continue
+            contents = file.read_bytes()
+            digest = hashlib.sha256(contents).digest()
+            if entry is not None and entry[2] == digest:
+                self.entries[key] = (stat.st_mtime_ns, stat.st_size, digest, entry[3])
+            else:
+                changed[key] = (stat.st_mtime_ns, stat.st_size, digest, contents)
+            self.dirty = True
+
+        contents_list = [contents for *_, contents in changed.values()]
+        if len(contents_list) >= PARALLEL_PARSE_THRESHOLD:
+            with ProcessPoolExecutor() as pool:
+                parsed = list(pool.map(_parse_json, contents_list, chunksize=16))
+        else:
+            parsed = [_parse_json(contents) for contents in contents_list]
+        for (key, (mtime, size, digest, _)), data in zip(changed.items(), parsed):
+            self.entries[key] = (mtime, size, digest, data)
+
+        return [pickle.loads(self.entries[str(file)][3]) for file in files]
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        entries = {k: v for k, v in self.entries.items() if os.path.exists(k)}
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump((self.VERSION, entries), f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            log.warning(f"Could not write cache {self.path}: {e}")
+            return
+        self.dirty = False
+
+
+_json_cache: JsonCache | None = None
+
+
+def json_cache() -> JsonCache:
+    """Returns the cache of CACHE_FILE, which is saved when the process exits."""
+    global _json_cache
+    if _json_cache is None:
+        _json_cache = JsonCache(CACHE_FILE)
+        atexit.register(_json_cache.save)
+    return _json_cache
+
+
+def load_json_files(files: Iterable[Path]) -> list[Any]:
+    """Load several JSON files at once, parsing the changed ones in parallel."""
+    return json_cache().load(list(files))
+
+
 def load_json(*path: str | Path) -> Any:
     """Convenience function to load a JSON file from DEFS_DIR."""
     if len(path) == 1 and isinstance(path[0], Path):
@@ -159,7 +261,7 @@ def load_json(*path: str | Path) -> Any:
     else:
         file = Path(DEFS_DIR, *path)
 
-    return json.loads(file.read_text(), object_pairs_hook=OrderedDict)
+    return load_json_files([file])[0]
 
 
 # ====== CoinsInfo ======
@@ -352,8 +454,7 @@ def validate_btc(coin: Coin) -> list[str]:
 def _load_btc_coins() -> Coins:
     """Load btc-like coins from `bitcoin/*.json`"""
     coins: Coins = []
-    for file in DEFS_DIR.glob("bitcoin/*.json"):
-        coin: Coin = load_json(file)
+    for coin in load_json_files(DEFS_DIR.glob("bitcoin/*.json")):
         is_testnet = "testnet" in coin["coin_name"].lower()
         coin.update(
             name=coin["coin_label"],
@@ -416,11 +517,11 @@ def _load_ethereum_networks() -> Coins:
     """Load ethereum networks from `ethereum/networks.json`"""
     chains_path = DEFS_DIR / "ethereum" / "chains" / "_data" / "chains"
     networks: Coins = []
-    for chain in sorted(
+    chain_files = sorted(
         chains_path.glob("eip155-*.json"),
         key=lambda x: int(x.stem.replace("eip155-", "")),
-    ):
-        chain_data = load_json(chain)
+    )
+    for chain_data in load_json_files(chain_files):
         shortcut = chain_data["nativeCurrency"]["symbol"]
         name = chain_data["name"]
         title = chain_data.get("title", "")
@@ -467,8 +568,8 @@ def _load_erc20_tokens() -> Coins:
     #     chain = network["chain"]
 
     chain_path = DEFS_DIR / "evm_tokens"
-    for file in sorted(chain_path.glob("*.json")):
-        chain = load_json(file)
+    chain_files = sorted(chain_path.glob("*.json"))
+    for file, chain in zip(chain_files, load_json_files(chain_files)):
         chain_name = chain["chain"]
         _tokens = chain["tokens"]
         for token in _tokens:
@@ -561,9 +662,9 @@ def _load_misc() -> Coins:
 def _load_fido_apps() -> FidoApps:
     """Load FIDO apps from `fido/*.json`"""
     apps: FidoApps = []
-    for file in sorted(DEFS_DIR.glob("fido/*.json")):
+    app_files = sorted(DEFS_DIR.glob("fido/*.json"))
+    for file, app in zip(app_files, load_json_files(app_files)):
         app_name = file.stem.lower()
-        app = load_json(file)
         app.setdefault("use_sign_count", None)
         app.setdefault("use_self_attestation", None)
         app.setdefault("u2f", [])
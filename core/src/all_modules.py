@@ -491,6 +491,8 @@ apps.bitcoin.authorization
 import apps.bitcoin.authorization
 apps.bitcoin.authorize_coinjoin
 import apps.bitcoin.authorize_coinjoin
+apps.bitcoin.batch_get_addresses
+import apps.bitcoin.batch_get_addresses
 apps.bitcoin.bip322_simple
 import apps.bitcoin.bip322_simple
 apps.bitcoin.common
@@ -539,6 +541,10 @@ apps.bitcoin.sign_tx.omni
 import apps.bitcoin.sign_tx.omni
 apps.bitcoin.sign_tx.payment_request
 import apps.bitcoin.sign_tx.payment_request
+apps.bitcoin.sign_tx.prefetch
+import apps.bitcoin.sign_tx.prefetch
+apps.bitcoin.sign_tx.prevtx_cache
+import apps.bitcoin.sign_tx.prevtx_cache
 apps.bitcoin.sign_tx.progress
 import apps.bitcoin.sign_tx.progress
 apps.bitcoin.sign_tx.sig_hasher
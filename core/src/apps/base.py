@@ -140,6 +140,7 @@ def get_features() -> Features:
             Capability.Crypto,
             Capability.Shamir,
             Capability.ShamirGroups,
+            Capability.TxAckBatch,
         ]
         f.fw_vendor = FW_VENDOR_BTC_ONLY
     else:
@@ -160,6 +161,7 @@ def get_features() -> Features:
             Capability.Shamir,
             Capability.ShamirGroups,
             Capability.EthereumTypedData,
+            Capability.TxAckBatch,
         ]
 
     # Other models are not capable of PassphraseEntry
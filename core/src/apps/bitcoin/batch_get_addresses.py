@@ -0,0 +1,49 @@
+from micropython import const
+from typing import TYPE_CHECKING
+
+from trezor import wire
+from trezor.enums import InputScriptType
+from trezor.messages import Addresses
+
+from apps.common.paths import HARDENED
+
+from . import addresses
+from .keychain import with_keychain
+
+if TYPE_CHECKING:
+    from trezor.messages import BatchGetAddresses
+    from apps.common.keychain import Keychain
+    from apps.common.coininfo import CoinInfo
+
+MAX_BATCH_SIZE = const(100)
+
+_SINGLESIG_SCRIPT_TYPES = (
+    InputScriptType.SPENDADDRESS,
+    InputScriptType.SPENDP2SHWITNESS,
+    InputScriptType.SPENDWITNESS,
+    InputScriptType.SPENDTAPROOT,
+)
+
+
+@with_keychain
+async def batch_get_addresses(
+    ctx: wire.Context, msg: BatchGetAddresses, keychain: Keychain, coin: CoinInfo
+) -> Addresses:
+    if not 0 < msg.count <= MAX_BATCH_SIZE:
+        raise wire.DataError(f"Batch size must be between 1 and {MAX_BATCH_SIZE}")
+    if msg.start_index + msg.count > HARDENED:
+        raise wire.DataError("Invalid address index")
+    if msg.script_type not in _SINGLESIG_SCRIPT_TYPES:
+        raise wire.DataError("Unsupported script type")
+
+    indexes = range(msg.start_index, msg.start_index + msg.count)
+    # The account and the change node are derived once, the address nodes are
+    # their non-hardened children and only need public derivation.
+    chain = keychain.derive_parent(msg.address_n + [msg.change], indexes)
+
+    result = []
+    for index in indexes:
+        node = chain.clone()
+        node.derive(index, True)
+        result.append(addresses.get_address(msg.script_type, coin, node))
+    return Addresses(addresses=result)
@@ -7,7 +7,7 @@ from trezor.messages import TxRequest
 
 from ..common import BITCOIN_NAMES
 from ..keychain import with_keychain
-from . import approvers, bitcoin, helpers, progress
+from . import approvers, bitcoin, helpers, prefetch, progress
 
 if not utils.BITCOIN_ONLY:
     from . import bitcoinlike, decred, zcash_v4
@@ -19,10 +19,14 @@ if TYPE_CHECKING:
     from trezor.messages import (
         SignTx,
         TxAckInput,
+        TxAckInputs,
         TxAckOutput,
+        TxAckOutputs,
         TxAckPrevMeta,
         TxAckPrevInput,
+        TxAckPrevInputs,
         TxAckPrevOutput,
+        TxAckPrevOutputs,
         TxAckPrevExtraData,
     )
 
@@ -33,10 +37,14 @@ if TYPE_CHECKING:
 
     TxAckType = (
         TxAckInput
+        | TxAckInputs
         | TxAckOutput
+        | TxAckOutputs
         | TxAckPrevMeta
         | TxAckPrevInput
+        | TxAckPrevInputs
         | TxAckPrevOutput
+        | TxAckPrevOutputs
         | TxAckPrevExtraData
     )
 
@@ -89,19 +97,24 @@ async def sign_tx(
         lv.color_hex(coin.primary_color),
         f"A:/res/{coin.icon}",
     )
-    while True:
-        req = signer.send(res)
-        if isinstance(req, tuple):
-            request_class, req = req
-            assert TxRequest.is_type_of(req)
-            if req.request_type == RequestType.TXFINISHED:
-                from trezor.ui.layouts import confirm_final
+    # The QR flow answers each request with a single item.
+    prefetch.prefetch.reset(not isinstance(ctx, wire.QRContext))
+    try:
+        while True:
+            req = signer.send(res)
+            if isinstance(req, tuple):
+                request_class, req = req
+                assert TxRequest.is_type_of(req)
+                if req.request_type == RequestType.TXFINISHED:
+                    from trezor.ui.layouts import confirm_final
 
-                await confirm_final(ctx, coin.coin_name)
-                return req
-            res = await ctx.call(req, request_class)
-        elif isinstance(req, helpers.UiConfirm):
-            res = await req.confirm_dialog(ctx)
-            progress.progress.report_init()
-        else:
-            raise TypeError("Invalid signing instruction")
+                    await confirm_final(ctx, coin.coin_name)
+                    return req
+                res = await ctx.call(req, request_class)
+            elif isinstance(req, helpers.UiConfirm):
+                res = await req.confirm_dialog(ctx)
+                progress.progress.report_init()
+            else:
+                raise TypeError("Invalid signing instruction")
+    finally:
+        prefetch.prefetch.reset(False)
@@ -20,6 +20,7 @@ from ..common import (
 from ..ownership import verify_nonownership
 from ..verification import SignatureVerifier
 from . import approvers, helpers
+from .prevtx_cache import PrevTxCache
 from .progress import progress
 from .sig_hasher import BitcoinSigHasher
 from .tx_info import OriginalTxInfo, TxInfo
@@ -48,6 +49,9 @@ if TYPE_CHECKING:
 _MAX_SERIALIZED_CHUNK_SIZE = const(2048)
 _SERIALIZED_TX_BUFFER = empty_bytearray(_MAX_SERIALIZED_CHUNK_SIZE)
 
+# the maximum number of legacy input digests computed in one pass over the transaction
+_MAX_LEGACY_DIGESTS = const(64)
+
 
 class Bitcoin:
     async def signer(self) -> None:
@@ -149,6 +153,15 @@ class Bitcoin:
         # The index of the payment request being processed.
         self.payment_req_index: int | None = None
 
+        # Outputs of the previous transactions which have already been verified, so
+        # that a previous transaction spent by several inputs is only streamed once.
+        self.prevtx_cache = PrevTxCache()
+
+        # Digests of the legacy inputs which are about to be signed, computed together
+        # in one pass over the transaction. Maps input index to the digest, the input
+        # and the signing key.
+        self.legacy_digests: dict[int, tuple[bytes, TxInput, bip32.HDNode | None]] = {}
+
     def create_hash_writer(self) -> HashWriter:
         return HashWriter(sha256())
 
@@ -679,74 +692,126 @@ class Bitcoin:
         tx_info: TxInfo | OriginalTxInfo,
         script_pubkey: bytes | None = None,
     ) -> tuple[bytes, TxInput, bip32.HDNode | None]:
+        digests = await self.get_legacy_tx_digests((index,), tx_info, script_pubkey)
+        return digests[0]
+
+    async def get_legacy_tx_digests(
+        self,
+        indices: Sequence[int],
+        tx_info: TxInfo | OriginalTxInfo,
+        script_pubkey: bytes | None = None,
+    ) -> list[tuple[bytes, TxInput, bip32.HDNode | None]]:
+        """
+        Compute the legacy digests of the inputs at the given (increasing) indices.
+
+        The transaction is streamed only once for all of the digests. Each digest
+        differs only in which input carries its scriptPubKey, so every input and output
+        is serialized once and the same bytes are written into each of the digests.
+
+        If script_pubkey is given, it is used for the single input being verified.
+        Otherwise the inputs are checked and their signing keys are derived.
+        """
+        assert script_pubkey is None or len(indices) == 1
         tx_hash = tx_info.orig_hash if isinstance(tx_info, OriginalTxInfo) else None
 
-        # the transaction digest which gets signed for this input
-        h_sign = self.create_hash_writer()
-        # should come out the same as h_tx_check, checked before signing the digest
+        # the transaction digests which get signed, one for each of the inputs
+        h_signs = [self.create_hash_writer() for _ in indices]
+        # should come out the same as h_tx_check, checked before signing the digests
         h_check = HashWriter(sha256())
+        # the serialized input or output, written into each of the digests
+        buf = empty_bytearray(_MAX_SERIALIZED_CHUNK_SIZE)
 
-        self.write_tx_header(h_sign, tx_info.tx, witness_marker=False)
-        write_compact_size(h_sign, tx_info.tx.inputs_count)
+        for h_sign in h_signs:
+            self.write_tx_header(h_sign, tx_info.tx, witness_marker=False)
+            write_compact_size(h_sign, tx_info.tx.inputs_count)
 
-        txi_sign = None
-        node = None
+        signing: list[tuple[TxInput, bip32.HDNode | None]] = []
         for i in range(tx_info.tx.inputs_count):
             # STAGE_REQUEST_4_INPUT in legacy
-            progress.advance()
+            progress.advance(len(indices))
             txi = await helpers.request_tx_input(self.tx_req, i, self.coin, tx_hash)
             writers.write_tx_input_check(h_check, txi)
+
+            buf[:] = bytes()
+            self.write_tx_input(buf, txi, bytes())
+
             # Only the previous UTXO's scriptPubKey is included in h_sign.
-            if i == index:
-                txi_sign = txi
-                if not script_pubkey:
-                    self.tx_info.check_input(txi)
-                    node = self.keychain.derive(
-                        txi.address_n, force_strict=not txi.multisig
-                    )
-                    key_sign_pub = node.public_key()
-                    if txi.multisig:
-                        # Sanity check to ensure we are signing with a key that is included in the multisig.
-                        multisig.multisig_pubkey_index(txi.multisig, key_sign_pub)
-
-                    if txi.script_type == InputScriptType.SPENDMULTISIG:
-                        assert txi.multisig is not None  # checked in sanitize_tx_input
-                        script_pubkey = scripts.output_script_multisig(
-                            multisig.multisig_get_pubkeys(txi.multisig),
-                            txi.multisig.m,
-                        )
-                    elif txi.script_type == InputScriptType.SPENDADDRESS:
-                        script_pubkey = scripts.output_script_p2pkh(
-                            addresses.ecdsa_hash_pubkey(key_sign_pub, self.coin)
-                        )
+            sign_j = len(signing)
+            if sign_j < len(indices) and indices[sign_j] == i:
+                node = None
+                if script_pubkey:
+                    txi_script_pubkey = script_pubkey
+                else:
+                    node, txi_script_pubkey = self.derive_legacy_signing_key(txi)
+                signing.append((txi, node))
+                for j, h_sign in enumerate(h_signs):
+                    if j == sign_j:
+                        self.write_tx_input(h_sign, txi, txi_script_pubkey)
                     else:
-                        raise wire.ProcessError("Unknown transaction type")
-                self.write_tx_input(h_sign, txi, script_pubkey)
+                        h_sign.extend(buf)
             else:
-                self.write_tx_input(h_sign, txi, bytes())
+                for h_sign in h_signs:
+                    h_sign.extend(buf)
 
-        if txi_sign is None:
+        if len(signing) != len(indices):
             raise RuntimeError  # index >= tx_info.tx.inputs_count
 
-        write_compact_size(h_sign, tx_info.tx.outputs_count)
+        for h_sign in h_signs:
+            write_compact_size(h_sign, tx_info.tx.outputs_count)
 
         for i in range(tx_info.tx.outputs_count):
             # STAGE_REQUEST_4_OUTPUT in legacy
-            progress.advance()
+            progress.advance(len(indices))
             txo = await helpers.request_tx_output(self.tx_req, i, self.coin, tx_hash)
-            script_pubkey = self.output_derive_script(txo)
-            self.write_tx_output(h_check, txo, script_pubkey)
-            self.write_tx_output(h_sign, txo, script_pubkey)
-
-        writers.write_uint32(h_sign, tx_info.tx.lock_time)
-        writers.write_uint32(h_sign, self.get_hash_type(txi_sign))
+            buf[:] = bytes()
+            self.write_tx_output(buf, txo, self.output_derive_script(txo))
+            h_check.extend(buf)
+            for h_sign in h_signs:
+                h_sign.extend(buf)
 
         # check that the inputs were the same as those streamed for approval
         if tx_info.get_tx_check_digest() != h_check.get_digest():
             raise wire.ProcessError("Transaction has changed during signing")
 
-        tx_digest = writers.get_tx_hash(h_sign, double=self.coin.sign_hash_double)
-        return tx_digest, txi_sign, node
+        digests = []
+        for h_sign, (txi, node) in zip(h_signs, signing):
+            writers.write_uint32(h_sign, tx_info.tx.lock_time)
+            writers.write_uint32(h_sign, self.get_hash_type(txi))
+            tx_digest = writers.get_tx_hash(h_sign, double=self.coin.sign_hash_double)
+            digests.append((tx_digest, txi, node))
+        return digests
+
+    def derive_legacy_signing_key(self, txi: TxInput) -> tuple[bip32.HDNode, bytes]:
+        self.tx_info.check_input(txi)
+        node = self.keychain.derive(txi.address_n, force_strict=not txi.multisig)
+        key_sign_pub = node.public_key()
+        if txi.multisig:
+            # Sanity check to ensure we are signing with a key that is included in the multisig.
+            multisig.multisig_pubkey_index(txi.multisig, key_sign_pub)
+
+        if txi.script_type == InputScriptType.SPENDMULTISIG:
+            assert txi.multisig is not None  # checked in sanitize_tx_input
+            script_pubkey = scripts.output_script_multisig(
+                multisig.multisig_get_pubkeys(txi.multisig),
+                txi.multisig.m,
+            )
+        elif txi.script_type == InputScriptType.SPENDADDRESS:
+            script_pubkey = scripts.output_script_p2pkh(
+                addresses.ecdsa_hash_pubkey(key_sign_pub, self.coin)
+            )
+        else:
+            raise wire.ProcessError("Unknown transaction type")
+        return node, script_pubkey
+
+    def legacy_inputs_from(self, first: int) -> list[int]:
+        """Return the indices of the next legacy inputs to be signed, up to a limit."""
+        indices = []
+        for i in range(first, self.tx_info.tx.inputs_count):
+            if i not in self.segwit and i not in self.external:
+                indices.append(i)
+                if len(indices) == _MAX_LEGACY_DIGESTS:
+                    break
+        return indices
 
     async def sign_nonsegwit_input(self, i: int) -> None:
         if self.taproot_only:
@@ -754,7 +819,14 @@ class Bitcoin:
             # script type than the one that was provided during the confirmation phase.
             raise wire.ProcessError("Transaction has changed during signing")
 
-        tx_digest, txi, node = await self.get_legacy_tx_digest(i, self.tx_info)
+        if i not in self.legacy_digests:
+            # Compute the digests of this and the following legacy inputs in one pass,
+            # instead of streaming the whole transaction for each of them.
+            indices = self.legacy_inputs_from(i)
+            digests = await self.get_legacy_tx_digests(indices, self.tx_info)
+            self.legacy_digests = dict(zip(indices, digests))
+
+        tx_digest, txi, node = self.legacy_digests.pop(i)
         assert node is not None
 
         # compute the signature from the tx digest
@@ -776,6 +848,12 @@ class Bitcoin:
     async def get_prevtx_output(
         self, prev_hash: bytes, prev_index: int
     ) -> tuple[int, bytes]:
+        txo_bin = self.prevtx_cache.get(prev_hash, prev_index)
+        if txo_bin is not None:
+            progress.skip_prev_tx()
+            self.check_prevtx_output(txo_bin)
+            return txo_bin.amount, txo_bin.script_pubkey
+
         amount_out = 0  # output amount
 
         # STAGE_REQUEST_3_PREV_META in legacy
@@ -801,6 +879,11 @@ class Bitcoin:
 
         write_compact_size(txh, tx.outputs_count)
 
+        # Outputs to be cached for other inputs spending the same transaction, None if
+        # they don't fit in the cache. A single output can't be spent twice.
+        outputs: list[PrevOutput] | None = [] if tx.outputs_count > 1 else None
+        outputs_size = 0
+
         script_pubkey: bytes | None = None
         for i in range(tx.outputs_count):
             # STAGE_REQUEST_3_PREV_OUTPUT in legacy
@@ -813,6 +896,12 @@ class Bitcoin:
                 amount_out = txo_bin.amount
                 script_pubkey = txo_bin.script_pubkey
                 self.check_prevtx_output(txo_bin)
+            if outputs is not None:
+                outputs_size += self.prevtx_cache.output_size(txo_bin)
+                if self.prevtx_cache.fits(outputs_size):
+                    outputs.append(txo_bin)
+                else:
+                    outputs = None
 
         assert script_pubkey is not None  # prev_index < tx.outputs_count
 
@@ -824,6 +913,9 @@ class Bitcoin:
         ):
             raise wire.ProcessError("Encountered invalid prev_hash")
 
+        if outputs is not None:
+            self.prevtx_cache.add(prev_hash, outputs, outputs_size)
+
         return amount_out, script_pubkey
 
     def check_prevtx_output(self, txo_bin: PrevOutput) -> None:
@@ -8,12 +8,16 @@ from trezor.messages import (
     PrevTx,
     SignTx,
     TxAckInput,
+    TxAckInputs,
     TxAckOutput,
+    TxAckOutputs,
     TxAckPaymentRequest,
     TxAckPrevExtraData,
     TxAckPrevInput,
+    TxAckPrevInputs,
     TxAckPrevMeta,
     TxAckPrevOutput,
+    TxAckPrevOutputs,
     TxInput,
     TxOutput,
     TxRequest,
@@ -24,7 +28,7 @@ from apps.common.coininfo import CoinInfo
 
 from .. import common
 from ..writers import TX_HASH_SIZE
-from . import layout
+from . import layout, prefetch
 
 if TYPE_CHECKING:
     from typing import Any, Awaitable
@@ -300,22 +304,44 @@ def request_tx_input(tx_req: TxRequest, i: int, coin: CoinInfo, tx_hash: bytes |
     if tx_hash:
         tx_req.request_type = RequestType.TXORIGINPUT
         tx_req.details.tx_hash = tx_hash
-    else:
+        tx_req.details.request_index = i
+        ack = yield TxAckInput, tx_req
+        _clear_tx_request(tx_req)
+        return sanitize_tx_input(ack.tx.input, coin)
+
+    txi = _take_prefetched(tx_req, prefetch.INPUT, None, i)
+    if txi is None:
         tx_req.request_type = RequestType.TXINPUT
-    tx_req.details.request_index = i
-    ack = yield TxAckInput, tx_req
-    _clear_tx_request(tx_req)
-    return sanitize_tx_input(ack.tx.input, coin)
+        tx_req.details.request_index = i
+        if prefetch.prefetch.enabled:
+            tx_req.details.request_count = prefetch.MAX_REQUEST_COUNT
+            ack = yield TxAckInputs, tx_req
+            txi = prefetch.prefetch.store(prefetch.INPUT, None, i, ack.tx.inputs)
+        else:
+            ack = yield TxAckInput, tx_req
+            txi = ack.tx.input
+        _clear_tx_request(tx_req)
+    return sanitize_tx_input(txi, coin)
 
 
 def request_tx_prev_input(tx_req: TxRequest, i: int, coin: CoinInfo, tx_hash: bytes | None = None) -> Awaitable[PrevInput]:  # type: ignore [awaitable-is-generator]
     assert tx_req.details is not None
-    tx_req.request_type = RequestType.TXINPUT
-    tx_req.details.request_index = i
-    tx_req.details.tx_hash = tx_hash
-    ack = yield TxAckPrevInput, tx_req
-    _clear_tx_request(tx_req)
-    return sanitize_tx_prev_input(ack.tx.input, coin)
+    txi = _take_prefetched(tx_req, prefetch.PREV_INPUT, tx_hash, i)
+    if txi is None:
+        tx_req.request_type = RequestType.TXINPUT
+        tx_req.details.request_index = i
+        tx_req.details.tx_hash = tx_hash
+        if prefetch.prefetch.enabled:
+            tx_req.details.request_count = prefetch.MAX_REQUEST_COUNT
+            ack = yield TxAckPrevInputs, tx_req
+            txi = prefetch.prefetch.store(
+                prefetch.PREV_INPUT, tx_hash, i, ack.tx.inputs
+            )
+        else:
+            ack = yield TxAckPrevInput, tx_req
+            txi = ack.tx.input
+        _clear_tx_request(tx_req)
+    return sanitize_tx_prev_input(txi, coin)
 
 
 def request_tx_output(tx_req: TxRequest, i: int, coin: CoinInfo, tx_hash: bytes | None = None) -> Awaitable[TxOutput]:  # type: ignore [awaitable-is-generator]
@@ -323,23 +349,45 @@ def request_tx_output(tx_req: TxRequest, i: int, coin: CoinInfo, tx_hash: bytes
     if tx_hash:
         tx_req.request_type = RequestType.TXORIGOUTPUT
         tx_req.details.tx_hash = tx_hash
-    else:
+        tx_req.details.request_index = i
+        ack = yield TxAckOutput, tx_req
+        _clear_tx_request(tx_req)
+        return sanitize_tx_output(ack.tx.output, coin)
+
+    txo = _take_prefetched(tx_req, prefetch.OUTPUT, None, i)
+    if txo is None:
         tx_req.request_type = RequestType.TXOUTPUT
-    tx_req.details.request_index = i
-    ack = yield TxAckOutput, tx_req
-    _clear_tx_request(tx_req)
-    return sanitize_tx_output(ack.tx.output, coin)
+        tx_req.details.request_index = i
+        if prefetch.prefetch.enabled:
+            tx_req.details.request_count = prefetch.MAX_REQUEST_COUNT
+            ack = yield TxAckOutputs, tx_req
+            txo = prefetch.prefetch.store(prefetch.OUTPUT, None, i, ack.tx.outputs)
+        else:
+            ack = yield TxAckOutput, tx_req
+            txo = ack.tx.output
+        _clear_tx_request(tx_req)
+    return sanitize_tx_output(txo, coin)
 
 
 def request_tx_prev_output(tx_req: TxRequest, i: int, coin: CoinInfo, tx_hash: bytes | None = None) -> Awaitable[PrevOutput]:  # type: ignore [awaitable-is-generator]
     assert tx_req.details is not None
-    tx_req.request_type = RequestType.TXOUTPUT
-    tx_req.details.request_index = i
-    tx_req.details.tx_hash = tx_hash
-    ack = yield TxAckPrevOutput, tx_req
-    _clear_tx_request(tx_req)
+    txo = _take_prefetched(tx_req, prefetch.PREV_OUTPUT, tx_hash, i)
+    if txo is None:
+        tx_req.request_type = RequestType.TXOUTPUT
+        tx_req.details.request_index = i
+        tx_req.details.tx_hash = tx_hash
+        if prefetch.prefetch.enabled:
+            tx_req.details.request_count = prefetch.MAX_REQUEST_COUNT
+            ack = yield TxAckPrevOutputs, tx_req
+            txo = prefetch.prefetch.store(
+                prefetch.PREV_OUTPUT, tx_hash, i, ack.tx.outputs
+            )
+        else:
+            ack = yield TxAckPrevOutput, tx_req
+            txo = ack.tx.output
+        _clear_tx_request(tx_req)
     # return sanitize_tx_prev_output(ack.tx, coin)  # no sanitize is required
-    return ack.tx.output
+    return txo
 
 
 def request_payment_req(tx_req: TxRequest, i: int) -> Awaitable[TxAckPaymentRequest]:  # type: ignore [awaitable-is-generator]
@@ -357,6 +405,17 @@ def request_tx_finish(tx_req: TxRequest) -> Awaitable[None]:  # type: ignore [aw
     _clear_tx_request(tx_req)
 
 
+def _take_prefetched(
+    tx_req: TxRequest, kind: int, tx_hash: bytes | None, i: int
+) -> Any | None:
+    assert tx_req.serialized is not None
+    if tx_req.serialized.signature_index is not None:
+        # A signature can only be returned in a TxRequest, so it has to be sent
+        # before the next signature is produced.
+        return None
+    return prefetch.prefetch.take(kind, tx_hash, i)
+
+
 def _clear_tx_request(tx_req: TxRequest) -> None:
     assert tx_req.details is not None
     assert tx_req.serialized is not None
@@ -366,6 +425,7 @@ def _clear_tx_request(tx_req: TxRequest) -> None:
     tx_req.details.tx_hash = None
     tx_req.details.extra_data_len = None
     tx_req.details.extra_data_offset = None
+    tx_req.details.request_count = None
     tx_req.serialized.signature = None
     tx_req.serialized.signature_index = None
     # typechecker thinks serialized_tx is `bytes`, which is immutable
@@ -0,0 +1,68 @@
+from micropython import const
+from typing import TYPE_CHECKING
+
+from trezor.wire import DataError
+
+if TYPE_CHECKING:
+    from typing import Any
+
+# Maximum number of consecutive inputs or outputs which the host may send in one
+# TxAck. The host additionally keeps each TxAck within the device's receive buffer.
+MAX_REQUEST_COUNT = const(16)
+
+# Kinds of items which can be prefetched, each of them has its own window.
+INPUT = const(0)
+OUTPUT = const(1)
+PREV_INPUT = const(2)
+PREV_OUTPUT = const(3)
+
+
+class Prefetch:
+    """
+    Inputs and outputs which the host sent ahead of the TxRequests asking for them.
+
+    When batching is enabled, every TxRequest for an input or output of the signed
+    transaction or of a previous transaction sets request_count, and the host may
+    answer with up to that many consecutive items starting at request_index. The
+    items after the requested one are kept in a window, one for each kind of item,
+    and they are served to the subsequent requests of the same kind.
+
+    Every item is served at most once and only in increasing order. The signing
+    passes therefore see exactly the same sequence of items as without batching,
+    and any request which the window cannot serve goes to the host again.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        # For each kind: None or [tx_hash, first index, next index, items].
+        self.windows: list[list | None] = [None, None, None, None]
+
+    def reset(self, enabled: bool) -> None:
+        self.enabled = enabled
+        for kind in range(len(self.windows)):
+            self.windows[kind] = None
+
+    def take(self, kind: int, tx_hash: bytes | None, index: int) -> Any | None:
+        window = self.windows[kind]
+        if window is None:
+            return None
+        w_hash, first, next_index, items = window
+        if w_hash != tx_hash or not next_index <= index < first + len(items):
+            # Requests are out of order, the rest of the window is of no use.
+            self.windows[kind] = None
+            return None
+        window[2] = index + 1
+        return items[index - first]
+
+    def store(self, kind: int, tx_hash: bytes | None, index: int, items: list) -> Any:
+        """Keep the items received in response to a request for `index`."""
+        if not 1 <= len(items) <= MAX_REQUEST_COUNT:
+            raise DataError("Invalid number of items in TxAck.")
+        if len(items) > 1:
+            self.windows[kind] = [tx_hash, index, index + 1, items]
+        else:
+            self.windows[kind] = None
+        return items[0]
+
+
+prefetch = Prefetch()
@@ -0,0 +1,58 @@
+from micropython import const
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from trezor.messages import PrevOutput
+
+# Approximate number of bytes of heap used by a cached output, not counting its
+# scriptPubKey.
+_OUTPUT_OVERHEAD = const(64)
+
+# Total number of bytes that the cached outputs may use.
+_CACHE_SIZE = const(16384)
+
+
+class PrevTxCache:
+    """
+    Outputs of previous transactions that were streamed and verified during signing.
+
+    Inputs which spend outputs of the same previous transaction would otherwise cause
+    the whole transaction to be requested and hashed once per input. Once the hash of
+    a streamed previous transaction matches its prev_hash, all of its outputs are
+    verified, so they are kept here for the remaining inputs of the same signing
+    session.
+
+    The cache is bounded by the approximate size of the outputs. A previous
+    transaction whose outputs do not fit is not cached at all, and the least recently
+    added transactions are evicted to make room for a new one.
+    """
+
+    def __init__(self, size: int = _CACHE_SIZE) -> None:
+        self.size = size
+        self.used = 0
+        # List of (prev_hash, outputs, size) in the order in which they were added.
+        # A list is used instead of a dict because dict ordering is undefined.
+        self.txs: list[tuple[bytes, list[PrevOutput], int]] = []
+
+    def get(self, prev_hash: bytes, prev_index: int) -> PrevOutput | None:
+        for tx_hash, outputs, _ in self.txs:
+            if tx_hash == prev_hash:
+                if prev_index < len(outputs):
+                    return outputs[prev_index]
+                return None
+        return None
+
+    def output_size(self, txo: PrevOutput) -> int:
+        return _OUTPUT_OVERHEAD + len(txo.script_pubkey)
+
+    def fits(self, size: int) -> bool:
+        return size <= self.size
+
+    def add(self, prev_hash: bytes, outputs: list[PrevOutput], size: int) -> None:
+        """Add the outputs of a previous transaction whose prev_hash was verified."""
+        if not self.fits(size):
+            return
+        while self.txs and self.used + size > self.size:
+            self.used -= self.txs.pop(0)[2]
+        self.txs.append((prev_hash, outputs, size))
+        self.used += size
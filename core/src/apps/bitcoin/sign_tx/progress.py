@@ -101,14 +101,19 @@ class Progress:
     def init_prev_tx(self, inputs: int, outputs: int) -> None:
         self.prev_tx_step = _PREV_TX_MULTIPLIER / (inputs + outputs)
 
-    def advance(self) -> None:
-        self.progress += 1
+    def advance(self, steps: int = 1) -> None:
+        self.progress += steps
         self.report()
 
     def advance_prev_tx(self) -> None:
         self.progress += self.prev_tx_step
         self.report()
 
+    def skip_prev_tx(self) -> None:
+        # The prev_tx was already verified, so all the reserved steps are done.
+        self.progress += _PREV_TX_MULTIPLIER
+        self.report()
+
     def report_init(self) -> None:
         from trezor import workflow
 
@@ -1,6 +1,7 @@
 import sys
 from typing import TYPE_CHECKING
 
+import storage.cache as storage_cache
 from trezor import utils, wire
 from trezor.crypto import bip32
 
@@ -47,39 +48,96 @@ if TYPE_CHECKING:
 FORBIDDEN_KEY_PATH = wire.DataError("Forbidden key path")
 
 
+# number of derived prefixes kept by a standalone Keychain
+_CACHE_SIZE = 10
+# number of derived prefixes shared by all keychains in a session
+_SESSION_CACHE_SIZE = 16
+
+
 class LRUCache:
+    """Least-recently-used cache with O(1) `get` and `insert`.
+
+    Entries are kept in a circular doubly linked list, from the most recently used
+    one (`root[1]`) to the least recently used one (`root[0]`). Each link is a list of
+    `[prev, next, key, value]`. Evicted values are wiped by calling their `__del__`.
+    """
+
     def __init__(self, size: int) -> None:
         self.size = size
-        self.cache_keys: list[Any] = []
-        self.cache: dict[Any, Deletable] = {}
+        self.hits = 0
+        self.misses = 0
+        self.cache: dict[Any, list[Any]] = {}
+        self.root: list[Any] = [None, None, None, None]
+        self.root[0] = self.root[1] = self.root
+
+    def _unlink(self, link: list[Any]) -> None:
+        prev_link, next_link = link[0], link[1]
+        prev_link[1] = next_link
+        next_link[0] = prev_link
+
+    def _link_first(self, link: list[Any]) -> None:
+        root = self.root
+        first = root[1]
+        link[0] = root
+        link[1] = first
+        first[0] = link
+        root[1] = link
 
     def insert(self, key: Any, value: Deletable) -> None:
-        if key in self.cache_keys:
-            self.cache_keys.remove(key)
-        self.cache_keys.insert(0, key)
-        self.cache[key] = value
+        link = self.cache.get(key)
+        if link is not None:
+            self._unlink(link)
+            link[3] = value
+        else:
+            link = [None, None, key, value]
+            self.cache[key] = link
+        self._link_first(link)
 
-        if len(self.cache_keys) > self.size:
-            dropped_key = self.cache_keys.pop()
-            self.cache[dropped_key].__del__()
-            del self.cache[dropped_key]
+        if len(self.cache) > self.size:
+            dropped = self.root[0]
+            self._unlink(dropped)
+            del self.cache[dropped[2]]
+            dropped[3].__del__()
 
     def get(self, key: Any) -> Any:
-        if key not in self.cache:
+        link = self.cache.get(key)
+        if link is None:
+            self.misses += 1
             return None
 
-        self.cache_keys.remove(key)
-        self.cache_keys.insert(0, key)
-        return self.cache[key]
+        self.hits += 1
+        self._unlink(link)
+        self._link_first(link)
+        return link[3]
+
+    def __len__(self) -> int:
+        return len(self.cache)
 
     def __del__(self) -> None:
-        for value in self.cache.values():
-            value.__del__()
+        for link in self.cache.values():
+            link[3].__del__()
+            link[:] = ()
         self.cache.clear()
-        self.cache_keys.clear()
+        self.root[0] = self.root[1] = self.root
         del self.cache
 
 
+def get_session_cache() -> LRUCache | None:
+    """Return the derivation cache shared by keychains of the current session.
+
+    The cache lives in `storage.cache` and is wiped when the session ends. Returns
+    None if there is no active session.
+    """
+    try:
+        node_cache = storage_cache.get_derivation_cache()
+    except storage_cache.InvalidSessionError:
+        return None
+    if node_cache is None:
+        node_cache = LRUCache(_SESSION_CACHE_SIZE)
+        storage_cache.set_derivation_cache(node_cache)
+    return node_cache
+
+
 class Keychain:
     def __init__(
         self,
@@ -87,17 +145,22 @@ class Keychain:
         curve: str,
         schemas: Iterable[paths.PathSchemaType],
         slip21_namespaces: Iterable[paths.Slip21Path] = (),
+        cache: LRUCache | None = None,
     ) -> None:
         self.seed = seed
         self.curve = curve
         self.schemas = tuple(schemas)
         self.slip21_namespaces = tuple(slip21_namespaces)
 
-        self._cache = LRUCache(10)
+        # A shared `cache` must only be used with keychains on the same seed, and
+        # is owned (and wiped) by whoever provided it.
+        self._owns_cache = cache is None
+        self._cache = LRUCache(_CACHE_SIZE) if cache is None else cache
         self._root_fingerprint: int | None = None
 
     def __del__(self) -> None:
-        self._cache.__del__()
+        if self._owns_cache:
+            self._cache.__del__()
         del self._cache
         del self.seed
 
@@ -124,11 +187,13 @@ class Keychain:
     ) -> NodeType:
         if not utils.USE_THD89:
             cached_prefix = tuple(path[:prefix_len])
-            cached_root: NodeType | None = self._cache.get(cached_prefix)
+            # the cache may be shared with keychains on other curves
+            cache_key = (self.curve, cached_prefix)
+            cached_root: NodeType | None = self._cache.get(cache_key)
             if cached_root is None:
                 cached_root = new_root()
                 cached_root.derive_path(cached_prefix)
-                self._cache.insert(cached_prefix, cached_root)
+                self._cache.insert(cache_key, cached_root)
 
             node = cached_root.clone()
             node.derive_path(path[prefix_len:])
@@ -163,6 +228,27 @@ class Keychain:
             new_root=lambda: bip32.from_seed(self.seed, self.curve),  # type: ignore[Argument of type "() -> HDNode" cannot be assigned to parameter "new_root" of type "() -> NodeType@_derive_with_cache" in function "_derive_with_cache"]
         )
 
+    def derive_parent(
+        self,
+        path: paths.Bip32Path,
+        child_indexes: Iterable[int],
+        force_strict: bool = True,
+    ) -> bip32.HDNode:
+        """
+        Derive the node at `path` so that the caller can derive its non-hardened
+        children at `child_indexes` with public derivation. The paths of those
+        children are verified instead of `path` itself.
+        """
+        for index in child_indexes:
+            if index & paths.HARDENED:
+                raise wire.DataError("Hardened child index")
+            self.verify_path(list(path) + [index], force_strict)
+        return self._derive_with_cache(  # type: ignore[Expression of type "NodeType@_derive_with_cache" cannot be assigned to return type "HDNode"]
+            prefix_len=3,
+            path=path,
+            new_root=lambda: bip32.from_seed(self.seed, self.curve),  # type: ignore[Argument of type "() -> HDNode" cannot be assigned to parameter "new_root" of type "() -> NodeType@_derive_with_cache" in function "_derive_with_cache"]
+        )
+
     def derive_slip21(self, path: paths.Slip21Path) -> Slip21Node:
         if safety_checks.is_strict() and not any(
             ns == path[: len(ns)] for ns in self.slip21_namespaces
@@ -197,7 +283,9 @@ async def get_keychain(
         keychain = Keychain(b"", curve, schemas, slip21_namespaces)
     else:
         seed = await get_seed(ctx)
-        keychain = Keychain(seed, curve, schemas, slip21_namespaces)
+        keychain = Keychain(
+            seed, curve, schemas, slip21_namespaces, cache=get_session_cache()
+        )
     return keychain
 
 
@@ -2,9 +2,11 @@
 # (by running `make templates` in `core`)
 # do not edit manually!
 
-# NOTE: using positional arguments saves 4400 bytes in flash size,
-# returning tuples instead of classes saved 800 bytes
+# NOTE: networks are stored in binary tables sorted by chain_id and by slip44,
+# instead of yielding a tuple per network. The tables take less flash than the
+# tuples did, and lookups are a bisection instead of a linear scan.
 
+from micropython import const
 from typing import TYPE_CHECKING
 
 from trezor.messages import EthereumNetworkInfo
@@ -14,17 +16,10 @@ from apps.common.paths import HARDENED
 if TYPE_CHECKING:
     from typing import Iterator
 
-    # Removing the necessity to construct object to save space
-    # fmt: off
-    NetworkInfoTuple = tuple[
-        int,  # chain_id
-        int,  # slip44
-        str,  # symbol
-        str,  # name
-        str,  # icon
-        int,  # primary_color
-    ]
-    # fmt: on
+_ENTRY_LEN = const(14)  # chain_id (uint64 BE), slip44 (uint32 BE), offset (uint16 BE)
+_SLIP44_ENTRY_LEN = const(6)  # slip44 (uint32 BE), network index (uint16 BE)
+_MAX_CHAIN_ID = const(0xFFFF_FFFF_FFFF_FFFF)
+_MAX_SLIP44 = const(0xFFFF_FFFF)
 
 UNKNOWN_NETWORK = EthereumNetworkInfo(
     chain_id=0,
@@ -35,1836 +30,599 @@ UNKNOWN_NETWORK = EthereumNetworkInfo(
 
 
 def shortcut_by_chain_id(chain_id: int) -> str:
-    n = by_chain_id(chain_id)
-    return n.symbol if n is not None else "UNKN"
+    entry = _find_chain_id(chain_id)
+    if entry < 0:
+        return "UNKN"
+    offset = _NETWORKS[entry + 12] << 8 | _NETWORKS[entry + 13]
+    offset += 3  # primary_color
+    return _NETWORK_DATA[offset + 1 : offset + 1 + _NETWORK_DATA[offset]].decode()
 
 
 def all_slip44_ids_hardened() -> Iterator[int]:
-    for n in _networks_iterator():
-        yield n[1] | HARDENED
+    for entry in range(0, len(_NETWORKS), _ENTRY_LEN):
+        yield int.from_bytes(_NETWORKS[entry + 8 : entry + 12], "big") | HARDENED
 
 
 def by_chain_id(chain_id: int) -> EthereumNetworkInfo:
-    for n in _networks_iterator():
-        n_chain_id = n[0]
-        if n_chain_id == chain_id:
-            return EthereumNetworkInfo(
-                chain_id=n[0],
-                slip44=n[1],
-                symbol=n[2],
-                name=n[3],
-                icon=n[4],
-                primary_color=n[5],
-            )
-    return UNKNOWN_NETWORK
+    entry = _find_chain_id(chain_id)
+    if entry < 0:
+        return UNKNOWN_NETWORK
+    return _network_info(entry)
 
 
 def by_slip44(slip44: int) -> EthereumNetworkInfo:
-    for n in _networks_iterator():
-        n_slip44 = n[1]
-        if n_slip44 == slip44:
-            return EthereumNetworkInfo(
-                chain_id=n[0],
-                slip44=n[1],
-                symbol=n[2],
-                name=n[3],
-                icon=n[4],
-                primary_color=n[5],
-            )
+    if not 0 <= slip44 <= _MAX_SLIP44:
+        return UNKNOWN_NETWORK
+    key = slip44.to_bytes(4, "big")
+
+    lo = 0
+    hi = len(_SLIP44_INDEX) // _SLIP44_ENTRY_LEN
+    while lo < hi:
+        mid = (lo + hi) // 2
+        entry = mid * _SLIP44_ENTRY_LEN
+        mid_key = _SLIP44_INDEX[entry : entry + 4]
+        if mid_key < key:
+            lo = mid + 1
+        elif mid_key > key:
+            hi = mid
+        else:
+            index = _SLIP44_INDEX[entry + 4] << 8 | _SLIP44_INDEX[entry + 5]
+            return _network_info(index * _ENTRY_LEN)
     return UNKNOWN_NETWORK
 
 
-# fmt: off
-def _networks_iterator() -> Iterator[NetworkInfoTuple]:
-    yield (
-        1,  # chain_id
-        60,  # slip44
-        "ETH",  # symbol
-        "Ethereum",  # name
-        "evm-eth.png",  # name
-        0x637FFF,  # primary_color
-    )
-    yield (
-        2,  # chain_id
-        40,  # slip44
-        "EXP",  # symbol
-        "Expanse Network",  # name
-        "evm-exp.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        3,  # chain_id
-        1,  # slip44
-        "tETH",  # symbol
-        "Ropsten",  # name
-        "evm-teth.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        4,  # chain_id
-        1,  # slip44
-        "tETH",  # symbol
-        "Rinkeby",  # name
-        "evm-teth.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        5,  # chain_id
-        1,  # slip44
-        "tETH",  # symbol
-        "Goerli",  # name
-        "evm-teth.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        6,  # chain_id
-        1,  # slip44
-        "tKOT",  # symbol
-        "Kotti Testnet",  # name
-        "evm-tkot.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        7,  # chain_id
-        60,  # slip44
-        "TCH",  # symbol
-        "ThaiChain",  # name
-        "evm-tch.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        8,  # chain_id
-        108,  # slip44
-        "UBQ",  # symbol
-        "Ubiq",  # name
-        "evm-ubq.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        9,  # chain_id
-        1,  # slip44
-        "TUBQ",  # symbol
-        "Ubiq Network Testnet",  # name
-        "evm-tubq.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        10,  # chain_id
-        60,  # slip44
-        "ETH",  # symbol
-        "OP",  # name
-        "evm-oeth.png",  # name
-        0xFF0420,  # primary_color
-    )
-    yield (
-        11,  # chain_id
-        916,  # slip44
-        "META",  # symbol
-        "Metadium",  # name
-        "evm-meta.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        12,  # chain_id
-        1,  # slip44
-        "tKAL",  # symbol
-        "Metadium Testnet",  # name
-        "evm-tkal.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        13,  # chain_id
-        1,  # slip44
-        "tsDIODE",  # symbol
-        "Diode Testnet Staging",  # name
-        "evm-tsdiode.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        14,  # chain_id
-        60,  # slip44
-        "FLR",  # symbol
-        "Flare",  # name
-        "evm-flr.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        15,  # chain_id
-        60,  # slip44
-        "DIODE",  # symbol
-        "Diode Prenet",  # name
-        "evm-diode.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        16,  # chain_id
-        1,  # slip44
-        "tCFLR",  # symbol
-        "Songbird Testnet Coston",  # name
-        "evm-tcflr.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        17,  # chain_id
-        60,  # slip44
-        "TFI",  # symbol
-        "ThaiChain 2.0 ThaiFi",  # name
-        "evm-tfi.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        18,  # chain_id
-        1,  # slip44
-        "TST",  # symbol
-        "ThunderCore Testnet",  # name
-        "evm-tst.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        19,  # chain_id
-        60,  # slip44
-        "SGB",  # symbol
-        "Songbird Canary-Network",  # name
-        "evm-sgb.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        20,  # chain_id
-        60,  # slip44
-        "ELA",  # symbol
-        "Elastos Smart Chain",  # name
-        "evm-ela.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        25,  # chain_id
-        60,  # slip44
-        "CRO",  # symbol
-        "Cronos",  # name
-        "evm-cro.png",  # name
-        0x1199FA,  # primary_color
-    )
-    yield (
-        27,  # chain_id
-        60,  # slip44
-        "SHIB",  # symbol
-        "ShibaChain",  # name
-        "evm-shib.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        29,  # chain_id
-        60,  # slip44
-        "L1",  # symbol
-        "Genesis L1",  # name
-        "evm-l1.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        30,  # chain_id
-        137,  # slip44
-        "RBTC",  # symbol
-        "Rootstock",  # name
-        "evm-rbtc.png",  # name
-        0xFF9100,  # primary_color
-    )
-    yield (
-        31,  # chain_id
-        1,  # slip44
-        "tRBTC",  # symbol
-        "Rootstock Testnet",  # name
-        "evm-trbtc.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        33,  # chain_id
-        60,  # slip44
-        "GooD",  # symbol
-        "GoodData",  # name
-        "evm-good.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        35,  # chain_id
-        60,  # slip44
-        "TBG",  # symbol
-        "TBWG Chain",  # name
-        "evm-tbg.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        38,  # chain_id
-        538,  # slip44
-        "VAL",  # symbol
-        "Valorbit",  # name
-        "evm-val.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        40,  # chain_id
-        60,  # slip44
-        "TLOS",  # symbol
-        "Telos EVM",  # name
-        "evm-tlos.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        44,  # chain_id
-        60,  # slip44
-        "CRAB",  # symbol
-        "Crab Network",  # name
-        "evm-crab.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        50,  # chain_id
-        60,  # slip44
-        "XDC",  # symbol
-        "XDC Network",  # name
-        "evm-xdc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        51,  # chain_id
-        60,  # slip44
-        "TXDC",  # symbol
-        "XDC Apothem Network",  # name
-        "evm-txdc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        52,  # chain_id
-        60,  # slip44
-        "cet",  # symbol
-        "CoinEx Smart Chain",  # name
-        "evm-cet.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        55,  # chain_id
-        60,  # slip44
-        "ZYX",  # symbol
-        "Zyx",  # name
-        "evm-zyx.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        56,  # chain_id
-        714,  # slip44
-        "BNB",  # symbol
-        "BNB Smart Chain",  # name
-        "evm-bnb.png",  # name
-        0xF0B90B,  # primary_color
-    )
-    yield (
-        58,  # chain_id
-        60,  # slip44
-        "ONG",  # symbol
-        "Ontology",  # name
-        "evm-ong.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        60,  # chain_id
-        6060,  # slip44
-        "GO",  # symbol
-        "GoChain",  # name
-        "evm-go.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        61,  # chain_id
-        61,  # slip44
-        "ETC",  # symbol
-        "Ethereum Classic",  # name
-        "evm-etc.png",  # name
-        0x328332,  # primary_color
-    )
-    yield (
-        62,  # chain_id
-        1,  # slip44
-        "TETC",  # symbol
-        "Morden Testnet",  # name
-        "evm-tetc.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        63,  # chain_id
-        1,  # slip44
-        "tMETC",  # symbol
-        "Mordor Testnet",  # name
-        "evm-tmetc.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        64,  # chain_id
-        163,  # slip44
-        "ELLA",  # symbol
-        "Ellaism",  # name
-        "evm-ella.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        66,  # chain_id
-        60,  # slip44
-        "OKT",  # symbol
-        "OKXChain",  # name
-        "evm-okt.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        67,  # chain_id
-        1,  # slip44
-        "tDBM",  # symbol
-        "DBChain Testnet",  # name
-        "evm-tdbm.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        74,  # chain_id
-        60,  # slip44
-        "EIDI",  # symbol
-        "IDChain",  # name
-        "evm-eidi.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        76,  # chain_id
-        76,  # slip44
-        "MIX",  # symbol
-        "Mix",  # name
-        "evm-mix.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        77,  # chain_id
-        60,  # slip44
-        "SPOA",  # symbol
-        "POA Network Sokol",  # name
-        "evm-spoa.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        78,  # chain_id
-        60,  # slip44
-        "PETH",  # symbol
-        "PrimusChain",  # name
-        "evm-peth.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        80,  # chain_id
-        60,  # slip44
-        "RNA",  # symbol
-        "GeneChain",  # name
-        "evm-rna.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        82,  # chain_id
-        60,  # slip44
-        "MTR",  # symbol
-        "Meter",  # name
-        "evm-mtr.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        87,  # chain_id
-        60,  # slip44
-        "SNT",  # symbol
-        "Nova Network",  # name
-        "evm-snt.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        88,  # chain_id
-        889,  # slip44
-        "VIC",  # symbol
-        "Viction",  # name
-        "evm-vic.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        90,  # chain_id
-        60,  # slip44
-        "GAR",  # symbol
-        "Garizon Stage0",  # name
-        "evm-gar.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        97,  # chain_id
-        1,  # slip44
-        "tBNB",  # symbol
-        "BNB Smart Chain Testnet",  # name
-        "evm-tbnb.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        99,  # chain_id
-        178,  # slip44
-        "POA",  # symbol
-        "POA Network Core",  # name
-        "evm-poa.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        100,  # chain_id
-        700,  # slip44
-        "XDAI",  # symbol
-        "Gnosis",  # name
-        "evm-xdai.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        101,  # chain_id
-        464,  # slip44
-        "ETI",  # symbol
-        "EtherInc",  # name
-        "evm-eti.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        105,  # chain_id
-        60,  # slip44
-        "W3G",  # symbol
-        "Web3Games Devnet",  # name
-        "evm-w3g.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        106,  # chain_id
-        60,  # slip44
-        "VLX",  # symbol
-        "Velas EVM",  # name
-        "evm-vlx.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        108,  # chain_id
-        1001,  # slip44
-        "TT",  # symbol
-        "ThunderCore",  # name
-        "evm-tt.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        111,  # chain_id
-        60,  # slip44
-        "ETL",  # symbol
-        "EtherLite Chain",  # name
-        "evm-etl.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        122,  # chain_id
-        60,  # slip44
-        "FUSE",  # symbol
-        "Fuse",  # name
-        "evm-fuse.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        123,  # chain_id
-        60,  # slip44
-        "SPARK",  # symbol
-        "Fuse Sparknet",  # name
-        "evm-spark.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        124,  # chain_id
-        60,  # slip44
-        "DWU",  # symbol
-        "Decentralized Web",  # name
-        "evm-dwu.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        126,  # chain_id
-        126,  # slip44
-        "OY",  # symbol
-        "OYchain",  # name
-        "evm-oy.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        127,  # chain_id
-        127,  # slip44
-        "FETH",  # symbol
-        "Factory 127",  # name
-        "evm-feth.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        128,  # chain_id
-        1010,  # slip44
-        "HT",  # symbol
-        "Huobi ECO Chain",  # name
-        "evm-ht.png",  # name
-        0x01943F,  # primary_color
-    )
-    yield (
-        137,  # chain_id
-        966,  # slip44
-        "POL",  # symbol
-        "Polygon",  # name
-        "evm-matic.png",  # name
-        0x8247E5,  # primary_color
-    )
-    yield (
-        142,  # chain_id
-        60,  # slip44
-        "DAX",  # symbol
-        "DAX CHAIN",  # name
-        "evm-dax.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        146,  # chain_id
-        60,  # slip44
-        "S",  # symbol
-        "Sonic",  # name
-        "evm-s.png",  # name
-        0xFFFFFF,  # primary_color
-    )
-    yield (
-        162,  # chain_id
-        1,  # slip44
-        "tPHT",  # symbol
-        "Lightstreams Testnet",  # name
-        "evm-tpht.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        163,  # chain_id
-        60,  # slip44
-        "PHT",  # symbol
-        "Lightstreams",  # name
-        "evm-pht.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        177,  # chain_id
-        60,  # slip44
-        "HSK",  # symbol
-        "HashKey Chain",  # name
-        "evm-hsk.png",  # name
-        0xFFFFFF,  # primary_color
-    )
-    yield (
-        186,  # chain_id
-        60,  # slip44
-        "Seele",  # symbol
-        "Seele",  # name
-        "evm-seele.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        188,  # chain_id
-        60,  # slip44
-        "BTM",  # symbol
-        "BMC",  # name
-        "evm-btm.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        199,  # chain_id
-        60,  # slip44
-        "BTT",  # symbol
-        "BitTorrent Chain",  # name
-        "evm-btt.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        211,  # chain_id
-        60,  # slip44
-        "0xF",  # symbol
-        "Freight Trust Network",  # name
-        "evm-0xf.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        222,  # chain_id
-        2221,  # slip44
-        "ASK",  # symbol
-        "Permission",  # name
-        "evm-ask.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        225,  # chain_id
-        60,  # slip44
-        "LA",  # symbol
-        "LACHAIN",  # name
-        "evm-la.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        246,  # chain_id
-        246,  # slip44
-        "EWT",  # symbol
-        "Energy Web Chain",  # name
-        "evm-ewt.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        250,  # chain_id
-        60,  # slip44
-        "FTM",  # symbol
-        "Fantom Opera",  # name
-        "evm-ftm.png",  # name
-        0x1969FF,  # primary_color
-    )
-    yield (
-        256,  # chain_id
-        1,  # slip44
-        "thtt",  # symbol
-        "Huobi ECO Chain Testnet",  # name
-        "evm-thtt.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        258,  # chain_id
-        60,  # slip44
-        "SETM",  # symbol
-        "Setheum",  # name
-        "evm-setm.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        262,  # chain_id
-        60,  # slip44
-        "SRN",  # symbol
-        "SUR Blockchain Network",  # name
-        "evm-srn.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        269,  # chain_id
-        269,  # slip44
-        "HPB",  # symbol
-        "High Performance Blockchain",  # name
-        "evm-hpb.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        288,  # chain_id
-        60,  # slip44
-        "ETH",  # symbol
-        "Boba Network",  # name
-        "evm-boba.png",  # name
-        0xCCFF00,  # primary_color
-    )
-    yield (
-        314,  # chain_id
-        461,  # slip44
-        "FIL",  # symbol
-        "Filecoin",  # name
-        "evm-filecoin.png",  # name
-        0x0090FF,  # primary_color
-    )
-    yield (
-        321,  # chain_id
-        641,  # slip44
-        "KCS",  # symbol
-        "KCC",  # name
-        "evm-kcs.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        324,  # chain_id
-        60,  # slip44
-        "ETH",  # symbol
-        "zkSync",  # name
-        "evm-zksync-era.png",  # name
-        0xFFFFFF,  # primary_color
-    )
-    yield (
-        333,  # chain_id
-        60,  # slip44
-        "W3Q",  # symbol
-        "Web3Q",  # name
-        "evm-w3q.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        336,  # chain_id
-        60,  # slip44
-        "SDN",  # symbol
-        "Shiden",  # name
-        "evm-sdn.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        369,  # chain_id
-        60,  # slip44
-        "PLS",  # symbol
-        "PulseChain",  # name
-        "evm-pls.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        420,  # chain_id
-        1,  # slip44
-        "tETH",  # symbol
-        "Optimism Goerli Testnet",  # name
-        "evm-teth.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        499,  # chain_id
-        499,  # slip44
-        "RUPX",  # symbol
-        "Rupaya",  # name
-        "evm-rupx.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        512,  # chain_id
-        1512,  # slip44
-        "AAC",  # symbol
-        "Double-A Chain",  # name
-        "evm-aac.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        555,  # chain_id
-        60,  # slip44
-        "CLASS",  # symbol
-        "Vela1 Chain",  # name
-        "evm-class.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        558,  # chain_id
-        60,  # slip44
-        "TAO",  # symbol
-        "Tao Network",  # name
-        "evm-tao.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        595,  # chain_id
-        1,  # slip44
-        "tmACA",  # symbol
-        "Acala Mandala Testnet TC9",  # name
-        "evm-tmaca.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        686,  # chain_id
-        686,  # slip44
-        "KAR",  # symbol
-        "Karura Network",  # name
-        "evm-kar.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        707,  # chain_id
-        60,  # slip44
-        "BCS",  # symbol
-        "BlockChain Station",  # name
-        "evm-bcs.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        777,  # chain_id
-        60,  # slip44
-        "cTH",  # symbol
-        "cheapETH",  # name
-        "evm-cth.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        787,  # chain_id
-        787,  # slip44
-        "ACA",  # symbol
-        "Acala Network",  # name
-        "evm-aca.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        803,  # chain_id
-        60,  # slip44
-        "HAIC",  # symbol
-        "Haic",  # name
-        "evm-haic.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        820,  # chain_id
-        820,  # slip44
-        "CLO",  # symbol
-        "Callisto",  # name
-        "evm-clo.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        821,  # chain_id
-        1,  # slip44
-        "TCLO",  # symbol
-        "Callisto Testnet Deprecated",  # name
-        "evm-tclo.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        888,  # chain_id
-        5718350,  # slip44
-        "WAN",  # symbol
-        "Wanchain",  # name
-        "evm-wan.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        977,  # chain_id
-        60,  # slip44
-        "YETI",  # symbol
-        "Nepal Blockchain Network",  # name
-        "evm-yeti.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        998,  # chain_id
-        60,  # slip44
-        "L99",  # symbol
-        "Lucky Network",  # name
-        "evm-l99.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1001,  # chain_id
-        1,  # slip44
-        "tKAIA",  # symbol
-        "Kaia Kairos Testnet",  # name
-        "evm-tkaia.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        1007,  # chain_id
-        1,  # slip44
-        "tNEW",  # symbol
-        "Newton Testnet",  # name
-        "evm-tnew.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        1010,  # chain_id
-        1020,  # slip44
-        "EVC",  # symbol
-        "Evrice Network",  # name
-        "evm-evc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1012,  # chain_id
-        60,  # slip44
-        "NEW",  # symbol
-        "Newton",  # name
-        "evm-new.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1022,  # chain_id
-        60,  # slip44
-        "SKU",  # symbol
-        "Sakura",  # name
-        "evm-sku.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1024,  # chain_id
-        60,  # slip44
-        "CLV",  # symbol
-        "CLV Parachain",  # name
-        "evm-clv.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1030,  # chain_id
-        60,  # slip44
-        "CFX",  # symbol
-        "Conflux eSpace",  # name
-        "evm-cfx.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1088,  # chain_id
-        60,  # slip44
-        "METIS",  # symbol
-        "Metis Andromeda",  # name
-        "evm-metis.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1139,  # chain_id
-        60,  # slip44
-        "MATH",  # symbol
-        "MathChain",  # name
-        "evm-math.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1140,  # chain_id
-        1,  # slip44
-        "tMATH",  # symbol
-        "MathChain Testnet",  # name
-        "evm-tmath.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        1197,  # chain_id
-        60,  # slip44
-        "IORA",  # symbol
-        "Iora Chain",  # name
-        "evm-iora.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1202,  # chain_id
-        60,  # slip44
-        "WTT",  # symbol
-        "World Trade Technical Chain",  # name
-        "evm-wtt.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1213,  # chain_id
-        60,  # slip44
-        "POP",  # symbol
-        "Popcateum",  # name
-        "evm-pop.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1214,  # chain_id
-        60,  # slip44
-        "ENTER",  # symbol
-        "EnterChain",  # name
-        "evm-enter.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1280,  # chain_id
-        60,  # slip44
-        "HO",  # symbol
-        "HALO",  # name
-        "evm-ho.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1284,  # chain_id
-        60,  # slip44
-        "GLMR",  # symbol
-        "Moonbeam",  # name
-        "evm-glmr.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1285,  # chain_id
-        60,  # slip44
-        "MOVR",  # symbol
-        "Moonriver",  # name
-        "evm-movr.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1287,  # chain_id
-        1,  # slip44
-        "DEV",  # symbol
-        "Moonbase Alpha",  # name
-        "evm-dev.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1618,  # chain_id
-        60,  # slip44
-        "CATE",  # symbol
-        "Catecoin Chain",  # name
-        "evm-cate.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1657,  # chain_id
-        60,  # slip44
-        "BTA",  # symbol
-        "Btachain",  # name
-        "evm-bta.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1856,  # chain_id
-        60,  # slip44
-        "TSF",  # symbol
-        "Teslafunds",  # name
-        "evm-tsf.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1898,  # chain_id
-        60,  # slip44
-        "BOY",  # symbol
-        "BON Network",  # name
-        "evm-boy.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1987,  # chain_id
-        1987,  # slip44
-        "EGEM",  # symbol
-        "EtherGem",  # name
-        "evm-egem.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        2021,  # chain_id
-        523,  # slip44
-        "EDG",  # symbol
-        "Edgeware EdgeEVM",  # name
-        "evm-edg.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        2025,  # chain_id
-        1008,  # slip44
-        "RPG",  # symbol
-        "Rangers Protocol",  # name
-        "evm-rpg.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        2100,  # chain_id
-        60,  # slip44
-        "ECO",  # symbol
-        "Ecoball",  # name
-        "evm-eco.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        2213,  # chain_id
-        60,  # slip44
-        "EVA",  # symbol
-        "Evanesco",  # name
-        "evm-eva.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        2559,  # chain_id
-        60,  # slip44
-        "KTO",  # symbol
-        "Kortho",  # name
-        "evm-kto.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        3400,  # chain_id
-        60,  # slip44
-        "PRB",  # symbol
-        "Paribu Net",  # name
-        "evm-prb.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        3966,  # chain_id
-        60,  # slip44
-        "DYNO",  # symbol
-        "DYNO",  # name
-        "evm-dyno.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        4689,  # chain_id
-        60,  # slip44
-        "IOTX",  # symbol
-        "IoTeX Network",  # name
-        "evm-iotx.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        5000,  # chain_id
-        60,  # slip44
-        "MNT",  # symbol
-        "Mantle",  # name
-        "evm-mnt.png",  # name
-        0xFFFFFF,  # primary_color
-    )
-    yield (
-        5197,  # chain_id
-        60,  # slip44
-        "ES",  # symbol
-        "EraSwap",  # name
-        "evm-es.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        5315,  # chain_id
-        60,  # slip44
-        "UZMI",  # symbol
-        "Uzmi Network",  # name
-        "evm-uzmi.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        5869,  # chain_id
-        60,  # slip44
-        "RBD",  # symbol
-        "Wegochain Rubidium",  # name
-        "evm-rbd.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        6626,  # chain_id
-        60,  # slip44
-        "PIX",  # symbol
-        "Pixie Chain",  # name
-        "evm-pix.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        8000,  # chain_id
-        60,  # slip44
-        "TELE",  # symbol
-        "Teleport",  # name
-        "evm-tele.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        8217,  # chain_id
-        8217,  # slip44
-        "KAIA",  # symbol
-        "Kaia",  # name
-        "evm-kaia.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        8453,  # chain_id
-        60,  # slip44
-        "ETH",  # symbol
-        "Base",  # name
-        "evm-base.png",  # name
-        0x0052FF,  # primary_color
-    )
-    yield (
-        8723,  # chain_id
-        479,  # slip44
-        "OLO",  # symbol
-        "TOOL Global",  # name
-        "evm-olo.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        8995,  # chain_id
-        60,  # slip44
-        "U+25B3",  # symbol
-        "bloxberg",  # name
-        "evm-u+25b3.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        9001,  # chain_id
-        60,  # slip44
-        "EVMOS",  # symbol
-        "Evmos",  # name
-        "evm-evmos.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        9100,  # chain_id
-        60,  # slip44
-        "GNC",  # symbol
-        "Genesis Coin",  # name
-        "evm-gnc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        10101,  # chain_id
-        60,  # slip44
-        "GEN",  # symbol
-        "Blockchain Genesis",  # name
-        "evm-gen.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        10823,  # chain_id
-        60,  # slip44
-        "CCP",  # symbol
-        "CryptoCoinPay",  # name
-        "evm-ccp.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        11111,  # chain_id
-        60,  # slip44
-        "WGM",  # symbol
-        "WAGMI",  # name
-        "evm-wgm.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        12052,  # chain_id
-        621,  # slip44
-        "ZERO",  # symbol
-        "Singularity ZERO",  # name
-        "evm-zero.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        13381,  # chain_id
-        60,  # slip44
-        "PHX",  # symbol
-        "Phoenix",  # name
-        "evm-phx.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        16000,  # chain_id
-        60,  # slip44
-        "MTT",  # symbol
-        "MetaDot",  # name
-        "evm-mtt.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        19515,  # chain_id
-        1,  # slip44
-        "tSEP",  # symbol
-        "SEC Testnet",  # name
-        "evm-tsep.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        19845,  # chain_id
-        60,  # slip44
-        "BTCIX",  # symbol
-        "BTCIX Network",  # name
-        "evm-btcix.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        24484,  # chain_id
-        227,  # slip44
-        "WEB",  # symbol
-        "Webchain",  # name
-        "evm-web.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        24734,  # chain_id
-        60,  # slip44
-        "MINTME",  # symbol
-        "MintMe.com Coin",  # name
-        "evm-mintme.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        31102,  # chain_id
-        31102,  # slip44
-        "ESN",  # symbol
-        "Ethersocial Network",  # name
-        "evm-esn.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        32659,  # chain_id
-        288,  # slip44
-        "FSN",  # symbol
-        "Fusion",  # name
-        "evm-fsn.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        39797,  # chain_id
-        39797,  # slip44
-        "NRG",  # symbol
-        "Energi",  # name
-        "evm-nrg.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        42069,  # chain_id
-        60,  # slip44
-        "peggle",  # symbol
-        "pegglecoin",  # name
-        "evm-peggle.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        42161,  # chain_id
-        60,  # slip44
-        "ETH",  # symbol
-        "Arbitrum One",  # name
-        "evm-arb1.png",  # name
-        0x28A0F0,  # primary_color
-    )
-    yield (
-        42220,  # chain_id
-        60,  # slip44
-        "CELO",  # symbol
-        "Celo",  # name
-        "evm-celo.png",  # name
-        0x35D07F,  # primary_color
-    )
-    yield (
-        43113,  # chain_id
-        1,  # slip44
-        "tAVAX",  # symbol
-        "Avalanche Fuji Testnet",  # name
-        "evm-tavax.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        43114,  # chain_id
-        9005,  # slip44
-        "AVAX",  # symbol
-        "Avalanche C-Chain",  # name
-        "evm-avax.png",  # name
-        0xE84142,  # primary_color
-    )
-    yield (
-        44787,  # chain_id
-        1,  # slip44
-        "tCELO",  # symbol
-        "Celo Alfajores Testnet",  # name
-        "evm-tcelo.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        47805,  # chain_id
-        60,  # slip44
-        "REI",  # symbol
-        "REI Network",  # name
-        "evm-rei.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        49797,  # chain_id
-        1,  # slip44
-        "tNRG",  # symbol
-        "Energi Testnet",  # name
-        "evm-tnrg.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        53935,  # chain_id
-        60,  # slip44
-        "JEWEL",  # symbol
-        "DFK Chain",  # name
-        "evm-jewel.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        59144,  # chain_id
-        60,  # slip44
-        "ETH",  # symbol
-        "Linea",  # name
-        "evm-linea.png",  # name
-        0xFFFFFF,  # primary_color
-    )
-    yield (
-        62320,  # chain_id
-        1,  # slip44
-        "tCELO",  # symbol
-        "Celo Baklava Testnet",  # name
-        "evm-tcelo.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        63000,  # chain_id
-        60,  # slip44
-        "ECS",  # symbol
-        "eSync Network",  # name
-        "evm-ecs.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        73799,  # chain_id
-        1,  # slip44
-        "tVT",  # symbol
-        "Energy Web Volta Testnet",  # name
-        "evm-tvt.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        73927,  # chain_id
-        60,  # slip44
-        "ETH",  # symbol
-        "Mixin Virtual Machine",  # name
-        "evm-mixin.png",  # name
-        0x5959D8,  # primary_color
-    )
-    yield (
-        78110,  # chain_id
-        1,  # slip44
-        "FIN",  # symbol
-        "Firenze test network",  # name
-        "evm-fin.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        80001,  # chain_id
-        1,  # slip44
-        "tMATIC",  # symbol
-        "Mumbai",  # name
-        "evm-tmatic.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        99999,  # chain_id
-        60,  # slip44
-        "UBC",  # symbol
-        "UB Smart Chain",  # name
-        "evm-ubc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        100000,  # chain_id
-        60,  # slip44
-        "QKC",  # symbol
-        "QuarkChain",  # name
-        "evm-qkc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        100001,  # chain_id
-        60,  # slip44
-        "QKC",  # symbol
-        "QuarkChain",  # name
-        "evm-qkc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        100002,  # chain_id
-        60,  # slip44
-        "QKC",  # symbol
-        "QuarkChain",  # name
-        "evm-qkc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        100003,  # chain_id
-        60,  # slip44
-        "QKC",  # symbol
-        "QuarkChain",  # name
-        "evm-qkc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        100004,  # chain_id
-        60,  # slip44
-        "QKC",  # symbol
-        "QuarkChain",  # name
-        "evm-qkc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        100005,  # chain_id
-        60,  # slip44
-        "QKC",  # symbol
-        "QuarkChain",  # name
-        "evm-qkc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        100006,  # chain_id
-        60,  # slip44
-        "QKC",  # symbol
-        "QuarkChain",  # name
-        "evm-qkc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        100007,  # chain_id
-        60,  # slip44
-        "QKC",  # symbol
-        "QuarkChain",  # name
-        "evm-qkc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        100008,  # chain_id
-        60,  # slip44
-        "QKC",  # symbol
-        "QuarkChain",  # name
-        "evm-qkc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        200625,  # chain_id
-        200625,  # slip44
-        "AKA",  # symbol
-        "Akroma",  # name
-        "evm-aka.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        201018,  # chain_id
-        60,  # slip44
-        "atp",  # symbol
-        "Alaya",  # name
-        "evm-atp.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        210425,  # chain_id
-        60,  # slip44
-        "lat",  # symbol
-        "PlatON",  # name
-        "evm-lat.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        246529,  # chain_id
-        246529,  # slip44
-        "ATS",  # symbol
-        "ARTIS sigma1",  # name
-        "evm-ats.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        246785,  # chain_id
-        1,  # slip44
-        "tATS",  # symbol
-        "ARTIS Testnet tau1",  # name
-        "evm-tats.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        281121,  # chain_id
-        60,  # slip44
-        "$OC",  # symbol
-        "Social Smart Chain",  # name
-        "evm-$oc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        333999,  # chain_id
-        60,  # slip44
-        "POLIS",  # symbol
-        "Polis",  # name
-        "evm-polis.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        888888,  # chain_id
-        60,  # slip44
-        "VS",  # symbol
-        "Vision",  # name
-        "evm-vs.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        955305,  # chain_id
-        1011,  # slip44
-        "ELV",  # symbol
-        "Eluvio Content Fabric",  # name
-        "evm-elv.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1313114,  # chain_id
-        1313114,  # slip44
-        "ETHO",  # symbol
-        "Etho Protocol",  # name
-        "evm-etho.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1313500,  # chain_id
-        60,  # slip44
-        "XERO",  # symbol
-        "Xerom",  # name
-        "evm-xero.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        7762959,  # chain_id
-        184,  # slip44
-        "MUSIC",  # symbol
-        "Musicoin",  # name
-        "evm-music.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        11155111,  # chain_id
-        1,  # slip44
-        "tETH",  # symbol
-        "Sepolia",  # name
-        "evm-teth.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        13371337,  # chain_id
-        60,  # slip44
-        "TPEP",  # symbol
-        "PepChain Churchill",  # name
-        "evm-tpep.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        18289463,  # chain_id
-        60,  # slip44
-        "ILT",  # symbol
-        "IOLite",  # name
-        "evm-ilt.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        20181205,  # chain_id
-        60,  # slip44
-        "QKI",  # symbol
-        "quarkblockchain",  # name
-        "evm-qki.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        28945486,  # chain_id
-        344,  # slip44
-        "AUX",  # symbol
-        "Auxilium Network",  # name
-        "evm-aux.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        35855456,  # chain_id
-        60,  # slip44
-        "JOYS",  # symbol
-        "Joys Digital",  # name
-        "evm-joys.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        61717561,  # chain_id
-        61717561,  # slip44
-        "AQUA",  # symbol
-        "Aquachain",  # name
-        "evm-aqua.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        99415706,  # chain_id
-        1,  # slip44
-        "TOYS",  # symbol
-        "Joys Digital TestNet",  # name
-        "evm-toys.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        245022934,  # chain_id
-        60,  # slip44
-        "NEON",  # symbol
-        "Neon EVM",  # name
-        "evm-neon.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        311752642,  # chain_id
-        60,  # slip44
-        "OLT",  # symbol
-        "OneLedger",  # name
-        "evm-olt.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1122334455,  # chain_id
-        60,  # slip44
-        "IPOS",  # symbol
-        "IPOS Network",  # name
-        "evm-ipos.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1313161554,  # chain_id
-        60,  # slip44
-        "ETH",  # symbol
-        "Aurora",  # name
-        "evm-aurora.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1666600000,  # chain_id
-        1023,  # slip44
-        "ONE",  # symbol
-        "Harmony",  # name
-        "evm-one.png",  # name
-        0x33D3D5,  # primary_color
-    )
-    yield (
-        1666600001,  # chain_id
-        1023,  # slip44
-        "ONE",  # symbol
-        "Harmony",  # name
-        "evm-one.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1666600002,  # chain_id
-        1023,  # slip44
-        "ONE",  # symbol
-        "Harmony",  # name
-        "evm-one.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1666600003,  # chain_id
-        1023,  # slip44
-        "ONE",  # symbol
-        "Harmony",  # name
-        "evm-one.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        2021121117,  # chain_id
-        60,  # slip44
-        "HOP",  # symbol
-        "DataHopper",  # name
-        "evm-hop.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        3125659152,  # chain_id
-        164,  # slip44
-        "PIRL",  # symbol
-        "Pirl",  # name
-        "evm-pirl.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        11297108109,  # chain_id
-        60,  # slip44
-        "PALM",  # symbol
-        "Palm",  # name
-        "evm-palm.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        197710212030,  # chain_id
-        60,  # slip44
-        "NTT",  # symbol
-        "Ntity",  # name
-        "evm-ntt.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        6022140761023,  # chain_id
-        60,  # slip44
-        "MOLE",  # symbol
-        "Molereum Network",  # name
-        "evm-mole.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        9798,  # chain_id
-        9798,  # slip44
-        "DTT",  # symbol
-        "Data Trade Chain",  # name
-        "evm-dtt.png",  # icon
-        0x1A2A5F,  # primary_color
-    )
-    yield (
-        1672,  # chain_id
-        1672,  # slip44
-        "PROS",  # symbol
-        "Pharos",  # name
-        "evm-pros.png",  # icon
-        0x00FF33,  # primary_color
+def _find_chain_id(chain_id: int) -> int:
+    """Return the offset of the network in `_NETWORKS`, or -1 if not found."""
+    if not 0 <= chain_id <= _MAX_CHAIN_ID:
+        return -1
+    key = chain_id.to_bytes(8, "big")
+
+    lo = 0
+    hi = len(_NETWORKS) // _ENTRY_LEN
+    while lo < hi:
+        mid = (lo + hi) // 2
+        entry = mid * _ENTRY_LEN
+        mid_key = _NETWORKS[entry : entry + 8]
+        if mid_key < key:
+            lo = mid + 1
+        elif mid_key > key:
+            hi = mid
+        else:
+            return entry
+    return -1
+
+
+def _network_info(entry: int) -> EthereumNetworkInfo:
+    offset = _NETWORKS[entry + 12] << 8 | _NETWORKS[entry + 13]
+    symbol = offset + 3  # skip primary_color
+    name = symbol + 1 + _NETWORK_DATA[symbol]
+    icon = name + 1 + _NETWORK_DATA[name]
+    icon_end = icon + 1 + _NETWORK_DATA[icon]
+    return EthereumNetworkInfo(
+        chain_id=int.from_bytes(_NETWORKS[entry : entry + 8], "big"),
+        slip44=int.from_bytes(_NETWORKS[entry + 8 : entry + 12], "big"),
+        symbol=_NETWORK_DATA[symbol + 1 : name].decode(),
+        name=_NETWORK_DATA[name + 1 : icon].decode(),
+        icon=_NETWORK_DATA[icon + 1 : icon_end].decode(),
+        primary_color=int.from_bytes(_NETWORK_DATA[offset:symbol], "big"),
     )
+
+
+# fmt: off
+# Sorted by chain_id. Each entry is: chain_id (uint64 BE), slip44 (uint32 BE),
+# offset of the network data in _NETWORK_DATA (uint16 BE).
+_NETWORKS = (
+    b"\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x3c\x00\x00"  # 1: Ethereum
+    b"\x00\x00\x00\x00\x00\x00\x00\x02\x00\x00\x00\x28\x00\x1c"  # 2: Expanse Network
+    b"\x00\x00\x00\x00\x00\x00\x00\x03\x00\x00\x00\x01\x00\x3f"  # 3: Ropsten
+    b"\x00\x00\x00\x00\x00\x00\x00\x04\x00\x00\x00\x01\x00\x5c"  # 4: Rinkeby
+    b"\x00\x00\x00\x00\x00\x00\x00\x05\x00\x00\x00\x01\x00\x79"  # 5: Goerli
+    b"\x00\x00\x00\x00\x00\x00\x00\x06\x00\x00\x00\x01\x00\x95"  # 6: Kotti Testnet
+    b"\x00\x00\x00\x00\x00\x00\x00\x07\x00\x00\x00\x3c\x00\xb8"  # 7: ThaiChain
+    b"\x00\x00\x00\x00\x00\x00\x00\x08\x00\x00\x00\x6c\x00\xd5"  # 8: Ubiq
+    b"\x00\x00\x00\x00\x00\x00\x00\x09\x00\x00\x00\x01\x00\xed"  # 9: Ubiq Network Testnet
+    b"\x00\x00\x00\x00\x00\x00\x00\x0a\x00\x00\x00\x3c\x01\x17"  # 10: OP
+    b"\x00\x00\x00\x00\x00\x00\x00\x0b\x00\x00\x03\x94\x01\x2e"  # 11: Metadium
+    b"\x00\x00\x00\x00\x00\x00\x00\x0c\x00\x00\x00\x01\x01\x4c"  # 12: Metadium Testnet
+    b"\x00\x00\x00\x00\x00\x00\x00\x0d\x00\x00\x00\x01\x01\x72"  # 13: Diode Testnet Staging
+    b"\x00\x00\x00\x00\x00\x00\x00\x0e\x00\x00\x00\x3c\x01\xa3"  # 14: Flare
+    b"\x00\x00\x00\x00\x00\x00\x00\x0f\x00\x00\x00\x3c\x01\xbc"  # 15: Diode Prenet
+    b"\x00\x00\x00\x00\x00\x00\x00\x10\x00\x00\x00\x01\x01\xe0"  # 16: Songbird Testnet Coston
+    b"\x00\x00\x00\x00\x00\x00\x00\x11\x00\x00\x00\x3c\x02\x0f"  # 17: ThaiChain 2.0 ThaiFi
+    b"\x00\x00\x00\x00\x00\x00\x00\x12\x00\x00\x00\x01\x02\x37"  # 18: ThunderCore Testnet
+    b"\x00\x00\x00\x00\x00\x00\x00\x13\x00\x00\x00\x3c\x02\x5e"  # 19: Songbird Canary-Network
+    b"\x00\x00\x00\x00\x00\x00\x00\x14\x00\x00\x00\x3c\x02\x89"  # 20: Elastos Smart Chain
+    b"\x00\x00\x00\x00\x00\x00\x00\x19\x00\x00\x00\x3c\x02\xb0"  # 25: Cronos
+    b"\x00\x00\x00\x00\x00\x00\x00\x1b\x00\x00\x00\x3c\x02\xca"  # 27: ShibaChain
+    b"\x00\x00\x00\x00\x00\x00\x00\x1d\x00\x00\x00\x3c\x02\xea"  # 29: Genesis L1
+    b"\x00\x00\x00\x00\x00\x00\x00\x1e\x00\x00\x00\x89\x03\x06"  # 30: Rootstock
+    b"\x00\x00\x00\x00\x00\x00\x00\x1f\x00\x00\x00\x01\x03\x25"  # 31: Rootstock Testnet
+    b"\x00\x00\x00\x00\x00\x00\x00\x21\x00\x00\x00\x3c\x03\x4e"  # 33: GoodData
+    b"\x00\x00\x00\x00\x00\x00\x00\x23\x00\x00\x00\x3c\x03\x6c"  # 35: TBWG Chain
+    b"\x00\x00\x00\x00\x00\x00\x00\x26\x00\x00\x02\x1a\x03\x8a"  # 38: Valorbit
+    b"\x00\x00\x00\x00\x00\x00\x00\x28\x00\x00\x00\x3c\x03\xa6"  # 40: Telos EVM
+    b"\x00\x00\x00\x00\x00\x00\x00\x2c\x00\x00\x00\x3c\x03\xc5"  # 44: Crab Network
+    b"\x00\x00\x00\x00\x00\x00\x00\x32\x00\x00\x00\x3c\x03\xe7"  # 50: XDC Network
+    b"\x00\x00\x00\x00\x00\x00\x00\x33\x00\x00\x00\x3c\x04\x06"  # 51: XDC Apothem Network
+    b"\x00\x00\x00\x00\x00\x00\x00\x34\x00\x00\x00\x3c\x04\x2f"  # 52: CoinEx Smart Chain
+    b"\x00\x00\x00\x00\x00\x00\x00\x37\x00\x00\x00\x3c\x04\x55"  # 55: Zyx
+    b"\x00\x00\x00\x00\x00\x00\x00\x38\x00\x00\x02\xca\x04\x6c"  # 56: BNB Smart Chain
+    b"\x00\x00\x00\x00\x00\x00\x00\x3a\x00\x00\x00\x3c\x04\x8f"  # 58: Ontology
+    b"\x00\x00\x00\x00\x00\x00\x00\x3c\x00\x00\x17\xac\x04\xab"  # 60: GoChain
+    b"\x00\x00\x00\x00\x00\x00\x00\x3d\x00\x00\x00\x3d\x04\xc4"  # 61: Ethereum Classic
+    b"\x00\x00\x00\x00\x00\x00\x00\x3e\x00\x00\x00\x01\x04\xe8"  # 62: Morden Testnet
+    b"\x00\x00\x00\x00\x00\x00\x00\x3f\x00\x00\x00\x01\x05\x0c"  # 63: Mordor Testnet
+    b"\x00\x00\x00\x00\x00\x00\x00\x40\x00\x00\x00\xa3\x05\x32"  # 64: Ellaism
+    b"\x00\x00\x00\x00\x00\x00\x00\x42\x00\x00\x00\x3c\x05\x4f"  # 66: OKXChain
+    b"\x00\x00\x00\x00\x00\x00\x00\x43\x00\x00\x00\x01\x05\x6b"  # 67: DBChain Testnet
+    b"\x00\x00\x00\x00\x00\x00\x00\x4a\x00\x00\x00\x3c\x05\x90"  # 74: IDChain
+    b"\x00\x00\x00\x00\x00\x00\x00\x4c\x00\x00\x00\x4c\x05\xad"  # 76: Mix
+    b"\x00\x00\x00\x00\x00\x00\x00\x4d\x00\x00\x00\x3c\x05\xc4"  # 77: POA Network Sokol
+    b"\x00\x00\x00\x00\x00\x00\x00\x4e\x00\x00\x00\x3c\x05\xeb"  # 78: PrimusChain
+    b"\x00\x00\x00\x00\x00\x00\x00\x50\x00\x00\x00\x3c\x06\x0c"  # 80: GeneChain
+    b"\x00\x00\x00\x00\x00\x00\x00\x52\x00\x00\x00\x3c\x06\x29"  # 82: Meter
+    b"\x00\x00\x00\x00\x00\x00\x00\x57\x00\x00\x00\x3c\x06\x42"  # 87: Nova Network
+    b"\x00\x00\x00\x00\x00\x00\x00\x58\x00\x00\x03\x79\x06\x62"  # 88: Viction
+    b"\x00\x00\x00\x00\x00\x00\x00\x5a\x00\x00\x00\x3c\x06\x7d"  # 90: Garizon Stage0
+    b"\x00\x00\x00\x00\x00\x00\x00\x61\x00\x00\x00\x01\x06\x9f"  # 97: BNB Smart Chain Testnet
+    b"\x00\x00\x00\x00\x00\x00\x00\x63\x00\x00\x00\xb2\x06\xcc"  # 99: POA Network Core
+    b"\x00\x00\x00\x00\x00\x00\x00\x64\x00\x00\x02\xbc\x06\xf0"  # 100: Gnosis
+    b"\x00\x00\x00\x00\x00\x00\x00\x65\x00\x00\x01\xd0\x07\x0c"  # 101: EtherInc
+    b"\x00\x00\x00\x00\x00\x00\x00\x69\x00\x00\x00\x3c\x07\x28"  # 105: Web3Games Devnet
+    b"\x00\x00\x00\x00\x00\x00\x00\x6a\x00\x00\x00\x3c\x07\x4c"  # 106: Velas EVM
+    b"\x00\x00\x00\x00\x00\x00\x00\x6c\x00\x00\x03\xe9\x07\x69"  # 108: ThunderCore
+    b"\x00\x00\x00\x00\x00\x00\x00\x6f\x00\x00\x00\x3c\x07\x86"  # 111: EtherLite Chain
+    b"\x00\x00\x00\x00\x00\x00\x00\x7a\x00\x00\x00\x3c\x07\xa9"  # 122: Fuse
+    b"\x00\x00\x00\x00\x00\x00\x00\x7b\x00\x00\x00\x3c\x07\xc3"  # 123: Fuse Sparknet
+    b"\x00\x00\x00\x00\x00\x00\x00\x7c\x00\x00\x00\x3c\x07\xe8"  # 124: Decentralized Web
+    b"\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x00\x00\x7e\x08\x0d"  # 126: OYchain
+    b"\x00\x00\x00\x00\x00\x00\x00\x7f\x00\x00\x00\x7f\x08\x26"  # 127: Factory 127
+    b"\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\x03\xf2\x08\x47"  # 128: Huobi ECO Chain
+    b"\x00\x00\x00\x00\x00\x00\x00\x89\x00\x00\x03\xc6\x08\x68"  # 137: Polygon
+    b"\x00\x00\x00\x00\x00\x00\x00\x8e\x00\x00\x00\x3c\x08\x85"  # 142: DAX CHAIN
+    b"\x00\x00\x00\x00\x00\x00\x00\x92\x00\x00\x00\x3c\x08\xa2"  # 146: Sonic
+    b"\x00\x00\x00\x00\x00\x00\x00\xa2\x00\x00\x00\x01\x08\xb7"  # 162: Lightstreams Testnet
+    b"\x00\x00\x00\x00\x00\x00\x00\xa3\x00\x00\x00\x3c\x08\xe1"  # 163: Lightstreams
+    b"\x00\x00\x00\x00\x00\x00\x00\xb1\x00\x00\x00\x3c\x09\x01"  # 177: HashKey Chain
+    b"\x00\x00\x00\x00\x00\x00\x00\xba\x00\x00\x00\x3c\x09\x22"  # 186: Seele
+    b"\x00\x00\x00\x00\x00\x00\x00\xbc\x00\x00\x00\x3c\x09\x3f"  # 188: BMC
+    b"\x00\x00\x00\x00\x00\x00\x00\xc7\x00\x00\x00\x3c\x09\x56"  # 199: BitTorrent Chain
+    b"\x00\x00\x00\x00\x00\x00\x00\xd3\x00\x00\x00\x3c\x09\x7a"  # 211: Freight Trust Network
+    b"\x00\x00\x00\x00\x00\x00\x00\xde\x00\x00\x08\xad\x09\xa3"  # 222: Permission
+    b"\x00\x00\x00\x00\x00\x00\x00\xe1\x00\x00\x00\x3c\x09\xc1"  # 225: LACHAIN
+    b"\x00\x00\x00\x00\x00\x00\x00\xf6\x00\x00\x00\xf6\x09\xda"  # 246: Energy Web Chain
+    b"\x00\x00\x00\x00\x00\x00\x00\xfa\x00\x00\x00\x3c\x09\xfe"  # 250: Fantom Opera
+    b"\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x01\x0a\x1e"  # 256: Huobi ECO Chain Testnet
+    b"\x00\x00\x00\x00\x00\x00\x01\x02\x00\x00\x00\x3c\x0a\x4b"  # 258: Setheum
+    b"\x00\x00\x00\x00\x00\x00\x01\x06\x00\x00\x00\x3c\x0a\x68"  # 262: SUR Blockchain Network
+    b"\x00\x00\x00\x00\x00\x00\x01\x0d\x00\x00\x01\x0d\x0a\x92"  # 269: High Performance Blockchain
+    b"\x00\x00\x00\x00\x00\x00\x01\x20\x00\x00\x00\x3c\x0a\xc1"  # 288: Boba Network
+    b"\x00\x00\x00\x00\x00\x00\x01\x3a\x00\x00\x01\xcd\x0a\xe2"  # 314: Filecoin
+    b"\x00\x00\x00\x00\x00\x00\x01\x41\x00\x00\x02\x81\x0b\x03"  # 321: KCC
+    b"\x00\x00\x00\x00\x00\x00\x01\x44\x00\x00\x00\x3c\x0b\x1a"  # 324: zkSync
+    b"\x00\x00\x00\x00\x00\x00\x01\x4d\x00\x00\x00\x3c\x0b\x3b"  # 333: Web3Q
+    b"\x00\x00\x00\x00\x00\x00\x01\x50\x00\x00\x00\x3c\x0b\x54"  # 336: Shiden
+    b"\x00\x00\x00\x00\x00\x00\x01\x71\x00\x00\x00\x3c\x0b\x6e"  # 369: PulseChain
+    b"\x00\x00\x00\x00\x00\x00\x01\xa4\x00\x00\x00\x01\x0b\x8c"  # 420: Optimism Goerli Testnet
+    b"\x00\x00\x00\x00\x00\x00\x01\xf3\x00\x00\x01\xf3\x0b\xb9"  # 499: Rupaya
+    b"\x00\x00\x00\x00\x00\x00\x02\x00\x00\x00\x05\xe8\x0b\xd5"  # 512: Double-A Chain
+    b"\x00\x00\x00\x00\x00\x00\x02\x2b\x00\x00\x00\x3c\x0b\xf7"  # 555: Vela1 Chain
+    b"\x00\x00\x00\x00\x00\x00\x02\x2e\x00\x00\x00\x3c\x0c\x1a"  # 558: Tao Network
+    b"\x00\x00\x00\x00\x00\x00\x02\x53\x00\x00\x00\x01\x0c\x39"  # 595: Acala Mandala Testnet TC9
+    b"\x00\x00\x00\x00\x00\x00\x02\xae\x00\x00\x02\xae\x0c\x6a"  # 686: Karura Network
+    b"\x00\x00\x00\x00\x00\x00\x02\xc3\x00\x00\x00\x3c\x0c\x8c"  # 707: BlockChain Station
+    b"\x00\x00\x00\x00\x00\x00\x03\x09\x00\x00\x00\x3c\x0c\xb2"  # 777: cheapETH
+    b"\x00\x00\x00\x00\x00\x00\x03\x13\x00\x00\x03\x13\x0c\xce"  # 787: Acala Network
+    b"\x00\x00\x00\x00\x00\x00\x03\x23\x00\x00\x00\x3c\x0c\xef"  # 803: Haic
+    b"\x00\x00\x00\x00\x00\x00\x03\x34\x00\x00\x03\x34\x0d\x09"  # 820: Callisto
+    b"\x00\x00\x00\x00\x00\x00\x03\x35\x00\x00\x00\x01\x0d\x25"  # 821: Callisto Testnet Deprecated
+    b"\x00\x00\x00\x00\x00\x00\x03\x78\x00\x57\x41\x4e\x0d\x56"  # 888: Wanchain
+    b"\x00\x00\x00\x00\x00\x00\x03\xd1\x00\x00\x00\x3c\x0d\x72"  # 977: Nepal Blockchain Network
+    b"\x00\x00\x00\x00\x00\x00\x03\xe6\x00\x00\x00\x3c\x0d\xa0"  # 998: Lucky Network
+    b"\x00\x00\x00\x00\x00\x00\x03\xe9\x00\x00\x00\x01\x0d\xc1"  # 1001: Kaia Kairos Testnet
+    b"\x00\x00\x00\x00\x00\x00\x03\xef\x00\x00\x00\x01\x0d\xec"  # 1007: Newton Testnet
+    b"\x00\x00\x00\x00\x00\x00\x03\xf2\x00\x00\x03\xfc\x0e\x10"  # 1010: Evrice Network
+    b"\x00\x00\x00\x00\x00\x00\x03\xf4\x00\x00\x00\x3c\x0e\x32"  # 1012: Newton
+    b"\x00\x00\x00\x00\x00\x00\x03\xfe\x00\x00\x00\x3c\x0e\x4c"  # 1022: Sakura
+    b"\x00\x00\x00\x00\x00\x00\x04\x00\x00\x00\x00\x3c\x0e\x66"  # 1024: CLV Parachain
+    b"\x00\x00\x00\x00\x00\x00\x04\x06\x00\x00\x00\x3c\x0e\x87"  # 1030: Conflux eSpace
+    b"\x00\x00\x00\x00\x00\x00\x04\x40\x00\x00\x00\x3c\x0e\xa9"  # 1088: Metis Andromeda
+    b"\x00\x00\x00\x00\x00\x00\x04\x73\x00\x00\x00\x3c\x0e\xd0"  # 1139: MathChain
+    b"\x00\x00\x00\x00\x00\x00\x04\x74\x00\x00\x00\x01\x0e\xef"  # 1140: MathChain Testnet
+    b"\x00\x00\x00\x00\x00\x00\x04\xad\x00\x00\x00\x3c\x0f\x18"  # 1197: Iora Chain
+    b"\x00\x00\x00\x00\x00\x00\x04\xb2\x00\x00\x00\x3c\x0f\x38"  # 1202: World Trade Technical Chain
+    b"\x00\x00\x00\x00\x00\x00\x04\xbd\x00\x00\x00\x3c\x0f\x67"  # 1213: Popcateum
+    b"\x00\x00\x00\x00\x00\x00\x04\xbe\x00\x00\x00\x3c\x0f\x84"  # 1214: EnterChain
+    b"\x00\x00\x00\x00\x00\x00\x05\x00\x00\x00\x00\x3c\x0f\xa6"  # 1280: HALO
+    b"\x00\x00\x00\x00\x00\x00\x05\x04\x00\x00\x00\x3c\x0f\xbc"  # 1284: Moonbeam
+    b"\x00\x00\x00\x00\x00\x00\x05\x05\x00\x00\x00\x3c\x0f\xda"  # 1285: Moonriver
+    b"\x00\x00\x00\x00\x00\x00\x05\x07\x00\x00\x00\x01\x0f\xf9"  # 1287: Moonbase Alpha
+    b"\x00\x00\x00\x00\x00\x00\x06\x52\x00\x00\x00\x3c\x10\x1b"  # 1618: Catecoin Chain
+    b"\x00\x00\x00\x00\x00\x00\x06\x79\x00\x00\x00\x3c\x10\x3f"  # 1657: Btachain
+    b"\x00\x00\x00\x00\x00\x00\x06\x88\x00\x00\x06\x88\x10\x5b"  # 1672: Pharos
+    b"\x00\x00\x00\x00\x00\x00\x07\x40\x00\x00\x00\x3c\x10\x77"  # 1856: Teslafunds
+    b"\x00\x00\x00\x00\x00\x00\x07\x6a\x00\x00\x00\x3c\x10\x95"  # 1898: BON Network
+    b"\x00\x00\x00\x00\x00\x00\x07\xc3\x00\x00\x07\xc3\x10\xb4"  # 1987: EtherGem
+    b"\x00\x00\x00\x00\x00\x00\x07\xe5\x00\x00\x02\x0b\x10\xd2"  # 2021: Edgeware EdgeEVM
+    b"\x00\x00\x00\x00\x00\x00\x07\xe9\x00\x00\x03\xf0\x10\xf6"  # 2025: Rangers Protocol
+    b"\x00\x00\x00\x00\x00\x00\x08\x34\x00\x00\x00\x3c\x11\x1a"  # 2100: Ecoball
+    b"\x00\x00\x00\x00\x00\x00\x08\xa5\x00\x00\x00\x3c\x11\x35"  # 2213: Evanesco
+    b"\x00\x00\x00\x00\x00\x00\x09\xff\x00\x00\x00\x3c\x11\x51"  # 2559: Kortho
+    b"\x00\x00\x00\x00\x00\x00\x0d\x48\x00\x00\x00\x3c\x11\x6b"  # 3400: Paribu Net
+    b"\x00\x00\x00\x00\x00\x00\x0f\x7e\x00\x00\x00\x3c\x11\x89"  # 3966: DYNO
+    b"\x00\x00\x00\x00\x00\x00\x12\x51\x00\x00\x00\x3c\x11\xa3"  # 4689: IoTeX Network
+    b"\x00\x00\x00\x00\x00\x00\x13\x88\x00\x00\x00\x3c\x11\xc6"  # 5000: Mantle
+    b"\x00\x00\x00\x00\x00\x00\x14\x4d\x00\x00\x00\x3c\x11\xe0"  # 5197: EraSwap
+    b"\x00\x00\x00\x00\x00\x00\x14\xc3\x00\x00\x00\x3c\x11\xf9"  # 5315: Uzmi Network
+    b"\x00\x00\x00\x00\x00\x00\x16\xed\x00\x00\x00\x3c\x12\x1b"  # 5869: Wegochain Rubidium
+    b"\x00\x00\x00\x00\x00\x00\x19\xe2\x00\x00\x00\x3c\x12\x41"  # 6626: Pixie Chain
+    b"\x00\x00\x00\x00\x00\x00\x1f\x40\x00\x00\x00\x3c\x12\x60"  # 8000: Teleport
+    b"\x00\x00\x00\x00\x00\x00\x20\x19\x00\x00\x20\x19\x12\x7e"  # 8217: Kaia
+    b"\x00\x00\x00\x00\x00\x00\x21\x05\x00\x00\x00\x3c\x12\x98"  # 8453: Base
+    b"\x00\x00\x00\x00\x00\x00\x22\x13\x00\x00\x01\xdf\x12\xb1"  # 8723: TOOL Global
+    b"\x00\x00\x00\x00\x00\x00\x23\x23\x00\x00\x00\x3c\x12\xd0"  # 8995: bloxberg
+    b"\x00\x00\x00\x00\x00\x00\x23\x29\x00\x00\x00\x3c\x12\xf2"  # 9001: Evmos
+    b"\x00\x00\x00\x00\x00\x00\x23\x8c\x00\x00\x00\x3c\x13\x0f"  # 9100: Genesis Coin
+    b"\x00\x00\x00\x00\x00\x00\x26\x46\x00\x00\x26\x46\x13\x2f"  # 9798: Data Trade Chain
+    b"\x00\x00\x00\x00\x00\x00\x27\x75\x00\x00\x00\x3c\x13\x53"  # 10101: Blockchain Genesis
+    b"\x00\x00\x00\x00\x00\x00\x2a\x47\x00\x00\x00\x3c\x13\x79"  # 10823: CryptoCoinPay
+    b"\x00\x00\x00\x00\x00\x00\x2b\x67\x00\x00\x00\x3c\x13\x9a"  # 11111: WAGMI
+    b"\x00\x00\x00\x00\x00\x00\x2f\x14\x00\x00\x02\x6d\x13\xb3"  # 12052: Singularity ZERO
+    b"\x00\x00\x00\x00\x00\x00\x34\x45\x00\x00\x00\x3c\x13\xd9"  # 13381: Phoenix
+    b"\x00\x00\x00\x00\x00\x00\x3e\x80\x00\x00\x00\x3c\x13\xf4"  # 16000: MetaDot
+    b"\x00\x00\x00\x00\x00\x00\x4c\x3b\x00\x00\x00\x01\x14\x0f"  # 19515: SEC Testnet
+    b"\x00\x00\x00\x00\x00\x00\x4d\x85\x00\x00\x00\x3c\x14\x30"  # 19845: BTCIX Network
+    b"\x00\x00\x00\x00\x00\x00\x5f\xa4\x00\x00\x00\xe3\x14\x55"  # 24484: Webchain
+    b"\x00\x00\x00\x00\x00\x00\x60\x9e\x00\x00\x00\x3c\x14\x71"  # 24734: MintMe.com Coin
+    b"\x00\x00\x00\x00\x00\x00\x79\x7e\x00\x00\x79\x7e\x14\x9a"  # 31102: Ethersocial Network
+    b"\x00\x00\x00\x00\x00\x00\x7f\x93\x00\x00\x01\x20\x14\xc1"  # 32659: Fusion
+    b"\x00\x00\x00\x00\x00\x00\x9b\x75\x00\x00\x9b\x75\x14\xdb"  # 39797: Energi
+    b"\x00\x00\x00\x00\x00\x00\xa4\x55\x00\x00\x00\x3c\x14\xf5"  # 42069: pegglecoin
+    b"\x00\x00\x00\x00\x00\x00\xa4\xb1\x00\x00\x00\x3c\x15\x19"  # 42161: Arbitrum One
+    b"\x00\x00\x00\x00\x00\x00\xa4\xec\x00\x00\x00\x3c\x15\x3a"  # 42220: Celo
+    b"\x00\x00\x00\x00\x00\x00\xa8\x69\x00\x00\x00\x01\x15\x54"  # 43113: Avalanche Fuji Testnet
+    b"\x00\x00\x00\x00\x00\x00\xa8\x6a\x00\x00\x23\x2d\x15\x82"  # 43114: Avalanche C-Chain
+    b"\x00\x00\x00\x00\x00\x00\xae\xf3\x00\x00\x00\x01\x15\xa9"  # 44787: Celo Alfajores Testnet
+    b"\x00\x00\x00\x00\x00\x00\xba\xbd\x00\x00\x00\x3c\x15\xd7"  # 47805: REI Network
+    b"\x00\x00\x00\x00\x00\x00\xc2\x85\x00\x00\x00\x01\x15\xf6"  # 49797: Energi Testnet
+    b"\x00\x00\x00\x00\x00\x00\xd2\xaf\x00\x00\x00\x3c\x16\x1a"  # 53935: DFK Chain
+    b"\x00\x00\x00\x00\x00\x00\xe7\x08\x00\x00\x00\x3c\x16\x3b"  # 59144: Linea
+    b"\x00\x00\x00\x00\x00\x00\xf3\x70\x00\x00\x00\x01\x16\x56"  # 62320: Celo Baklava Testnet
+    b"\x00\x00\x00\x00\x00\x00\xf6\x18\x00\x00\x00\x3c\x16\x82"  # 63000: eSync Network
+    b"\x00\x00\x00\x00\x00\x01\x20\x47\x00\x00\x00\x01\x16\xa3"  # 73799: Energy Web Volta Testnet
+    b"\x00\x00\x00\x00\x00\x01\x20\xc7\x00\x00\x00\x3c\x16\xcf"  # 73927: Mixin Virtual Machine
+    b"\x00\x00\x00\x00\x00\x01\x31\x1e\x00\x00\x00\x01\x16\xfa"  # 78110: Firenze test network
+    b"\x00\x00\x00\x00\x00\x01\x38\x81\x00\x00\x00\x01\x17\x22"  # 80001: Mumbai
+    b"\x00\x00\x00\x00\x00\x01\x86\x9f\x00\x00\x00\x3c\x17\x42"  # 99999: UB Smart Chain
+    b"\x00\x00\x00\x00\x00\x01\x86\xa0\x00\x00\x00\x3c\x17\x64"  # 100000: QuarkChain
+    b"\x00\x00\x00\x00\x00\x01\x86\xa1\x00\x00\x00\x3c\x17\x82"  # 100001: QuarkChain
+    b"\x00\x00\x00\x00\x00\x01\x86\xa2\x00\x00\x00\x3c\x17\xa0"  # 100002: QuarkChain
+    b"\x00\x00\x00\x00\x00\x01\x86\xa3\x00\x00\x00\x3c\x17\xbe"  # 100003: QuarkChain
+    b"\x00\x00\x00\x00\x00\x01\x86\xa4\x00\x00\x00\x3c\x17\xdc"  # 100004: QuarkChain
+    b"\x00\x00\x00\x00\x00\x01\x86\xa5\x00\x00\x00\x3c\x17\xfa"  # 100005: QuarkChain
+    b"\x00\x00\x00\x00\x00\x01\x86\xa6\x00\x00\x00\x3c\x18\x18"  # 100006: QuarkChain
+    b"\x00\x00\x00\x00\x00\x01\x86\xa7\x00\x00\x00\x3c\x18\x36"  # 100007: QuarkChain
+    b"\x00\x00\x00\x00\x00\x01\x86\xa8\x00\x00\x00\x3c\x18\x54"  # 100008: QuarkChain
+    b"\x00\x00\x00\x00\x00\x03\x0f\xb1\x00\x03\x0f\xb1\x18\x72"  # 200625: Akroma
+    b"\x00\x00\x00\x00\x00\x03\x11\x3a\x00\x00\x00\x3c\x18\x8c"  # 201018: Alaya
+    b"\x00\x00\x00\x00\x00\x03\x35\xf9\x00\x00\x00\x3c\x18\xa5"  # 210425: PlatON
+    b"\x00\x00\x00\x00\x00\x03\xc3\x01\x00\x03\xc3\x01\x18\xbf"  # 246529: ARTIS sigma1
+    b"\x00\x00\x00\x00\x00\x03\xc4\x01\x00\x00\x00\x01\x18\xdf"  # 246785: ARTIS Testnet tau1
+    b"\x00\x00\x00\x00\x00\x04\x4a\x21\x00\x00\x00\x3c\x19\x07"  # 281121: Social Smart Chain
+    b"\x00\x00\x00\x00\x00\x05\x18\xaf\x00\x00\x00\x3c\x19\x2d"  # 333999: Polis
+    b"\x00\x00\x00\x00\x00\x0d\x90\x38\x00\x00\x00\x3c\x19\x4a"  # 888888: Vision
+    b"\x00\x00\x00\x00\x00\x0e\x93\xa9\x00\x00\x03\xf3\x19\x62"  # 955305: Eluvio Content Fabric
+    b"\x00\x00\x00\x00\x00\x14\x09\x5a\x00\x14\x09\x5a\x19\x8b"  # 1313114: Etho Protocol
+    b"\x00\x00\x00\x00\x00\x14\x0a\xdc\x00\x00\x00\x3c\x19\xae"  # 1313500: Xerom
+    b"\x00\x00\x00\x00\x00\x76\x74\x0f\x00\x00\x00\xb8\x19\xc9"  # 7762959: Musicoin
+    b"\x00\x00\x00\x00\x00\xaa\x36\xa7\x00\x00\x00\x01\x19\xe9"  # 11155111: Sepolia
+    b"\x00\x00\x00\x00\x00\xcc\x07\xc9\x00\x00\x00\x3c\x1a\x06"  # 13371337: PepChain Churchill
+    b"\x00\x00\x00\x00\x01\x17\x13\x37\x00\x00\x00\x3c\x1a\x2e"  # 18289463: IOLite
+    b"\x00\x00\x00\x00\x01\x33\xf0\xd5\x00\x00\x00\x3c\x1a\x48"  # 20181205: quarkblockchain
+    b"\x00\x00\x00\x00\x01\xb9\xac\x4e\x00\x00\x01\x58\x1a\x6b"  # 28945486: Auxilium Network
+    b"\x00\x00\x00\x00\x02\x23\x1c\x60\x00\x00\x00\x3c\x1a\x8f"  # 35855456: Joys Digital
+    b"\x00\x00\x00\x00\x03\xad\xbc\x39\x03\xad\xbc\x39\x1a\xb1"  # 61717561: Aquachain
+    b"\x00\x00\x00\x00\x05\xec\xf6\x9a\x00\x00\x00\x01\x1a\xd0"  # 99415706: Joys Digital TestNet
+    b"\x00\x00\x00\x00\x0e\x9a\xc0\xd6\x00\x00\x00\x3c\x1a\xfa"  # 245022934: Neon EVM
+    b"\x00\x00\x00\x00\x12\x94\xf7\xc2\x00\x00\x00\x3c\x1b\x18"  # 311752642: OneLedger
+    b"\x00\x00\x00\x00\x42\xe5\x76\xf7\x00\x00\x00\x3c\x1b\x35"  # 1122334455: IPOS Network
+    b"\x00\x00\x00\x00\x4e\x45\x41\x52\x00\x00\x00\x3c\x1b\x57"  # 1313161554: Aurora
+    b"\x00\x00\x00\x00\x63\x56\x4c\x40\x00\x00\x03\xff\x1b\x74"  # 1666600000: Harmony
+    b"\x00\x00\x00\x00\x63\x56\x4c\x41\x00\x00\x03\xff\x1b\x8f"  # 1666600001: Harmony
+    b"\x00\x00\x00\x00\x63\x56\x4c\x42\x00\x00\x03\xff\x1b\xaa"  # 1666600002: Harmony
+    b"\x00\x00\x00\x00\x63\x56\x4c\x43\x00\x00\x03\xff\x1b\xc5"  # 1666600003: Harmony
+    b"\x00\x00\x00\x00\x78\x77\xdc\x5d\x00\x00\x00\x3c\x1b\xe0"  # 2021121117: DataHopper
+    b"\x00\x00\x00\x00\xba\x4d\xc6\x10\x00\x00\x00\xa4\x1b\xfe"  # 3125659152: Pirl
+    b"\x00\x00\x00\x02\xa1\x5c\x30\x8d\x00\x00\x00\x3c\x1c\x18"  # 11297108109: Palm
+    b"\x00\x00\x00\x2e\x08\x72\x6b\xbe\x00\x00\x00\x3c\x1c\x32"  # 197710212030: Ntity
+    b"\x00\x00\x05\x7a\x23\x8f\x93\xbf\x00\x00\x00\x3c\x1c\x4b"  # 6022140761023: Molereum Network
+)
+
+# Sorted by slip44, pointing to the first network with that slip44.
+_SLIP44_INDEX = (
+    b"\x00\x00\x00\x01\x00\x02"  # 1: Ropsten
+    b"\x00\x00\x00\x28\x00\x01"  # 40: Expanse Network
+    b"\x00\x00\x00\x3c\x00\x00"  # 60: Ethereum
+    b"\x00\x00\x00\x3d\x00\x25"  # 61: Ethereum Classic
+    b"\x00\x00\x00\x4c\x00\x2c"  # 76: Mix
+    b"\x00\x00\x00\x6c\x00\x07"  # 108: Ubiq
+    b"\x00\x00\x00\x7e\x00\x3f"  # 126: OYchain
+    b"\x00\x00\x00\x7f\x00\x40"  # 127: Factory 127
+    b"\x00\x00\x00\x89\x00\x17"  # 137: Rootstock
+    b"\x00\x00\x00\xa3\x00\x28"  # 163: Ellaism
+    b"\x00\x00\x00\xa4\x00\xdc"  # 164: Pirl
+    b"\x00\x00\x00\xb2\x00\x35"  # 178: POA Network Core
+    b"\x00\x00\x00\xb8\x00\xca"  # 184: Musicoin
+    b"\x00\x00\x00\xe3\x00\xa0"  # 227: Webchain
+    b"\x00\x00\x00\xf6\x00\x4e"  # 246: Energy Web Chain
+    b"\x00\x00\x01\x0d\x00\x53"  # 269: High Performance Blockchain
+    b"\x00\x00\x01\x20\x00\xa3"  # 288: Fusion
+    b"\x00\x00\x01\x58\x00\xcf"  # 344: Auxilium Network
+    b"\x00\x00\x01\xcd\x00\x55"  # 461: Filecoin
+    b"\x00\x00\x01\xd0\x00\x37"  # 464: EtherInc
+    b"\x00\x00\x01\xdf\x00\x93"  # 479: TOOL Global
+    b"\x00\x00\x01\xf3\x00\x5c"  # 499: Rupaya
+    b"\x00\x00\x02\x0b\x00\x83"  # 523: Edgeware EdgeEVM
+    b"\x00\x00\x02\x1a\x00\x1b"  # 538: Valorbit
+    b"\x00\x00\x02\x6d\x00\x9b"  # 621: Singularity ZERO
+    b"\x00\x00\x02\x81\x00\x56"  # 641: KCC
+    b"\x00\x00\x02\xae\x00\x61"  # 686: Karura Network
+    b"\x00\x00\x02\xbc\x00\x36"  # 700: Gnosis
+    b"\x00\x00\x02\xca\x00\x22"  # 714: BNB Smart Chain
+    b"\x00\x00\x03\x13\x00\x64"  # 787: Acala Network
+    b"\x00\x00\x03\x34\x00\x66"  # 820: Callisto
+    b"\x00\x00\x03\x79\x00\x32"  # 889: Viction
+    b"\x00\x00\x03\x94\x00\x0a"  # 916: Metadium
+    b"\x00\x00\x03\xc6\x00\x42"  # 966: Polygon
+    b"\x00\x00\x03\xe9\x00\x3a"  # 1001: ThunderCore
+    b"\x00\x00\x03\xf0\x00\x84"  # 1008: Rangers Protocol
+    b"\x00\x00\x03\xf2\x00\x41"  # 1010: Huobi ECO Chain
+    b"\x00\x00\x03\xf3\x00\xc7"  # 1011: Eluvio Content Fabric
+    b"\x00\x00\x03\xfc\x00\x6d"  # 1020: Evrice Network
+    b"\x00\x00\x03\xff\x00\xd7"  # 1023: Harmony
+    b"\x00\x00\x05\xe8\x00\x5d"  # 1512: Double-A Chain
+    b"\x00\x00\x06\x88\x00\x7f"  # 1672: Pharos
+    b"\x00\x00\x07\xc3\x00\x82"  # 1987: EtherGem
+    b"\x00\x00\x08\xad\x00\x4c"  # 2221: Permission
+    b"\x00\x00\x17\xac\x00\x24"  # 6060: GoChain
+    b"\x00\x00\x20\x19\x00\x91"  # 8217: Kaia
+    b"\x00\x00\x23\x2d\x00\xa9"  # 9005: Avalanche C-Chain
+    b"\x00\x00\x26\x46\x00\x97"  # 9798: Data Trade Chain
+    b"\x00\x00\x79\x7e\x00\xa2"  # 31102: Ethersocial Network
+    b"\x00\x00\x9b\x75\x00\xa4"  # 39797: Energi
+    b"\x00\x03\x0f\xb1\x00\xbf"  # 200625: Akroma
+    b"\x00\x03\xc3\x01\x00\xc2"  # 246529: ARTIS sigma1
+    b"\x00\x14\x09\x5a\x00\xc8"  # 1313114: Etho Protocol
+    b"\x00\x57\x41\x4e\x00\x68"  # 5718350: Wanchain
+    b"\x03\xad\xbc\x39\x00\xd1"  # 61717561: Aquachain
+)
+
+# Network data: primary_color (uint24 BE), symbol, name, icon. Strings are UTF-8
+# prefixed by their length (uint8).
+_NETWORK_DATA = (
+    b"\x63\x7f\xff\x03\x45\x54\x48\x08\x45\x74\x68\x65\x72\x65\x75\x6d\x0b\x65\x76\x6d\x2d\x65\x74\x68\x2e\x70\x6e\x67"  # 1: ETH
+    b"\xd2\xd2\xd2\x03\x45\x58\x50\x0f\x45\x78\x70\x61\x6e\x73\x65\x20\x4e\x65\x74\x77\x6f\x72\x6b\x0b\x65\x76\x6d\x2d\x65\x78\x70\x2e\x70\x6e\x67"  # 2: EXP
+    b"\x96\x96\x96\x04\x74\x45\x54\x48\x07\x52\x6f\x70\x73\x74\x65\x6e\x0c\x65\x76\x6d\x2d\x74\x65\x74\x68\x2e\x70\x6e\x67"  # 3: tETH
+    b"\x96\x96\x96\x04\x74\x45\x54\x48\x07\x52\x69\x6e\x6b\x65\x62\x79\x0c\x65\x76\x6d\x2d\x74\x65\x74\x68\x2e\x70\x6e\x67"  # 4: tETH
+    b"\x96\x96\x96\x04\x74\x45\x54\x48\x06\x47\x6f\x65\x72\x6c\x69\x0c\x65\x76\x6d\x2d\x74\x65\x74\x68\x2e\x70\x6e\x67"  # 5: tETH
+    b"\x96\x96\x96\x04\x74\x4b\x4f\x54\x0d\x4b\x6f\x74\x74\x69\x20\x54\x65\x73\x74\x6e\x65\x74\x0c\x65\x76\x6d\x2d\x74\x6b\x6f\x74\x2e\x70\x6e\x67"  # 6: tKOT
+    b"\xd2\xd2\xd2\x03\x54\x43\x48\x09\x54\x68\x61\x69\x43\x68\x61\x69\x6e\x0b\x65\x76\x6d\x2d\x74\x63\x68\x2e\x70\x6e\x67"  # 7: TCH
+    b"\xd2\xd2\xd2\x03\x55\x42\x51\x04\x55\x62\x69\x71\x0b\x65\x76\x6d\x2d\x75\x62\x71\x2e\x70\x6e\x67"  # 8: UBQ
+    b"\x96\x96\x96\x04\x54\x55\x42\x51\x14\x55\x62\x69\x71\x20\x4e\x65\x74\x77\x6f\x72\x6b\x20\x54\x65\x73\x74\x6e\x65\x74\x0c\x65\x76\x6d\x2d\x74\x75\x62\x71\x2e\x70\x6e\x67"  # 9: TUBQ
+    b"\xff\x04\x20\x03\x45\x54\x48\x02\x4f\x50\x0c\x65\x76\x6d\x2d\x6f\x65\x74\x68\x2e\x70\x6e\x67"  # 10: ETH
+    b"\xd2\xd2\xd2\x04\x4d\x45\x54\x41\x08\x4d\x65\x74\x61\x64\x69\x75\x6d\x0c\x65\x76\x6d\x2d\x6d\x65\x74\x61\x2e\x70\x6e\x67"  # 11: META
+    b"\x96\x96\x96\x04\x74\x4b\x41\x4c\x10\x4d\x65\x74\x61\x64\x69\x75\x6d\x20\x54\x65\x73\x74\x6e\x65\x74\x0c\x65\x76\x6d\x2d\x74\x6b\x61\x6c\x2e\x70\x6e\x67"  # 12: tKAL
+    b"\x96\x96\x96\x07\x74\x73\x44\x49\x4f\x44\x45\x15\x44\x69\x6f\x64\x65\x20\x54\x65\x73\x74\x6e\x65\x74\x20\x53\x74\x61\x67\x69\x6e\x67\x0f\x65\x76\x6d\x2d\x74\x73\x64\x69\x6f\x64\x65\x2e\x70\x6e\x67"  # 13: tsDIODE
+    b"\xd2\xd2\xd2\x03\x46\x4c\x52\x05\x46\x6c\x61\x72\x65\x0b\x65\x76\x6d\x2d\x66\x6c\x72\x2e\x70\x6e\x67"  # 14: FLR
+    b"\xd2\xd2\xd2\x05\x44\x49\x4f\x44\x45\x0c\x44\x69\x6f\x64\x65\x20\x50\x72\x65\x6e\x65\x74\x0d\x65\x76\x6d\x2d\x64\x69\x6f\x64\x65\x2e\x70\x6e\x67"  # 15: DIODE
+    b"\x96\x96\x96\x05\x74\x43\x46\x4c\x52\x17\x53\x6f\x6e\x67\x62\x69\x72\x64\x20\x54\x65\x73\x74\x6e\x65\x74\x20\x43\x6f\x73\x74\x6f\x6e\x0d\x65\x76\x6d\x2d\x74\x63\x66\x6c\x72\x2e\x70\x6e\x67"  # 16: tCFLR
+    b"\xd2\xd2\xd2\x03\x54\x46\x49\x14\x54\x68\x61\x69\x43\x68\x61\x69\x6e\x20\x32\x2e\x30\x20\x54\x68\x61\x69\x46\x69\x0b\x65\x76\x6d\x2d\x74\x66\x69\x2e\x70\x6e\x67"  # 17: TFI
+    b"\x96\x96\x96\x03\x54\x53\x54\x13\x54\x68\x75\x6e\x64\x65\x72\x43\x6f\x72\x65\x20\x54\x65\x73\x74\x6e\x65\x74\x0b\x65\x76\x6d\x2d\x74\x73\x74\x2e\x70\x6e\x67"  # 18: TST
+    b"\xd2\xd2\xd2\x03\x53\x47\x42\x17\x53\x6f\x6e\x67\x62\x69\x72\x64\x20\x43\x61\x6e\x61\x72\x79\x2d\x4e\x65\x74\x77\x6f\x72\x6b\x0b\x65\x76\x6d\x2d\x73\x67\x62\x2e\x70\x6e\x67"  # 19: SGB
+    b"\xd2\xd2\xd2\x03\x45\x4c\x41\x13\x45\x6c\x61\x73\x74\x6f\x73\x20\x53\x6d\x61\x72\x74\x20\x43\x68\x61\x69\x6e\x0b\x65\x76\x6d\x2d\x65\x6c\x61\x2e\x70\x6e\x67"  # 20: ELA
+    b"\x11\x99\xfa\x03\x43\x52\x4f\x06\x43\x72\x6f\x6e\x6f\x73\x0b\x65\x76\x6d\x2d\x63\x72\x6f\x2e\x70\x6e\x67"  # 25: CRO
+    b"\xd2\xd2\xd2\x04\x53\x48\x49\x42\x0a\x53\x68\x69\x62\x61\x43\x68\x61\x69\x6e\x0c\x65\x76\x6d\x2d\x73\x68\x69\x62\x2e\x70\x6e\x67"  # 27: SHIB
+    b"\xd2\xd2\xd2\x02\x4c\x31\x0a\x47\x65\x6e\x65\x73\x69\x73\x20\x4c\x31\x0a\x65\x76\x6d\x2d\x6c\x31\x2e\x70\x6e\x67"  # 29: L1
+    b"\xff\x91\x00\x04\x52\x42\x54\x43\x09\x52\x6f\x6f\x74\x73\x74\x6f\x63\x6b\x0c\x65\x76\x6d\x2d\x72\x62\x74\x63\x2e\x70\x6e\x67"  # 30: RBTC
+    b"\x96\x96\x96\x05\x74\x52\x42\x54\x43\x11\x52\x6f\x6f\x74\x73\x74\x6f\x63\x6b\x20\x54\x65\x73\x74\x6e\x65\x74\x0d\x65\x76\x6d\x2d\x74\x72\x62\x74\x63\x2e\x70\x6e\x67"  # 31: tRBTC
+    b"\xd2\xd2\xd2\x04\x47\x6f\x6f\x44\x08\x47\x6f\x6f\x64\x44\x61\x74\x61\x0c\x65\x76\x6d\x2d\x67\x6f\x6f\x64\x2e\x70\x6e\x67"  # 33: GooD
+    b"\xd2\xd2\xd2\x03\x54\x42\x47\x0a\x54\x42\x57\x47\x20\x43\x68\x61\x69\x6e\x0b\x65\x76\x6d\x2d\x74\x62\x67\x2e\x70\x6e\x67"  # 35: TBG
+    b"\xd2\xd2\xd2\x03\x56\x41\x4c\x08\x56\x61\x6c\x6f\x72\x62\x69\x74\x0b\x65\x76\x6d\x2d\x76\x61\x6c\x2e\x70\x6e\x67"  # 38: VAL
+    b"\xd2\xd2\xd2\x04\x54\x4c\x4f\x53\x09\x54\x65\x6c\x6f\x73\x20\x45\x56\x4d\x0c\x65\x76\x6d\x2d\x74\x6c\x6f\x73\x2e\x70\x6e\x67"  # 40: TLOS
+    b"\xd2\xd2\xd2\x04\x43\x52\x41\x42\x0c\x43\x72\x61\x62\x20\x4e\x65\x74\x77\x6f\x72\x6b\x0c\x65\x76\x6d\x2d\x63\x72\x61\x62\x2e\x70\x6e\x67"  # 44: CRAB
+    b"\xd2\xd2\xd2\x03\x58\x44\x43\x0b\x58\x44\x43\x20\x4e\x65\x74\x77\x6f\x72\x6b\x0b\x65\x76\x6d\x2d\x78\x64\x63\x2e\x70\x6e\x67"  # 50: XDC
+    b"\xd2\xd2\xd2\x04\x54\x58\x44\x43\x13\x58\x44\x43\x20\x41\x70\x6f\x74\x68\x65\x6d\x20\x4e\x65\x74\x77\x6f\x72\x6b\x0c\x65\x76\x6d\x2d\x74\x78\x64\x63\x2e\x70\x6e\x67"  # 51: TXDC
+    b"\xd2\xd2\xd2\x03\x63\x65\x74\x12\x43\x6f\x69\x6e\x45\x78\x20\x53\x6d\x61\x72\x74\x20\x43\x68\x61\x69\x6e\x0b\x65\x76\x6d\x2d\x63\x65\x74\x2e\x70\x6e\x67"  # 52: cet
+    b"\xd2\xd2\xd2\x03\x5a\x59\x58\x03\x5a\x79\x78\x0b\x65\x76\x6d\x2d\x7a\x79\x78\x2e\x70\x6e\x67"  # 55: ZYX
+    b"\xf0\xb9\x0b\x03\x42\x4e\x42\x0f\x42\x4e\x42\x20\x53\x6d\x61\x72\x74\x20\x43\x68\x61\x69\x6e\x0b\x65\x76\x6d\x2d\x62\x6e\x62\x2e\x70\x6e\x67"  # 56: BNB
+    b"\xd2\xd2\xd2\x03\x4f\x4e\x47\x08\x4f\x6e\x74\x6f\x6c\x6f\x67\x79\x0b\x65\x76\x6d\x2d\x6f\x6e\x67\x2e\x70\x6e\x67"  # 58: ONG
+    b"\xd2\xd2\xd2\x02\x47\x4f\x07\x47\x6f\x43\x68\x61\x69\x6e\x0a\x65\x76\x6d\x2d\x67\x6f\x2e\x70\x6e\x67"  # 60: GO
+    b"\x32\x83\x32\x03\x45\x54\x43\x10\x45\x74\x68\x65\x72\x65\x75\x6d\x20\x43\x6c\x61\x73\x73\x69\x63\x0b\x65\x76\x6d\x2d\x65\x74\x63\x2e\x70\x6e\x67"  # 61: ETC
+    b"\x96\x96\x96\x04\x54\x45\x54\x43\x0e\x4d\x6f\x72\x64\x65\x6e\x20\x54\x65\x73\x74\x6e\x65\x74\x0c\x65\x76\x6d\x2d\x74\x65\x74\x63\x2e\x70\x6e\x67"  # 62: TETC
+    b"\x96\x96\x96\x05\x74\x4d\x45\x54\x43\x0e\x4d\x6f\x72\x64\x6f\x72\x20\x54\x65\x73\x74\x6e\x65\x74\x0d\x65\x76\x6d\x2d\x74\x6d\x65\x74\x63\x2e\x70\x6e\x67"  # 63: tMETC
+    b"\xd2\xd2\xd2\x04\x45\x4c\x4c\x41\x07\x45\x6c\x6c\x61\x69\x73\x6d\x0c\x65\x76\x6d\x2d\x65\x6c\x6c\x61\x2e\x70\x6e\x67"  # 64: ELLA
+    b"\xd2\xd2\xd2\x03\x4f\x4b\x54\x08\x4f\x4b\x58\x43\x68\x61\x69\x6e\x0b\x65\x76\x6d\x2d\x6f\x6b\x74\x2e\x70\x6e\x67"  # 66: OKT
+    b"\x96\x96\x96\x04\x74\x44\x42\x4d\x0f\x44\x42\x43\x68\x61\x69\x6e\x20\x54\x65\x73\x74\x6e\x65\x74\x0c\x65\x76\x6d\x2d\x74\x64\x62\x6d\x2e\x70\x6e\x67"  # 67: tDBM
+    b"\xd2\xd2\xd2\x04\x45\x49\x44\x49\x07\x49\x44\x43\x68\x61\x69\x6e\x0c\x65\x76\x6d\x2d\x65\x69\x64\x69\x2e\x70\x6e\x67"  # 74: EIDI
+    b"\xd2\xd2\xd2\x03\x4d\x49\x58\x03\x4d\x69\x78\x0b\x65\x76\x6d\x2d\x6d\x69\x78\x2e\x70\x6e\x67"  # 76: MIX
+    b"\xd2\xd2\xd2\x04\x53\x50\x4f\x41\x11\x50\x4f\x41\x20\x4e\x65\x74\x77\x6f\x72\x6b\x20\x53\x6f\x6b\x6f\x6c\x0c\x65\x76\x6d\x2d\x73\x70\x6f\x61\x2e\x70\x6e\x67"  # 77: SPOA
+    b"\xd2\xd2\xd2\x04\x50\x45\x54\x48\x0b\x50\x72\x69\x6d\x75\x73\x43\x68\x61\x69\x6e\x0c\x65\x76\x6d\x2d\x70\x65\x74\x68\x2e\x70\x6e\x67"  # 78: PETH
+    b"\xd2\xd2\xd2\x03\x52\x4e\x41\x09\x47\x65\x6e\x65\x43\x68\x61\x69\x6e\x0b\x65\x76\x6d\x2d\x72\x6e\x61\x2e\x70\x6e\x67"  # 80: RNA
+    b"\xd2\xd2\xd2\x03\x4d\x54\x52\x05\x4d\x65\x74\x65\x72\x0b\x65\x76\x6d\x2d\x6d\x74\x72\x2e\x70\x6e\x67"  # 82: MTR
+    b"\xd2\xd2\xd2\x03\x53\x4e\x54\x0c\x4e\x6f\x76\x61\x20\x4e\x65\x74\x77\x6f\x72\x6b\x0b\x65\x76\x6d\x2d\x73\x6e\x74\x2e\x70\x6e\x67"  # 87: SNT
+    b"\xd2\xd2\xd2\x03\x56\x49\x43\x07\x56\x69\x63\x74\x69\x6f\x6e\x0b\x65\x76\x6d\x2d\x76\x69\x63\x2e\x70\x6e\x67"  # 88: VIC
+    b"\xd2\xd2\xd2\x03\x47\x41\x52\x0e\x47\x61\x72\x69\x7a\x6f\x6e\x20\x53\x74\x61\x67\x65\x30\x0b\x65\x76\x6d\x2d\x67\x61\x72\x2e\x70\x6e\x67"  # 90: GAR
+    b"\x96\x96\x96\x04\x74\x42\x4e\x42\x17\x42\x4e\x42\x20\x53\x6d\x61\x72\x74\x20\x43\x68\x61\x69\x6e\x20\x54\x65\x73\x74\x6e\x65\x74\x0c\x65\x76\x6d\x2d\x74\x62\x6e\x62\x2e\x70\x6e\x67"  # 97: tBNB
+    b"\xd2\xd2\xd2\x03\x50\x4f\x41\x10\x50\x4f\x41\x20\x4e\x65\x74\x77\x6f\x72\x6b\x20\x43\x6f\x72\x65\x0b\x65\x76\x6d\x2d\x70\x6f\x61\x2e\x70\x6e\x67"  # 99: POA
+    b"\xd2\xd2\xd2\x04\x58\x44\x41\x49\x06\x47\x6e\x6f\x73\x69\x73\x0c\x65\x76\x6d\x2d\x78\x64\x61\x69\x2e\x70\x6e\x67"  # 100: XDAI
+    b"\xd2\xd2\xd2\x03\x45\x54\x49\x08\x45\x74\x68\x65\x72\x49\x6e\x63\x0b\x65\x76\x6d\x2d\x65\x74\x69\x2e\x70\x6e\x67"  # 101: ETI
+    b"\xd2\xd2\xd2\x03\x57\x33\x47\x10\x57\x65\x62\x33\x47\x61\x6d\x65\x73\x20\x44\x65\x76\x6e\x65\x74\x0b\x65\x76\x6d\x2d\x77\x33\x67\x2e\x70\x6e\x67"  # 105: W3G
+    b"\xd2\xd2\xd2\x03\x56\x4c\x58\x09\x56\x65\x6c\x61\x73\x20\x45\x56\x4d\x0b\x65\x76\x6d\x2d\x76\x6c\x78\x2e\x70\x6e\x67"  # 106: VLX
+    b"\xd2\xd2\xd2\x02\x54\x54\x0b\x54\x68\x75\x6e\x64\x65\x72\x43\x6f\x72\x65\x0a\x65\x76\x6d\x2d\x74\x74\x2e\x70\x6e\x67"  # 108: TT
+    b"\xd2\xd2\xd2\x03\x45\x54\x4c\x0f\x45\x74\x68\x65\x72\x4c\x69\x74\x65\x20\x43\x68\x61\x69\x6e\x0b\x65\x76\x6d\x2d\x65\x74\x6c\x2e\x70\x6e\x67"  # 111: ETL
+    b"\xd2\xd2\xd2\x04\x46\x55\x53\x45\x04\x46\x75\x73\x65\x0c\x65\x76\x6d\x2d\x66\x75\x73\x65\x2e\x70\x6e\x67"  # 122: FUSE
+    b"\xd2\xd2\xd2\x05\x53\x50\x41\x52\x4b\x0d\x46\x75\x73\x65\x20\x53\x70\x61\x72\x6b\x6e\x65\x74\x0d\x65\x76\x6d\x2d\x73\x70\x61\x72\x6b\x2e\x70\x6e\x67"  # 123: SPARK
+    b"\xd2\xd2\xd2\x03\x44\x57\x55\x11\x44\x65\x63\x65\x6e\x74\x72\x61\x6c\x69\x7a\x65\x64\x20\x57\x65\x62\x0b\x65\x76\x6d\x2d\x64\x77\x75\x2e\x70\x6e\x67"  # 124: DWU
+    b"\xd2\xd2\xd2\x02\x4f\x59\x07\x4f\x59\x63\x68\x61\x69\x6e\x0a\x65\x76\x6d\x2d\x6f\x79\x2e\x70\x6e\x67"  # 126: OY
+    b"\xd2\xd2\xd2\x04\x46\x45\x54\x48\x0b\x46\x61\x63\x74\x6f\x72\x79\x20\x31\x32\x37\x0c\x65\x76\x6d\x2d\x66\x65\x74\x68\x2e\x70\x6e\x67"  # 127: FETH
+    b"\x01\x94\x3f\x02\x48\x54\x0f\x48\x75\x6f\x62\x69\x20\x45\x43\x4f\x20\x43\x68\x61\x69\x6e\x0a\x65\x76\x6d\x2d\x68\x74\x2e\x70\x6e\x67"  # 128: HT
+    b"\x82\x47\xe5\x03\x50\x4f\x4c\x07\x50\x6f\x6c\x79\x67\x6f\x6e\x0d\x65\x76\x6d\x2d\x6d\x61\x74\x69\x63\x2e\x70\x6e\x67"  # 137: POL
+    b"\xd2\xd2\xd2\x03\x44\x41\x58\x09\x44\x41\x58\x20\x43\x48\x41\x49\x4e\x0b\x65\x76\x6d\x2d\x64\x61\x78\x2e\x70\x6e\x67"  # 142: DAX
+    b"\xff\xff\xff\x01\x53\x05\x53\x6f\x6e\x69\x63\x09\x65\x76\x6d\x2d\x73\x2e\x70\x6e\x67"  # 146: S
+    b"\x96\x96\x96\x04\x74\x50\x48\x54\x14\x4c\x69\x67\x68\x74\x73\x74\x72\x65\x61\x6d\x73\x20\x54\x65\x73\x74\x6e\x65\x74\x0c\x65\x76\x6d\x2d\x74\x70\x68\x74\x2e\x70\x6e\x67"  # 162: tPHT
+    b"\xd2\xd2\xd2\x03\x50\x48\x54\x0c\x4c\x69\x67\x68\x74\x73\x74\x72\x65\x61\x6d\x73\x0b\x65\x76\x6d\x2d\x70\x68\x74\x2e\x70\x6e\x67"  # 163: PHT
+    b"\xff\xff\xff\x03\x48\x53\x4b\x0d\x48\x61\x73\x68\x4b\x65\x79\x20\x43\x68\x61\x69\x6e\x0b\x65\x76\x6d\x2d\x68\x73\x6b\x2e\x70\x6e\x67"  # 177: HSK
+    b"\xd2\xd2\xd2\x05\x53\x65\x65\x6c\x65\x05\x53\x65\x65\x6c\x65\x0d\x65\x76\x6d\x2d\x73\x65\x65\x6c\x65\x2e\x70\x6e\x67"  # 186: Seele
+    b"\xd2\xd2\xd2\x03\x42\x54\x4d\x03\x42\x4d\x43\x0b\x65\x76\x6d\x2d\x62\x74\x6d\x2e\x70\x6e\x67"  # 188: BTM
+    b"\xd2\xd2\xd2\x03\x42\x54\x54\x10\x42\x69\x74\x54\x6f\x72\x72\x65\x6e\x74\x20\x43\x68\x61\x69\x6e\x0b\x65\x76\x6d\x2d\x62\x74\x74\x2e\x70\x6e\x67"  # 199: BTT
+    b"\xd2\xd2\xd2\x03\x30\x78\x46\x15\x46\x72\x65\x69\x67\x68\x74\x20\x54\x72\x75\x73\x74\x20\x4e\x65\x74\x77\x6f\x72\x6b\x0b\x65\x76\x6d\x2d\x30\x78\x66\x2e\x70\x6e\x67"  # 211: 0xF
+    b"\xd2\xd2\xd2\x03\x41\x53\x4b\x0a\x50\x65\x72\x6d\x69\x73\x73\x69\x6f\x6e\x0b\x65\x76\x6d\x2d\x61\x73\x6b\x2e\x70\x6e\x67"  # 222: ASK
+    b"\xd2\xd2\xd2\x02\x4c\x41\x07\x4c\x41\x43\x48\x41\x49\x4e\x0a\x65\x76\x6d\x2d\x6c\x61\x2e\x70\x6e\x67"  # 225: LA
+    b"\xd2\xd2\xd2\x03\x45\x57\x54\x10\x45\x6e\x65\x72\x67\x79\x20\x57\x65\x62\x20\x43\x68\x61\x69\x6e\x0b\x65\x76\x6d\x2d\x65\x77\x74\x2e\x70\x6e\x67"  # 246: EWT
+    b"\x19\x69\xff\x03\x46\x54\x4d\x0c\x46\x61\x6e\x74\x6f\x6d\x20\x4f\x70\x65\x72\x61\x0b\x65\x76\x6d\x2d\x66\x74\x6d\x2e\x70\x6e\x67"  # 250: FTM
+    b"\x96\x96\x96\x04\x74\x68\x74\x74\x17\x48\x75\x6f\x62\x69\x20\x45\x43\x4f\x20\x43\x68\x61\x69\x6e\x20\x54\x65\x73\x74\x6e\x65\x74\x0c\x65\x76\x6d\x2d\x74\x68\x74\x74\x2e\x70\x6e\x67"  # 256: thtt
+    b"\xd2\xd2\xd2\x04\x53\x45\x54\x4d\x07\x53\x65\x74\x68\x65\x75\x6d\x0c\x65\x76\x6d\x2d\x73\x65\x74\x6d\x2e\x70\x6e\x67"  # 258: SETM
+    b"\xd2\xd2\xd2\x03\x53\x52\x4e\x16\x53\x55\x52\x20\x42\x6c\x6f\x63\x6b\x63\x68\x61\x69\x6e\x20\x4e\x65\x74\x77\x6f\x72\x6b\x0b\x65\x76\x6d\x2d\x73\x72\x6e\x2e\x70\x6e\x67"  # 262: SRN
+    b"\xd2\xd2\xd2\x03\x48\x50\x42\x1b\x48\x69\x67\x68\x20\x50\x65\x72\x66\x6f\x72\x6d\x61\x6e\x63\x65\x20\x42\x6c\x6f\x63\x6b\x63\x68\x61\x69\x6e\x0b\x65\x76\x6d\x2d\x68\x70\x62\x2e\x70\x6e\x67"  # 269: HPB
+    b"\xcc\xff\x00\x03\x45\x54\x48\x0c\x42\x6f\x62\x61\x20\x4e\x65\x74\x77\x6f\x72\x6b\x0c\x65\x76\x6d\x2d\x62\x6f\x62\x61\x2e\x70\x6e\x67"  # 288: ETH
+    b"\x00\x90\xff\x03\x46\x49\x4c\x08\x46\x69\x6c\x65\x63\x6f\x69\x6e\x10\x65\x76\x6d\x2d\x66\x69\x6c\x65\x63\x6f\x69\x6e\x2e\x70\x6e\x67"  # 314: FIL
+    b"\xd2\xd2\xd2\x03\x4b\x43\x53\x03\x4b\x43\x43\x0b\x65\x76\x6d\x2d\x6b\x63\x73\x2e\x70\x6e\x67"  # 321: KCS
+    b"\xff\xff\xff\x03\x45\x54\x48\x06\x7a\x6b\x53\x79\x6e\x63\x12\x65\x76\x6d\x2d\x7a\x6b\x73\x79\x6e\x63\x2d\x65\x72\x61\x2e\x70\x6e\x67"  # 324: ETH
+    b"\xd2\xd2\xd2\x03\x57\x33\x51\x05\x57\x65\x62\x33\x51\x0b\x65\x76\x6d\x2d\x77\x33\x71\x2e\x70\x6e\x67"  # 333: W3Q
+    b"\xd2\xd2\xd2\x03\x53\x44\x4e\x06\x53\x68\x69\x64\x65\x6e\x0b\x65\x76\x6d\x2d\x73\x64\x6e\x2e\x70\x6e\x67"  # 336: SDN
+    b"\xd2\xd2\xd2\x03\x50\x4c\x53\x0a\x50\x75\x6c\x73\x65\x43\x68\x61\x69\x6e\x0b\x65\x76\x6d\x2d\x70\x6c\x73\x2e\x70\x6e\x67"  # 369: PLS
+    b"\x96\x96\x96\x04\x74\x45\x54\x48\x17\x4f\x70\x74\x69\x6d\x69\x73\x6d\x20\x47\x6f\x65\x72\x6c\x69\x20\x54\x65\x73\x74\x6e\x65\x74\x0c\x65\x76\x6d\x2d\x74\x65\x74\x68\x2e\x70\x6e\x67"  # 420: tETH
+    b"\xd2\xd2\xd2\x04\x52\x55\x50\x58\x06\x52\x75\x70\x61\x79\x61\x0c\x65\x76\x6d\x2d\x72\x75\x70\x78\x2e\x70\x6e\x67"  # 499: RUPX
+    b"\xd2\xd2\xd2\x03\x41\x41\x43\x0e\x44\x6f\x75\x62\x6c\x65\x2d\x41\x20\x43\x68\x61\x69\x6e\x0b\x65\x76\x6d\x2d\x61\x61\x63\x2e\x70\x6e\x67"  # 512: AAC
+    b"\xd2\xd2\xd2\x05\x43\x4c\x41\x53\x53\x0b\x56\x65\x6c\x61\x31\x20\x43\x68\x61\x69\x6e\x0d\x65\x76\x6d\x2d\x63\x6c\x61\x73\x73\x2e\x70\x6e\x67"  # 555: CLASS
+    b"\xd2\xd2\xd2\x03\x54\x41\x4f\x0b\x54\x61\x6f\x20\x4e\x65\x74\x77\x6f\x72\x6b\x0b\x65\x76\x6d\x2d\x74\x61\x6f\x2e\x70\x6e\x67"  # 558: TAO
+    b"\x96\x96\x96\x05\x74\x6d\x41\x43\x41\x19\x41\x63\x61\x6c\x61\x20\x4d\x61\x6e\x64\x61\x6c\x61\x20\x54\x65\x73\x74\x6e\x65\x74\x20\x54\x43\x39\x0d\x65\x76\x6d\x2d\x74\x6d\x61\x63\x61\x2e\x70\x6e\x67"  # 595: tmACA
+    b"\xd2\xd2\xd2\x03\x4b\x41\x52\x0e\x4b\x61\x72\x75\x72\x61\x20\x4e\x65\x74\x77\x6f\x72\x6b\x0b\x65\x76\x6d\x2d\x6b\x61\x72\x2e\x70\x6e\x67"  # 686: KAR
+    b"\xd2\xd2\xd2\x03\x42\x43\x53\x12\x42\x6c\x6f\x63\x6b\x43\x68\x61\x69\x6e\x20\x53\x74\x61\x74\x69\x6f\x6e\x0b\x65\x76\x6d\x2d\x62\x63\x73\x2e\x70\x6e\x67"  # 707: BCS
+    b"\xd2\xd2\xd2\x03\x63\x54\x48\x08\x63\x68\x65\x61\x70\x45\x54\x48\x0b\x65\x76\x6d\x2d\x63\x74\x68\x2e\x70\x6e\x67"  # 777: cTH
+    b"\xd2\xd2\xd2\x03\x41\x43\x41\x0d\x41\x63\x61\x6c\x61\x20\x4e\x65\x74\x77\x6f\x72\x6b\x0b\x65\x76\x6d\x2d\x61\x63\x61\x2e\x70\x6e\x67"  # 787: ACA
+    b"\xd2\xd2\xd2\x04\x48\x41\x49\x43\x04\x48\x61\x69\x63\x0c\x65\x76\x6d\x2d\x68\x61\x69\x63\x2e\x70\x6e\x67"  # 803: HAIC
+    b"\xd2\xd2\xd2\x03\x43\x4c\x4f\x08\x43\x61\x6c\x6c\x69\x73\x74\x6f\x0b\x65\x76\x6d\x2d\x63\x6c\x6f\x2e\x70\x6e\x67"  # 820: CLO
+    b"\x96\x96\x96\x04\x54\x43\x4c\x4f\x1b\x43\x61\x6c\x6c\x69\x73\x74\x6f\x20\x54\x65\x73\x74\x6e\x65\x74\x20\x44\x65\x70\x72\x65\x63\x61\x74\x65\x64\x0c\x65\x76\x6d\x2d\x74\x63\x6c\x6f\x2e\x70\x6e\x67"  # 821: TCLO
+    b"\xd2\xd2\xd2\x03\x57\x41\x4e\x08\x57\x61\x6e\x63\x68\x61\x69\x6e\x0b\x65\x76\x6d\x2d\x77\x61\x6e\x2e\x70\x6e\x67"  # 888: WAN
+    b"\xd2\xd2\xd2\x04\x59\x45\x54\x49\x18\x4e\x65\x70\x61\x6c\x20\x42\x6c\x6f\x63\x6b\x63\x68\x61\x69\x6e\x20\x4e\x65\x74\x77\x6f\x72\x6b\x0c\x65\x76\x6d\x2d\x79\x65\x74\x69\x2e\x70\x6e\x67"  # 977: YETI
+    b"\xd2\xd2\xd2\x03\x4c\x39\x39\x0d\x4c\x75\x63\x6b\x79\x20\x4e\x65\x74\x77\x6f\x72\x6b\x0b\x65\x76\x6d\x2d\x6c\x39\x39\x2e\x70\x6e\x67"  # 998: L99
+    b"\x96\x96\x96\x05\x74\x4b\x41\x49\x41\x13\x4b\x61\x69\x61\x20\x4b\x61\x69\x72\x6f\x73\x20\x54\x65\x73\x74\x6e\x65\x74\x0d\x65\x76\x6d\x2d\x74\x6b\x61\x69\x61\x2e\x70\x6e\x67"  # 1001: tKAIA
+    b"\x96\x96\x96\x04\x74\x4e\x45\x57\x0e\x4e\x65\x77\x74\x6f\x6e\x20\x54\x65\x73\x74\x6e\x65\x74\x0c\x65\x76\x6d\x2d\x74\x6e\x65\x77\x2e\x70\x6e\x67"  # 1007: tNEW
+    b"\xd2\xd2\xd2\x03\x45\x56\x43\x0e\x45\x76\x72\x69\x63\x65\x20\x4e\x65\x74\x77\x6f\x72\x6b\x0b\x65\x76\x6d\x2d\x65\x76\x63\x2e\x70\x6e\x67"  # 1010: EVC
+    b"\xd2\xd2\xd2\x03\x4e\x45\x57\x06\x4e\x65\x77\x74\x6f\x6e\x0b\x65\x76\x6d\x2d\x6e\x65\x77\x2e\x70\x6e\x67"  # 1012: NEW
+    b"\xd2\xd2\xd2\x03\x53\x4b\x55\x06\x53\x61\x6b\x75\x72\x61\x0b\x65\x76\x6d\x2d\x73\x6b\x75\x2e\x70\x6e\x67"  # 1022: SKU
+    b"\xd2\xd2\xd2\x03\x43\x4c\x56\x0d\x43\x4c\x56\x20\x50\x61\x72\x61\x63\x68\x61\x69\x6e\x0b\x65\x76\x6d\x2d\x63\x6c\x76\x2e\x70\x6e\x67"  # 1024: CLV
+    b"\xd2\xd2\xd2\x03\x43\x46\x58\x0e\x43\x6f\x6e\x66\x6c\x75\x78\x20\x65\x53\x70\x61\x63\x65\x0b\x65\x76\x6d\x2d\x63\x66\x78\x2e\x70\x6e\x67"  # 1030: CFX
+    b"\xd2\xd2\xd2\x05\x4d\x45\x54\x49\x53\x0f\x4d\x65\x74\x69\x73\x20\x41\x6e\x64\x72\x6f\x6d\x65\x64\x61\x0d\x65\x76\x6d\x2d\x6d\x65\x74\x69\x73\x2e\x70\x6e\x67"  # 1088: METIS
+    b"\xd2\xd2\xd2\x04\x4d\x41\x54\x48\x09\x4d\x61\x74\x68\x43\x68\x61\x69\x6e\x0c\x65\x76\x6d\x2d\x6d\x61\x74\x68\x2e\x70\x6e\x67"  # 1139: MATH
+    b"\x96\x96\x96\x05\x74\x4d\x41\x54\x48\x11\x4d\x61\x74\x68\x43\x68\x61\x69\x6e\x20\x54\x65\x73\x74\x6e\x65\x74\x0d\x65\x76\x6d\x2d\x74\x6d\x61\x74\x68\x2e\x70\x6e\x67"  # 1140: tMATH
+    b"\xd2\xd2\xd2\x04\x49\x4f\x52\x41\x0a\x49\x6f\x72\x61\x20\x43\x68\x61\x69\x6e\x0c\x65\x76\x6d\x2d\x69\x6f\x72\x61\x2e\x70\x6e\x67"  # 1197: IORA
+    b"\xd2\xd2\xd2\x03\x57\x54\x54\x1b\x57\x6f\x72\x6c\x64\x20\x54\x72\x61\x64\x65\x20\x54\x65\x63\x68\x6e\x69\x63\x61\x6c\x20\x43\x68\x61\x69\x6e\x0b\x65\x76\x6d\x2d\x77\x74\x74\x2e\x70\x6e\x67"  # 1202: WTT
+    b"\xd2\xd2\xd2\x03\x50\x4f\x50\x09\x50\x6f\x70\x63\x61\x74\x65\x75\x6d\x0b\x65\x76\x6d\x2d\x70\x6f\x70\x2e\x70\x6e\x67"  # 1213: POP
+    b"\xd2\xd2\xd2\x05\x45\x4e\x54\x45\x52\x0a\x45\x6e\x74\x65\x72\x43\x68\x61\x69\x6e\x0d\x65\x76\x6d\x2d\x65\x6e\x74\x65\x72\x2e\x70\x6e\x67"  # 1214: ENTER
+    b"\xd2\xd2\xd2\x02\x48\x4f\x04\x48\x41\x4c\x4f\x0a\x65\x76\x6d\x2d\x68\x6f\x2e\x70\x6e\x67"  # 1280: HO
+    b"\xd2\xd2\xd2\x04\x47\x4c\x4d\x52\x08\x4d\x6f\x6f\x6e\x62\x65\x61\x6d\x0c\x65\x76\x6d\x2d\x67\x6c\x6d\x72\x2e\x70\x6e\x67"  # 1284: GLMR
+    b"\xd2\xd2\xd2\x04\x4d\x4f\x56\x52\x09\x4d\x6f\x6f\x6e\x72\x69\x76\x65\x72\x0c\x65\x76\x6d\x2d\x6d\x6f\x76\x72\x2e\x70\x6e\x67"  # 1285: MOVR
+    b"\xd2\xd2\xd2\x03\x44\x45\x56\x0e\x4d\x6f\x6f\x6e\x62\x61\x73\x65\x20\x41\x6c\x70\x68\x61\x0b\x65\x76\x6d\x2d\x64\x65\x76\x2e\x70\x6e\x67"  # 1287: DEV
+    b"\xd2\xd2\xd2\x04\x43\x41\x54\x45\x0e\x43\x61\x74\x65\x63\x6f\x69\x6e\x20\x43\x68\x61\x69\x6e\x0c\x65\x76\x6d\x2d\x63\x61\x74\x65\x2e\x70\x6e\x67"  # 1618: CATE
+    b"\xd2\xd2\xd2\x03\x42\x54\x41\x08\x42\x74\x61\x63\x68\x61\x69\x6e\x0b\x65\x76\x6d\x2d\x62\x74\x61\x2e\x70\x6e\x67"  # 1657: BTA
+    b"\x00\xff\x33\x04\x50\x52\x4f\x53\x06\x50\x68\x61\x72\x6f\x73\x0c\x65\x76\x6d\x2d\x70\x72\x6f\x73\x2e\x70\x6e\x67"  # 1672: PROS
+    b"\xd2\xd2\xd2\x03\x54\x53\x46\x0a\x54\x65\x73\x6c\x61\x66\x75\x6e\x64\x73\x0b\x65\x76\x6d\x2d\x74\x73\x66\x2e\x70\x6e\x67"  # 1856: TSF
+    b"\xd2\xd2\xd2\x03\x42\x4f\x59\x0b\x42\x4f\x4e\x20\x4e\x65\x74\x77\x6f\x72\x6b\x0b\x65\x76\x6d\x2d\x62\x6f\x79\x2e\x70\x6e\x67"  # 1898: BOY
+    b"\xd2\xd2\xd2\x04\x45\x47\x45\x4d\x08\x45\x74\x68\x65\x72\x47\x65\x6d\x0c\x65\x76\x6d\x2d\x65\x67\x65\x6d\x2e\x70\x6e\x67"  # 1987: EGEM
+    b"\xd2\xd2\xd2\x03\x45\x44\x47\x10\x45\x64\x67\x65\x77\x61\x72\x65\x20\x45\x64\x67\x65\x45\x56\x4d\x0b\x65\x76\x6d\x2d\x65\x64\x67\x2e\x70\x6e\x67"  # 2021: EDG
+    b"\xd2\xd2\xd2\x03\x52\x50\x47\x10\x52\x61\x6e\x67\x65\x72\x73\x20\x50\x72\x6f\x74\x6f\x63\x6f\x6c\x0b\x65\x76\x6d\x2d\x72\x70\x67\x2e\x70\x6e\x67"  # 2025: RPG
+    b"\xd2\xd2\xd2\x03\x45\x43\x4f\x07\x45\x63\x6f\x62\x61\x6c\x6c\x0b\x65\x76\x6d\x2d\x65\x63\x6f\x2e\x70\x6e\x67"  # 2100: ECO
+    b"\xd2\xd2\xd2\x03\x45\x56\x41\x08\x45\x76\x61\x6e\x65\x73\x63\x6f\x0b\x65\x76\x6d\x2d\x65\x76\x61\x2e\x70\x6e\x67"  # 2213: EVA
+    b"\xd2\xd2\xd2\x03\x4b\x54\x4f\x06\x4b\x6f\x72\x74\x68\x6f\x0b\x65\x76\x6d\x2d\x6b\x74\x6f\x2e\x70\x6e\x67"  # 2559: KTO
+    b"\xd2\xd2\xd2\x03\x50\x52\x42\x0a\x50\x61\x72\x69\x62\x75\x20\x4e\x65\x74\x0b\x65\x76\x6d\x2d\x70\x72\x62\x2e\x70\x6e\x67"  # 3400: PRB
+    b"\xd2\xd2\xd2\x04\x44\x59\x4e\x4f\x04\x44\x59\x4e\x4f\x0c\x65\x76\x6d\x2d\x64\x79\x6e\x6f\x2e\x70\x6e\x67"  # 3966: DYNO
+    b"\xd2\xd2\xd2\x04\x49\x4f\x54\x58\x0d\x49\x6f\x54\x65\x58\x20\x4e\x65\x74\x77\x6f\x72\x6b\x0c\x65\x76\x6d\x2d\x69\x6f\x74\x78\x2e\x70\x6e\x67"  # 4689: IOTX
+    b"\xff\xff\xff\x03\x4d\x4e\x54\x06\x4d\x61\x6e\x74\x6c\x65\x0b\x65\x76\x6d\x2d\x6d\x6e\x74\x2e\x70\x6e\x67"  # 5000: MNT
+    b"\xd2\xd2\xd2\x02\x45\x53\x07\x45\x72\x61\x53\x77\x61\x70\x0a\x65\x76\x6d\x2d\x65\x73\x2e\x70\x6e\x67"  # 5197: ES
+    b"\xd2\xd2\xd2\x04\x55\x5a\x4d\x49\x0c\x55\x7a\x6d\x69\x20\x4e\x65\x74\x77\x6f\x72\x6b\x0c\x65\x76\x6d\x2d\x75\x7a\x6d\x69\x2e\x70\x6e\x67"  # 5315: UZMI
+    b"\xd2\xd2\xd2\x03\x52\x42\x44\x12\x57\x65\x67\x6f\x63\x68\x61\x69\x6e\x20\x52\x75\x62\x69\x64\x69\x75\x6d\x0b\x65\x76\x6d\x2d\x72\x62\x64\x2e\x70\x6e\x67"  # 5869: RBD
+    b"\xd2\xd2\xd2\x03\x50\x49\x58\x0b\x50\x69\x78\x69\x65\x20\x43\x68\x61\x69\x6e\x0b\x65\x76\x6d\x2d\x70\x69\x78\x2e\x70\x6e\x67"  # 6626: PIX
+    b"\xd2\xd2\xd2\x04\x54\x45\x4c\x45\x08\x54\x65\x6c\x65\x70\x6f\x72\x74\x0c\x65\x76\x6d\x2d\x74\x65\x6c\x65\x2e\x70\x6e\x67"  # 8000: TELE
+    b"\xd2\xd2\xd2\x04\x4b\x41\x49\x41\x04\x4b\x61\x69\x61\x0c\x65\x76\x6d\x2d\x6b\x61\x69\x61\x2e\x70\x6e\x67"  # 8217: KAIA
+    b"\x00\x52\xff\x03\x45\x54\x48\x04\x42\x61\x73\x65\x0c\x65\x76\x6d\x2d\x62\x61\x73\x65\x2e\x70\x6e\x67"  # 8453: ETH
+    b"\xd2\xd2\xd2\x03\x4f\x4c\x4f\x0b\x54\x4f\x4f\x4c\x20\x47\x6c\x6f\x62\x61\x6c\x0b\x65\x76\x6d\x2d\x6f\x6c\x6f\x2e\x70\x6e\x67"  # 8723: OLO
+    b"\xd2\xd2\xd2\x06\x55\x2b\x32\x35\x42\x33\x08\x62\x6c\x6f\x78\x62\x65\x72\x67\x0e\x65\x76\x6d\x2d\x75\x2b\x32\x35\x62\x33\x2e\x70\x6e\x67"  # 8995: U+25B3
+    b"\xd2\xd2\xd2\x05\x45\x56\x4d\x4f\x53\x05\x45\x76\x6d\x6f\x73\x0d\x65\x76\x6d\x2d\x65\x76\x6d\x6f\x73\x2e\x70\x6e\x67"  # 9001: EVMOS
+    b"\xd2\xd2\xd2\x03\x47\x4e\x43\x0c\x47\x65\x6e\x65\x73\x69\x73\x20\x43\x6f\x69\x6e\x0b\x65\x76\x6d\x2d\x67\x6e\x63\x2e\x70\x6e\x67"  # 9100: GNC
+    b"\x1a\x2a\x5f\x03\x44\x54\x54\x10\x44\x61\x74\x61\x20\x54\x72\x61\x64\x65\x20\x43\x68\x61\x69\x6e\x0b\x65\x76\x6d\x2d\x64\x74\x74\x2e\x70\x6e\x67"  # 9798: DTT
+    b"\xd2\xd2\xd2\x03\x47\x45\x4e\x12\x42\x6c\x6f\x63\x6b\x63\x68\x61\x69\x6e\x20\x47\x65\x6e\x65\x73\x69\x73\x0b\x65\x76\x6d\x2d\x67\x65\x6e\x2e\x70\x6e\x67"  # 10101: GEN
+    b"\xd2\xd2\xd2\x03\x43\x43\x50\x0d\x43\x72\x79\x70\x74\x6f\x43\x6f\x69\x6e\x50\x61\x79\x0b\x65\x76\x6d\x2d\x63\x63\x70\x2e\x70\x6e\x67"  # 10823: CCP
+    b"\xd2\xd2\xd2\x03\x57\x47\x4d\x05\x57\x41\x47\x4d\x49\x0b\x65\x76\x6d\x2d\x77\x67\x6d\x2e\x70\x6e\x67"  # 11111: WGM
+    b"\xd2\xd2\xd2\x04\x5a\x45\x52\x4f\x10\x53\x69\x6e\x67\x75\x6c\x61\x72\x69\x74\x79\x20\x5a\x45\x52\x4f\x0c\x65\x76\x6d\x2d\x7a\x65\x72\x6f\x2e\x70\x6e\x67"  # 12052: ZERO
+    b"\xd2\xd2\xd2\x03\x50\x48\x58\x07\x50\x68\x6f\x65\x6e\x69\x78\x0b\x65\x76\x6d\x2d\x70\x68\x78\x2e\x70\x6e\x67"  # 13381: PHX
+    b"\xd2\xd2\xd2\x03\x4d\x54\x54\x07\x4d\x65\x74\x61\x44\x6f\x74\x0b\x65\x76\x6d\x2d\x6d\x74\x74\x2e\x70\x6e\x67"  # 16000: MTT
+    b"\x96\x96\x96\x04\x74\x53\x45\x50\x0b\x53\x45\x43\x20\x54\x65\x73\x74\x6e\x65\x74\x0c\x65\x76\x6d\x2d\x74\x73\x65\x70\x2e\x70\x6e\x67"  # 19515: tSEP
+    b"\xd2\xd2\xd2\x05\x42\x54\x43\x49\x58\x0d\x42\x54\x43\x49\x58\x20\x4e\x65\x74\x77\x6f\x72\x6b\x0d\x65\x76\x6d\x2d\x62\x74\x63\x69\x78\x2e\x70\x6e\x67"  # 19845: BTCIX
+    b"\xd2\xd2\xd2\x03\x57\x45\x42\x08\x57\x65\x62\x63\x68\x61\x69\x6e\x0b\x65\x76\x6d\x2d\x77\x65\x62\x2e\x70\x6e\x67"  # 24484: WEB
+    b"\xd2\xd2\xd2\x06\x4d\x49\x4e\x54\x4d\x45\x0f\x4d\x69\x6e\x74\x4d\x65\x2e\x63\x6f\x6d\x20\x43\x6f\x69\x6e\x0e\x65\x76\x6d\x2d\x6d\x69\x6e\x74\x6d\x65\x2e\x70\x6e\x67"  # 24734: MINTME
+    b"\xd2\xd2\xd2\x03\x45\x53\x4e\x13\x45\x74\x68\x65\x72\x73\x6f\x63\x69\x61\x6c\x20\x4e\x65\x74\x77\x6f\x72\x6b\x0b\x65\x76\x6d\x2d\x65\x73\x6e\x2e\x70\x6e\x67"  # 31102: ESN
+    b"\xd2\xd2\xd2\x03\x46\x53\x4e\x06\x46\x75\x73\x69\x6f\x6e\x0b\x65\x76\x6d\x2d\x66\x73\x6e\x2e\x70\x6e\x67"  # 32659: FSN
+    b"\xd2\xd2\xd2\x03\x4e\x52\x47\x06\x45\x6e\x65\x72\x67\x69\x0b\x65\x76\x6d\x2d\x6e\x72\x67\x2e\x70\x6e\x67"  # 39797: NRG
+    b"\xd2\xd2\xd2\x06\x70\x65\x67\x67\x6c\x65\x0a\x70\x65\x67\x67\x6c\x65\x63\x6f\x69\x6e\x0e\x65\x76\x6d\x2d\x70\x65\x67\x67\x6c\x65\x2e\x70\x6e\x67"  # 42069: peggle
+    b"\x28\xa0\xf0\x03\x45\x54\x48\x0c\x41\x72\x62\x69\x74\x72\x75\x6d\x20\x4f\x6e\x65\x0c\x65\x76\x6d\x2d\x61\x72\x62\x31\x2e\x70\x6e\x67"  # 42161: ETH
+    b"\x35\xd0\x7f\x04\x43\x45\x4c\x4f\x04\x43\x65\x6c\x6f\x0c\x65\x76\x6d\x2d\x63\x65\x6c\x6f\x2e\x70\x6e\x67"  # 42220: CELO
+    b"\x96\x96\x96\x05\x74\x41\x56\x41\x58\x16\x41\x76\x61\x6c\x61\x6e\x63\x68\x65\x20\x46\x75\x6a\x69\x20\x54\x65\x73\x74\x6e\x65\x74\x0d\x65\x76\x6d\x2d\x74\x61\x76\x61\x78\x2e\x70\x6e\x67"  # 43113: tAVAX
+    b"\xe8\x41\x42\x04\x41\x56\x41\x58\x11\x41\x76\x61\x6c\x61\x6e\x63\x68\x65\x20\x43\x2d\x43\x68\x61\x69\x6e\x0c\x65\x76\x6d\x2d\x61\x76\x61\x78\x2e\x70\x6e\x67"  # 43114: AVAX
+    b"\x96\x96\x96\x05\x74\x43\x45\x4c\x4f\x16\x43\x65\x6c\x6f\x20\x41\x6c\x66\x61\x6a\x6f\x72\x65\x73\x20\x54\x65\x73\x74\x6e\x65\x74\x0d\x65\x76\x6d\x2d\x74\x63\x65\x6c\x6f\x2e\x70\x6e\x67"  # 44787: tCELO
+    b"\xd2\xd2\xd2\x03\x52\x45\x49\x0b\x52\x45\x49\x20\x4e\x65\x74\x77\x6f\x72\x6b\x0b\x65\x76\x6d\x2d\x72\x65\x69\x2e\x70\x6e\x67"  # 47805: REI
+    b"\x96\x96\x96\x04\x74\x4e\x52\x47\x0e\x45\x6e\x65\x72\x67\x69\x20\x54\x65\x73\x74\x6e\x65\x74\x0c\x65\x76\x6d\x2d\x74\x6e\x72\x67\x2e\x70\x6e\x67"  # 49797: tNRG
+    b"\xd2\xd2\xd2\x05\x4a\x45\x57\x45\x4c\x09\x44\x46\x4b\x20\x43\x68\x61\x69\x6e\x0d\x65\x76\x6d\x2d\x6a\x65\x77\x65\x6c\x2e\x70\x6e\x67"  # 53935: JEWEL
+    b"\xff\xff\xff\x03\x45\x54\x48\x05\x4c\x69\x6e\x65\x61\x0d\x65\x76\x6d\x2d\x6c\x69\x6e\x65\x61\x2e\x70\x6e\x67"  # 59144: ETH
+    b"\x96\x96\x96\x05\x74\x43\x45\x4c\x4f\x14\x43\x65\x6c\x6f\x20\x42\x61\x6b\x6c\x61\x76\x61\x20\x54\x65\x73\x74\x6e\x65\x74\x0d\x65\x76\x6d\x2d\x74\x63\x65\x6c\x6f\x2e\x70\x6e\x67"  # 62320: tCELO
+    b"\xd2\xd2\xd2\x03\x45\x43\x53\x0d\x65\x53\x79\x6e\x63\x20\x4e\x65\x74\x77\x6f\x72\x6b\x0b\x65\x76\x6d\x2d\x65\x63\x73\x2e\x70\x6e\x67"  # 63000: ECS
+    b"\x96\x96\x96\x03\x74\x56\x54\x18\x45\x6e\x65\x72\x67\x79\x20\x57\x65\x62\x20\x56\x6f\x6c\x74\x61\x20\x54\x65\x73\x74\x6e\x65\x74\x0b\x65\x76\x6d\x2d\x74\x76\x74\x2e\x70\x6e\x67"  # 73799: tVT
+    b"\x59\x59\xd8\x03\x45\x54\x48\x15\x4d\x69\x78\x69\x6e\x20\x56\x69\x72\x74\x75\x61\x6c\x20\x4d\x61\x63\x68\x69\x6e\x65\x0d\x65\x76\x6d\x2d\x6d\x69\x78\x69\x6e\x2e\x70\x6e\x67"  # 73927: ETH
+    b"\xd2\xd2\xd2\x03\x46\x49\x4e\x14\x46\x69\x72\x65\x6e\x7a\x65\x20\x74\x65\x73\x74\x20\x6e\x65\x74\x77\x6f\x72\x6b\x0b\x65\x76\x6d\x2d\x66\x69\x6e\x2e\x70\x6e\x67"  # 78110: FIN
+    b"\x96\x96\x96\x06\x74\x4d\x41\x54\x49\x43\x06\x4d\x75\x6d\x62\x61\x69\x0e\x65\x76\x6d\x2d\x74\x6d\x61\x74\x69\x63\x2e\x70\x6e\x67"  # 80001: tMATIC
+    b"\xd2\xd2\xd2\x03\x55\x42\x43\x0e\x55\x42\x20\x53\x6d\x61\x72\x74\x20\x43\x68\x61\x69\x6e\x0b\x65\x76\x6d\x2d\x75\x62\x63\x2e\x70\x6e\x67"  # 99999: UBC
+    b"\xd2\xd2\xd2\x03\x51\x4b\x43\x0a\x51\x75\x61\x72\x6b\x43\x68\x61\x69\x6e\x0b\x65\x76\x6d\x2d\x71\x6b\x63\x2e\x70\x6e\x67"  # 100000: QKC
+    b"\xd2\xd2\xd2\x03\x51\x4b\x43\x0a\x51\x75\x61\x72\x6b\x43\x68\x61\x69\x6e\x0b\x65\x76\x6d\x2d\x71\x6b\x63\x2e\x70\x6e\x67"  # 100001: QKC
+    b"\xd2\xd2\xd2\x03\x51\x4b\x43\x0a\x51\x75\x61\x72\x6b\x43\x68\x61\x69\x6e\x0b\x65\x76\x6d\x2d\x71\x6b\x63\x2e\x70\x6e\x67"  # 100002: QKC
+    b"\xd2\xd2\xd2\x03\x51\x4b\x43\x0a\x51\x75\x61\x72\x6b\x43\x68\x61\x69\x6e\x0b\x65\x76\x6d\x2d\x71\x6b\x63\x2e\x70\x6e\x67"  # 100003: QKC
+    b"\xd2\xd2\xd2\x03\x51\x4b\x43\x0a\x51\x75\x61\x72\x6b\x43\x68\x61\x69\x6e\x0b\x65\x76\x6d\x2d\x71\x6b\x63\x2e\x70\x6e\x67"  # 100004: QKC
+    b"\xd2\xd2\xd2\x03\x51\x4b\x43\x0a\x51\x75\x61\x72\x6b\x43\x68\x61\x69\x6e\x0b\x65\x76\x6d\x2d\x71\x6b\x63\x2e\x70\x6e\x67"  # 100005: QKC
+    b"\xd2\xd2\xd2\x03\x51\x4b\x43\x0a\x51\x75\x61\x72\x6b\x43\x68\x61\x69\x6e\x0b\x65\x76\x6d\x2d\x71\x6b\x63\x2e\x70\x6e\x67"  # 100006: QKC
+    b"\xd2\xd2\xd2\x03\x51\x4b\x43\x0a\x51\x75\x61\x72\x6b\x43\x68\x61\x69\x6e\x0b\x65\x76\x6d\x2d\x71\x6b\x63\x2e\x70\x6e\x67"  # 100007: QKC
+    b"\xd2\xd2\xd2\x03\x51\x4b\x43\x0a\x51\x75\x61\x72\x6b\x43\x68\x61\x69\x6e\x0b\x65\x76\x6d\x2d\x71\x6b\x63\x2e\x70\x6e\x67"  # 100008: QKC
+    b"\xd2\xd2\xd2\x03\x41\x4b\x41\x06\x41\x6b\x72\x6f\x6d\x61\x0b\x65\x76\x6d\x2d\x61\x6b\x61\x2e\x70\x6e\x67"  # 200625: AKA
+    b"\xd2\xd2\xd2\x03\x61\x74\x70\x05\x41\x6c\x61\x79\x61\x0b\x65\x76\x6d\x2d\x61\x74\x70\x2e\x70\x6e\x67"  # 201018: atp
+    b"\xd2\xd2\xd2\x03\x6c\x61\x74\x06\x50\x6c\x61\x74\x4f\x4e\x0b\x65\x76\x6d\x2d\x6c\x61\x74\x2e\x70\x6e\x67"  # 210425: lat
+    b"\xd2\xd2\xd2\x03\x41\x54\x53\x0c\x41\x52\x54\x49\x53\x20\x73\x69\x67\x6d\x61\x31\x0b\x65\x76\x6d\x2d\x61\x74\x73\x2e\x70\x6e\x67"  # 246529: ATS
+    b"\x96\x96\x96\x04\x74\x41\x54\x53\x12\x41\x52\x54\x49\x53\x20\x54\x65\x73\x74\x6e\x65\x74\x20\x74\x61\x75\x31\x0c\x65\x76\x6d\x2d\x74\x61\x74\x73\x2e\x70\x6e\x67"  # 246785: tATS
+    b"\xd2\xd2\xd2\x03\x24\x4f\x43\x12\x53\x6f\x63\x69\x61\x6c\x20\x53\x6d\x61\x72\x74\x20\x43\x68\x61\x69\x6e\x0b\x65\x76\x6d\x2d\x24\x6f\x63\x2e\x70\x6e\x67"  # 281121: $OC
+    b"\xd2\xd2\xd2\x05\x50\x4f\x4c\x49\x53\x05\x50\x6f\x6c\x69\x73\x0d\x65\x76\x6d\x2d\x70\x6f\x6c\x69\x73\x2e\x70\x6e\x67"  # 333999: POLIS
+    b"\xd2\xd2\xd2\x02\x56\x53\x06\x56\x69\x73\x69\x6f\x6e\x0a\x65\x76\x6d\x2d\x76\x73\x2e\x70\x6e\x67"  # 888888: VS
+    b"\xd2\xd2\xd2\x03\x45\x4c\x56\x15\x45\x6c\x75\x76\x69\x6f\x20\x43\x6f\x6e\x74\x65\x6e\x74\x20\x46\x61\x62\x72\x69\x63\x0b\x65\x76\x6d\x2d\x65\x6c\x76\x2e\x70\x6e\x67"  # 955305: ELV
+    b"\xd2\xd2\xd2\x04\x45\x54\x48\x4f\x0d\x45\x74\x68\x6f\x20\x50\x72\x6f\x74\x6f\x63\x6f\x6c\x0c\x65\x76\x6d\x2d\x65\x74\x68\x6f\x2e\x70\x6e\x67"  # 1313114: ETHO
+    b"\xd2\xd2\xd2\x04\x58\x45\x52\x4f\x05\x58\x65\x72\x6f\x6d\x0c\x65\x76\x6d\x2d\x78\x65\x72\x6f\x2e\x70\x6e\x67"  # 1313500: XERO
+    b"\xd2\xd2\xd2\x05\x4d\x55\x53\x49\x43\x08\x4d\x75\x73\x69\x63\x6f\x69\x6e\x0d\x65\x76\x6d\x2d\x6d\x75\x73\x69\x63\x2e\x70\x6e\x67"  # 7762959: MUSIC
+    b"\x96\x96\x96\x04\x74\x45\x54\x48\x07\x53\x65\x70\x6f\x6c\x69\x61\x0c\x65\x76\x6d\x2d\x74\x65\x74\x68\x2e\x70\x6e\x67"  # 11155111: tETH
+    b"\xd2\xd2\xd2\x04\x54\x50\x45\x50\x12\x50\x65\x70\x43\x68\x61\x69\x6e\x20\x43\x68\x75\x72\x63\x68\x69\x6c\x6c\x0c\x65\x76\x6d\x2d\x74\x70\x65\x70\x2e\x70\x6e\x67"  # 13371337: TPEP
+    b"\xd2\xd2\xd2\x03\x49\x4c\x54\x06\x49\x4f\x4c\x69\x74\x65\x0b\x65\x76\x6d\x2d\x69\x6c\x74\x2e\x70\x6e\x67"  # 18289463: ILT
+    b"\xd2\xd2\xd2\x03\x51\x4b\x49\x0f\x71\x75\x61\x72\x6b\x62\x6c\x6f\x63\x6b\x63\x68\x61\x69\x6e\x0b\x65\x76\x6d\x2d\x71\x6b\x69\x2e\x70\x6e\x67"  # 20181205: QKI
+    b"\xd2\xd2\xd2\x03\x41\x55\x58\x10\x41\x75\x78\x69\x6c\x69\x75\x6d\x20\x4e\x65\x74\x77\x6f\x72\x6b\x0b\x65\x76\x6d\x2d\x61\x75\x78\x2e\x70\x6e\x67"  # 28945486: AUX
+    b"\xd2\xd2\xd2\x04\x4a\x4f\x59\x53\x0c\x4a\x6f\x79\x73\x20\x44\x69\x67\x69\x74\x61\x6c\x0c\x65\x76\x6d\x2d\x6a\x6f\x79\x73\x2e\x70\x6e\x67"  # 35855456: JOYS
+    b"\xd2\xd2\xd2\x04\x41\x51\x55\x41\x09\x41\x71\x75\x61\x63\x68\x61\x69\x6e\x0c\x65\x76\x6d\x2d\x61\x71\x75\x61\x2e\x70\x6e\x67"  # 61717561: AQUA
+    b"\x96\x96\x96\x04\x54\x4f\x59\x53\x14\x4a\x6f\x79\x73\x20\x44\x69\x67\x69\x74\x61\x6c\x20\x54\x65\x73\x74\x4e\x65\x74\x0c\x65\x76\x6d\x2d\x74\x6f\x79\x73\x2e\x70\x6e\x67"  # 99415706: TOYS
+    b"\xd2\xd2\xd2\x04\x4e\x45\x4f\x4e\x08\x4e\x65\x6f\x6e\x20\x45\x56\x4d\x0c\x65\x76\x6d\x2d\x6e\x65\x6f\x6e\x2e\x70\x6e\x67"  # 245022934: NEON
+    b"\xd2\xd2\xd2\x03\x4f\x4c\x54\x09\x4f\x6e\x65\x4c\x65\x64\x67\x65\x72\x0b\x65\x76\x6d\x2d\x6f\x6c\x74\x2e\x70\x6e\x67"  # 311752642: OLT
+    b"\xd2\xd2\xd2\x04\x49\x50\x4f\x53\x0c\x49\x50\x4f\x53\x20\x4e\x65\x74\x77\x6f\x72\x6b\x0c\x65\x76\x6d\x2d\x69\x70\x6f\x73\x2e\x70\x6e\x67"  # 1122334455: IPOS
+    b"\xd2\xd2\xd2\x03\x45\x54\x48\x06\x41\x75\x72\x6f\x72\x61\x0e\x65\x76\x6d\x2d\x61\x75\x72\x6f\x72\x61\x2e\x70\x6e\x67"  # 1313161554: ETH
+    b"\x33\xd3\xd5\x03\x4f\x4e\x45\x07\x48\x61\x72\x6d\x6f\x6e\x79\x0b\x65\x76\x6d\x2d\x6f\x6e\x65\x2e\x70\x6e\x67"  # 1666600000: ONE
+    b"\xd2\xd2\xd2\x03\x4f\x4e\x45\x07\x48\x61\x72\x6d\x6f\x6e\x79\x0b\x65\x76\x6d\x2d\x6f\x6e\x65\x2e\x70\x6e\x67"  # 1666600001: ONE
+    b"\xd2\xd2\xd2\x03\x4f\x4e\x45\x07\x48\x61\x72\x6d\x6f\x6e\x79\x0b\x65\x76\x6d\x2d\x6f\x6e\x65\x2e\x70\x6e\x67"  # 1666600002: ONE
+    b"\xd2\xd2\xd2\x03\x4f\x4e\x45\x07\x48\x61\x72\x6d\x6f\x6e\x79\x0b\x65\x76\x6d\x2d\x6f\x6e\x65\x2e\x70\x6e\x67"  # 1666600003: ONE
+    b"\xd2\xd2\xd2\x03\x48\x4f\x50\x0a\x44\x61\x74\x61\x48\x6f\x70\x70\x65\x72\x0b\x65\x76\x6d\x2d\x68\x6f\x70\x2e\x70\x6e\x67"  # 2021121117: HOP
+    b"\xd2\xd2\xd2\x04\x50\x49\x52\x4c\x04\x50\x69\x72\x6c\x0c\x65\x76\x6d\x2d\x70\x69\x72\x6c\x2e\x70\x6e\x67"  # 3125659152: PIRL
+    b"\xd2\xd2\xd2\x04\x50\x41\x4c\x4d\x04\x50\x61\x6c\x6d\x0c\x65\x76\x6d\x2d\x70\x61\x6c\x6d\x2e\x70\x6e\x67"  # 11297108109: PALM
+    b"\xd2\xd2\xd2\x03\x4e\x54\x54\x05\x4e\x74\x69\x74\x79\x0b\x65\x76\x6d\x2d\x6e\x74\x74\x2e\x70\x6e\x67"  # 197710212030: NTT
+    b"\xd2\xd2\xd2\x04\x4d\x4f\x4c\x45\x10\x4d\x6f\x6c\x65\x72\x65\x75\x6d\x20\x4e\x65\x74\x77\x6f\x72\x6b\x0c\x65\x76\x6d\x2d\x6d\x6f\x6c\x65\x2e\x70\x6e\x67"  # 6022140761023: MOLE
+)
+# fmt: on
@@ -2,9 +2,11 @@
 # (by running `make templates` in `core`)
 # do not edit manually!
 
-# NOTE: using positional arguments saves 4400 bytes in flash size,
-# returning tuples instead of classes saved 800 bytes
+# NOTE: networks are stored in binary tables sorted by chain_id and by slip44,
+# instead of yielding a tuple per network. The tables take less flash than the
+# tuples did, and lookups are a bisection instead of a linear scan.
 
+from micropython import const
 from typing import TYPE_CHECKING
 
 from trezor.messages import EthereumNetworkInfo
@@ -13,18 +15,69 @@ from apps.common.paths import HARDENED
 
 if TYPE_CHECKING:
     from typing import Iterator
-
-    # Removing the necessity to construct object to save space
-    # fmt: off
-    NetworkInfoTuple = tuple[
-        int,  # chain_id
-        int,  # slip44
-        str,  # symbol
-        str,  # name
-        str,  # icon
-        int,  # primary_color
-    ]
-    # fmt: on
+<%
+import struct
+from types import SimpleNamespace
+
+# networks missing from the upstream definitions
+EXTRA_NETWORKS = [
+    SimpleNamespace(
+        chain_id=9798,
+        slip44=9798,
+        shortcut="DTT",
+        name="Data Trade Chain",
+        icon="evm-dtt.png",
+        primary_color=0x1A2A5F,
+    ),
+    SimpleNamespace(
+        chain_id=1672,
+        slip44=1672,
+        shortcut="PROS",
+        name="Pharos",
+        icon="evm-pros.png",
+        primary_color=0x00FF33,
+    ),
+]
+
+def color(c):
+    return int(c, 16) if isinstance(c, str) else c
+
+def short_str(s):
+    data = s.encode()
+    assert len(data) < 256
+    return bytes([len(data)]) + data
+
+networks = sorted(
+    supported_on("trezor2", eth), key=lambda n: (int(n.chain_id), n.name)
+)
+known_chain_ids = set(int(n.chain_id) for n in networks)
+networks += [n for n in EXTRA_NETWORKS if n.chain_id not in known_chain_ids]
+networks.sort(key=lambda n: int(n.chain_id))
+
+data_offset = 0
+entries = []
+first_by_slip44 = {}
+for i, n in enumerate(networks):
+    assert 0 <= int(n.chain_id) < 2**64
+    assert 0 <= n.slip44 < 2**32
+    assert data_offset <= 0xFFFF
+    data = (
+        color(n.primary_color).to_bytes(3, "big")
+        + short_str(n.shortcut)
+        + short_str(n.name)
+        + short_str(n.icon)
+    )
+    entry = struct.pack(">QLH", int(n.chain_id), n.slip44, data_offset)
+    entries.append((n, entry, data))
+    data_offset += len(data)
+    # by_slip44 returns the first network with the given slip44
+    first_by_slip44.setdefault(n.slip44, i)
+%>\
+
+_ENTRY_LEN = const(14)  # chain_id (uint64 BE), slip44 (uint32 BE), offset (uint16 BE)
+_SLIP44_ENTRY_LEN = const(6)  # slip44 (uint32 BE), network index (uint16 BE)
+_MAX_CHAIN_ID = const(0xFFFF_FFFF_FFFF_FFFF)
+_MAX_SLIP44 = const(0xFFFF_FFFF)
 
 UNKNOWN_NETWORK = EthereumNetworkInfo(
     chain_id=0,
@@ -35,70 +88,105 @@ UNKNOWN_NETWORK = EthereumNetworkInfo(
 
 
 def shortcut_by_chain_id(chain_id: int) -> str:
-    n = by_chain_id(chain_id)
-    return n.symbol if n is not None else "UNKN"
+    entry = _find_chain_id(chain_id)
+    if entry < 0:
+        return "UNKN"
+    offset = _NETWORKS[entry + 12] << 8 | _NETWORKS[entry + 13]
+    offset += 3  # primary_color
+    return _NETWORK_DATA[offset + 1 : offset + 1 + _NETWORK_DATA[offset]].decode()
 
 
 def all_slip44_ids_hardened() -> Iterator[int]:
-    for n in _networks_iterator():
-        yield n[1] | HARDENED
+    for entry in range(0, len(_NETWORKS), _ENTRY_LEN):
+        yield int.from_bytes(_NETWORKS[entry + 8 : entry + 12], "big") | HARDENED
 
 
 def by_chain_id(chain_id: int) -> EthereumNetworkInfo:
-    for n in _networks_iterator():
-        n_chain_id = n[0]
-        if n_chain_id == chain_id:
-            return EthereumNetworkInfo(
-                chain_id=n[0],
-                slip44=n[1],
-                symbol=n[2],
-                name=n[3],
-                icon=n[4],
-                primary_color=n[5],
-            )
-    return UNKNOWN_NETWORK
+    entry = _find_chain_id(chain_id)
+    if entry < 0:
+        return UNKNOWN_NETWORK
+    return _network_info(entry)
 
 
 def by_slip44(slip44: int) -> EthereumNetworkInfo:
-    for n in _networks_iterator():
-        n_slip44 = n[1]
-        if n_slip44 == slip44:
-            return EthereumNetworkInfo(
-                chain_id=n[0],
-                slip44=n[1],
-                symbol=n[2],
-                name=n[3],
-                icon=n[4],
-                primary_color=n[5],
-            )
+    if not 0 <= slip44 <= _MAX_SLIP44:
+        return UNKNOWN_NETWORK
+    key = slip44.to_bytes(4, "big")
+
+    lo = 0
+    hi = len(_SLIP44_INDEX) // _SLIP44_ENTRY_LEN
+    while lo < hi:
+        mid = (lo + hi) // 2
+        entry = mid * _SLIP44_ENTRY_LEN
+        mid_key = _SLIP44_INDEX[entry : entry + 4]
+        if mid_key < key:
+            lo = mid + 1
+        elif mid_key > key:
+            hi = mid
+        else:
+            index = _SLIP44_INDEX[entry + 4] << 8 | _SLIP44_INDEX[entry + 5]
+            return _network_info(index * _ENTRY_LEN)
     return UNKNOWN_NETWORK
 
 
-# fmt: off
-def _networks_iterator() -> Iterator[NetworkInfoTuple]:
-% for n in sorted(supported_on("trezor2", eth), key=lambda network: (int(network.chain_id), network.name)):
-    yield (
-        ${n.chain_id},  # chain_id
-        ${n.slip44},  # slip44
-        "${n.shortcut}",  # symbol
-        "${n.name}",  # name
-        "${n.icon}",  # name
-        ${n.primary_color},  # primary_color
+def _find_chain_id(chain_id: int) -> int:
+    """Return the offset of the network in `_NETWORKS`, or -1 if not found."""
+    if not 0 <= chain_id <= _MAX_CHAIN_ID:
+        return -1
+    key = chain_id.to_bytes(8, "big")
+
+    lo = 0
+    hi = len(_NETWORKS) // _ENTRY_LEN
+    while lo < hi:
+        mid = (lo + hi) // 2
+        entry = mid * _ENTRY_LEN
+        mid_key = _NETWORKS[entry : entry + 8]
+        if mid_key < key:
+            lo = mid + 1
+        elif mid_key > key:
+            hi = mid
+        else:
+            return entry
+    return -1
+
+
+def _network_info(entry: int) -> EthereumNetworkInfo:
+    offset = _NETWORKS[entry + 12] << 8 | _NETWORKS[entry + 13]
+    symbol = offset + 3  # skip primary_color
+    name = symbol + 1 + _NETWORK_DATA[symbol]
+    icon = name + 1 + _NETWORK_DATA[name]
+    icon_end = icon + 1 + _NETWORK_DATA[icon]
+    return EthereumNetworkInfo(
+        chain_id=int.from_bytes(_NETWORKS[entry : entry + 8], "big"),
+        slip44=int.from_bytes(_NETWORKS[entry + 8 : entry + 12], "big"),
+        symbol=_NETWORK_DATA[symbol + 1 : name].decode(),
+        name=_NETWORK_DATA[name + 1 : icon].decode(),
+        icon=_NETWORK_DATA[icon + 1 : icon_end].decode(),
+        primary_color=int.from_bytes(_NETWORK_DATA[offset:symbol], "big"),
     )
+
+
+# fmt: off
+# Sorted by chain_id. Each entry is: chain_id (uint64 BE), slip44 (uint32 BE),
+# offset of the network data in _NETWORK_DATA (uint16 BE).
+_NETWORKS = (
+% for n, entry, _ in entries:
+    ${black_repr(entry)}  # ${n.chain_id}: ${n.name | ascii}
 % endfor
-    yield (
-        9798,  # chain_id
-        9798,  # slip44
-        "DTT",  # symbol
-        "Data Trade Chain",  # name
-        "evm-dtt.png",  # icon
-        0x1A2A5F,  # primary_color
-    )
-    yield (
-        1672,  # chain_id
-        1672,  # slip44
-        "PROS",  # symbol
-        "Pharos",  # name
-        "evm-pros.png",  # icon
-        0x00FF33,  # primary_color
-    )
+)
+
+# Sorted by slip44, pointing to the first network with that slip44.
+_SLIP44_INDEX = (
+% for slip44, index in sorted(first_by_slip44.items()):
+    ${black_repr(struct.pack(">LH", slip44, index))}  # ${slip44}: ${networks[index].name | ascii}
+% endfor
+)
+
+# Network data: primary_color (uint24 BE), symbol, name, icon. Strings are UTF-8
+# prefixed by their length (uint8).
+_NETWORK_DATA = (
+% for n, _, data in entries:
+    ${black_repr(data)}  # ${n.chain_id}: ${n.shortcut | ascii}
+% endfor
+)
+# fmt: on
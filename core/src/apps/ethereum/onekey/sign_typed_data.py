@@ -181,6 +181,8 @@ class TypedDataEnvelope:
         self.primary_type = primary_type
         self.metamask_v4_compat = metamask_v4_compat
         self.types: dict[str, EthereumTypedDataStructAck] = {}
+        # typeHash of each struct, computed when the struct is first hashed
+        self.type_hashes: dict[str, bytes] = {}
 
     async def collect_types(self) -> None:
         """Aggregate type collection process for both domain and message data."""
@@ -226,7 +228,10 @@ class TypedDataEnvelope:
 
     def hash_type(self, w: HashWriter, primary_type: str) -> None:
         """Create a representation of a type."""
-        result = keccak256(self.encode_type(primary_type))
+        result = self.type_hashes.get(primary_type)
+        if result is None:
+            result = keccak256(self.encode_type(primary_type))
+            self.type_hashes[primary_type] = result
         w.extend(result)
 
     def encode_type(self, primary_type: str) -> bytes:
@@ -15,6 +15,7 @@ from trezor.messages import (
     EthereumTypedDataStructRequest,
     EthereumTypedDataValueAck,
     EthereumTypedDataValueRequest,
+    EthereumTypedDataValuesAck,
 )
 from trezor.utils import HashWriter
 
@@ -36,6 +37,7 @@ from .layout import (
 )
 
 if TYPE_CHECKING:
+    from trezor.messages import EthereumTypedDataValue
     from apps.common.keychain import Keychain
     from trezor.wire import Context
     from .definitions import Definitions
@@ -44,6 +46,9 @@ if TYPE_CHECKING:
 # Maximum data size we support
 MAX_VALUE_BYTE_SIZE = 1536  # 1.5 KB
 
+# Maximum total size of the values in one EthereumTypedDataValuesAck
+MAX_CHUNK_SIZE = 4096
+
 HIGH_RISK_PRIMARY_TYPES_PERMIT = (
     "Permit",
     "PermitBatch",
@@ -86,7 +91,7 @@ async def sign_typed_data(
             signature=resp.signature,
         )
     data_hash = await generate_typed_data_hash(
-        ctx, msg.primary_type, msg.metamask_v4_compat
+        ctx, msg.primary_type, msg.metamask_v4_compat, bool(msg.bulk_values)
     )
 
     node = keychain.derive(msg.address_n, force_strict=False)
@@ -101,18 +106,23 @@ async def sign_typed_data(
 
 
 async def generate_typed_data_hash(
-    ctx: Context, primary_type: str, metamask_v4_compat: bool = True
+    ctx: Context,
+    primary_type: str,
+    metamask_v4_compat: bool = True,
+    bulk_values: bool = False,
 ) -> bytes:
     """
     Generate typed data hash according to EIP-712 specification
     https://eips.ethereum.org/EIPS/eip-712#specification
 
     metamask_v4_compat - a flag that enables compatibility with MetaMask's signTypedData_v4 method
+    bulk_values - the host can send several values in one EthereumTypedDataValuesAck
     """
     typed_data_envelope = TypedDataEnvelope(
         ctx=ctx,
         primary_type=primary_type,
         metamask_v4_compat=metamask_v4_compat,
+        bulk_values=bulk_values,
     )
     await typed_data_envelope.collect_types()
     await show_eip712_warning(ctx, primary_type)
@@ -168,11 +178,18 @@ class TypedDataEnvelope:
         ctx: Context,
         primary_type: str,
         metamask_v4_compat: bool,
+        bulk_values: bool = False,
     ) -> None:
         self.ctx = ctx
         self.primary_type = primary_type
         self.metamask_v4_compat = metamask_v4_compat
+        self.bulk_values = bulk_values
         self.types: dict[str, EthereumTypedDataStructAck] = {}
+        # typeHash of each struct, computed when the struct is first hashed
+        self.type_hashes: dict[str, bytes] = {}
+        # values sent ahead by the host in bulk mode, and the next one to use
+        self.values: list[EthereumTypedDataValue] = []
+        self.next_value = 0
 
     async def collect_types(self) -> None:
         """Aggregate type collection process for both domain and message data."""
@@ -218,7 +235,10 @@ class TypedDataEnvelope:
 
     def hash_type(self, w: HashWriter, primary_type: str) -> None:
         """Create a representation of a type."""
-        result = keccak256(self.encode_type(primary_type))
+        result = self.type_hashes.get(primary_type)
+        if result is None:
+            result = keccak256(self.encode_type(primary_type))
+            self.type_hashes[primary_type] = result
         w.extend(result)
 
     def encode_type(self, primary_type: str) -> bytes:
@@ -316,7 +336,7 @@ class TypedDataEnvelope:
             elif field_type.data_type == EthereumDataType.ARRAY:
                 # Getting the length of the array first, if not fixed
                 if field_type.size is None:
-                    array_size = await get_array_size(self.ctx, member_value_path)
+                    array_size = await self.get_array_size(member_value_path)
                 else:
                     array_size = field_type.size
 
@@ -364,7 +384,7 @@ class TypedDataEnvelope:
                                 parent_objects=current_parent_objects,
                             )
                     else:
-                        value = await get_value(self.ctx, entry_type, el_member_path)
+                        value = await self.get_value(entry_type, el_member_path)
                         encode_field(arr_w, entry_type, value)
                         if show_array:
                             await confirm_typed_value(
@@ -377,7 +397,7 @@ class TypedDataEnvelope:
                             )
                 w.extend(arr_w.get_digest())
             else:
-                value = await get_value(self.ctx, field_type, member_value_path)
+                value = await self.get_value(field_type, member_value_path)
                 encode_field(w, field_type, value)
                 if show_data:
                     await confirm_typed_value(
@@ -388,6 +408,53 @@ class TypedDataEnvelope:
                         field=field_type,
                     )
 
+    async def get_array_size(self, member_path: list[int]) -> int:
+        """Get the length of an array at specific `member_path` from the client."""
+        # Field type for getting the array length from client, so we can check the return value
+        ARRAY_LENGTH_TYPE = EthereumFieldType(data_type=EthereumDataType.UINT, size=2)
+        length_value = await self.get_value(ARRAY_LENGTH_TYPE, member_path)
+        return int.from_bytes(length_value, "big")
+
+    async def get_value(
+        self, field: EthereumFieldType, member_value_path: list[int]
+    ) -> bytes:
+        """
+        Get a single value from the client and perform its validation.
+
+        In bulk mode, the client sends the values of the following member paths along
+        with the requested one. They are used as long as the device asks for them in
+        the same order, and each of them is validated only when it is used.
+        """
+        if not self.bulk_values:
+            return await get_value(self.ctx, field, member_value_path)
+
+        value = self._next_value(member_value_path)
+        if value is None:
+            req = EthereumTypedDataValueRequest(
+                member_path=member_value_path, max_chunk_size=MAX_CHUNK_SIZE
+            )
+            res = await self.ctx.call(req, EthereumTypedDataValuesAck)
+            self.values = res.values
+            self.next_value = 0
+            value = self._next_value(member_value_path)
+            if value is None:
+                raise wire.DataError("Invalid member path")
+
+        validate_value(field=field, value=value)
+        return value
+
+    def _next_value(self, member_value_path: list[int]) -> bytes | None:
+        if self.next_value >= len(self.values):
+            return None
+        entry = self.values[self.next_value]
+        if entry.member_path != member_value_path:
+            # The rest is not what the device needs next, it has to ask again.
+            self.values = []
+            self.next_value = 0
+            return None
+        self.next_value += 1
+        return entry.value
+
 
 def encode_field(
     w: HashWriter,
@@ -530,14 +597,6 @@ def validate_field_type(field: EthereumFieldType) -> None:
             raise wire.DataError("Unexpected size in str/bool/addr")
 
 
-async def get_array_size(ctx: Context, member_path: list[int]) -> int:
-    """Get the length of an array at specific `member_path` from the client."""
-    # Field type for getting the array length from client, so we can check the return value
-    ARRAY_LENGTH_TYPE = EthereumFieldType(data_type=EthereumDataType.UINT, size=2)
-    length_value = await get_value(ctx, ARRAY_LENGTH_TYPE, member_path)
-    return int.from_bytes(length_value, "big")
-
-
 async def get_value(
     ctx: Context,
     field: EthereumFieldType,
@@ -566,9 +625,13 @@ async def get_name_and_version_for_domain(
     for member_index, member in enumerate(domain_members):
         member_value_path[-1] = member_index
         if member.name == "name":
-            domain_name = await get_value(ctx, member.type, member_value_path)
+            domain_name = await typed_data_envelope.get_value(
+                member.type, member_value_path
+            )
         elif member.name == "version":
-            domain_version = await get_value(ctx, member.type, member_value_path)
+            domain_version = await typed_data_envelope.get_value(
+                member.type, member_value_path
+            )
 
     return domain_name, domain_version
 
@@ -579,7 +642,7 @@ async def confirm_domain(ctx: Context, typed_data_envelope: TypedDataEnvelope) -
     member_value_path = [0, 0]
     for member_index, member in enumerate(domain_members):
         member_value_path[-1] = member_index
-        value = await get_value(ctx, member.type, member_value_path)
+        value = await typed_data_envelope.get_value(member.type, member_value_path)
         eip712_domain[member.name] = value
     from .layout import confirm_domain
 
@@ -1,6 +1,8 @@
 from trezor import io, wire
 from trezor.messages import FileInfo, FileInfoList, ListResDir
 
+from .update_res import file_digest
+
 
 async def list_dir(ctx: wire.Context, msg: ListResDir) -> FileInfoList:
     try:
@@ -8,6 +10,10 @@ async def list_dir(ctx: wire.Context, msg: ListResDir) -> FileInfoList:
         for size, attrs, name in io.fatfs.listdir(msg.path):
             if attrs[1] != "h":
                 files.append(FileInfo(name=name, size=size))
+        if msg.with_hash:
+            # the host compares the hashes to skip files it would send again
+            for info in files:
+                info.hash = file_digest(f"{msg.path.rstrip('/')}/{info.name}")
     except io.fatfs.FatFSError as e:
         raise wire.DataError(f"Fatfs error {e}")
 
@@ -1,10 +1,17 @@
 from micropython import const
 from typing import TYPE_CHECKING
+from ubinascii import hexlify
 
 from storage.cache import show_update_res_confirm
 from trezor import io, loop, utils, wire
 from trezor.crypto.hashlib import blake2s
-from trezor.messages import ResourceAck, ResourceRequest, Success
+from trezor.messages import (
+    BlurRequest,
+    ResourceAck,
+    ResourceRequest,
+    Success,
+    ZoomRequest,
+)
 from trezor.ui.layouts import confirm_update_res
 
 if TYPE_CHECKING:
@@ -32,70 +39,194 @@ if TYPE_CHECKING:
 # FR_INVALID_PARAMETER: int    # (19) Given parameter is invalid
 
 REQUEST_CHUNK_SIZE = const(16 * 1024)
+# Data asked for in one ResourceRequest, four chunks per round trip.
+REQUEST_WINDOW = const(4 * REQUEST_CHUNK_SIZE)
+# data_chunk tag and length, hash tag, length and digest of a ResourceAck
+_ACK_OVERHEAD = const(38)
+# a resumable transfer is synced to the disk after this much data
+_SYNC_INTERVAL = const(64 * 1024)
+
+_READ_BUFFER_SIZE = const(4 * 1024)
 
 BOOTLOADER_NAME = "bootloader.bin"
 
 BOOTLOADER_TEMP_NAME = BOOTLOADER_NAME + ".tmp"
 
+PART_SUFFIX = ".part"
+
 
 async def update_res(ctx: wire.Context, msg: ResourceUpdate) -> Success:
     is_update_boot = msg.file_name == BOOTLOADER_NAME
+    res_size = msg.data_length
+    file_hash = msg.file_hash
+    target_path = make_file_path(msg.file_name, is_update_boot)
+    if (
+        file_hash is not None
+        and not is_update_boot
+        and has_content(target_path, res_size, file_hash)
+    ):
+        # the host may skip the file, but older hosts do not compare first
+        return Success(message="Success")
+
     if show_update_res_confirm(is_update_boot):
         await confirm_update_res(ctx, is_update_boot)
-    file_name = BOOTLOADER_TEMP_NAME if is_update_boot else msg.file_name
-    res_size = msg.data_length
     initial_data = msg.initial_data_chunk
     if blake2s(initial_data).digest() != msg.hash:
         raise wire.DataError("Date digest is inconsistent")
 
+    if file_hash is not None:
+        # The partial file is named after the content, so that only a transfer of
+        # the same file resumes from it.
+        file_name = f"{msg.file_name}.{hexlify(file_hash[:4]).decode()}{PART_SUFFIX}"
+    else:
+        file_name = BOOTLOADER_TEMP_NAME if is_update_boot else msg.file_name
     file_path = make_file_path(file_name, is_update_boot)
-    data_left = res_size - REQUEST_CHUNK_SIZE
-    offset = REQUEST_CHUNK_SIZE
+    offset = 0
+    if file_hash is not None:
+        offset = synced_size(file_path)
+        if not len(initial_data) <= offset <= res_size:
+            offset = 0
+            _remove_partial_files(file_path)
     try:
-        with io.fatfs.open(file_path, "w") as f:
-            f.write(initial_data)
-
-            while data_left > 0:
-                request = ResourceRequest(data_length=REQUEST_CHUNK_SIZE, offset=offset)
-                ack: ResourceAck = await ctx.call(request, ResourceAck)
-                data = ack.data_chunk
-                digest = blake2s(data).digest()
-                if digest != ack.hash:
-                    raise wire.DataError("Date digest is inconsistent")
-                f.write(data)
-                offset += (
-                    REQUEST_CHUNK_SIZE if data_left > REQUEST_CHUNK_SIZE else data_left
-                )
-                data_left -= REQUEST_CHUNK_SIZE
+        with io.fatfs.open(file_path, "a" if offset else "w") as f:
+            if offset:
+                f.seek(offset)
+            else:
+                f.write(initial_data)
+                offset = len(initial_data)
+            await receive_data(
+                ctx, f, offset, res_size, resumable=file_hash is not None
+            )
             # force refresh to disk
             f.sync()
     except BaseException as e:
         raise wire.FirmwareError(f"Failed to write file with error code {e}")
-    else:
-        if is_update_boot:
+
+    if file_hash is not None:
+        if file_digest(file_path) != file_hash:
+            io.fatfs.unlink(file_path)
+            raise wire.DataError("File digest is inconsistent")
+        if not is_update_boot:
             try:
-                size, _, _ = io.fatfs.stat(file_path)
-                if size != calc_bootloader_size(msg.initial_data_chunk):
-                    io.fatfs.unlink(file_path)
-                    raise wire.FirmwareError("Invalid bootloader detected")
-
-                bootloader_path = make_file_path(BOOTLOADER_NAME, True)
-                try:
-                    # delete the existing file
-                    io.fatfs.unlink(bootloader_path)
-                except BaseException:
-                    # the file was not exist, ignored
-                    pass
-                io.fatfs.rename(file_path, bootloader_path)
+                _replace(file_path, target_path)
             except BaseException as e:
                 raise wire.FirmwareError(f"File system error {e}")
-            else:
-                await ctx.write(Success(message="Restarting"))
-                # make sure the outgoing USB buffer is flushed
-                await loop.wait(ctx.iface.iface_num() | io.POLL_WRITE)
-                utils.reset()
-                assert False  # this should be not reachable
-        return Success(message="Success")
+
+    if is_update_boot:
+        try:
+            size, _, _ = io.fatfs.stat(file_path)
+            if size != calc_bootloader_size(msg.initial_data_chunk):
+                io.fatfs.unlink(file_path)
+                raise wire.FirmwareError("Invalid bootloader detected")
+            _replace(file_path, target_path)
+        except BaseException as e:
+            raise wire.FirmwareError(f"File system error {e}")
+        else:
+            await ctx.write(Success(message="Restarting"))
+            # make sure the outgoing USB buffer is flushed
+            await loop.wait(ctx.iface.iface_num() | io.POLL_WRITE)
+            utils.reset()
+            assert False  # this should be not reachable
+    return Success(message="Success")
+
+
+async def receive_data(
+    ctx: wire.Context,
+    f: io.fatfs.FatFSFile,
+    offset: int,
+    size: int,
+    request_type: type[ResourceRequest | ZoomRequest | BlurRequest] = ResourceRequest,
+    resumable: bool = False,
+) -> None:
+    """
+    Ask the host for the data of the file from `offset` up to `size` and write it
+    to `f`. The host may send less than asked for in a ResourceAck. With
+    `resumable`, `f` is synced regularly, so its size is where an interrupted
+    transfer continues.
+    """
+    window = min(REQUEST_WINDOW, size - offset)
+    wire_buffer = ctx.buffer
+    if window + _ACK_OVERHEAD > len(wire_buffer):
+        # The acks do not fit the wire buffer. They are read into one buffer for the
+        # whole transfer, not into a new one on every round trip.
+        try:
+            ctx.buffer = bytearray(window + _ACK_OVERHEAD)
+        except MemoryError:
+            window = len(wire_buffer) - _ACK_OVERHEAD
+    try:
+        synced = offset
+        while offset < size:
+            length = min(window, size - offset)
+            request = request_type(data_length=length, offset=offset)
+            ack: ResourceAck = await ctx.call(request, ResourceAck)
+            data = ack.data_chunk
+            if blake2s(data).digest() != ack.hash:
+                raise wire.DataError("Date digest is inconsistent")
+            if not 0 < len(data) <= length:
+                raise wire.DataError("Unexpected data length")
+            f.write(data)
+            offset += len(data)
+            if resumable and offset - synced >= _SYNC_INTERVAL:
+                f.sync()
+                synced = offset
+    finally:
+        ctx.buffer = wire_buffer
+
+
+def file_digest(path: str) -> bytes:
+    """blake2s hash of the content of the file at `path`."""
+    h = blake2s()
+    buf = bytearray(_READ_BUFFER_SIZE)
+    view = memoryview(buf)
+    with io.fatfs.open(path, "r") as f:
+        while True:
+            n = f.read(buf)
+            if n == 0:
+                break
+            h.update(view[:n])
+    return h.digest()
+
+
+def has_content(path: str, size: int, digest: bytes) -> bool:
+    try:
+        file_size, _, _ = io.fatfs.stat(path)
+        return file_size == size and file_digest(path) == digest
+    except io.fatfs.FatFSError:
+        return False
+
+
+def synced_size(path: str) -> int:
+    try:
+        size, _, _ = io.fatfs.stat(path)
+    except io.fatfs.FatFSError:
+        return 0
+    return size
+
+
+def _remove_partial_files(path: str) -> None:
+    """Remove what is left from interrupted transfers of other versions of a file."""
+    dir_path, name = path.rsplit("/", 1)
+    prefix = name[: name.rindex(".", 0, -len(PART_SUFFIX)) + 1]
+    try:
+        stale = [
+            entry
+            for _size, _attrs, entry in io.fatfs.listdir(dir_path)
+            if entry.startswith(prefix) and entry.endswith(PART_SUFFIX)
+        ]
+        for entry in stale:
+            io.fatfs.unlink(f"{dir_path}/{entry}")
+    except io.fatfs.FatFSError:
+        pass
+
+
+def _replace(src: str, dst: str) -> None:
+    try:
+        # delete the existing file
+        io.fatfs.unlink(dst)
+    except BaseException:
+        # the file was not exist, ignored
+        pass
+    io.fatfs.rename(src, dst)
 
 
 def make_file_path(file_name, update_boot: bool = False) -> str:
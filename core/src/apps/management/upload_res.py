@@ -4,19 +4,14 @@ from typing import TYPE_CHECKING, Optional
 
 from storage import device
 from trezor import io, wire
-from trezor.crypto.hashlib import blake2s
 from trezor.enums import ResourceType
-from trezor.messages import (
-    BlurRequest,
-    ResourceAck,
-    ResourceRequest,
-    Success,
-    ZoomRequest,
-)
+from trezor.messages import BlurRequest, Success, ZoomRequest
 
 import ujson as json
 import ure as re  # type: ignore[could not be resolved]
 
+from .update_res import receive_data
+
 if TYPE_CHECKING:
     from trezor.messages import ResourceUpload
 SUPPORTED_EXTS = (("jpg", "png", "jpeg"), ("jpg", "jpeg", "png", "mp4"))
@@ -28,7 +23,6 @@ SUPPORTED_MAX_RESOURCE_SIZE = {
     "mp4": const(10 * 1024 * 1024),
 }
 NFT_METADATA_ALLOWED_KEYS = ("header", "subheader", "network", "owner")
-REQUEST_CHUNK_SIZE = const(16 * 1024)
 
 MAX_WP_COUNTER = const(5)
 MAX_NFT_COUNTER = const(24)
@@ -228,38 +222,12 @@ async def upload_res(ctx: wire.Context, msg: ResourceUpload) -> Success:
 
     try:
         with io.fatfs.open(file_full_path, "w") as f:
-            data_left = res_size
-            offset = 0
-            while data_left > 0:
-                request = ResourceRequest(data_length=REQUEST_CHUNK_SIZE, offset=offset)
-                ack: ResourceAck = await ctx.call(request, ResourceAck)
-                data = ack.data_chunk
-                digest = blake2s(data).digest()
-                if digest != ack.hash:
-                    raise wire.DataError("Date digest is inconsistent")
-                f.write(data)
-                offset += (
-                    REQUEST_CHUNK_SIZE if data_left > REQUEST_CHUNK_SIZE else data_left
-                )
-                data_left -= REQUEST_CHUNK_SIZE
+            await receive_data(ctx, f, 0, res_size)
             f.sync()
         _verify_file_size(file_full_path, res_size)
 
         with io.fatfs.open(zoom_path, "w") as f:
-            data_left = res_zoom_size
-            offset = 0
-            while data_left > 0:
-                request = ZoomRequest(data_length=REQUEST_CHUNK_SIZE, offset=offset)
-                ack: ResourceAck = await ctx.call(request, ResourceAck)
-                data = ack.data_chunk
-                digest = blake2s(data).digest()
-                if digest != ack.hash:
-                    raise wire.DataError("Date digest is inconsistent")
-                f.write(data)
-                offset += (
-                    REQUEST_CHUNK_SIZE if data_left > REQUEST_CHUNK_SIZE else data_left
-                )
-                data_left -= REQUEST_CHUNK_SIZE
+            await receive_data(ctx, f, 0, res_zoom_size, ZoomRequest)
             f.sync()
         _verify_file_size(zoom_path, res_zoom_size)
 
@@ -274,22 +242,7 @@ async def upload_res(ctx: wire.Context, msg: ResourceUpload) -> Success:
             await loop.sleep(50)
 
             with io.fatfs.open(blur_path, "w") as f:
-                data_left = res_blur_size
-                offset = 0
-                while data_left > 0:
-                    request = BlurRequest(data_length=REQUEST_CHUNK_SIZE, offset=offset)
-                    ack: ResourceAck = await ctx.call(request, ResourceAck)
-                    data = ack.data_chunk
-                    digest = blake2s(data).digest()
-                    if digest != ack.hash:
-                        raise wire.DataError("Date digest is inconsistent")
-                    f.write(data)
-                    offset += (
-                        REQUEST_CHUNK_SIZE
-                        if data_left > REQUEST_CHUNK_SIZE
-                        else data_left
-                    )
-                    data_left -= REQUEST_CHUNK_SIZE
+                await receive_data(ctx, f, 0, res_blur_size, BlurRequest)
                 f.sync()
             _verify_file_size(blur_path, res_blur_size)
 
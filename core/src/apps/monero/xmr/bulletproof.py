@@ -1164,6 +1164,143 @@ class MultiExpSequential:
         return crypto.encodepoint_into(dst, self.acc)
 
 
+# Pairs evaluated at once by MultiExp, bounds the memory of the decoded points.
+_MULTIEXP_CHUNK = const(64)
+# Below this number of pairs, native scalar multiplications are faster.
+_MULTIEXP_MIN_BUCKET = const(16)
+
+
+def _recode_signed(scalar: bytes, c: int) -> bytearray:
+    """
+    Signed digits of the scalar in base 2^c, least significant first,
+    each in [-2^(c-1), 2^(c-1)) and stored in two's complement.
+    """
+    digits = bytearray(256 // c + 1)
+    mask = (1 << c) - 1
+    half = 1 << (c - 1)
+    carry = 0
+    for w in range(len(digits)):
+        pos = w * c
+        b = pos >> 3
+        v = scalar[b] if b < 32 else 0
+        if b + 1 < 32:
+            v |= scalar[b + 1] << 8
+        d = ((v >> (pos & 7)) & mask) + carry
+        carry = 0
+        if d >= half:
+            d -= 1 << c
+            carry = 1
+        digits[w] = d & 0xFF
+    return digits
+
+
+class MultiExp(MultiExpSequential):
+    """
+    MultiExp evaluated with the bucket method (Pippenger).
+
+    Scalars are recoded into signed digits of c bits. In every window each point
+    is added to (or subtracted from) the bucket of its digit and the buckets are
+    folded into \\sum_k k * bucket_k, so a pair costs about one point addition per
+    window instead of a full scalar multiplication.
+
+    The pairs are evaluated in chunks of at most _MULTIEXP_CHUNK pairs, which bounds
+    the memory to the points and scalars of one chunk and 2^(c-1) buckets.
+    Pairs with the fixed generators G and H use the native base point
+    multiplication and the precomputed H point. The evaluation branches on the
+    digits of the scalars, use it only for public scalars, i.e. in verification.
+    """
+
+    def __init__(
+        self, size: int | None = None, points: list | None = None, point_fnc=None
+    ) -> None:
+        super().__init__(size, points, point_fnc)
+        self.scalars: list[bytes] = []
+        self.chunk: list[crypto.Point] = []
+        self.window_acc = crypto.Point()
+        self.running = crypto.Point()
+
+    def _acc(self, scalar, point) -> None:
+        self.current_idx += 1
+        self.size += 1
+        if point is _XMR_G or point is _XMR_H:
+            crypto.decodeint_into_noreduce(_tmp_sc_1, scalar)
+            if point is _XMR_G:
+                crypto.scalarmult_base_into(_tmp_pt_3, _tmp_sc_1)
+            else:
+                crypto.scalarmult_into(_tmp_pt_3, _XMR_HP, _tmp_sc_1)
+            crypto.point_add_into(self.acc, self.acc, _tmp_pt_3)
+            return
+
+        self.scalars.append(bytes(scalar))
+        self.chunk.append(crypto.decodepoint_into(None, point))
+        if len(self.scalars) >= _MULTIEXP_CHUNK:
+            self._eval_chunk()
+
+    def _eval_chunk(self) -> None:
+        scalars = self.scalars
+        points = self.chunk
+        n = len(scalars)
+        self.scalars = []
+        self.chunk = []
+
+        if n < _MULTIEXP_MIN_BUCKET:
+            for i in range(n):
+                crypto.decodeint_into_noreduce(_tmp_sc_1, scalars[i])
+                crypto.scalarmult_into(_tmp_pt_3, points[i], _tmp_sc_1)
+                crypto.point_add_into(self.acc, self.acc, _tmp_pt_3)
+            return
+
+        c = 4 if n < 48 else 5
+        digits = [_recode_signed(sc, c) for sc in scalars]
+        del scalars
+        half = 1 << (c - 1)
+        buckets = [crypto.Point() for _ in range(half)]
+        used = bytearray(half)
+        acc = crypto.identity_into(self.window_acc)
+        running = self.running
+        started = False
+
+        for w in range(len(digits[0]) - 1, -1, -1):
+            if started:
+                # c doublings, three of them at once
+                crypto.ge25519_mul8(acc, acc)
+                for _ in range(c - 3):
+                    crypto.point_add_into(acc, acc, acc)
+
+            for b in range(half):
+                used[b] = 0
+            for i in range(n):
+                d = digits[i][w]
+                if d == 0:
+                    continue
+                b = d - 1 if d < 0x80 else 0xFF - d
+                bucket = buckets[b]
+                if not used[b]:
+                    crypto.identity_into(bucket)
+                    used[b] = 1
+                if d < 0x80:
+                    crypto.point_add_into(bucket, bucket, points[i])
+                else:
+                    crypto.point_sub_into(bucket, bucket, points[i])
+
+            # acc += sum_k (k + 1) * buckets[k], as a sum of running sums
+            crypto.identity_into(running)
+            running_set = False
+            for b in range(half - 1, -1, -1):
+                if used[b]:
+                    crypto.point_add_into(running, running, buckets[b])
+                    running_set = True
+                if running_set:
+                    crypto.point_add_into(acc, acc, running)
+            started = started or running_set
+
+        crypto.point_add_into(self.acc, self.acc, acc)
+
+    def eval(self, dst):
+        self._eval_chunk()
+        return super().eval(dst)
+
+
 def _multiexp(dst=None, data=None):
     return data.eval(dst)
 
@@ -1762,8 +1899,8 @@ class BulletProofPlusBuilder:
         # multiexp_size = nV + (2 * (max_logm + logN) + 3) * len(proofs) + 2 * maxMN
         Gprec = self._gprec_aux(maxMN)  # Extended precomputed GiHi
         Hprec = self._hprec_aux(maxMN)
-        muex_expl = MultiExpSequential()
-        muex_gh = MultiExpSequential(
+        muex_expl = MultiExp()
+        muex_gh = MultiExp(
             point_fnc=lambda i, d: Gprec[i >> 1] if i & 1 == 0 else Hprec[i >> 1]
         )
 
@@ -10,9 +10,10 @@ from .serialize import (
     ser_compact_size,
     ser_string,
     ser_uint256,
+    skip_string,
     uint256_from_str,
 )
-from .tx import COutPoint, CTransaction, CTxIn, CTxInWitness, CTxOut
+from .tx import COutPoint, CTransaction, CTransactionView, CTxIn, CTxInWitness, CTxOut
 
 if TYPE_CHECKING:
     from .serialize import Readable
@@ -93,7 +94,7 @@ class PartiallySignedInput:
     PSBT_IN_TAP_MERKLE_ROOT = 0x18
 
     def __init__(self, version: int) -> None:
-        self.non_witness_utxo: CTransaction | None = None
+        self.non_witness_utxo: CTransaction | CTransactionView | None = None
         self.witness_utxo: CTxOut | None = None
         self.partial_sigs: Dict[bytes, bytes] = {}
         self.sighash: int | None = None
@@ -143,11 +144,12 @@ class PartiallySignedInput:
         self.height_locktime = None
         self.unknown.clear()
 
-    def deserialize(self, f: Readable) -> None:
+    def deserialize(self, f: Readable, lazy: bool = False) -> None:
         """
         Deserialize a serialized PSBT input.
 
         :param f: A byte stream containing the serialized PSBT input
+        :param lazy: Keep the non witness utxo as a view into the stream, which must be a BufferReader
         """
         key_lookup: Set[bytes] = set()
 
@@ -172,9 +174,14 @@ class PartiallySignedInput:
                     )
                 elif len(key) != 1:
                     raise Exception("non witness utxo key is more than one byte type")
-                self.non_witness_utxo = CTransaction()
-                utxo_bytes = BufferReader(deser_string(f))
-                self.non_witness_utxo.deserialize(utxo_bytes)
+                if lazy:
+                    assert isinstance(f, BufferReader)
+                    utxo_data = f.read_memoryview(deser_compact_size(f))
+                    self.non_witness_utxo = CTransactionView(utxo_data)
+                else:
+                    self.non_witness_utxo = CTransaction()
+                    utxo_bytes = BufferReader(deser_string(f))
+                    self.non_witness_utxo.deserialize(utxo_bytes)
                 self.non_witness_utxo.rehash()
             elif key_type == PartiallySignedInput.PSBT_IN_WITNESS_UTXO:
                 if key in key_lookup:
@@ -437,7 +444,10 @@ class PartiallySignedInput:
             r += ser_string(
                 ser_compact_size(PartiallySignedInput.PSBT_IN_NON_WITNESS_UTXO)
             )
-            tx = self.non_witness_utxo.serialize_with_witness()
+            if isinstance(self.non_witness_utxo, CTransactionView):
+                tx = bytes(self.non_witness_utxo.data)
+            else:
+                tx = self.non_witness_utxo.serialize_with_witness()
             r += ser_string(tx)
 
         if self.witness_utxo:
@@ -844,6 +854,53 @@ class PSBT:
         f = BufferReader(psbt)
         end = len(psbt)
 
+        input_count, output_count = self.deserialize_global(f)
+
+        # Read input data
+        for i in range(input_count):
+            if f.tell() == end:
+                break
+            psbt_in = PartiallySignedInput(self.version)
+            psbt_in.deserialize(f)
+            self.inputs.append(psbt_in)
+
+            if self.version >= 2:
+                prev_txid = psbt_in.prev_txid
+            else:
+                prev_txid = ser_uint256(self.tx.vin[i].prevout.hash)
+
+            if psbt_in.non_witness_utxo:
+                psbt_in.non_witness_utxo.rehash()
+                if psbt_in.non_witness_utxo.hash != prev_txid:
+                    raise Exception("Non-witness UTXO does not match outpoint hash")
+
+        if len(self.inputs) != input_count:
+            raise Exception(
+                "Inputs provided does not match the number of inputs in transaction"
+            )
+
+        # Read output data
+        for i in range(output_count):
+            if f.tell() == end:
+                break
+            output = PartiallySignedOutput(self.version)
+            output.deserialize(f)
+            self.outputs.append(output)
+
+        if len(self.outputs) != output_count:
+            raise Exception(
+                "Outputs provided does not match the number of outputs in transaction"
+            )
+
+        self.cache_unsigned_tx_pieces()
+
+    def deserialize_global(self, f: BufferReader) -> Tuple[int, int]:
+        """
+        Deserialize the magic bytes and the global map of a PSBT.
+
+        :param f: The byte stream positioned at the start of the PSBT
+        :returns: The number of input maps and output maps which follow
+        """
         # Read the magic bytes
         magic = f.read(5)
         if magic != b"psbt\xff":
@@ -1006,47 +1063,11 @@ class PSBT:
             if not self.tx.is_null():
                 raise Exception("PSBT_GLOBAL_UNSIGNED_TX is not allowed in PSBTv2")
 
-        # Read input data
         if input_count is None:
             input_count = len(self.tx.vin)
-        for i in range(input_count):
-            if f.tell() == end:
-                break
-            psbt_in = PartiallySignedInput(self.version)
-            psbt_in.deserialize(f)
-            self.inputs.append(psbt_in)
-
-            if self.version >= 2:
-                prev_txid = psbt_in.prev_txid
-            else:
-                prev_txid = ser_uint256(self.tx.vin[i].prevout.hash)
-
-            if psbt_in.non_witness_utxo:
-                psbt_in.non_witness_utxo.rehash()
-                if psbt_in.non_witness_utxo.hash != prev_txid:
-                    raise Exception("Non-witness UTXO does not match outpoint hash")
-
-        if len(self.inputs) != input_count:
-            raise Exception(
-                "Inputs provided does not match the number of inputs in transaction"
-            )
-
-        # Read output data
         if output_count is None:
             output_count = len(self.tx.vout)
-        for i in range(output_count):
-            if f.tell() == end:
-                break
-            output = PartiallySignedOutput(self.version)
-            output.deserialize(f)
-            self.outputs.append(output)
-
-        if len(self.outputs) != output_count:
-            raise Exception(
-                "Outputs provided does not match the number of outputs in transaction"
-            )
-
-        self.cache_unsigned_tx_pieces()
+        return input_count, output_count
 
     def serialize(self) -> bytes:
         r = b""
@@ -1117,7 +1138,7 @@ class PSBT:
         """
         # To make things easier, we split up the global transaction
         # and use the PSBTv2 fields for PSBTv0
-        if self.tx is not None:
+        if not self.tx.is_null():
             self.setup_from_tx(self.tx)
 
     def setup_from_tx(self, tx: CTransaction):
@@ -1151,20 +1172,20 @@ class PSBT:
         time_lock: int | None = 0
         height_lock: int | None = 0
 
-        for psbt_in in self.inputs:
-            if psbt_in.time_locktime is not None and psbt_in.height_locktime is None:
+        for time_locktime, height_locktime in self.input_locktimes():
+            if time_locktime is not None and height_locktime is None:
                 height_lock = None
                 if time_lock is None:
                     raise Exception("Cannot require both time and height locktimes")
-            elif psbt_in.time_locktime is None and psbt_in.height_locktime is not None:
+            elif time_locktime is None and height_locktime is not None:
                 time_lock = None
                 if height_lock is None:
                     raise Exception("Cannot require both time and height locktimes")
 
-            if psbt_in.time_locktime is not None and time_lock is not None:
-                time_lock = max(time_lock, psbt_in.time_locktime)
-            if psbt_in.height_locktime is not None and height_lock is not None:
-                height_lock = max(height_lock, psbt_in.height_locktime)
+            if time_locktime is not None and time_lock is not None:
+                time_lock = max(time_lock, time_locktime)
+            if height_locktime is not None and height_lock is not None:
+                height_lock = max(height_lock, height_locktime)
 
         if height_lock is not None and height_lock > 0:
             return height_lock
@@ -1174,6 +1195,12 @@ class PSBT:
             return self.fallback_locktime
         return 0
 
+    def input_locktimes(self) -> List[Tuple[int | None, int | None]]:
+        """
+        The required time based and height based locktimes of the inputs
+        """
+        return [(i.time_locktime, i.height_locktime) for i in self.inputs]
+
     def lock_time_disabled(self) -> bool:
         """
         Checks if the lock time is disabled
@@ -1239,3 +1266,166 @@ class PSBT:
         self._convert_version(0)
         self.tx = self.get_unsigned_tx()
         self.explicit_version = False
+
+
+class PSBTView(PSBT):
+    """
+    A PSBT which is read in place from its serialization.
+
+    Only the global map is deserialized up front. The input and output maps are
+    indexed by their offsets and each of them is deserialized when it is asked
+    for, with the previous transactions kept as views into the serialization
+    rather than copies. The only changes which can be made are new signatures,
+    which `serialize` adds to the original maps.
+    """
+
+    def __init__(self, psbt: bytes) -> None:
+        super().__init__()
+        self.data = psbt
+        # (start, end) of each map, without the separator
+        self.input_spans: List[Tuple[int, int]] = []
+        self.output_spans: List[Tuple[int, int]] = []
+        self.locktimes: List[Tuple[int | None, int | None]] = []
+        # Serialized key-value pairs added to each input map
+        self.additions: Dict[int, bytes] = {}
+
+        f = BufferReader(psbt)
+        end = len(psbt)
+
+        input_count, output_count = self.deserialize_global(f)
+        self.global_end = f.tell()
+
+        for _ in range(input_count):
+            if f.tell() == end:
+                break
+            start = f.tell()
+            self.input_spans.append((start, self._index_map(f, self.locktimes)))
+
+        if len(self.input_spans) != input_count:
+            raise Exception(
+                "Inputs provided does not match the number of inputs in transaction"
+            )
+
+        for _ in range(output_count):
+            if f.tell() == end:
+                break
+            start = f.tell()
+            self.output_spans.append((start, self._index_map(f, None)))
+
+        if len(self.output_spans) != output_count:
+            raise Exception(
+                "Outputs provided does not match the number of outputs in transaction"
+            )
+
+        if not self.tx.is_null():
+            self.tx_version = self.tx.nVersion
+            self.fallback_locktime = self.tx.nLockTime
+
+    @staticmethod
+    def _index_map(
+        f: BufferReader, locktimes: List[Tuple[int | None, int | None]] | None
+    ) -> int:
+        """
+        Skip over a map and return the offset of its end, without the separator.
+
+        :param locktimes: If given, the required locktimes of the input are appended to it
+        """
+        time_locktime = None
+        height_locktime = None
+        while True:
+            end = f.tell()
+            try:
+                key = deser_string(f)
+            except Exception:
+                break
+            if len(key) == 0:
+                break
+            if locktimes is None or len(key) != 1:
+                skip_string(f)
+            elif key[0] == PartiallySignedInput.PSBT_IN_REQUIRED_TIME_LOCKTIME:
+                time_locktime = PSBTView._read_uint32(f)
+            elif key[0] == PartiallySignedInput.PSBT_IN_REQUIRED_HEIGHT_LOCKTIME:
+                height_locktime = PSBTView._read_uint32(f)
+            else:
+                skip_string(f)
+        if locktimes is not None:
+            locktimes.append((time_locktime, height_locktime))
+        return end
+
+    @staticmethod
+    def _read_uint32(f: BufferReader) -> int | None:
+        # Invalid values are reported when the input is deserialized
+        v = deser_string(f)
+        return struct.unpack("<I", v)[0] if len(v) == 4 else None
+
+    def input_count(self) -> int:
+        return len(self.input_spans)
+
+    def output_count(self) -> int:
+        return len(self.output_spans)
+
+    def input(self, i: int) -> PartiallySignedInput:
+        """
+        Deserialize the input map `i`, together with the signatures added to it
+        """
+        f = BufferReader(self.data)
+        f.seek(self.input_spans[i][0])
+        psbt_in = PartiallySignedInput(self.version)
+        psbt_in.deserialize(f, lazy=True)
+        if i in self.additions:
+            psbt_in.deserialize(BufferReader(self.additions[i]))
+
+        if not self.tx.is_null():
+            txin = self.tx.vin[i]
+            psbt_in.prev_txid = ser_uint256(txin.prevout.hash)
+            psbt_in.prev_out = txin.prevout.n
+            psbt_in.sequence = txin.nSequence
+
+        if psbt_in.non_witness_utxo:
+            if psbt_in.non_witness_utxo.hash != psbt_in.prev_txid:
+                raise Exception("Non-witness UTXO does not match outpoint hash")
+        return psbt_in
+
+    def output(self, i: int) -> PartiallySignedOutput:
+        """
+        Deserialize the output map `i`
+        """
+        f = BufferReader(self.data)
+        f.seek(self.output_spans[i][0])
+        psbt_out = PartiallySignedOutput(self.version)
+        psbt_out.deserialize(f)
+
+        if not self.tx.is_null():
+            txout = self.tx.vout[i]
+            psbt_out.amount = txout.nValue
+            psbt_out.script = txout.scriptPubKey
+        return psbt_out
+
+    def add_partial_sig(self, i: int, pubkey: bytes, sig: bytes) -> None:
+        key = ser_compact_size(PartiallySignedInput.PSBT_IN_PARTIAL_SIG) + pubkey
+        self._add(i, key, sig)
+
+    def add_tap_key_sig(self, i: int, sig: bytes) -> None:
+        key = ser_compact_size(PartiallySignedInput.PSBT_IN_TAP_KEY_SIG)
+        self._add(i, key, sig)
+
+    def _add(self, i: int, key: bytes, value: bytes) -> None:
+        self.additions[i] = (
+            self.additions.get(i, b"") + ser_string(key) + ser_string(value)
+        )
+
+    def input_locktimes(self) -> List[Tuple[int | None, int | None]]:
+        return self.locktimes
+
+    def serialize(self) -> bytes:
+        data = memoryview(self.data)
+        r = bytearray(data[: self.global_end])
+        for i, (start, end) in enumerate(self.input_spans):
+            r.extend(data[start:end])
+            if i in self.additions:
+                r.extend(self.additions[i])
+            r.append(0)
+        for start, end in self.output_spans:
+            r.extend(data[start:end])
+            r.append(0)
+        return bytes(r)
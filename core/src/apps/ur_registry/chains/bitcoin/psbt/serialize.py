@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from typing import List, Protocol, TypeVar, Callable, Sequence
+    from trezor.utils import BufferReader
 
     class Readable(Protocol):
         def read(self, length: int | None = -1) -> bytes:
@@ -67,6 +68,16 @@ def deser_string(s: Readable) -> bytes:
     return s.read(nit)
 
 
+def skip_string(s: BufferReader) -> None:
+    """
+    Skip a variable length byte string in a byte stream without copying it.
+
+    :param s: The byte stream
+    """
+    nit = deser_compact_size(s)
+    s.read_memoryview(nit)
+
+
 def ser_string(s: bytes) -> bytes:
     """
     Serialize a byte string with Bitcoin's variable length string serialization.
@@ -1,8 +1,11 @@
 import ustruct as struct
 from typing import TYPE_CHECKING
 
+from trezor.utils import BufferReader
+
 from .script import is_opreturn, is_p2pk, is_p2pkh, is_p2sh, is_p2wsh, is_witness
 from .serialize import (
+    deser_compact_size,
     deser_string,
     deser_string_vector,
     deser_uint256,
@@ -11,6 +14,7 @@ from .serialize import (
     ser_string_vector,
     ser_uint256,
     ser_vector,
+    skip_string,
     uint256_from_str,
 )
 
@@ -289,7 +293,77 @@ class CTransaction:
     def is_null(self) -> bool:
         return len(self.vin) == 0 and len(self.vout) == 0
 
+    def txout(self, n: int) -> CTxOut:
+        return self.vout[n]
+
     if __debug__:
 
         def __repr__(self) -> str:
             return f"CTransaction(nVersion={self.nVersion:i} vin={repr(self.vin)} vout={repr(self.vout)} wit={repr(self.wit)} nLockTime={self.nLockTime:i})"
+
+
+class CTransactionView:
+    """
+    A serialized transaction which is read in place, without being copied out of
+    the buffer holding it. Only its txid and single outputs are ever decoded,
+    which is all that is needed of the previous transactions of a PSBT.
+    """
+
+    def __init__(self, data: memoryview) -> None:
+        self.data = data
+        self.hash: bytes | None = None
+        self.vout_offset = 0
+        self.vout_count = 0
+
+    def rehash(self) -> None:
+        from trezor.crypto import hashlib
+
+        data = self.data
+        f = BufferReader(data)
+        f.read_memoryview(4)  # nVersion
+        vin_offset = f.tell()
+        vin_count = deser_compact_size(f)
+        flags = 0
+        if vin_count == 0:
+            # same as CTransaction.deserialize
+            flags = f.get()
+            if flags != 0:
+                vin_offset = f.tell()
+                vin_count = deser_compact_size(f)
+        for _ in range(vin_count):
+            f.read_memoryview(36)  # prevout
+            skip_string(f)  # scriptSig
+            f.read_memoryview(4)  # nSequence
+        if vin_count != 0 or flags != 0:
+            self.vout_count = deser_compact_size(f)
+        self.vout_offset = f.tell()
+        for _ in range(self.vout_count):
+            f.read_memoryview(8)  # nValue
+            skip_string(f)  # scriptPubKey
+        vout_end = f.tell()
+        if flags != 0:
+            for _ in range(vin_count):
+                for _ in range(deser_compact_size(f)):
+                    skip_string(f)
+        lock_time = f.read_memoryview(4)
+
+        # txid is the double SHA-256 of the serialization without witness
+        h = hashlib.sha256()
+        h.update(data[:4])
+        h.update(data[vin_offset:vout_end])
+        h.update(lock_time)
+        self.hash = hashlib.sha256(h.digest()).digest()
+
+    def txout(self, n: int) -> CTxOut:
+        if self.hash is None:
+            self.rehash()
+        if not 0 <= n < self.vout_count:
+            raise IndexError
+        f = BufferReader(self.data)
+        f.seek(self.vout_offset)
+        for _ in range(n):
+            f.read_memoryview(8)  # nValue
+            skip_string(f)  # scriptPubKey
+        txout = CTxOut()
+        txout.deserialize(f)
+        return txout
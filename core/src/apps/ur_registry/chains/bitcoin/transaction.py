@@ -9,7 +9,7 @@ from apps.ur_registry.chains import MismatchError
 
 from .crypto_psbt import CryptoPSBT
 from .psbt.key import ExtendedPubKey
-from .psbt.psbt import PSBT
+from .psbt.psbt import PSBTView
 from .psbt.script import is_p2pkh, is_p2sh, is_p2wsh, is_witness
 from .psbt.tx import CTxOut
 
@@ -223,8 +223,8 @@ class SignPsbt:
     async def run(self):
         # if __debug__:
         #     utils.mem_trace(__name__, 0)
-        psbt = PSBT()
-        psbt.deserialize(self.req.get_psbt())
+        # the view keeps the serialized PSBT and decodes one map at a time
+        psbt = PSBTView(self.req.get_psbt())
         # if __debug__:
         #     utils.mem_trace(__name__, 1)
         del self.req.psbt
@@ -254,7 +254,8 @@ class SignPsbt:
             to_ignore = (
                 []
             )  # Note down which inputs whose signatures we're going to ignore
-            for input_num, psbt_in in enumerate(psbt.inputs):
+            for input_num in range(psbt.input_count()):
+                psbt_in = psbt.input(input_num)
                 assert psbt_in.prev_txid is not None
                 assert psbt_in.prev_out is not None
                 assert psbt_in.sequence is not None
@@ -275,7 +276,7 @@ class SignPsbt:
                         raise Exception(
                             f"Input {input_num} has a non_witness_utxo with the wrong hash"
                         )
-                    utxo = psbt_in.non_witness_utxo.vout[psbt_in.prev_out]
+                    utxo = psbt_in.non_witness_utxo.txout(psbt_in.prev_out)
                 if utxo is None:
                     continue
                 scriptcode = utxo.scriptPubKey
@@ -399,7 +400,8 @@ class SignPsbt:
 
             # prepare outputs
             outputs = []
-            for psbt_out in psbt.outputs:
+            for output_num in range(psbt.output_count()):
+                psbt_out = psbt.output(output_num)
                 out = psbt_out.get_txout()
                 txoutput = TxOutputType(amount=out.nValue)
                 txoutput.script_type = OutputScriptType.PAYTOADDRESS
@@ -503,9 +505,8 @@ class SignPsbt:
             # if __debug__:
             #     utils.mem_trace(__name__, 5)
             self._retrieval_signatures(res)
-            for input_num, (psbt_in, sig) in enumerate(
-                list(zip(psbt.inputs, self.signatures))
-            ):
+            for input_num, sig in enumerate(self.signatures):
+                psbt_in = psbt.input(input_num)
                 if input_num in to_ignore:
                     if __debug__:
                         print(f"input {input_num} signature ignored")
@@ -514,7 +515,7 @@ class SignPsbt:
                     fp = psbt_in.hd_keypaths[pubkey].fingerprint
                     if fp == master_fp and pubkey not in psbt_in.partial_sigs:
                         assert sig is not None, "signature should not be None"
-                        psbt_in.partial_sigs[pubkey] = sig + b"\x01"
+                        psbt.add_partial_sig(input_num, pubkey, sig + b"\x01")
                         if __debug__:
                             import binascii
 
@@ -529,7 +530,7 @@ class SignPsbt:
                 if len(psbt_in.tap_internal_key) > 0 and len(psbt_in.tap_key_sig) == 0:
                     # Assume key path sig
                     assert sig is not None, "signature should not be None"
-                    psbt_in.tap_key_sig = sig
+                    psbt.add_tap_key_sig(input_num, sig)
                     if __debug__:
                         import binascii
 
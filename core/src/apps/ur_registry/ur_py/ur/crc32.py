@@ -5,34 +5,12 @@
 # Licensed under the "BSD-2-Clause Plus Patent License"
 #
 # pyright: off
-from .constants import MAX_UINT32
-
-
-def bit_length(n):
-    return len(bin(abs(n))) - 2
-
-
-TABLE = None
+from trezor.crypto import crc
 
 
 def crc32(buf):
-    # Lazily instantiate CRC table
-    global TABLE
-    if TABLE is None:
-        TABLE = [None] * (256 * 4)
-
-        for i in range(256):
-            c = i
-            for j in range(8):
-                c = (c >> 1) if (c % 2 == 0) else (0xEDB88320 ^ (c >> 1))
-
-            TABLE[i] = c
-
-    crc = MAX_UINT32 & ~0
-    for byte in buf:
-        crc = (crc >> 8) ^ TABLE[(crc ^ byte) & 0xFF]
-
-    return MAX_UINT32 & ~crc
+    # CRC-32/ISO-HDLC, computed by the native module instead of a table in Python
+    return crc.crc32(buf)
 
 
 def crc32n(buf):
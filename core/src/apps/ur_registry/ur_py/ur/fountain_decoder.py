@@ -5,8 +5,8 @@
 # Licensed under the "BSD-2-Clause Plus Patent License"
 #
 # pyright: off
-from .fountain_utils import choose_fragments, contains, is_strict_subset, set_difference
-from .utils import crc32_int, join_bytes, take_first, xor_with
+from .fountain_utils import choose_fragments
+from .utils import crc32_int, join_bytes, take_first
 
 
 class InvalidPart(Exception):
@@ -17,57 +17,93 @@ class InvalidChecksum(Exception):
     pass
 
 
+# Fragment sets are kept as bitmasks, bit `i` standing for fragment `i`, and the
+# fragment data as big-endian integers, so that subset tests, set differences and
+# XORs each take a single operation on whole words instead of a loop in Python.
+
+
+def indexes_to_mask(indexes):
+    mask = 0
+    for i in indexes:
+        mask |= 1 << i
+    return mask
+
+
+def mask_to_indexes(mask):
+    i = 0
+    while mask:
+        if mask & 0xFF == 0:
+            mask >>= 8
+            i += 8
+            continue
+        if mask & 1:
+            yield i
+        mask >>= 1
+        i += 1
+
+
+def lowest_index(mask):
+    # MicroPython integers have no bit_length()
+    return len(bin(mask ^ (mask & (mask - 1)))) - 3
+
+
 class FountainDecoder:
     class Part:
-        def __init__(self, indexes, data):
-            self.indexes = frozenset(indexes)
+        def __init__(self, mask, data):
+            self.mask = mask
             self.data = data
 
         @classmethod
         def from_encoder_part(cls, p):
-            return cls(choose_fragments(p.seq_num, p.seq_len, p.checksum), p.data[:])
+            indexes = choose_fragments(p.seq_num, p.seq_len, p.checksum)
+            return cls(indexes_to_mask(indexes), int.from_bytes(p.data, "big"))
 
         def indexes(self):
-            return self.indexes
-
-        def data(self):
-            return self.data
+            return set(mask_to_indexes(self.mask))
 
         def is_simple(self):
-            return len(self.indexes) == 1
+            return self.mask & (self.mask - 1) == 0
 
         def index(self):
-            # TODO: Not efficient
-            return list(self.indexes)[0]
+            return lowest_index(self.mask)
 
     # FountainDecoder
     def __init__(self):
-        self.received_part_indexes = set()
         self.last_part_indexes = None
         self.processed_parts_count = 0
         self.result = None
-        self.expected_part_indexes = None
+        self.expected_part_len = None
+        self.expected_mask = None
         self.expected_fragment_len = None
         self.expected_message_len = None
         self.expected_checksum = None
+        self.received_mask = 0
+        # fragment index -> fragment data
         self.simple_parts = {}
+        # fragment mask -> Part
         self.mixed_parts = {}
         self.queued_parts = []
 
     def reset(self):
-        self.received_part_indexes.clear()
         self.last_part_indexes = None
         self.processed_parts_count = 0
         self.result = None
-        self.expected_part_indexes = None
+        self.expected_part_len = None
+        self.expected_mask = None
         self.expected_fragment_len = None
         self.expected_message_len = None
         self.expected_checksum = None
+        self.received_mask = 0
         self.simple_parts.clear()
         self.mixed_parts.clear()
         self.queued_parts.clear()
+
+    @property
+    def received_part_indexes(self):
+        return set(mask_to_indexes(self.received_mask))
+
     def expected_part_count(self):
-        return len(self.expected_part_indexes)  # TODO: Handle None?
+        return self.expected_part_len  # TODO: Handle None?
 
     def is_success(self):
         result = self.result
@@ -89,7 +125,7 @@ class FountainDecoder:
     def estimated_percent_complete(self):
         if self.is_complete():
             return 1
-        if self.expected_part_indexes is None:
+        if self.expected_part_len is None:
             return 0
         estimated_input_parts = self.expected_part_count() * 1.75
         return min(0.95, self.processed_parts_count / estimated_input_parts)
@@ -105,7 +141,7 @@ class FountainDecoder:
 
         # Add this part to the queue
         p = FountainDecoder.Part.from_encoder_part(encoder_part)
-        self.last_part_indexes = p.indexes
+        self.last_part_indexes = p.indexes()
         self.enqueue(p)
 
         # Process the queue until we're done or the queue is empty
@@ -139,58 +175,50 @@ class FountainDecoder:
         # self.print_state()
 
     def reduce_mixed_by(self, p):
-        # Reduce all the current mixed parts by the given part
-        reduced_parts = []
-        for value in self.mixed_parts.values():
-            reduced_parts.append(self.reduce_part_by_part(value, p))
-
-        # Collect all the remaining mixed parts
-        new_mixed = {}
-        for reduced_part in reduced_parts:
+        # Only reduce the mixed parts whose fragments are a strict superset of
+        # those in `p`, a single AND of the masks tells them apart
+        mask = p.mask
+        affected = []
+        for m in self.mixed_parts:
+            if m != mask and m & mask == mask:
+                affected.append(m)
+
+        for m in affected:
+            reduced_part = self.reduce_part_by_part(self.mixed_parts.pop(m), p)
             # If this reduced part is now simple
             if reduced_part.is_simple():
                 # Add it to the queue
                 self.enqueue(reduced_part)
-            else:
-                # Otherwise, add it to the dict of current mixed parts
-                new_mixed[reduced_part.indexes] = reduced_part
-
-        self.mixed_parts = new_mixed
+            elif reduced_part.mask not in self.mixed_parts:
+                # Otherwise, add it to the current mixed parts
+                self.mixed_parts[reduced_part.mask] = reduced_part
 
     def reduce_part_by_part(self, a, b):
         # If the fragments mixed into `b` are a strict (proper) subset of those in `a`...
-        if is_strict_subset(b.indexes, a.indexes):
-            # The new fragments in the revised part are `a` - `b`.
-            new_indexes = set_difference(a.indexes, b.indexes)
-            # The new data in the revised part are `a` XOR `b`
-            new_data = xor_with(bytearray(a.data), b.data)
-            return self.Part(new_indexes, new_data)
+        if a.mask != b.mask and a.mask & b.mask == b.mask:
+            # The new fragments in the revised part are `a` - `b`,
+            # the new data in the revised part are `a` XOR `b`.
+            return self.Part(a.mask ^ b.mask, a.data ^ b.data)
         else:
             # `a` is not reducable by `b`, so return a
             return a
 
     def process_simple_part(self, p):
         # Don't process duplicate parts
-        fragment_index = p.index()
-        if contains(self.received_part_indexes, fragment_index):
+        if self.received_mask & p.mask:
             return
 
         # Record this part
-        self.simple_parts[p.indexes] = p
-        self.received_part_indexes.add(fragment_index)
+        self.simple_parts[p.index()] = p.data
+        self.received_mask |= p.mask
 
         # If we've received all the parts
-        if self.received_part_indexes == self.expected_part_indexes:
+        if self.received_mask == self.expected_mask:
             # Reassemble the message from its fragments
-            sorted_parts = []
-            for value in self.simple_parts.values():
-                sorted_parts.append(value)
-
-            sorted_parts.sort(key=lambda a: a.index())
-
+            fragment_len = self.expected_fragment_len
             fragments = []
-            for part in sorted_parts:
-                fragments.append(part.data)
+            for i in range(self.expected_part_len):
+                fragments.append(self.simple_parts[i].to_bytes(fragment_len, "big"))
 
             message = self.join_fragments(fragments, self.expected_message_len)
 
@@ -207,18 +235,28 @@ class FountainDecoder:
 
     def process_mixed_part(self, p):
         # Don't process duplicate parts
-        for r in self.mixed_parts.values():
-            if r == p.indexes:
-                return
+        if p.mask in self.mixed_parts:
+            return
 
-        # Reduce this part by all the others
-        p2 = p  # TODO: Does this need to make a copy of p?
-        for r in self.simple_parts.values():
-            p2 = self.reduce_part_by_part(p2, r)
+        # Reduce this part by all the simple parts it contains
+        mask, data = p.mask, p.data
+        known = mask & self.received_mask
+        if known:
+            for i in mask_to_indexes(known):
+                data ^= self.simple_parts[i]
+            mask ^= known
 
+        # and by the mixed parts whose fragments it contains
         for r in self.mixed_parts.values():
-            p2 = self.reduce_part_by_part(p2, r)
+            if r.mask != mask and r.mask & mask == r.mask:
+                mask ^= r.mask
+                data ^= r.data
 
+        # Nothing new in this part
+        if mask == 0 or mask in self.mixed_parts:
+            return
+
+        p2 = self.Part(mask, data)
         # If the part is now simple
         if p2.is_simple():
             # Add it to the queue
@@ -227,16 +265,14 @@ class FountainDecoder:
             # Reduce all the mixed parts by this one
             self.reduce_mixed_by(p2)
             # Record this new mixed part
-            self.mixed_parts[p2.indexes] = p2
+            self.mixed_parts[p2.mask] = p2
 
     def validate_part(self, p):
         # If this is the first part we've seen
-        if self.expected_part_indexes is None:
+        if self.expected_part_len is None:
             # Record the things that all the other parts we see will have to match to be valid.
-            self.expected_part_indexes = set()
-            for i in range(p.seq_len):
-                self.expected_part_indexes.add(i)
-
+            self.expected_part_len = p.seq_len
+            self.expected_mask = (1 << p.seq_len) - 1
             self.expected_message_len = p.message_len
             self.expected_checksum = p.checksum
             self.expected_fragment_len = len(p.data)
@@ -274,13 +310,11 @@ class FountainDecoder:
 
     def print_part(self, p):
         if __debug__:
-            print("part indexes: {}".format(self.indexes_to_string(p.indexes)))
+            print("part indexes: {}".format(self.indexes_to_string(p.indexes())))
 
     def print_part_end(self):
         expected = (
-            self.expected_part_count()
-            if self.expected_part_indexes is not None
-            else "None"
+            self.expected_part_count() if self.expected_part_len is not None else "None"
         )
         percent = int(round(self.estimated_percent_complete() * 100))
         if __debug__:
@@ -295,14 +329,12 @@ class FountainDecoder:
 
     def print_state(self):
         parts = (
-            self.expected_part_count()
-            if self.expected_part_indexes is not None
-            else "None"
+            self.expected_part_count() if self.expected_part_len is not None else "None"
         )
         received = self.indexes_to_string(self.received_part_indexes)
         mixed = []
-        for indexes, p in self.mixed_parts.items():
-            mixed.append(self.indexes_to_string(indexes))
+        for p in self.mixed_parts.values():
+            mixed.append(self.indexes_to_string(p.indexes()))
 
         mixed_s = "[{}]".format(", ".join(mixed))
         queued = len(self.queued_parts)
@@ -313,4 +345,6 @@ class FountainDecoder:
                     parts, received, mixed_s, queued, res
                 )
             )
+
+
 # pyright: on
@@ -10,11 +10,13 @@ from .utils import int_to_bytes
 from .xoshiro256 import Xoshiro256
 
 
-# Fisher-Yates shuffle
-def shuffled(items, rng):
+# Fisher-Yates shuffle, optionally stopping after the first `count` items
+def shuffled(items, rng, count=None):
     remaining = items
     result = []
-    while len(remaining) > 0:
+    if count is None:
+        count = len(items)
+    while len(result) < count:
         index = rng.next_int(0, len(remaining) - 1)
         item = remaining.pop(index)
         result.append(item)
@@ -22,13 +24,20 @@ def shuffled(items, rng):
     return result
 
 
+# The degree sampler of the last `seq_len`, all parts of a message share it
+_degree_chooser = None
+
+
 def choose_degree(seq_len, rng):
-    degree_probabilities = []
-    for i in range(1, seq_len + 1):
-        degree_probabilities.append(1.0 / i)
+    global _degree_chooser
+    if _degree_chooser is None or _degree_chooser[0] != seq_len:
+        degree_probabilities = []
+        for i in range(1, seq_len + 1):
+            degree_probabilities.append(1.0 / i)
+
+        _degree_chooser = (seq_len, RandomSampler(degree_probabilities))
 
-    degree_chooser = RandomSampler(degree_probabilities)
-    return degree_chooser.next(lambda: rng.next_double()) + 1
+    return _degree_chooser[1].next(lambda: rng.next_double()) + 1
 
 
 def choose_fragments(seq_num, seq_len, checksum):
@@ -45,8 +54,9 @@ def choose_fragments(seq_num, seq_len, checksum):
 
         for i in range(seq_len):
             indexes.append(i)
-        shuffled_indexes = shuffled(indexes, rng)
-        return set(shuffled_indexes[0:degree])
+        # Only the first `degree` shuffled indexes are used, the rest of the
+        # shuffle doesn't need to be drawn.
+        return set(shuffled(indexes, rng, degree))
 
 
 def contains(set_or_list, el):
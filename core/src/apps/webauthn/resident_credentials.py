@@ -24,32 +24,32 @@ def _credential_from_data(index: int, data: bytes) -> Fido2Credential:
 def find_all() -> Iterator[Fido2Credential]:
     if not _ALLOW_RESIDENT_CREDENTIALS:
         return
-    registered_count = storage.resident_credentials.get_fido2_counter()
-    if registered_count == 0:
+    if storage.resident_credentials.get_fido2_counter() == 0:
         return
-    find = 0
-    for index in range(MAX_RESIDENT_CREDENTIALS):
-        if find >= registered_count:
-            return
+    for index in storage.resident_credentials.occupied_slots():
         data = storage.resident_credentials.get(index)
-        if data is not None:
-            yield _credential_from_data(index, data)
-            find += 1
+        if data is None:
+            # the index is out of date, it gets rebuilt on the next lookup
+            storage.resident_credentials.invalidate_index()
+            continue
+        yield _credential_from_data(index, data)
 
 
 @ensure_fido_seed
 def find_by_rp_id_hash(rp_id_hash: bytes) -> Iterator[Fido2Credential]:
     if not _ALLOW_RESIDENT_CREDENTIALS:
         return
-    for index in range(MAX_RESIDENT_CREDENTIALS):
+    # only the slots whose RP ID hash prefix matches are read
+    for index in storage.resident_credentials.slots_by_rp_id_hash(rp_id_hash):
         data = storage.resident_credentials.get(index)
 
         if data is None:
-            # empty slot
+            # the index is out of date, it gets rebuilt on the next lookup
+            storage.resident_credentials.invalidate_index()
             continue
 
         if data[:RP_ID_HASH_LENGTH] != rp_id_hash:
-            # rp_id_hash mismatch
+            # rp_id_hash mismatch beyond the indexed prefix
             continue
 
         yield _credential_from_data(index, data)
@@ -78,13 +78,12 @@ def store_resident_credential(cred: Fido2Credential) -> bool:
 
     slot = None
     is_overwritten = False
-    for index in range(MAX_RESIDENT_CREDENTIALS):
+    for index in storage.resident_credentials.slots_by_rp_id_hash(cred.rp_id_hash):
         stored_data = storage.resident_credentials.get(index)
         if stored_data is None:
-            # found candidate empty slot
-            if slot is None:
-                slot = index
-            continue
+            # the index is out of date, look up the slots again after a rebuild
+            storage.resident_credentials.invalidate_index()
+            return store_resident_credential(cred)
 
         if cred.rp_id_hash != stored_data[:RP_ID_HASH_LENGTH]:
             # slot is occupied by a different rp_id_hash
@@ -97,6 +96,8 @@ def store_resident_credential(cred: Fido2Credential) -> bool:
             is_overwritten = True
             break
 
+    if slot is None:
+        slot = storage.resident_credentials.free_slot()
     if slot is None:
         return False
 
@@ -81,6 +81,8 @@ def find_message_handler_module(msg_type: int) -> str:
         return "apps.bitcoin.get_public_key"
     if msg_type == MessageType.GetAddress:
         return "apps.bitcoin.get_address"
+    if msg_type == MessageType.BatchGetAddresses:
+        return "apps.bitcoin.batch_get_addresses"
     if msg_type == MessageType.GetOwnershipId:
         return "apps.bitcoin.get_ownership_id"
     if msg_type == MessageType.GetOwnershipProof:
@@ -412,11 +414,13 @@ def _is_address_derivation_message(msg_type: int) -> bool:
     if utils.BITCOIN_ONLY:
         return msg_type in (
             MessageType.GetAddress,
+            MessageType.BatchGetAddresses,
             MessageType.GetPublicKey,
         )
     else:
         return msg_type in (
             MessageType.GetAddress,
+            MessageType.BatchGetAddresses,
             MessageType.GetPublicKey,
             MessageType.EthereumGetAddress,
             MessageType.EthereumGetAddressOneKey,
@@ -6,7 +6,7 @@ from trezor import utils
 from trezor.crypto import se_thd89
 
 if TYPE_CHECKING:
-    from typing import Sequence, TypeVar, overload
+    from typing import Any, Sequence, TypeVar, overload
 
     T = TypeVar("T")
 
@@ -121,8 +121,27 @@ class SessionCache(DataCache):
                 1,  # APP_MONERO_LIVE_REFRESH
             )
         self.last_usage = 0
+        # derived nodes shared by keychains of this session, see apps.common.keychain
+        self.derivation_cache: Any = None
         super().__init__()
 
+    def set(self, key: int, value: bytes) -> None:
+        if key == APP_COMMON_SEED:
+            # cached nodes belong to the previous seed
+            self.clear_derivation_cache()
+        super().set(key, value)
+
+    def delete(self, key: int) -> None:
+        if key == APP_COMMON_SEED:
+            self.clear_derivation_cache()
+        super().delete(key)
+
+    def clear_derivation_cache(self) -> None:
+        if self.derivation_cache is not None:
+            # wipes the cached nodes
+            self.derivation_cache.__del__()
+            self.derivation_cache = None
+
     def export_session_id(self) -> bytes:
         # generate a new session id if we don't have it yet
         if not self.session_id:
@@ -132,6 +151,7 @@ class SessionCache(DataCache):
 
     def clear(self) -> None:
         super().clear()
+        self.clear_derivation_cache()
         self.last_usage = 0
         self.session_id[:] = b""
 
@@ -262,6 +282,20 @@ def set(key: int, value: bytes) -> None:
         return
 
 
+def get_derivation_cache() -> Any:
+    if _active_session_idx is None:
+        raise InvalidSessionError
+    return _SESSIONS[_active_session_idx].derivation_cache
+
+
+def set_derivation_cache(value: Any) -> None:
+    if _active_session_idx is None:
+        raise InvalidSessionError
+    session = _SESSIONS[_active_session_idx]
+    session.clear_derivation_cache()
+    session.derivation_cache = value
+
+
 def set_int(key: int, value: int) -> None:
     if key & _SESSIONLESS_FLAG:
         length = _SESSIONLESS_CACHE.fields[key ^ _SESSIONLESS_FLAG]
@@ -19,6 +19,7 @@ LOCKSCREEN_PATH_MAXSIZE = const(128)
 BLE_NAME_MAXLENGTH = const(16)
 BLE_VERSION_MAXLENGTH = const(8)
 PREVIOUS_LABEL_MAXLENGTH = const(13)
+FIDO2_CRED_INDEX_MAXSIZE = const(224)
 
 SE_1ST_ADDRESS = const(0x10 << 1)
 SE_2ND_ADDRESS = const(0x11 << 1)
@@ -174,6 +175,12 @@ if utils.USE_THD89:
         "ble_version": (3 | uctypes.ARRAY, 12 | uctypes.UINT8),
     }
 
+    struct_fido2_cred_index: uctypes.StructDict = {
+        "has_value": 0 | uctypes.UINT8,
+        "size": 1 | uctypes.UINT16,
+        "index": (3 | uctypes.ARRAY, FIDO2_CRED_INDEX_MAXSIZE | uctypes.UINT8),
+    }
+
     struct_public = {}
 
     offset = 0
@@ -292,6 +299,8 @@ if utils.USE_THD89:
     offset += uctypes.sizeof(struct_uint32, uctypes.LITTLE_ENDIAN)
     struct_private["sd_auth_key"] = (offset, struct_SD_auth_key)
     offset += uctypes.sizeof(struct_SD_auth_key, uctypes.LITTLE_ENDIAN)
+    struct_private["fido2_cred_index"] = (offset, struct_fido2_cred_index)
+    offset += uctypes.sizeof(struct_fido2_cred_index, uctypes.LITTLE_ENDIAN)
     # private_field = uctypes.struct(0, struct_private, uctypes.LITTLE_ENDIAN)
     assert (
         uctypes.sizeof(struct_private, uctypes.LITTLE_ENDIAN) < _PRIVATE_REGION_SIZE
@@ -355,6 +364,7 @@ if utils.USE_THD89:
     _BACKUP_TYPE = _PRIVATE_FLAG | struct_private["backup_type"][0]
     _SAFETY_CHECK_LEVEL = _PRIVATE_FLAG | struct_private["safety_check"][0]
     _SD_SALT_AUTH_KEY = _PRIVATE_FLAG | struct_private["sd_auth_key"][0]
+    _FIDO2_CRED_INDEX = _PRIVATE_FLAG | struct_private["fido2_cred_index"][0]
 
 else:
     # fmt: off
@@ -409,6 +419,7 @@ else:
     _DEVICE_NAME_DISPLAY_ENABLED = (0x93)  # bool
     _USB_ENABLED = (0x94)  # bool
     _BLE_ENABLED_BACKUP = (0x95)  # bool
+    _FIDO2_CRED_INDEX = (0x96)  # bytes
     # fmt: on
 SAFETY_CHECK_LEVEL_STRICT: Literal[0] = const(0)
 SAFETY_CHECK_LEVEL_PROMPT: Literal[1] = const(1)
@@ -893,6 +904,22 @@ def set_fido2_counter(value: int) -> None:
     _FIDO2_COUNTER_VALUE = value
 
 
+def get_fido2_cred_index() -> bytes | None:
+    """
+    Index of the FIDO2 resident credential slots, see storage.resident_credentials.
+    """
+    return common.get(_NAMESPACE, _FIDO2_CRED_INDEX)
+
+
+def set_fido2_cred_index(index: bytes | None) -> None:
+    if index is not None:
+        if len(index) > FIDO2_CRED_INDEX_MAXSIZE:
+            raise ValueError
+        common.set(_NAMESPACE, _FIDO2_CRED_INDEX, index)
+    else:
+        common.delete(_NAMESPACE, _FIDO2_CRED_INDEX)
+
+
 def is_initialized() -> bool:
     global _INITIALIZED_VALUE
     if utils.EMULATOR:
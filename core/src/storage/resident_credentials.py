@@ -1,6 +1,9 @@
+from micropython import const
+
 from storage import common, device
 from trezor import utils
 from trezor.crypto import se_thd89
+from trezor.crypto.crc import crc32
 
 if utils.USE_THD89:
     MAX_RESIDENT_CREDENTIALS = se_thd89.FIDO2_CRED_COUNT_MAX
@@ -9,6 +12,17 @@ else:
     _RESIDENT_CREDENTIAL_START_KEY = 1
     MAX_RESIDENT_CREDENTIALS = 100
 
+# The index of the slots is stored in the device namespace as: a version byte,
+# a bitmap of the occupied slots, a prefix of the RP ID hash of every slot and
+# a CRC32 of all that. It never contains credential IDs and only serves to skip
+# reading the slots of other RPs. It is removed while a slot is being changed
+# and rebuilt from the slots whenever it is missing or invalid.
+_INDEX_VERSION = const(1)
+_INDEX_PREFIX_LEN = const(2)
+_INDEX_BITMAP_LEN = (MAX_RESIDENT_CREDENTIALS + 7) // 8
+_INDEX_PREFIXES = 1 + _INDEX_BITMAP_LEN
+_INDEX_LEN = _INDEX_PREFIXES + MAX_RESIDENT_CREDENTIALS * _INDEX_PREFIX_LEN
+
 
 def get(index: int) -> bytes | None:
     if not 0 <= index < MAX_RESIDENT_CREDENTIALS:
@@ -21,22 +35,31 @@ def set(index: int, data: bytes, is_overwritten: bool = False) -> None:
     if not 0 <= index < MAX_RESIDENT_CREDENTIALS:
         raise ValueError  # invalid credential index
 
+    slots = _load_index()
+    device.set_fido2_cred_index(None)
     common.set(common.APP_WEBAUTHN, index + _RESIDENT_CREDENTIAL_START_KEY, data)
     if not is_overwritten:
         _increase_fido2_counter()
+    _index_update(slots, index, data)
+    _save_index(slots)
 
 
 def delete(index: int) -> None:
     if not 0 <= index < MAX_RESIDENT_CREDENTIALS:
         raise ValueError  # invalid credential index
 
+    slots = _load_index()
+    device.set_fido2_cred_index(None)
     common.delete(common.APP_WEBAUTHN, index + _RESIDENT_CREDENTIAL_START_KEY)
     _decrement_fido2_counter()
+    _index_update(slots, index, None)
+    _save_index(slots)
 
 
 def delete_all() -> None:
     if device.get_fido2_counter() == 0:
         return
+    device.set_fido2_cred_index(None)
     if utils.USE_THD89:
         se_thd89.fido_delete_all_credentials()
     else:
@@ -45,6 +68,96 @@ def delete_all() -> None:
     _reset_fido2_counter()
 
 
+def occupied_slots() -> list[int]:
+    slots = _load_index()
+    return [i for i in range(MAX_RESIDENT_CREDENTIALS) if _is_occupied(slots, i)]
+
+
+def slots_by_rp_id_hash(rp_id_hash: bytes) -> list[int]:
+    """
+    Occupied slots whose RP ID hash starts like `rp_id_hash`. Only a prefix is
+    indexed, so the caller has to compare the full hash stored in the slot.
+    """
+    slots = _load_index()
+    prefix = rp_id_hash[:_INDEX_PREFIX_LEN]
+    result = []
+    for i in range(MAX_RESIDENT_CREDENTIALS):
+        offset = _INDEX_PREFIXES + i * _INDEX_PREFIX_LEN
+        if (
+            _is_occupied(slots, i)
+            and slots[offset : offset + _INDEX_PREFIX_LEN] == prefix
+        ):
+            result.append(i)
+    return result
+
+
+def free_slot() -> int | None:
+    slots = _load_index()
+    for i in range(MAX_RESIDENT_CREDENTIALS):
+        if not _is_occupied(slots, i):
+            return i
+    return None
+
+
+def invalidate_index() -> None:
+    """Drop the index when it turns out not to match the slots."""
+    device.set_fido2_cred_index(None)
+
+
+def _is_occupied(slots: bytearray, index: int) -> bool:
+    return bool(slots[1 + index // 8] & (1 << (index % 8)))
+
+
+def _index_update(slots: bytearray, index: int, data: bytes | None) -> None:
+    offset = _INDEX_PREFIXES + index * _INDEX_PREFIX_LEN
+    if data is None:
+        slots[1 + index // 8] &= 0xFF ^ (1 << (index % 8))
+        for i in range(_INDEX_PREFIX_LEN):
+            slots[offset + i] = 0
+    else:
+        slots[1 + index // 8] |= 1 << (index % 8)
+        slots[offset : offset + _INDEX_PREFIX_LEN] = data[:_INDEX_PREFIX_LEN]
+
+
+def _load_index() -> bytearray:
+    stored = device.get_fido2_cred_index()
+    if (
+        stored is not None
+        and len(stored) == _INDEX_LEN + 4
+        and stored[0] == _INDEX_VERSION
+        and crc32(stored[:_INDEX_LEN]) == int.from_bytes(stored[_INDEX_LEN:], "big")
+    ):
+        slots = bytearray(stored[:_INDEX_LEN])
+        if _count(slots) == device.get_fido2_counter():
+            return slots
+
+    slots = bytearray(_INDEX_LEN)
+    slots[0] = _INDEX_VERSION
+    for i in range(MAX_RESIDENT_CREDENTIALS):
+        data = get(i)
+        if data is not None:
+            _index_update(slots, i, data)
+    count = _count(slots)
+    if count != device.get_fido2_counter():
+        device.set_fido2_counter(count)
+    _save_index(slots)
+    return slots
+
+
+def _save_index(slots: bytearray) -> None:
+    device.set_fido2_cred_index(bytes(slots) + crc32(slots).to_bytes(4, "big"))
+
+
+def _count(slots: bytearray) -> int:
+    count = 0
+    for i in range(1, _INDEX_PREFIXES):
+        byte = slots[i]
+        while byte:
+            byte &= byte - 1
+            count += 1
+    return count
+
+
 def get_fido2_counter() -> int:
     return device.get_fido2_counter()
 
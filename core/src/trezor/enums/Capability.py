@@ -10,6 +10,7 @@ Shamir = 15
 ShamirGroups = 16
 PassphraseEntry = 17
 AttachToPin = 18
+TxAckBatch = 1001
 if not utils.BITCOIN_ONLY:
     Bitcoin_like = 2
     Binance = 3
@@ -69,6 +69,8 @@ OwnershipProof = 50
 AuthorizeCoinJoin = 51
 SignPsbt = 10052
 SignedPsbt = 10053
+BatchGetAddresses = 10054
+Addresses = 10055
 CipherKeyValue = 23
 CipheredKeyValue = 48
 SignIdentity = 53
@@ -166,6 +168,7 @@ if not utils.BITCOIN_ONLY:
     EthereumGnosisSafeTxAck = 20118
     EthereumGnosisSafeTxRequest = 20119
     EthereumSignTxEIP7702OneKey = 20120
+    EthereumTypedDataValuesAck = 20121
     NEMGetAddress = 67
     NEMAddress = 68
     NEMSignTx = 69
@@ -97,6 +97,8 @@ if TYPE_CHECKING:
         AuthorizeCoinJoin = 51
         SignPsbt = 10052
         SignedPsbt = 10053
+        BatchGetAddresses = 10054
+        Addresses = 10055
         CipherKeyValue = 23
         CipheredKeyValue = 48
         SignIdentity = 53
@@ -173,6 +175,7 @@ if TYPE_CHECKING:
         EthereumGnosisSafeTxAck = 20118
         EthereumGnosisSafeTxRequest = 20119
         EthereumSignTxEIP7702OneKey = 20120
+        EthereumTypedDataValuesAck = 20121
         NEMGetAddress = 67
         NEMAddress = 68
         NEMSignTx = 69
@@ -658,6 +661,7 @@ if TYPE_CHECKING:
         PassphraseEntry = 17
         AttachToPin = 18
         EthereumTypedData = 1000
+        TxAckBatch = 1001
 
     class SdProtectOperationType(IntEnum):
         DISABLE = 0
@@ -1012,6 +1012,44 @@ if TYPE_CHECKING:
         def is_type_of(cls, msg: Any) -> TypeGuard["Address"]:
             return isinstance(msg, cls)
 
+    class BatchGetAddresses(protobuf.MessageType):
+        address_n: "list[int]"
+        coin_name: "str"
+        script_type: "InputScriptType"
+        change: "int"
+        start_index: "int"
+        count: "int"
+
+        def __init__(
+            self,
+            *,
+            address_n: "list[int] | None" = None,
+            coin_name: "str | None" = None,
+            script_type: "InputScriptType | None" = None,
+            change: "int | None" = None,
+            start_index: "int | None" = None,
+            count: "int | None" = None,
+        ) -> None:
+            pass
+
+        @classmethod
+        def is_type_of(cls, msg: Any) -> TypeGuard["BatchGetAddresses"]:
+            return isinstance(msg, cls)
+
+    class Addresses(protobuf.MessageType):
+        addresses: "list[str]"
+
+        def __init__(
+            self,
+            *,
+            addresses: "list[str] | None" = None,
+        ) -> None:
+            pass
+
+        @classmethod
+        def is_type_of(cls, msg: Any) -> TypeGuard["Addresses"]:
+            return isinstance(msg, cls)
+
     class GetOwnershipId(protobuf.MessageType):
         address_n: "list[int]"
         coin_name: "str"
@@ -1414,6 +1452,62 @@ if TYPE_CHECKING:
         def is_type_of(cls, msg: Any) -> TypeGuard["TxAckPrevExtraData"]:
             return isinstance(msg, cls)
 
+    class TxAckInputs(protobuf.MessageType):
+        tx: "TxAckInputsWrapper"
+
+        def __init__(
+            self,
+            *,
+            tx: "TxAckInputsWrapper",
+        ) -> None:
+            pass
+
+        @classmethod
+        def is_type_of(cls, msg: Any) -> TypeGuard["TxAckInputs"]:
+            return isinstance(msg, cls)
+
+    class TxAckOutputs(protobuf.MessageType):
+        tx: "TxAckOutputsWrapper"
+
+        def __init__(
+            self,
+            *,
+            tx: "TxAckOutputsWrapper",
+        ) -> None:
+            pass
+
+        @classmethod
+        def is_type_of(cls, msg: Any) -> TypeGuard["TxAckOutputs"]:
+            return isinstance(msg, cls)
+
+    class TxAckPrevInputs(protobuf.MessageType):
+        tx: "TxAckPrevInputsWrapper"
+
+        def __init__(
+            self,
+            *,
+            tx: "TxAckPrevInputsWrapper",
+        ) -> None:
+            pass
+
+        @classmethod
+        def is_type_of(cls, msg: Any) -> TypeGuard["TxAckPrevInputs"]:
+            return isinstance(msg, cls)
+
+    class TxAckPrevOutputs(protobuf.MessageType):
+        tx: "TxAckPrevOutputsWrapper"
+
+        def __init__(
+            self,
+            *,
+            tx: "TxAckPrevOutputsWrapper",
+        ) -> None:
+            pass
+
+        @classmethod
+        def is_type_of(cls, msg: Any) -> TypeGuard["TxAckPrevOutputs"]:
+            return isinstance(msg, cls)
+
     class GetOwnershipProof(protobuf.MessageType):
         address_n: "list[int]"
         coin_name: "str"
@@ -1557,6 +1651,7 @@ if TYPE_CHECKING:
         tx_hash: "bytes | None"
         extra_data_len: "int | None"
         extra_data_offset: "int | None"
+        request_count: "int | None"
 
         def __init__(
             self,
@@ -1565,6 +1660,7 @@ if TYPE_CHECKING:
             tx_hash: "bytes | None" = None,
             extra_data_len: "int | None" = None,
             extra_data_offset: "int | None" = None,
+            request_count: "int | None" = None,
         ) -> None:
             pass
 
@@ -1728,6 +1824,62 @@ if TYPE_CHECKING:
         def is_type_of(cls, msg: Any) -> TypeGuard["TxAckPrevExtraDataWrapper"]:
             return isinstance(msg, cls)
 
+    class TxAckInputsWrapper(protobuf.MessageType):
+        inputs: "list[TxInput]"
+
+        def __init__(
+            self,
+            *,
+            inputs: "list[TxInput] | None" = None,
+        ) -> None:
+            pass
+
+        @classmethod
+        def is_type_of(cls, msg: Any) -> TypeGuard["TxAckInputsWrapper"]:
+            return isinstance(msg, cls)
+
+    class TxAckOutputsWrapper(protobuf.MessageType):
+        outputs: "list[TxOutput]"
+
+        def __init__(
+            self,
+            *,
+            outputs: "list[TxOutput] | None" = None,
+        ) -> None:
+            pass
+
+        @classmethod
+        def is_type_of(cls, msg: Any) -> TypeGuard["TxAckOutputsWrapper"]:
+            return isinstance(msg, cls)
+
+    class TxAckPrevInputsWrapper(protobuf.MessageType):
+        inputs: "list[PrevInput]"
+
+        def __init__(
+            self,
+            *,
+            inputs: "list[PrevInput] | None" = None,
+        ) -> None:
+            pass
+
+        @classmethod
+        def is_type_of(cls, msg: Any) -> TypeGuard["TxAckPrevInputsWrapper"]:
+            return isinstance(msg, cls)
+
+    class TxAckPrevOutputsWrapper(protobuf.MessageType):
+        outputs: "list[PrevOutput]"
+
+        def __init__(
+            self,
+            *,
+            outputs: "list[PrevOutput] | None" = None,
+        ) -> None:
+            pass
+
+        @classmethod
+        def is_type_of(cls, msg: Any) -> TypeGuard["TxAckPrevOutputsWrapper"]:
+            return isinstance(msg, cls)
+
     class CardanoBlockchainPointerType(protobuf.MessageType):
         block_index: "int"
         tx_index: "int"
@@ -3919,6 +4071,7 @@ if TYPE_CHECKING:
         data_length: "int"
         initial_data_chunk: "bytes"
         hash: "bytes | None"
+        file_hash: "bytes | None"
 
         def __init__(
             self,
@@ -3927,6 +4080,7 @@ if TYPE_CHECKING:
             data_length: "int",
             initial_data_chunk: "bytes",
             hash: "bytes | None" = None,
+            file_hash: "bytes | None" = None,
         ) -> None:
             pass
 
@@ -3936,11 +4090,13 @@ if TYPE_CHECKING:
 
     class ListResDir(protobuf.MessageType):
         path: "str"
+        with_hash: "bool | None"
 
         def __init__(
             self,
             *,
             path: "str",
+            with_hash: "bool | None" = None,
         ) -> None:
             pass
 
@@ -4055,12 +4211,14 @@ if TYPE_CHECKING:
     class FileInfo(protobuf.MessageType):
         name: "str"
         size: "int"
+        hash: "bytes | None"
 
         def __init__(
             self,
             *,
             name: "str",
             size: "int",
+            hash: "bytes | None" = None,
         ) -> None:
             pass
 
@@ -5243,6 +5401,7 @@ if TYPE_CHECKING:
         primary_type: "str"
         metamask_v4_compat: "bool"
         definitions: "EthereumDefinitions | None"
+        bulk_values: "bool | None"
 
         def __init__(
             self,
@@ -5251,6 +5410,7 @@ if TYPE_CHECKING:
             address_n: "list[int] | None" = None,
             metamask_v4_compat: "bool | None" = None,
             definitions: "EthereumDefinitions | None" = None,
+            bulk_values: "bool | None" = None,
         ) -> None:
             pass
 
@@ -5288,11 +5448,13 @@ if TYPE_CHECKING:
 
     class EthereumTypedDataValueRequest(protobuf.MessageType):
         member_path: "list[int]"
+        max_chunk_size: "int | None"
 
         def __init__(
             self,
             *,
             member_path: "list[int] | None" = None,
+            max_chunk_size: "int | None" = None,
         ) -> None:
             pass
 
@@ -5314,6 +5476,20 @@ if TYPE_CHECKING:
         def is_type_of(cls, msg: Any) -> TypeGuard["EthereumTypedDataValueAck"]:
             return isinstance(msg, cls)
 
+    class EthereumTypedDataValuesAck(protobuf.MessageType):
+        values: "list[EthereumTypedDataValue]"
+
+        def __init__(
+            self,
+            *,
+            values: "list[EthereumTypedDataValue] | None" = None,
+        ) -> None:
+            pass
+
+        @classmethod
+        def is_type_of(cls, msg: Any) -> TypeGuard["EthereumTypedDataValuesAck"]:
+            return isinstance(msg, cls)
+
     class EthereumStructMember(protobuf.MessageType):
         type: "EthereumFieldType"
         name: "str"
@@ -5350,6 +5526,22 @@ if TYPE_CHECKING:
         def is_type_of(cls, msg: Any) -> TypeGuard["EthereumFieldType"]:
             return isinstance(msg, cls)
 
+    class EthereumTypedDataValue(protobuf.MessageType):
+        member_path: "list[int]"
+        value: "bytes"
+
+        def __init__(
+            self,
+            *,
+            value: "bytes",
+            member_path: "list[int] | None" = None,
+        ) -> None:
+            pass
+
+        @classmethod
+        def is_type_of(cls, msg: Any) -> TypeGuard["EthereumTypedDataValue"]:
+            return isinstance(msg, cls)
+
     class EthereumGetPublicKeyOneKey(protobuf.MessageType):
         address_n: "list[int]"
         show_display: "bool | None"
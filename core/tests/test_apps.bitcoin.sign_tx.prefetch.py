@@ -0,0 +1,59 @@
+from common import *
+
+from trezor.wire import DataError
+
+from apps.bitcoin.sign_tx.prefetch import (
+    INPUT,
+    MAX_REQUEST_COUNT,
+    PREV_OUTPUT,
+    Prefetch,
+)
+
+
+class TestPrefetch(unittest.TestCase):
+
+    def test_take_in_order(self):
+        prefetch = Prefetch()
+        items = ["a", "b", "c", "d"]
+        self.assertEqual(prefetch.store(INPUT, None, 10, items), "a")
+
+        self.assertEqual(prefetch.take(INPUT, None, 11), "b")
+        self.assertEqual(prefetch.take(INPUT, None, 12), "c")
+        self.assertEqual(prefetch.take(INPUT, None, 13), "d")
+        self.assertIsNone(prefetch.take(INPUT, None, 14))
+
+    def test_take_once(self):
+        prefetch = Prefetch()
+        prefetch.store(INPUT, None, 0, ["a", "b", "c"])
+
+        self.assertEqual(prefetch.take(INPUT, None, 1), "b")
+        # an item is never served twice, the next pass asks the host again
+        self.assertIsNone(prefetch.take(INPUT, None, 1))
+        self.assertIsNone(prefetch.take(INPUT, None, 2))
+
+    def test_kinds(self):
+        prefetch = Prefetch()
+        prefetch.store(INPUT, None, 0, ["a", "b"])
+        prefetch.store(PREV_OUTPUT, b"\x01" * 32, 0, ["x", "y"])
+
+        self.assertIsNone(prefetch.take(PREV_OUTPUT, b"\x02" * 32, 1))
+        self.assertIsNone(prefetch.take(PREV_OUTPUT, b"\x01" * 32, 1))
+        self.assertEqual(prefetch.take(INPUT, None, 1), "b")
+
+    def test_reset(self):
+        prefetch = Prefetch()
+        prefetch.store(INPUT, None, 0, ["a", "b"])
+        prefetch.reset(True)
+        self.assertTrue(prefetch.enabled)
+        self.assertIsNone(prefetch.take(INPUT, None, 1))
+
+    def test_invalid_count(self):
+        prefetch = Prefetch()
+        with self.assertRaises(DataError):
+            prefetch.store(INPUT, None, 0, [])
+        with self.assertRaises(DataError):
+            prefetch.store(INPUT, None, 0, ["a"] * (MAX_REQUEST_COUNT + 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+from common import *
+
+from trezor.messages import PrevOutput
+
+from apps.bitcoin.sign_tx.prevtx_cache import PrevTxCache
+
+
+def outputs(count):
+    return [PrevOutput(amount=i, script_pubkey=bytes([i]) * 22) for i in range(count)]
+
+
+class TestPrevTxCache(unittest.TestCase):
+
+    def test_get(self):
+        cache = PrevTxCache()
+        txos = outputs(3)
+        cache.add(b"\x01" * 32, txos, sum(cache.output_size(txo) for txo in txos))
+
+        self.assertIs(cache.get(b"\x01" * 32, 0), txos[0])
+        self.assertIs(cache.get(b"\x01" * 32, 2), txos[2])
+        self.assertIsNone(cache.get(b"\x01" * 32, 3))
+        self.assertIsNone(cache.get(b"\x02" * 32, 0))
+
+    def test_eviction(self):
+        txos = outputs(2)
+        size = sum(PrevTxCache().output_size(txo) for txo in txos)
+        cache = PrevTxCache(2 * size)
+
+        cache.add(b"\x01" * 32, txos, size)
+        cache.add(b"\x02" * 32, txos, size)
+        cache.add(b"\x03" * 32, txos, size)
+        self.assertIsNone(cache.get(b"\x01" * 32, 0))
+        self.assertIsNotNone(cache.get(b"\x02" * 32, 0))
+        self.assertIsNotNone(cache.get(b"\x03" * 32, 0))
+        self.assertEqual(cache.used, 2 * size)
+
+        # a transaction that doesn't fit at all is not cached and evicts nothing
+        cache.add(b"\x04" * 32, txos, 3 * size)
+        self.assertIsNone(cache.get(b"\x04" * 32, 0))
+        self.assertIsNotNone(cache.get(b"\x02" * 32, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
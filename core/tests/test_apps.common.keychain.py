@@ -5,7 +5,13 @@ from mock_storage import mock_storage
 from storage import cache
 from apps.common import safety_checks
 from apps.common.paths import PATTERN_SEP5, PathSchema
-from apps.common.keychain import LRUCache, Keychain, with_slip44_keychain, get_keychain
+from apps.common.keychain import (
+    LRUCache,
+    Keychain,
+    with_slip44_keychain,
+    get_keychain,
+    get_session_cache,
+)
 from trezor import wire
 from trezor.crypto import bip39
 from trezor.enums import SafetyCheckLevel
@@ -163,6 +169,77 @@ class TestKeychain(unittest.TestCase):
         # "a" is recently used so should not be evicted now
         self.assertIs(cache.get("a"), obj_a)
 
+    def test_lru_cache_stats(self):
+        class Deletable:
+            def __del__(self):
+                pass
+
+        cache = LRUCache(2)
+        self.assertIsNone(cache.get("a"))
+        cache.insert("a", Deletable())
+        cache.insert("b", Deletable())
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNotNone(cache.get("b"))
+        cache.insert("c", Deletable())
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 2)
+        self.assertEqual((cache.hits, cache.misses), (2, 2))
+
+    def test_session_cache(self):
+        seed = bip39.seed(" ".join(["all"] * 12), "")
+        cache.set(cache.APP_COMMON_SEED, seed)
+        schema = PathSchema.parse("m/44'/coin_type'/account'/*/*", 0)
+        path = [H_(44), H_(0), H_(0), 0, 0]
+
+        with await_result(
+            get_keychain(wire.DUMMY_CONTEXT, "secp256k1", [schema])
+        ) as keychain:
+            node = keychain.derive(path)
+        node_cache = get_session_cache()
+        self.assertEqual(len(node_cache), 1)
+        self.assertEqual(node_cache.misses, 1)
+
+        # the cache outlives the keychain, and is reused by the next one
+        with await_result(
+            get_keychain(wire.DUMMY_CONTEXT, "secp256k1", [schema])
+        ) as keychain:
+            self.assertEqual(keychain.derive(path).public_key(), node.public_key())
+        self.assertIs(get_session_cache(), node_cache)
+        self.assertEqual((node_cache.hits, node_cache.misses), (1, 1))
+
+        # different curves do not share nodes
+        with await_result(
+            get_keychain(wire.DUMMY_CONTEXT, "nist256p1", [schema])
+        ) as keychain:
+            keychain.derive(path)
+        self.assertEqual(len(node_cache), 2)
+
+        # the cache is dropped with the session
+        cache.end_current_session()
+        cache.start_session()
+        self.assertIsNot(get_session_cache(), node_cache)
+
+    @mock_storage
+    def test_derive_parent(self):
+        seed = bip39.seed(" ".join(["all"] * 12), "")
+        schema = PathSchema.parse("m/44'/coin_type'/account'/change/address_index", 0)
+        keychain = Keychain(seed, "secp256k1", [schema])
+        parent = [H_(44), H_(0), H_(0), 1]
+
+        chain = keychain.derive_parent(parent, range(5, 8))
+        for i in range(5, 8):
+            node = chain.clone()
+            node.derive(i, True)
+            self.assertEqual(
+                node.public_key(), keychain.derive(parent + [i]).public_key()
+            )
+
+        # the children are verified, not the parent
+        with self.assertRaises(wire.DataError):
+            keychain.derive_parent([H_(44), H_(0), H_(0), 2], [0])
+        with self.assertRaises(wire.DataError):
+            keychain.derive_parent(parent, [H_(0)])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -5,6 +5,8 @@ from trezor.messages import EthereumTypedDataStructAck as ETDSA
 from trezor.messages import EthereumStructMember as ESM
 from trezor.messages import EthereumFieldType as EFT
 from trezor.messages import EthereumTypedDataValueAck
+from trezor.messages import EthereumTypedDataValuesAck
+from trezor.messages import EthereumTypedDataValue
 from trezor.enums import EthereumDataType as EDT
 
 
@@ -42,6 +44,45 @@ class MockContext:
         return EthereumTypedDataValueAck(value=value)
 
 
+class MockCountingContext(MockContext):
+    def __init__(self, message_contents: list):
+        super().__init__(message_contents)
+        self.calls = 0
+
+    async def call(self, request, resp_type):
+        self.calls += 1
+        return await super().call(request, resp_type)
+
+
+class MockBulkContext(MockContext):
+    """Sending the requested value together with the next sibling, if any."""
+    def __init__(self, message_contents: list):
+        super().__init__(message_contents)
+        self.calls = 0
+
+    def get(self, member_path: list):
+        entry = self.message_contents
+        for index in member_path:
+            if not isinstance(entry, list) or index >= len(entry):
+                return None
+            entry = entry[index]
+
+        if isinstance(entry, list):
+            return len(entry).to_bytes(2, "big")
+        return entry
+
+    async def call(self, request, _resp_type):
+        self.calls += 1
+        assert request.max_chunk_size
+        member_path = list(request.member_path)
+        values = [EthereumTypedDataValue(member_path=member_path, value=self.get(member_path))]
+        sibling = member_path[:-1] + [member_path[-1] + 1]
+        value = self.get(sibling)
+        if isinstance(value, bytes):
+            values.append(EthereumTypedDataValue(member_path=sibling, value=value))
+        return EthereumTypedDataValuesAck(values=values)
+
+
 # Helper functions from trezorctl to build expected type data structures
 # TODO: it could be better to group these functions into a class, to visibly differentiate it
 def get_type_definitions(types: dict) -> dict:
@@ -362,6 +403,35 @@ class TestEthereumSignTypedData(unittest.TestCase):
             )
             self.assertEqual(res, expected)
 
+    def test_hash_struct_bulk_values(self):
+        for data, types in (
+            (MESSAGE_VALUES_BASIC, TYPES_BASIC),
+            (MESSAGE_VALUES_COMPLEX, TYPES_COMPLEX),
+        ):
+            digests = []
+            contexts = (MockCountingContext(data), MockBulkContext(data))
+            for ctx, bulk_values in zip(contexts, (False, True)):
+                typed_data_envelope = TypedDataEnvelope(
+                    ctx=ctx,
+                    primary_type="Mail",
+                    metamask_v4_compat=True,
+                    bulk_values=bulk_values,
+                )
+                typed_data_envelope.types = types
+                digests.append(
+                    await_result(
+                        typed_data_envelope.hash_struct(
+                            primary_type="Mail",
+                            member_path=[0],
+                            show_data=False,
+                            parent_objects=["Mail"],
+                        )
+                    )
+                )
+            self.assertEqual(digests[0], digests[1])
+            # siblings were sent ahead
+            self.assertLess(contexts[1].calls, contexts[0].calls)
+
     def test_get_and_encode_data(self):
         VECTORS = (  # primary_type, data, types, expected
             (
@@ -457,6 +527,23 @@ class TestEthereumSignTypedData(unittest.TestCase):
             EMPTY_ENVELOPE.hash_type(w=w, primary_type=primary_type)
             self.assertEqual(w, expected)
 
+    def test_hash_type_memoized(self):
+        typed_data_envelope = TypedDataEnvelope(
+            ctx=None,
+            primary_type="Mail",
+            metamask_v4_compat=True,
+        )
+        typed_data_envelope.types = TYPES_BASIC
+
+        w = bytearray()
+        typed_data_envelope.hash_type(w=w, primary_type="Mail")
+        self.assertEqual(list(typed_data_envelope.type_hashes), ["Mail"])
+
+        # the memoized typeHash is used, not recomputed from the types
+        typed_data_envelope.types = {}
+        typed_data_envelope.hash_type(w=w, primary_type="Mail")
+        self.assertEqual(w[:32], w[32:])
+
     def test_find_typed_dependencies(self):
         # We need to be able to recognize dependency even as array of structs
         types_dependency_only_as_array = {
@@ -29,6 +29,20 @@ class TestEthereumTokens(unittest.TestCase):
         self.assertEqual(token.symbol, 'Wei UNKN')
         self.assertEqual(token.decimals, 0)
 
+    def test_first_and_last(self):
+        for entry in (0, len(tokens._TOKENS) - tokens._ENTRY_LEN):
+            key = tokens._TOKENS[entry : entry + tokens._KEY_LEN]
+            chain_id = int.from_bytes(key[:4], "big")
+            address = key[4:]
+            token = tokens.token_by_chain_address(chain_id, address)
+            self.assertIsNot(token, tokens.UNKNOWN_TOKEN)
+            self.assertEqual(token.chain_id, chain_id)
+            self.assertEqual(token.address, address)
+
+        # out of range chain_id
+        token = tokens.token_by_chain_address(2**32, key[4:])
+        self.assertIs(token, tokens.UNKNOWN_TOKEN)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,142 @@
+from common import *
+
+from storage import cache
+from trezor import io, wire
+from trezor.crypto.hashlib import blake2s
+from trezor.messages import ResourceAck, ResourceUpdate
+
+from apps.management.update_res import PART_SUFFIX, REQUEST_WINDOW, update_res
+
+fatfs = io.fatfs
+
+INITIAL_CHUNK_SIZE = 16 * 1024
+
+
+class Interrupted(Exception):
+    pass
+
+
+class MockContext:
+    """Sending the requested data, optionally interrupted after a few requests."""
+
+    def __init__(self, data: bytes, interrupt_after=None, max_chunk=None):
+        self.data = data
+        self.interrupt_after = interrupt_after
+        self.max_chunk = max_chunk
+        self.offsets = []
+        self.buffer = wire.WIRE_BUFFER
+
+    async def call(self, request, _resp_type):
+        if len(self.offsets) == self.interrupt_after:
+            raise Interrupted
+        self.offsets.append(request.offset)
+        length = request.data_length
+        if self.max_chunk is not None:
+            length = min(length, self.max_chunk)
+        chunk = self.data[request.offset : request.offset + length]
+        return ResourceAck(data_chunk=chunk, hash=blake2s(chunk).digest())
+
+
+def update_msg(data: bytes, file_name="image.bin", file_hash=None):
+    initial = data[:INITIAL_CHUNK_SIZE]
+    return ResourceUpdate(
+        file_name=file_name,
+        data_length=len(data),
+        initial_data_chunk=initial,
+        hash=blake2s(initial).digest(),
+        file_hash=file_hash or blake2s(data).digest(),
+    )
+
+
+def read_file(path: str) -> bytes:
+    size, _, _ = fatfs.stat(path)
+    buf = bytearray(size)
+    with fatfs.open(path, "r") as f:
+        f.read(buf)
+    return bytes(buf)
+
+
+def partial_files() -> list:
+    return [name for _, _, name in fatfs.listdir("/res") if name.endswith(PART_SUFFIX)]
+
+
+class TestUpdateRes(unittest.TestCase):
+    def setUp(self):
+        io.sdcard.power_on()
+        fatfs.mkfs()
+        fatfs.mount()
+        fatfs.mkdir("/res")
+        # only the first update of a session is confirmed on the screen
+        cache._show_update_res_confirm = False
+        self.data = bytes((i * 7) & 0xFF for i in range(200 * 1024))
+
+    def tearDown(self):
+        fatfs.unmount()
+        io.sdcard.power_off()
+
+    def test_resume(self):
+        ctx = MockContext(self.data, interrupt_after=2)
+        with self.assertRaises(wire.FirmwareError):
+            await_result(update_res(ctx, update_msg(self.data)))
+        self.assertEqual(ctx.offsets[1] - ctx.offsets[0], REQUEST_WINDOW)
+        # the wire buffer is back in place
+        self.assertIs(ctx.buffer, wire.WIRE_BUFFER)
+        with self.assertRaises(fatfs.FatFSError):
+            fatfs.stat("/res/image.bin")
+
+        # everything received is kept, the transfer continues from there
+        [partial] = partial_files()
+        received, _, _ = fatfs.stat(f"/res/{partial}")
+        self.assertEqual(received, INITIAL_CHUNK_SIZE + 2 * REQUEST_WINDOW)
+
+        ctx = MockContext(self.data)
+        await_result(update_res(ctx, update_msg(self.data)))
+        self.assertEqual(ctx.offsets[0], received)
+        self.assertEqual(read_file("/res/image.bin"), self.data)
+        self.assertEqual(partial_files(), [])
+
+    def test_other_version_restarts(self):
+        old = bytes(reversed(self.data))
+        with self.assertRaises(wire.FirmwareError):
+            await_result(
+                update_res(MockContext(old, interrupt_after=1), update_msg(old))
+            )
+        self.assertEqual(len(partial_files()), 1)
+
+        ctx = MockContext(self.data)
+        await_result(update_res(ctx, update_msg(self.data)))
+        self.assertEqual(ctx.offsets[0], INITIAL_CHUNK_SIZE)
+        self.assertEqual(read_file("/res/image.bin"), self.data)
+        # the partial file of the old version is removed
+        self.assertEqual(partial_files(), [])
+
+    def test_digest_mismatch(self):
+        msg = update_msg(self.data, file_hash=blake2s(b"something else").digest())
+        with self.assertRaises(wire.DataError):
+            await_result(update_res(MockContext(self.data), msg))
+        self.assertEqual(partial_files(), [])
+        with self.assertRaises(fatfs.FatFSError):
+            fatfs.stat("/res/image.bin")
+
+    def test_short_chunks(self):
+        # hosts may cap every chunk, e.g. at 4 KiB
+        ctx = MockContext(self.data, max_chunk=4 * 1024)
+        await_result(update_res(ctx, update_msg(self.data)))
+        self.assertEqual(ctx.offsets[1] - ctx.offsets[0], 4 * 1024)
+        self.assertEqual(read_file("/res/image.bin"), self.data)
+
+    def test_unchanged_skipped(self):
+        await_result(update_res(MockContext(self.data), update_msg(self.data)))
+        ctx = MockContext(self.data)
+        await_result(update_res(ctx, update_msg(self.data)))
+        self.assertEqual(ctx.offsets, [])
+
+        # empty files as well
+        await_result(update_res(MockContext(b""), update_msg(b"", "empty.bin")))
+        ctx = MockContext(b"")
+        await_result(update_res(ctx, update_msg(b"", "empty.bin")))
+        self.assertEqual(read_file("/res/empty.bin"), b"")
+
+
+if __name__ == "__main__":
+    unittest.main()
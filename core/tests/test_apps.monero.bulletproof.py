@@ -236,6 +236,43 @@ class TestMoneroBulletproof(unittest.TestCase):
         proof = bpi.prove_batch(sv, gamma)
         bpi.verify_batch([proof])
 
+    def test_multiexp(self):
+        points = [
+            crypto.encodepoint_into(
+                None, crypto.scalarmult_base_into(None, crypto.random_scalar())
+            )
+            for _ in range(70)
+        ]
+        for n in (1, 15, 16, 17, 64, 65, 70):
+            seq = bp.MultiExpSequential()
+            muex = bp.MultiExp()
+            for i in range(n):
+                if i < 2:
+                    sc = (bp._ZERO, bp._MINUS_ONE)[i]
+                else:
+                    sc = crypto.encodeint_into(None, crypto.random_scalar())
+                point = bp._XMR_G if i == 3 else bp._XMR_H if i == 5 else points[i]
+                seq.add_pair(sc, point)
+                muex.add_pair(sc, point)
+            self.assertEqual(bp._multiexp(None, seq), bp._multiexp(None, muex))
+
+    def test_verify_plus_multiexp(self):
+        bpi = bp.BulletProofPlusBuilder()
+        sv = [crypto.Scalar(i*123 + 45) for i in range(4)]
+        gamma = [crypto.Scalar(i*456 * 17) for i in range(4)]
+        proof = bpi.prove_batch(sv, gamma)
+
+        multiexp = bp.MultiExp
+        for muex_class in (bp.MultiExpSequential, bp.MultiExp):
+            bp.MultiExp = muex_class
+            try:
+                bpi.verify_batch([proof])
+                bpi.verify_batch([self.bproof_plus_2(), self.bproof_plus_2()])
+                with self.assertRaises(Exception):
+                    bpi.verify_batch([self.bproof_plus_2_invalid()])
+            finally:
+                bp.MultiExp = multiexp
+
     def ctest_multiexp(self):
         scalars = [0, 1, 2, 3, 4, 99]
         point_base = [0, 2, 4, 7, 12, 18]
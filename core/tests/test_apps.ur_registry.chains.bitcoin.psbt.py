@@ -0,0 +1,137 @@
+from common import *
+
+from apps.ur_registry.chains.bitcoin.psbt.key import KeyOriginInfo
+from apps.ur_registry.chains.bitcoin.psbt.psbt import (
+    PSBT,
+    PartiallySignedInput,
+    PartiallySignedOutput,
+    PSBTView,
+)
+from apps.ur_registry.chains.bitcoin.psbt.serialize import uint256_from_str
+from apps.ur_registry.chains.bitcoin.psbt.tx import (
+    COutPoint,
+    CTransaction,
+    CTxIn,
+    CTxInWitness,
+    CTxOut,
+)
+
+FINGERPRINT = b"\x01\x02\x03\x04"
+
+
+def make_psbt(inputs, prev_outputs, segwit=False):
+    psbt = PSBT()
+    tx = CTransaction()
+    tx.nVersion = 2
+    for i in range(inputs):
+        prev = CTransaction()
+        prev.vin.append(CTxIn(COutPoint(i + 1, 0), b"", 0xFFFF_FFFF))
+        for k in range(prev_outputs):
+            prev.vout.append(CTxOut(1000 + k, b"\x00\x14" + bytes([i, k]) * 10))
+        if segwit:
+            witness = CTxInWitness()
+            witness.scriptWitness.stack = [b"\x30" * 72, b"\x02" * 33]
+            prev.wit.vtxinwit = [witness]
+        prev.rehash()
+        prev_out = (i * 7) % prev_outputs
+        outpoint = COutPoint(uint256_from_str(prev.hash), prev_out)
+        tx.vin.append(CTxIn(outpoint, b"", 0xFFFF_FFFD))
+
+        psbt_in = PartiallySignedInput(0)
+        psbt_in.non_witness_utxo = prev
+        path = [0x8000_0054, 0x8000_0000, 0x8000_0000, 0, i]
+        psbt_in.hd_keypaths[b"\x02" + bytes([i]) * 32] = KeyOriginInfo(
+            FINGERPRINT, path
+        )
+        if i % 2:
+            psbt_in.time_locktime = 500_000_000 + i
+        psbt.inputs.append(psbt_in)
+
+    for k in range(2):
+        tx.vout.append(CTxOut(5000 + k, b"\x00\x14" + bytes([k]) * 20))
+        psbt.outputs.append(PartiallySignedOutput(0))
+    psbt.tx = tx
+    return psbt.serialize()
+
+
+class TestPSBTView(unittest.TestCase):
+    def check_same(self, data):
+        eager = PSBT()
+        eager.deserialize(data)
+        view = PSBTView(data)
+
+        self.assertEqual(view.input_count(), len(eager.inputs))
+        self.assertEqual(view.output_count(), len(eager.outputs))
+        self.assertEqual(view.tx_version, eager.tx_version)
+        self.assertEqual(view.compute_lock_time(), eager.compute_lock_time())
+
+        for i, expected in enumerate(eager.inputs):
+            psbt_in = view.input(i)
+            self.assertEqual(psbt_in.prev_txid, expected.prev_txid)
+            self.assertEqual(psbt_in.prev_out, expected.prev_out)
+            self.assertEqual(psbt_in.sequence, expected.sequence)
+            self.assertEqual(psbt_in.time_locktime, expected.time_locktime)
+            self.assertEqual(
+                list(psbt_in.hd_keypaths.keys()), list(expected.hd_keypaths.keys())
+            )
+            self.assertEqual(
+                psbt_in.non_witness_utxo.hash, expected.non_witness_utxo.hash
+            )
+            txout = psbt_in.non_witness_utxo.txout(psbt_in.prev_out)
+            expected_txout = expected.non_witness_utxo.vout[expected.prev_out]
+            self.assertEqual(txout.nValue, expected_txout.nValue)
+            self.assertEqual(txout.scriptPubKey, expected_txout.scriptPubKey)
+
+        for i, expected in enumerate(eager.outputs):
+            psbt_out = view.output(i)
+            self.assertEqual(psbt_out.amount, expected.amount)
+            self.assertEqual(psbt_out.script, expected.script)
+
+        self.assertEqual(view.serialize(), data)
+
+    def test_inputs_and_outputs(self):
+        self.check_same(make_psbt(5, 10))
+
+    def test_segwit_previous_transactions(self):
+        self.check_same(make_psbt(3, 4, segwit=True))
+
+    def test_signatures(self):
+        data = make_psbt(3, 2)
+        view = PSBTView(data)
+        pubkeys = [list(view.input(i).hd_keypaths.keys())[0] for i in range(3)]
+        view.add_partial_sig(0, pubkeys[0], b"\x30" * 71)
+        view.add_partial_sig(2, pubkeys[2], b"\x31" * 71)
+        view.add_tap_key_sig(1, b"\x55" * 64)
+
+        # the signatures are seen by the next pass over the inputs
+        self.assertEqual(view.input(0).partial_sigs, {pubkeys[0]: b"\x30" * 71})
+        self.assertEqual(view.input(1).tap_key_sig, b"\x55" * 64)
+
+        signed = PSBT()
+        signed.deserialize(view.serialize())
+        self.assertEqual(signed.inputs[0].partial_sigs, {pubkeys[0]: b"\x30" * 71})
+        self.assertEqual(signed.inputs[1].partial_sigs, {})
+        self.assertEqual(signed.inputs[1].tap_key_sig, b"\x55" * 64)
+        self.assertEqual(signed.inputs[2].partial_sigs, {pubkeys[2]: b"\x31" * 71})
+
+    def test_wrong_previous_transaction(self):
+        data = bytearray(make_psbt(2, 3))
+        # corrupt the last output of the first previous transaction
+        view = PSBTView(bytes(data))
+        utxo = view.input(0).non_witness_utxo
+        offset = bytes(data).find(bytes(utxo.data)) + len(utxo.data) - 5
+        data[offset] ^= 0xFF
+
+        view = PSBTView(bytes(data))
+        view.input(1)
+        with self.assertRaises(Exception):
+            view.input(0)
+
+    def test_missing_output_map(self):
+        data = make_psbt(2, 3)
+        with self.assertRaises(Exception):
+            PSBTView(data[:-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
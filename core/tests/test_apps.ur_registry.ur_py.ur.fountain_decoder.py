@@ -0,0 +1,85 @@
+from common import *
+
+from apps.ur_registry.ur_py.ur.fountain_decoder import FountainDecoder
+from apps.ur_registry.ur_py.ur.fountain_encoder import FountainEncoder
+from apps.ur_registry.ur_py.ur.xoshiro256 import Xoshiro256
+
+
+def make_message(length):
+    return bytearray((i * 7 + 3) & 0xFF for i in range(length))
+
+
+def make_parts(message, max_fragment_len, count):
+    encoder = FountainEncoder(bytearray(message), max_fragment_len)
+    return encoder, [encoder.next_part() for _ in range(count)]
+
+
+class TestFountainDecoder(unittest.TestCase):
+    def test_simple_parts(self):
+        message = make_message(1000)
+        encoder, parts = make_parts(message, 100, 10)
+        self.assertEqual(encoder.seq_len(), 10)
+
+        decoder = FountainDecoder()
+        for part in parts:
+            self.assertFalse(decoder.is_complete())
+            self.assertTrue(decoder.receive_part(part))
+
+        self.assertTrue(decoder.is_success())
+        self.assertEqual(decoder.result_message(), bytes(message))
+        self.assertEqual(decoder.received_part_indexes, set(range(10)))
+
+    def test_shuffled_lossy_stream(self):
+        message = make_message(3000)
+        encoder, parts = make_parts(message, 50, 400)
+        rng = Xoshiro256.from_bytes(b"fountain")
+
+        # drop a quarter of the parts and shuffle the rest
+        kept = [p for p in parts if rng.next_double() >= 0.25]
+        stream = []
+        while kept:
+            stream.append(kept.pop(rng.next_int(0, len(kept) - 1)))
+
+        decoder = FountainDecoder()
+        for part in stream:
+            decoder.receive_part(part)
+            if decoder.is_complete():
+                break
+
+        self.assertTrue(decoder.is_success())
+        self.assertEqual(decoder.result_message(), bytes(message))
+        self.assertEqual(decoder.expected_part_count(), encoder.seq_len())
+
+    def test_mixed_parts_only(self):
+        message = make_message(500)
+        encoder, parts = make_parts(message, 50, 200)
+        seq_len = encoder.seq_len()
+
+        decoder = FountainDecoder()
+        for part in parts[seq_len:]:
+            decoder.receive_part(part)
+            # duplicates are ignored
+            decoder.receive_part(part)
+            if decoder.is_complete():
+                break
+
+        self.assertEqual(decoder.result_message(), bytes(message))
+
+    def test_reset(self):
+        message = make_message(300)
+        _, parts = make_parts(message, 100, 3)
+
+        decoder = FountainDecoder()
+        decoder.receive_part(parts[0])
+        self.assertEqual(decoder.last_part_indexes, {0})
+        decoder.reset()
+        self.assertEqual(decoder.received_part_indexes, set())
+        self.assertEqual(decoder.estimated_percent_complete(), 0)
+
+        for part in parts:
+            decoder.receive_part(part)
+        self.assertEqual(decoder.result_message(), bytes(message))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+from common import *
+from mock_storage import mock_storage
+
+import storage.device
+import storage.resident_credentials as rc
+from storage import device
+
+RP_A = b"\xaa" * 32
+RP_B = b"\xbb" * 32
+# shares the indexed prefix with RP_A
+RP_A2 = b"\xaa" * 31 + b"\x01"
+
+
+def cred(rp_id_hash, user):
+    return rp_id_hash + b"credential id of " + user
+
+
+class TestResidentCredentials(unittest.TestCase):
+    def setUp(self):
+        storage.device._FIDO2_COUNTER_VALUE = None
+
+    @mock_storage
+    def test_set_delete(self):
+        rc.set(0, cred(RP_A, b"alice"))
+        rc.set(1, cred(RP_B, b"bob"))
+        rc.set(3, cred(RP_A2, b"carol"))
+        self.assertEqual(rc.get_fido2_counter(), 3)
+        self.assertEqual(rc.occupied_slots(), [0, 1, 3])
+        self.assertEqual(rc.slots_by_rp_id_hash(RP_A), [0, 3])
+        self.assertEqual(rc.slots_by_rp_id_hash(RP_B), [1])
+        self.assertEqual(rc.slots_by_rp_id_hash(b"\xcc" * 32), [])
+        self.assertEqual(rc.free_slot(), 2)
+
+        rc.set(1, cred(RP_A, b"dave"), is_overwritten=True)
+        self.assertEqual(rc.get_fido2_counter(), 3)
+        self.assertEqual(rc.slots_by_rp_id_hash(RP_A), [0, 1, 3])
+        self.assertEqual(rc.slots_by_rp_id_hash(RP_B), [])
+
+        rc.delete(0)
+        self.assertEqual(rc.get_fido2_counter(), 2)
+        self.assertEqual(rc.occupied_slots(), [1, 3])
+        self.assertEqual(rc.free_slot(), 0)
+
+        rc.delete_all()
+        self.assertEqual(rc.get_fido2_counter(), 0)
+        self.assertEqual(rc.occupied_slots(), [])
+
+    @mock_storage
+    def test_full(self):
+        for i in range(rc.MAX_RESIDENT_CREDENTIALS):
+            rc.set(i, cred(RP_A, str(i).encode()))
+        self.assertIsNone(rc.free_slot())
+        self.assertEqual(len(rc.slots_by_rp_id_hash(RP_A)), rc.MAX_RESIDENT_CREDENTIALS)
+
+    @mock_storage
+    def test_rebuild(self):
+        rc.set(0, cred(RP_A, b"alice"))
+        rc.set(2, cred(RP_B, b"bob"))
+
+        # missing index
+        rc.invalidate_index()
+        self.assertEqual(rc.slots_by_rp_id_hash(RP_B), [2])
+        self.assertIsNotNone(device.get_fido2_cred_index())
+
+        # corrupted index
+        index = bytearray(device.get_fido2_cred_index())
+        index[-1] ^= 0xFF
+        device.set_fido2_cred_index(bytes(index))
+        self.assertEqual(rc.occupied_slots(), [0, 2])
+
+        # index and counter out of sync with the slots
+        device.set_fido2_counter(5)
+        self.assertEqual(rc.occupied_slots(), [0, 2])
+        self.assertEqual(rc.get_fido2_counter(), 2)
+
+    @mock_storage
+    def test_no_credential_ids(self):
+        rc.set(0, cred(RP_A, b"alice"))
+        index = device.get_fido2_cred_index()
+        self.assertLessEqual(len(index), device.FIDO2_CRED_INDEX_MAXSIZE)
+        self.assertNotIn(b"credential id", index)
+        self.assertNotIn(RP_A[:4], index)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+# Shared helper of the benchmarks, imported instead of common:
+#
+#   from bench import *
+#
+# The benchmarks are not part of the test suite. Run them on the non-frozen unix
+# emulator with ./run_benchmarks.sh, optionally naming the files to run.
+
+import sys
+
+sys.path.append("../../src")
+sys.path.append("../../tests")
+
+from common import *  # noqa: F401,F403,E402
+
+import gc  # noqa: E402
+
+import utime  # noqa: E402
+
+
+def timed(label: str, fnc, rounds: int = 1, heap: bool = False):
+    """
+    Print the time a call of `fnc` takes, averaged over `rounds` calls.
+    With `heap`, the garbage collector is disabled during the calls, and the bytes
+    they allocated and the bytes still used by the result are printed too.
+    Returns the result of the last call.
+    """
+    if heap:
+        gc.collect()
+        gc.disable()
+        before = gc.mem_alloc()
+    start = utime.ticks_us()
+    for _ in range(rounds):
+        result = fnc()
+    elapsed = utime.ticks_diff(utime.ticks_us(), start) / rounds / 1000
+    if heap:
+        allocated = gc.mem_alloc() - before
+        gc.enable()
+        gc.collect()
+        kept = gc.mem_alloc() - before
+        print(
+            "%-28s %10.3f ms, %7d bytes allocated, %7d bytes kept"
+            % (label, elapsed, allocated, kept)
+        )
+    else:
+        print("%-28s %10.3f ms" % (label, elapsed))
+    return result
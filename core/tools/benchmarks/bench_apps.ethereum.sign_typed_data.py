@@ -0,0 +1,99 @@
+# Benchmark of hashing EIP-712 typed data with a large array of structs.
+
+from bench import *
+
+from trezor.enums import EthereumDataType as EDT
+from trezor.messages import EthereumFieldType as EFT
+from trezor.messages import EthereumStructMember as ESM
+from trezor.messages import EthereumTypedDataStructAck as ETDSA
+from trezor.messages import EthereumTypedDataValueAck
+
+from apps.ethereum.sign_typed_data import TypedDataEnvelope, keccak256
+
+ENTRIES = 200
+
+
+class MockContext:
+    """Sends the values of the message instead of the host."""
+
+    def __init__(self, message):
+        self.message = message
+
+    async def call(self, request, _resp_type):
+        entry = self.message
+        for index in request.member_path:
+            entry = entry[index]
+        if isinstance(entry, list):
+            entry = len(entry).to_bytes(2, "big")
+        return EthereumTypedDataValueAck(value=entry)
+
+
+class UncachedEnvelope(TypedDataEnvelope):
+    def hash_type(self, w, primary_type):
+        w.extend(keccak256(self.encode_type(primary_type)))
+
+
+def member(name, data_type, size=None, entry_type=None, struct_name=None):
+    field_type = EFT(
+        data_type=data_type, size=size, entry_type=entry_type, struct_name=struct_name
+    )
+    return ESM(type=field_type, name=name)
+
+
+# Permit2 PermitBatch
+TYPES = {
+    "PermitBatch": ETDSA(
+        members=[
+            member(
+                "details",
+                EDT.ARRAY,
+                entry_type=EFT(
+                    data_type=EDT.STRUCT, size=4, struct_name="PermitDetails"
+                ),
+            ),
+            member("spender", EDT.ADDRESS),
+            member("sigDeadline", EDT.UINT, 32),
+        ]
+    ),
+    "PermitDetails": ETDSA(
+        members=[
+            member("token", EDT.ADDRESS),
+            member("amount", EDT.UINT, 20),
+            member("expiration", EDT.UINT, 6),
+            member("nonce", EDT.UINT, 6),
+        ]
+    ),
+}
+
+MESSAGE = [
+    [
+        [
+            [bytes([i]) * 20, i.to_bytes(20, "big"), b"\xff" * 6, i.to_bytes(6, "big")]
+            for i in range(ENTRIES)
+        ],
+        b"\x01" * 20,
+        b"\xff" * 32,
+    ]
+]
+
+
+def bench(label, envelope_class):
+    envelope = envelope_class(
+        ctx=MockContext(MESSAGE), primary_type="PermitBatch", metamask_v4_compat=True
+    )
+    envelope.types = TYPES
+    return timed(
+        label,
+        lambda: await_result(
+            envelope.hash_struct(
+                primary_type="PermitBatch",
+                member_path=[0],
+                show_data=False,
+                parent_objects=["PermitBatch"],
+            )
+        ),
+    )
+
+
+print("PermitBatch with %d PermitDetails" % ENTRIES)
+assert bench("memoized", TypedDataEnvelope) == bench("uncached", UncachedEnvelope)
@@ -0,0 +1,35 @@
+# Benchmark of the EVM token and network lookups.
+
+from bench import *
+
+from apps.ethereum import networks, tokens
+
+ROUNDS = 1000
+
+
+def bench(label, fn, *args):
+    timed(label, lambda: fn(*args), ROUNDS)
+
+
+def token_key(entry):
+    key = tokens._TOKENS[entry : entry + tokens._KEY_LEN]
+    return int.from_bytes(key[:4], "big"), key[4:]
+
+
+def network_chain_id(entry):
+    return int.from_bytes(networks._NETWORKS[entry : entry + 8], "big")
+
+
+first_token = token_key(0)
+last_token = token_key(len(tokens._TOKENS) - tokens._ENTRY_LEN)
+first_network = network_chain_id(0)
+last_network = network_chain_id(len(networks._NETWORKS) - networks._ENTRY_LEN)
+
+bench("first token", tokens.token_by_chain_address, *first_token)
+bench("last token", tokens.token_by_chain_address, *last_token)
+bench("unknown token", tokens.token_by_chain_address, 1, b"\xff" * 20)
+bench("first network", networks.by_chain_id, first_network)
+bench("last network", networks.by_chain_id, last_network)
+bench("unknown network", networks.by_chain_id, 0xFFFF_FFFF)
+bench("shortcut (last network)", networks.shortcut_by_chain_id, last_network)
+bench("by_slip44 (60)", networks.by_slip44, 60)
@@ -0,0 +1,58 @@
+# Benchmark of the multiexps of Bulletproofs+ verification.
+
+from bench import *
+
+from apps.monero.xmr import bulletproof as bp, crypto
+
+ENGINES = (("sequential", bp.MultiExpSequential), ("bucket", bp.MultiExp))
+# pairs of the L/R rounds of 2 and 16 outputs: 2 * MN / 2^k + 2
+PAIRS = (6, 18, 34, 66, 130, 258, 514, 1026)
+OUTPUTS = (2, 16)
+
+
+def bench_multiexp(pairs, points):
+    scalars = [
+        crypto.encodeint_into(None, crypto.random_scalar()) for _ in range(pairs)
+    ]
+
+    def run(muex_class):
+        muex = muex_class()
+        for i in range(pairs):
+            muex.add_pair(scalars[i], points[i % len(points)])
+        return bp._multiexp(None, muex)
+
+    results = [
+        timed("%4d pairs %s" % (pairs, name), lambda: run(muex_class))
+        for name, muex_class in ENGINES
+    ]
+    assert results[0] == results[1]
+
+
+def bench_proof(outputs):
+    sv = [crypto.Scalar(i * 123 + 45) for i in range(outputs)]
+    gamma = [crypto.Scalar(i * 456 * 17) for i in range(outputs)]
+    bpi = bp.BulletProofPlusBuilder()
+    # the prover keeps the constant-time MultiExpSequential
+    proof = timed("prove %2d outputs" % outputs, lambda: bpi.prove_batch(sv, gamma))
+    multiexp = bp.MultiExp
+    for name, muex_class in ENGINES:
+        bp.MultiExp = muex_class
+        try:
+            timed(
+                "verify %2d outputs %s" % (outputs, name),
+                lambda: bpi.verify_batch([proof]),
+            )
+        finally:
+            bp.MultiExp = multiexp
+
+
+points = [
+    crypto.encodepoint_into(
+        None, crypto.scalarmult_base_into(None, crypto.random_scalar())
+    )
+    for _ in range(64)
+]
+for pairs in PAIRS:
+    bench_multiexp(pairs, points)
+for outputs in OUTPUTS:
+    bench_proof(outputs)
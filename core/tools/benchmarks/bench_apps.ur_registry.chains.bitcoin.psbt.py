@@ -0,0 +1,72 @@
+# Benchmark of parsing a large PSBT with previous transactions, as received by QR.
+# Compares the heap used and the time taken by the eager PSBT parser and the
+# PSBTView used for signing.
+
+from bench import *
+
+from apps.ur_registry.chains.bitcoin.psbt.key import KeyOriginInfo
+from apps.ur_registry.chains.bitcoin.psbt.psbt import (
+    PSBT,
+    PartiallySignedInput,
+    PartiallySignedOutput,
+    PSBTView,
+)
+from apps.ur_registry.chains.bitcoin.psbt.serialize import uint256_from_str
+from apps.ur_registry.chains.bitcoin.psbt.tx import (
+    COutPoint,
+    CTransaction,
+    CTxIn,
+    CTxOut,
+)
+
+INPUTS = 20
+PREV_OUTPUTS = 50
+
+
+def make_psbt():
+    psbt = PSBT()
+    tx = CTransaction()
+    tx.nVersion = 2
+    for i in range(INPUTS):
+        prev = CTransaction()
+        prev.vin.append(CTxIn(COutPoint(i + 1, 0), b"", 0xFFFF_FFFF))
+        for k in range(PREV_OUTPUTS):
+            prev.vout.append(CTxOut(1000 + k, b"\x00\x14" + bytes([i, k]) * 10))
+        prev.rehash()
+        outpoint = COutPoint(uint256_from_str(prev.hash), i % PREV_OUTPUTS)
+        tx.vin.append(CTxIn(outpoint, b"", 0xFFFF_FFFD))
+
+        psbt_in = PartiallySignedInput(0)
+        psbt_in.non_witness_utxo = prev
+        path = [0x8000_0054, 0x8000_0000, 0x8000_0000, 0, i]
+        psbt_in.hd_keypaths[b"\x02" + bytes([i]) * 32] = KeyOriginInfo(
+            b"\x01\x02\x03\x04", path
+        )
+        psbt.inputs.append(psbt_in)
+
+    tx.vout.append(CTxOut(5000, b"\x00\x14" + b"\x01" * 20))
+    psbt.outputs.append(PartiallySignedOutput(0))
+    psbt.tx = tx
+    return psbt.serialize()
+
+
+def eager(data):
+    psbt = PSBT()
+    psbt.deserialize(data)
+    for psbt_in in psbt.inputs:
+        psbt_in.non_witness_utxo.vout[psbt_in.prev_out]
+    return psbt
+
+
+def lazy(data):
+    psbt = PSBTView(data)
+    for i in range(psbt.input_count()):
+        psbt_in = psbt.input(i)
+        psbt_in.non_witness_utxo.txout(psbt_in.prev_out)
+    return psbt
+
+
+data = make_psbt()
+print("PSBT of %d bytes, %d inputs" % (len(data), INPUTS))
+timed("eager", lambda: eager(data), heap=True)
+timed("view", lambda: lazy(data), heap=True)
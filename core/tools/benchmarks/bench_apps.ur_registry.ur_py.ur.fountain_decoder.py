@@ -0,0 +1,38 @@
+# Benchmark of decoding an animated UR of a large payload from a shuffled stream
+# of parts with some of them lost, like a camera scanning the QR codes does.
+
+from bench import *
+
+from apps.ur_registry.ur_py.ur.fountain_decoder import FountainDecoder
+from apps.ur_registry.ur_py.ur.fountain_encoder import FountainEncoder
+from apps.ur_registry.ur_py.ur.xoshiro256 import Xoshiro256
+
+MESSAGE_LEN = 100 * 1024
+MAX_FRAGMENT_LEN = 200
+LOSS = 0.3
+
+message = bytearray((i * 7 + 3) & 0xFF for i in range(MESSAGE_LEN))
+encoder = FountainEncoder(message, MAX_FRAGMENT_LEN)
+rng = Xoshiro256.from_bytes(b"fountain")
+
+parts = [encoder.next_part() for _ in range(encoder.seq_len() * 3)]
+stream = []
+while parts:
+    part = parts.pop(rng.next_int(0, len(parts) - 1))
+    if rng.next_double() >= LOSS:
+        stream.append(part)
+
+
+def decode():
+    decoder = FountainDecoder()
+    for part in stream:
+        decoder.receive_part(part)
+        if decoder.is_complete():
+            break
+    return decoder
+
+
+print("%d bytes in %d fragments" % (MESSAGE_LEN, encoder.seq_len()))
+decoder = timed("decode", decode)
+assert decoder.result_message() == bytes(message)
+print("%d parts processed" % decoder.processed_parts_count)
@@ -0,0 +1,44 @@
+# Benchmark of looking up the resident credentials of one RP, as GetAssertion
+# does, with the slot index and with a scan of all slots.
+
+from bench import *
+
+import storage.resident_credentials as rc
+from trezor import config
+
+ROUNDS = 20
+
+
+def full_scan(rp_id_hash):
+    found = []
+    for index in range(rc.MAX_RESIDENT_CREDENTIALS):
+        data = rc.get(index)
+        if data is not None and data[:32] == rp_id_hash:
+            found.append(index)
+    return found
+
+
+def indexed(rp_id_hash):
+    found = []
+    for index in rc.slots_by_rp_id_hash(rp_id_hash):
+        data = rc.get(index)
+        if data is not None and data[:32] == rp_id_hash:
+            found.append(index)
+    return found
+
+
+def bench(label, lookup, rp_id_hash):
+    return timed(label, lambda: lookup(rp_id_hash), ROUNDS)
+
+
+config.init()
+for count in (10, 60):
+    config.wipe()
+    rc.delete_all()
+    for i in range(count):
+        # every tenth credential belongs to the RP that is looked up
+        rp_id_hash = bytes([i % 10]) * 32
+        rc.set(i, rp_id_hash + bytes([i]) * 70)
+    print("%d credentials" % count)
+    target = b"\x00" * 32
+    assert bench("full scan", full_scan, target) == bench("indexed", indexed, target)
@@ -0,0 +1,14 @@
+#!/usr/bin/env bash
+# Run the benchmarks on the unix emulator, all of them or the files given.
+
+MICROPYTHON="${MICROPYTHON:-../../build/unix/trezor-emu-core -X heapsize=2M}"
+
+cd $(dirname $0)
+
+[ -z "$*" ] && benchmarks=(bench_*.py) || benchmarks=($*)
+
+for benchmark in ${benchmarks[@]}; do
+    echo
+    echo "$benchmark"
+    $MICROPYTHON $benchmark || exit 1
+done
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import sys
 
@@ -37,16 +38,22 @@ def build_icons(check, remove):
 
     total_size = 0
 
+    icon_apps = []
     for app in apps:
         if app["icon"] is None:
             if not app.get("no_icon"):
                 raise click.ClickException(f"Icon not found for: {app['key']}")
             else:
                 continue
+        icon_apps.append(app)
 
-        im = Image.open(app["icon"])
-        resized = im.resize(ICON_SIZE, Image.BOX)
-        toi = toif.from_image(resized)
+    resized = [
+        Image.open(app["icon"]).resize(ICON_SIZE, Image.BOX) for app in icon_apps
+    ]
+    with ThreadPoolExecutor() as executor:
+        toifs = toif.from_images(resized, executor=executor)
+
+    for app, toi in zip(icon_apps, toifs):
         dest_path = DESTINATION / f"icon_{app['key']}.toif"
 
         total_size += len(toi.to_bytes())
@@ -191,6 +191,18 @@ class Emulator:
         self.stop()
         self.start()
 
+    def is_running(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    def restore_storage(self, storage: bytes) -> None:
+        """Restart the emulator with the given contents of its storage.
+
+        `storage` is typically a snapshot taken earlier with `get_storage()`.
+        """
+        self.stop()
+        self.storage.write_bytes(storage)
+        self.start()
+
     def __enter__(self) -> "Emulator":
         return self
 
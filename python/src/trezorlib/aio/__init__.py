@@ -0,0 +1,40 @@
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+"""asyncio API for talking to Trezor devices.
+
+>>> transport = await get_async_transport("udp:127.0.0.1:21324")
+>>> client = await AsyncTrezorClient.create(transport, ui)
+>>> address = await btc.get_address(client, "Bitcoin", parse_path("m/84h/0h/0h/0/0"))
+"""
+
+from .client import AsyncTrezorClient
+from .transport import (
+    AsyncBridgeTransport,
+    AsyncTransport,
+    AsyncUdpTransport,
+    ExecutorTransport,
+    get_async_transport,
+)
+
+__all__ = [
+    "AsyncBridgeTransport",
+    "AsyncTransport",
+    "AsyncTrezorClient",
+    "AsyncUdpTransport",
+    "ExecutorTransport",
+    "get_async_transport",
+]
@@ -0,0 +1,175 @@
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+"""Asynchronous versions of the common `trezorlib.btc` functions."""
+
+from typing import TYPE_CHECKING, Any, AnyStr, List, Optional, Sequence, Tuple
+
+from .. import btc, exceptions, messages
+from ..tools import prepare_message_bytes
+
+if TYPE_CHECKING:
+    from ..btc import TxCacheType
+    from ..tools import Address
+    from .client import AsyncTrezorClient
+
+
+async def _unlock_path(
+    client: "AsyncTrezorClient",
+    unlock_path: Optional[List[int]],
+    unlock_path_mac: Optional[bytes],
+) -> None:
+    if unlock_path:
+        res = await client.call(
+            messages.UnlockPath(address_n=unlock_path, mac=unlock_path_mac)
+        )
+        if not isinstance(res, messages.UnlockedPathRequest):
+            raise exceptions.TrezorException("Unexpected message")
+
+
+async def get_public_node(
+    client: "AsyncTrezorClient",
+    n: "Address",
+    ecdsa_curve_name: Optional[str] = None,
+    show_display: bool = False,
+    coin_name: Optional[str] = None,
+    script_type: messages.InputScriptType = messages.InputScriptType.SPENDADDRESS,
+    ignore_xpub_magic: bool = False,
+    unlock_path: Optional[List[int]] = None,
+    unlock_path_mac: Optional[bytes] = None,
+) -> messages.PublicKey:
+    async with client:
+        await _unlock_path(client, unlock_path, unlock_path_mac)
+        res = await client.call(
+            messages.GetPublicKey(
+                address_n=n,
+                ecdsa_curve_name=ecdsa_curve_name,
+                show_display=show_display,
+                coin_name=coin_name,
+                script_type=script_type,
+                ignore_xpub_magic=ignore_xpub_magic,
+            )
+        )
+    if not isinstance(res, messages.PublicKey):
+        raise exceptions.TrezorException("Unexpected message")
+    return res
+
+
+async def get_authenticated_address(
+    client: "AsyncTrezorClient",
+    coin_name: str,
+    n: "Address",
+    show_display: bool = False,
+    multisig: Optional[messages.MultisigRedeemScriptType] = None,
+    script_type: messages.InputScriptType = messages.InputScriptType.SPENDADDRESS,
+    ignore_xpub_magic: bool = False,
+    unlock_path: Optional[List[int]] = None,
+    unlock_path_mac: Optional[bytes] = None,
+) -> messages.Address:
+    async with client:
+        await _unlock_path(client, unlock_path, unlock_path_mac)
+        res = await client.call(
+            messages.GetAddress(
+                address_n=n,
+                coin_name=coin_name,
+                show_display=show_display,
+                multisig=multisig,
+                script_type=script_type,
+                ignore_xpub_magic=ignore_xpub_magic,
+            )
+        )
+    if not isinstance(res, messages.Address):
+        raise exceptions.TrezorException("Unexpected message")
+    return res
+
+
+async def get_address(*args: Any, **kwargs: Any) -> str:
+    return (await get_authenticated_address(*args, **kwargs)).address
+
+
+async def sign_message(
+    client: "AsyncTrezorClient",
+    coin_name: str,
+    n: "Address",
+    message: AnyStr,
+    script_type: messages.InputScriptType = messages.InputScriptType.SPENDADDRESS,
+    no_script_type: bool = False,
+    is_bip322_simple: bool = False,
+) -> messages.MessageSignature:
+    res = await client.call(
+        messages.SignMessage(
+            coin_name=coin_name,
+            address_n=n,
+            message=prepare_message_bytes(message),
+            script_type=script_type,
+            no_script_type=no_script_type,
+            is_bip322_simple=is_bip322_simple,
+        )
+    )
+    if not isinstance(res, messages.MessageSignature):
+        raise exceptions.TrezorException("Unexpected message")
+    return res
+
+
+async def verify_message(
+    client: "AsyncTrezorClient",
+    coin_name: str,
+    address: str,
+    signature: bytes,
+    message: AnyStr,
+) -> bool:
+    try:
+        resp = await client.call(
+            messages.VerifyMessage(
+                address=address,
+                signature=signature,
+                message=prepare_message_bytes(message),
+                coin_name=coin_name,
+            )
+        )
+    except exceptions.TrezorFailure:
+        return False
+    return isinstance(resp, messages.Success)
+
+
+async def sign_tx(
+    client: "AsyncTrezorClient",
+    coin_name: str,
+    inputs: Sequence[messages.TxInputType],
+    outputs: Sequence[messages.TxOutputType],
+    prev_txes: Optional["TxCacheType"] = None,
+    payment_reqs: Sequence[messages.TxAckPaymentRequest] = (),
+    preauthorized: bool = False,
+    unlock_path: Optional[List[int]] = None,
+    unlock_path_mac: Optional[bytes] = None,
+    batch: bool = False,
+    **kwargs: Any,
+) -> Tuple[Sequence[Optional[bytes]], bytes]:
+    """Sign a Bitcoin-like transaction, see `trezorlib.btc.sign_tx`."""
+    signtx = btc.prepare_sign_tx(coin_name, inputs, outputs, **kwargs)
+    return await client.run_flow(
+        btc.sign_tx_flow(
+            signtx,
+            inputs,
+            outputs,
+            prev_txes,
+            payment_reqs,
+            preauthorized,
+            unlock_path,
+            unlock_path_mac,
+            batch,
+        )
+    )
@@ -0,0 +1,341 @@
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, Optional
+
+from mnemonic import Mnemonic
+
+from .. import exceptions, mapping, messages, models
+from ..client import (
+    MAX_PASSPHRASE_LENGTH,
+    MAX_PIN_LENGTH,
+    PASSPHRASE_ON_DEVICE,
+    TrezorClient,
+)
+from ..log import DUMP_BYTES
+from ..messages import Capability
+
+if TYPE_CHECKING:
+    from ..protobuf import MessageType
+    from ..tools import Flow, R
+    from ..ui import TrezorClientUI
+    from .transport import AsyncTransport
+
+LOG = logging.getLogger(__name__)
+
+# how long to wait for the device to confirm a cancelled call
+CANCEL_TIMEOUT = 5
+
+
+class AsyncTrezorClient:
+    """Asynchronous Trezor client.
+
+    Counterpart of `TrezorClient` for use from an asyncio event loop. Use
+    `AsyncTrezorClient.create()` to connect and initialize the device in one step.
+
+    If a task waiting in `call` is cancelled, the client sends `Cancel` to the device
+    and waits for it to abort the operation, so the connection can be reused.
+    """
+
+    def __init__(
+        self,
+        transport: "AsyncTransport",
+        ui: "TrezorClientUI",
+        session_id: Optional[bytes] = None,
+        model: Optional[models.TrezorModel] = None,
+    ) -> None:
+        LOG.info(f"creating async client instance for device: {transport.get_path()}")
+        self.model = model
+        if self.model:
+            self.mapping = self.model.default_mapping
+        else:
+            self.mapping = mapping.DEFAULT_MAPPING
+        self.transport = transport
+        self.ui = ui
+        self.session_counter = 0
+        self.session_id = session_id
+        self._pending_read: "Optional[asyncio.Task[MessageType]]" = None
+
+    @classmethod
+    async def create(
+        cls,
+        transport: "AsyncTransport",
+        ui: "TrezorClientUI",
+        session_id: Optional[bytes] = None,
+        derive_cardano: Optional[bool] = None,
+        model: Optional[models.TrezorModel] = None,
+    ) -> "AsyncTrezorClient":
+        """Create a client and initialize the device, see `TrezorClient.__init__`."""
+        client = cls(transport, ui, session_id=session_id, model=model)
+        await client.init_device(session_id=session_id, derive_cardano=derive_cardano)
+        return client
+
+    # these only look at the features and work the same as in the sync client
+    _refresh_features = TrezorClient._refresh_features
+    is_outdated = TrezorClient.is_outdated
+    check_firmware_version = TrezorClient.check_firmware_version
+
+    async def open(self) -> None:
+        if self.session_counter == 0:
+            await self.transport.begin_session()
+        self.session_counter += 1
+
+    async def close(self) -> None:
+        self.session_counter = max(self.session_counter - 1, 0)
+        if self.session_counter == 0:
+            if self._pending_read is not None:
+                # nobody is going to pick up the response anymore
+                self._pending_read.cancel()
+                self._pending_read = None
+            await self.transport.end_session()
+
+    async def __aenter__(self) -> "AsyncTrezorClient":
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def cancel(self) -> None:
+        await self._raw_write(messages.Cancel())
+
+    async def call_raw(self, msg: "MessageType") -> "MessageType":
+        await self._raw_write(msg)
+        return await self._raw_read()
+
+    async def _raw_write(self, msg: "MessageType") -> None:
+        LOG.debug(
+            f"sending message: {msg.__class__.__name__}",
+            extra={"protobuf": msg},
+        )
+        msg_type, msg_bytes = self.mapping.encode(msg)
+        LOG.log(
+            DUMP_BYTES,
+            f"encoded as type {msg_type} ({len(msg_bytes)} bytes): {msg_bytes.hex()}",
+        )
+        # never leave a half-written message behind
+        await asyncio.shield(self.transport.write(msg_type, msg_bytes))
+
+    async def _read_message(self) -> "MessageType":
+        msg_type, msg_bytes = await self.transport.read()
+        LOG.log(
+            DUMP_BYTES,
+            f"received type {msg_type} ({len(msg_bytes)} bytes): {msg_bytes.hex()}",
+        )
+        msg = self.mapping.decode(msg_type, msg_bytes)
+        LOG.debug(
+            f"received message: {msg.__class__.__name__}",
+            extra={"protobuf": msg},
+        )
+        return msg
+
+    async def _raw_read(self) -> "MessageType":
+        # The read runs in its own task. If the caller is cancelled, the message
+        # being received is not torn apart and is picked up by the next read.
+        if self._pending_read is None:
+            self._pending_read = asyncio.ensure_future(self._read_message())
+        try:
+            return await asyncio.shield(self._pending_read)
+        finally:
+            if self._pending_read.done():
+                self._pending_read = None
+
+    async def _abort(self) -> None:
+        """Cancel the operation in progress and wait for the device to confirm."""
+        await self.cancel()
+        while True:
+            resp = await self._raw_read()
+            if isinstance(resp, messages.Failure):
+                return
+
+    async def _ui(self, func: Any, *args: Any) -> Any:
+        # UI callbacks may block on user input
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, func, *args)
+
+    async def _callback_pin(self, msg: messages.PinMatrixRequest) -> "MessageType":
+        try:
+            pin = await self._ui(self.ui.get_pin, msg.type)
+        except exceptions.Cancelled:
+            await self.call_raw(messages.Cancel())
+            raise
+
+        if any(d not in "1234567890" for d in pin) or not (
+            1 <= len(pin) <= MAX_PIN_LENGTH
+        ):
+            await self.call_raw(messages.Cancel())
+            raise ValueError("Invalid PIN provided")
+
+        resp = await self.call_raw(messages.PinMatrixAck(pin=pin))
+        if isinstance(resp, messages.Failure) and resp.code in (
+            messages.FailureType.PinInvalid,
+            messages.FailureType.PinCancelled,
+            messages.FailureType.PinExpected,
+        ):
+            raise exceptions.PinException(resp.code, resp.message)
+        else:
+            return resp
+
+    async def _callback_passphrase(
+        self, msg: messages.PassphraseRequest
+    ) -> "MessageType":
+        available_on_device = Capability.PassphraseEntry in self.features.capabilities
+
+        async def send_passphrase(
+            passphrase: Optional[str] = None, on_device: Optional[bool] = None
+        ) -> "MessageType":
+            msg = messages.PassphraseAck(passphrase=passphrase, on_device=on_device)
+            resp = await self.call_raw(msg)
+            if isinstance(resp, messages.Deprecated_PassphraseStateRequest):
+                self.session_id = resp.state
+                resp = await self.call_raw(messages.Deprecated_PassphraseStateAck())
+            return resp
+
+        # short-circuit old style entry
+        if msg._on_device is True:
+            return await send_passphrase(None, None)
+
+        try:
+            passphrase = await self._ui(self.ui.get_passphrase, available_on_device)
+        except exceptions.Cancelled:
+            await self.call_raw(messages.Cancel())
+            raise
+
+        if passphrase is PASSPHRASE_ON_DEVICE:
+            if not available_on_device:
+                await self.call_raw(messages.Cancel())
+                raise RuntimeError("Device is not capable of entering passphrase")
+            else:
+                return await send_passphrase(on_device=True)
+
+        # else process host-entered passphrase
+        if not isinstance(passphrase, str):
+            raise RuntimeError("Passphrase must be a str")
+        passphrase = Mnemonic.normalize_string(passphrase)
+        if len(passphrase) > MAX_PASSPHRASE_LENGTH:
+            await self.call_raw(messages.Cancel())
+            raise ValueError("Passphrase too long")
+
+        return await send_passphrase(passphrase, on_device=False)
+
+    async def _callback_button(self, msg: messages.ButtonRequest) -> "MessageType":
+        # do this raw - send ButtonAck first, notify UI later
+        await self._raw_write(messages.ButtonAck())
+        self.ui.button_request(msg)
+        return await self._raw_read()
+
+    async def call(self, msg: "MessageType") -> "MessageType":
+        await self.open()
+        try:
+            self.check_firmware_version()
+            resp = await self.call_raw(msg)
+            while True:
+                if isinstance(resp, messages.PinMatrixRequest):
+                    resp = await self._callback_pin(resp)
+                elif isinstance(resp, messages.PassphraseRequest):
+                    resp = await self._callback_passphrase(resp)
+                elif isinstance(resp, messages.ButtonRequest):
+                    resp = await self._callback_button(resp)
+                elif isinstance(resp, messages.Failure):
+                    if resp.code == messages.FailureType.ActionCancelled:
+                        raise exceptions.Cancelled
+                    raise exceptions.TrezorFailure(resp)
+                else:
+                    return resp
+        except asyncio.CancelledError:
+            try:
+                await asyncio.wait_for(asyncio.shield(self._abort()), CANCEL_TIMEOUT)
+            except Exception as e:
+                LOG.warning(f"Device did not confirm cancellation: {e}")
+            raise
+        finally:
+            await self.close()
+
+    async def run_flow(self, flow: "Flow[R]") -> "R":
+        """Drive a message flow (e.g. `btc.sign_tx_flow`) and return its result."""
+        await self.open()
+        try:
+            request = next(flow)
+            while True:
+                request = flow.send(await self.call(request))
+        except StopIteration as e:
+            return e.value
+        finally:
+            await self.close()
+
+    async def refresh_features(self) -> messages.Features:
+        """Reload features from the device."""
+        await self.open()
+        try:
+            resp = await self.call_raw(messages.GetFeatures())
+        finally:
+            await self.close()
+        if not isinstance(resp, messages.Features):
+            raise exceptions.TrezorException("Unexpected response to GetFeatures")
+        self._refresh_features(resp)
+        return resp
+
+    async def init_device(
+        self,
+        *,
+        session_id: Optional[bytes] = None,
+        new_session: bool = False,
+        derive_cardano: Optional[bool] = None,
+    ) -> Optional[bytes]:
+        """Initialize the device and return a session ID.
+
+        See `TrezorClient.init_device` for details.
+        """
+        if new_session:
+            self.session_id = None
+        elif session_id is not None:
+            self.session_id = session_id
+
+        await self.open()
+        try:
+            resp = await self.call_raw(
+                messages.Initialize(
+                    session_id=self.session_id,
+                    derive_cardano=derive_cardano,
+                )
+            )
+        finally:
+            await self.close()
+        if isinstance(resp, messages.Failure):
+            # can happen if `derive_cardano` does not match the current session
+            raise exceptions.TrezorFailure(resp)
+        if not isinstance(resp, messages.Features):
+            raise exceptions.TrezorException("Unexpected response to Initialize")
+
+        if self.session_id is not None and resp.session_id == self.session_id:
+            LOG.info("Successfully resumed session")
+        elif session_id is not None:
+            LOG.info("Failed to resume session")
+
+        reported_session_id = resp.session_id
+        self._refresh_features(resp)
+        return reported_session_id
+
+    async def ping(self, msg: str, button_protection: bool = False) -> str:
+        resp = await self.call(
+            messages.Ping(message=msg, button_protection=button_protection)
+        )
+        if not isinstance(resp, messages.Success):
+            raise RuntimeError(f"Got {resp.__class__}, expected {messages.Success}")
+        assert resp.message is not None
+        return resp.message
@@ -0,0 +1,151 @@
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+"""Asynchronous versions of the common `trezorlib.ethereum` functions."""
+
+from typing import TYPE_CHECKING, AnyStr, List, Optional, Tuple
+
+from .. import exceptions, messages
+from ..ethereum import int_to_big_endian, sign_tx_flow
+from ..tools import prepare_message_bytes
+
+if TYPE_CHECKING:
+    from ..tools import Address
+    from .client import AsyncTrezorClient
+
+
+async def get_address(
+    client: "AsyncTrezorClient",
+    n: "Address",
+    show_display: bool = False,
+    encoded_network: Optional[bytes] = None,
+) -> str:
+    res = await client.call(
+        messages.EthereumGetAddress(
+            address_n=n,
+            show_display=show_display,
+            encoded_network=encoded_network,
+        )
+    )
+    if not isinstance(res, messages.EthereumAddress) or res.address is None:
+        raise exceptions.TrezorException("Unexpected message")
+    return res.address
+
+
+async def get_public_node(
+    client: "AsyncTrezorClient", n: "Address", show_display: bool = False
+) -> messages.EthereumPublicKey:
+    res = await client.call(
+        messages.EthereumGetPublicKey(address_n=n, show_display=show_display)
+    )
+    if not isinstance(res, messages.EthereumPublicKey):
+        raise exceptions.TrezorException("Unexpected message")
+    return res
+
+
+async def sign_tx(
+    client: "AsyncTrezorClient",
+    n: "Address",
+    nonce: int,
+    gas_price: int,
+    gas_limit: int,
+    to: str,
+    value: int,
+    data: Optional[bytes] = None,
+    chain_id: Optional[int] = None,
+    tx_type: Optional[int] = None,
+    definitions: Optional[messages.EthereumDefinitions] = None,
+) -> Tuple[int, bytes, bytes]:
+    if chain_id is None:
+        raise exceptions.TrezorException("Chain ID cannot be undefined")
+
+    msg = messages.EthereumSignTx(
+        address_n=n,
+        nonce=int_to_big_endian(nonce),
+        gas_price=int_to_big_endian(gas_price),
+        gas_limit=int_to_big_endian(gas_limit),
+        value=int_to_big_endian(value),
+        to=to,
+        chain_id=chain_id,
+        tx_type=tx_type,
+        definitions=definitions,
+    )
+    return await client.run_flow(sign_tx_flow(msg, data or b""))
+
+
+async def sign_tx_eip1559(
+    client: "AsyncTrezorClient",
+    n: "Address",
+    *,
+    nonce: int,
+    gas_limit: int,
+    to: str,
+    value: int,
+    data: bytes = b"",
+    chain_id: int,
+    max_gas_fee: int,
+    max_priority_fee: int,
+    access_list: Optional[List[messages.EthereumAccessList]] = None,
+    definitions: Optional[messages.EthereumDefinitions] = None,
+) -> Tuple[int, bytes, bytes]:
+    msg = messages.EthereumSignTxEIP1559(
+        address_n=n,
+        nonce=int_to_big_endian(nonce),
+        gas_limit=int_to_big_endian(gas_limit),
+        value=int_to_big_endian(value),
+        to=to,
+        chain_id=chain_id,
+        max_gas_fee=int_to_big_endian(max_gas_fee),
+        max_priority_fee=int_to_big_endian(max_priority_fee),
+        access_list=access_list,
+        data_length=len(data),
+        definitions=definitions,
+    )
+    return await client.run_flow(sign_tx_flow(msg, data))
+
+
+async def sign_message(
+    client: "AsyncTrezorClient",
+    n: "Address",
+    message: AnyStr,
+    encoded_network: Optional[bytes] = None,
+) -> messages.EthereumMessageSignature:
+    res = await client.call(
+        messages.EthereumSignMessage(
+            address_n=n,
+            message=prepare_message_bytes(message),
+            encoded_network=encoded_network,
+        )
+    )
+    if not isinstance(res, messages.EthereumMessageSignature):
+        raise exceptions.TrezorException("Unexpected message")
+    return res
+
+
+async def verify_message(
+    client: "AsyncTrezorClient", address: str, signature: bytes, message: AnyStr
+) -> bool:
+    try:
+        resp = await client.call(
+            messages.EthereumVerifyMessage(
+                address=address,
+                signature=signature,
+                message=prepare_message_bytes(message),
+            )
+        )
+    except exceptions.TrezorFailure:
+        return False
+    return isinstance(resp, messages.Success)
@@ -0,0 +1,450 @@
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+import asyncio
+import json
+import logging
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from ..log import DUMP_PACKETS
+from ..transport import (
+    DeviceIsBusy,
+    MessagePayload,
+    Transport,
+    TransportException,
+    get_transport,
+)
+from ..transport.bridge import (
+    LEGACY_BRIDGE_CACHE,
+    TREZORD_HOST,
+    TREZORD_ORIGIN_HEADER,
+    TREZORD_VERSION_MODERN,
+    BridgeException,
+)
+from ..transport.protocol import ProtocolV1
+from ..transport.udp import UdpTransport
+
+LOG = logging.getLogger(__name__)
+
+
+class AsyncTransport:
+    """Asynchronous counterpart of `trezorlib.transport.Transport`.
+
+    Provides the session and message API as coroutines. Enumeration and path lookup
+    are left to the synchronous transports, see `get_async_transport`.
+    """
+
+    PATH_PREFIX: str
+
+    def __str__(self) -> str:
+        return self.get_path()
+
+    def get_path(self) -> str:
+        raise NotImplementedError
+
+    async def begin_session(self) -> None:
+        raise NotImplementedError
+
+    async def end_session(self) -> None:
+        raise NotImplementedError
+
+    async def read(self) -> MessagePayload:
+        raise NotImplementedError
+
+    async def write(self, message_type: int, message_data: bytes) -> None:
+        raise NotImplementedError
+
+
+class _DatagramQueue(asyncio.DatagramProtocol):
+    def __init__(self) -> None:
+        self.queue: "asyncio.Queue[Any]" = asyncio.Queue()
+
+    def datagram_received(self, data: bytes, addr: Any) -> None:
+        self.queue.put_nowait(data)
+
+    def error_received(self, exc: Exception) -> None:
+        self.queue.put_nowait(exc)
+
+
+class AsyncUdpTransport(AsyncTransport):
+    """UDP transport to an emulator, driven by the asyncio event loop."""
+
+    PATH_PREFIX = UdpTransport.PATH_PREFIX
+
+    def __init__(self, device: Optional[str] = None) -> None:
+        # reuse the path parsing of the synchronous transport
+        self.device = UdpTransport(device).device
+        self.session_counter = 0
+        self.transport: Optional[asyncio.DatagramTransport] = None
+        self.protocol: Optional[_DatagramQueue] = None
+
+    def get_path(self) -> str:
+        return "{}:{}:{}".format(self.PATH_PREFIX, *self.device)
+
+    def find_debug(self) -> "AsyncUdpTransport":
+        host, port = self.device
+        return AsyncUdpTransport(f"{host}:{port + 1}")
+
+    async def open(self) -> None:
+        loop = asyncio.get_running_loop()
+        self.transport, self.protocol = await loop.create_datagram_endpoint(
+            _DatagramQueue, remote_addr=self.device
+        )
+
+    def close(self) -> None:
+        if self.transport is not None:
+            self.transport.close()
+        self.transport = None
+        self.protocol = None
+
+    async def begin_session(self) -> None:
+        if self.session_counter == 0:
+            await self.open()
+        self.session_counter += 1
+
+    async def end_session(self) -> None:
+        self.session_counter = max(self.session_counter - 1, 0)
+        if self.session_counter == 0:
+            self.close()
+
+    async def _recv(self, timeout: Optional[float] = None) -> bytes:
+        assert self.protocol is not None
+        data = await asyncio.wait_for(self.protocol.queue.get(), timeout)
+        if isinstance(data, Exception):
+            raise TransportException(f"UDP receive failed: {data}") from data
+        return data
+
+    async def ping(self, timeout: float = 1) -> bool:
+        """Test if the device is listening."""
+        assert self.transport is not None
+        self.transport.sendto(b"PINGPING")
+        try:
+            return await self._recv(timeout) == b"PONGPONG"
+        except (asyncio.TimeoutError, TransportException):
+            return False
+
+    async def wait_until_ready(self, timeout: float = 10) -> None:
+        loop = asyncio.get_running_loop()
+        await self.open()
+        try:
+            start = loop.time()
+            while not await self.ping():
+                if loop.time() - start >= timeout:
+                    raise TransportException("Timed out waiting for connection.")
+                await asyncio.sleep(0.05)
+        finally:
+            self.close()
+
+    async def _read_chunk(self) -> bytes:
+        chunk = await self._recv()
+        LOG.log(DUMP_PACKETS, f"received packet: {chunk.hex()}")
+        if len(chunk) != 64:
+            raise TransportException(f"Unexpected chunk size: {len(chunk)}")
+        return chunk
+
+    async def write(self, message_type: int, message_data: bytes) -> None:
+        assert self.transport is not None
+        for chunk in ProtocolV1.frame(message_type, message_data):
+            LOG.log(DUMP_PACKETS, f"sending packet: {chunk.hex()}")
+            self.transport.sendto(chunk)
+
+    async def read(self) -> MessagePayload:
+        msg_type, datalen, data = ProtocolV1.parse_first(await self._read_chunk())
+        parts = [data]
+        received = len(data)
+        while received < datalen:
+            data = ProtocolV1.parse_next(await self._read_chunk())
+            parts.append(data)
+            received += len(data)
+        return msg_type, b"".join(parts)[:datalen]
+
+
+# Read-only Bridge endpoints that do not talk to the device
+_IDEMPOTENT_BRIDGE_CALLS = ("configure", "enumerate", "listen")
+
+
+class _HttpConnection:
+    """Minimal keep-alive HTTP/1.1 client for talking to Trezor Bridge."""
+
+    def __init__(self, url: str) -> None:
+        parts = urlsplit(url)
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or 80
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self.lock = asyncio.Lock()
+
+    def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+    async def _send(self, path: str, body: bytes) -> None:
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(
+                self.host, self.port
+            )
+        assert self.reader is not None
+
+        headers = [
+            f"POST /{path} HTTP/1.1",
+            f"Host: {self.host}:{self.port}",
+            f"Content-Length: {len(body)}",
+            "Content-Type: text/plain",
+        ] + [f"{key}: {value}" for key, value in TREZORD_ORIGIN_HEADER.items()]
+        self.writer.write(("\r\n".join(headers) + "\r\n\r\n").encode() + body)
+        await self.writer.drain()
+
+    async def _receive(self) -> Tuple[int, bytes]:
+        assert self.reader is not None
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionResetError("Bridge closed the connection")
+        status = int(status_line.split()[1])
+
+        response_headers: Dict[str, str] = {}
+        while True:
+            line = (await self.reader.readline()).decode().strip()
+            if not line:
+                break
+            key, _, value = line.partition(":")
+            response_headers[key.strip().lower()] = value.strip()
+
+        if response_headers.get("transfer-encoding", "").lower() == "chunked":
+            data = bytearray()
+            while True:
+                size = int((await self.reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    await self.reader.readline()
+                    break
+                data += await self.reader.readexactly(size)
+                await self.reader.readline()
+            content = bytes(data)
+        else:
+            length = int(response_headers.get("content-length", 0))
+            content = await self.reader.readexactly(length)
+
+        if response_headers.get("connection", "").lower() == "close":
+            self.close()
+        return status, content
+
+    async def post(self, path: str, data: Optional[str] = None) -> Tuple[int, bytes]:
+        body = data.encode() if data is not None else b""
+        async with self.lock:
+            reused = self.writer is not None
+            sent = False
+            try:
+                await self._send(path, body)
+                sent = True
+                return await self._receive()
+            except (ConnectionError, asyncio.IncompleteReadError):
+                self.close()
+                # A stale keep-alive connection is retried once on a fresh one. Once
+                # the request is out, Bridge may have passed it to the device already,
+                # so only requests that are safe to repeat are sent again.
+                if not reused or (sent and not _is_idempotent(path)):
+                    raise
+            except BaseException:
+                # the connection is in an unknown state, e.g. after cancellation
+                self.close()
+                raise
+
+            try:
+                await self._send(path, body)
+                return await self._receive()
+            except BaseException:
+                self.close()
+                raise
+
+
+def _is_idempotent(path: str) -> bool:
+    if path.startswith("debug/"):
+        path = path[len("debug/") :]
+    return path.split("/")[0] in _IDEMPOTENT_BRIDGE_CALLS
+
+
+async def call_bridge_async(
+    connection: _HttpConnection, path: str, data: Optional[str] = None
+) -> bytes:
+    status, content = await connection.post(path, data)
+    if status != 200:
+        raise BridgeException(path, status, json.loads(content)["error"])
+    return content
+
+
+class AsyncBridgeTransport(AsyncTransport):
+    """Transport through Trezor Bridge, using a native asyncio HTTP connection."""
+
+    PATH_PREFIX = "bridge"
+
+    def __init__(
+        self, device: Dict[str, Any], legacy: bool, debug: bool = False
+    ) -> None:
+        if legacy and debug:
+            raise TransportException("Debugging not supported on legacy Bridge")
+
+        self.device = device
+        self.session: Optional[str] = None
+        self.debug = debug
+        self.legacy = legacy
+        self.request: Optional[str] = None
+        self.connection = _HttpConnection(TREZORD_HOST)
+
+    def get_path(self) -> str:
+        return f"{self.PATH_PREFIX}:{self.device['path']}"
+
+    def find_debug(self) -> "AsyncBridgeTransport":
+        if not self.device.get("debug"):
+            raise TransportException("Debug device not available")
+        return AsyncBridgeTransport(self.device, self.legacy, debug=True)
+
+    @classmethod
+    async def enumerate(cls) -> List["AsyncBridgeTransport"]:
+        connection = _HttpConnection(TREZORD_HOST)
+        try:
+            legacy = LEGACY_BRIDGE_CACHE.get(TREZORD_HOST)
+            if legacy is None:
+                config = json.loads(await call_bridge_async(connection, "configure"))
+                version = tuple(map(int, config["version"].split(".")))
+                legacy = version < TREZORD_VERSION_MODERN
+                LEGACY_BRIDGE_CACHE[TREZORD_HOST] = legacy
+            devices = json.loads(await call_bridge_async(connection, "enumerate"))
+        except Exception:
+            return []
+        finally:
+            connection.close()
+        return [cls(dev, legacy) for dev in devices]
+
+    async def _call(self, action: str, data: Optional[str] = None) -> bytes:
+        session = self.session or "null"
+        uri = action + "/" + str(session)
+        if self.debug:
+            uri = "debug/" + uri
+        return await call_bridge_async(self.connection, uri, data=data)
+
+    async def begin_session(self) -> None:
+        try:
+            data = await self._call("acquire/" + self.device["path"])
+        except BridgeException as e:
+            if e.message == "wrong previous session":
+                raise DeviceIsBusy(self.device["path"]) from e
+            raise
+        self.session = json.loads(data)["session"]
+
+    async def end_session(self) -> None:
+        if not self.session:
+            return
+        try:
+            await self._call("release")
+        finally:
+            self.session = None
+
+    async def write(self, message_type: int, message_data: bytes) -> None:
+        header = struct.pack(">HL", message_type, len(message_data))
+        buf = (header + message_data).hex()
+        if self.legacy:
+            if self.request is not None:
+                raise TransportException("Can't write twice on legacy Bridge")
+            self.request = buf
+        else:
+            LOG.log(DUMP_PACKETS, f"sending message: {buf}")
+            await self._call("post", data=buf)
+
+    async def read(self) -> MessagePayload:
+        if self.legacy:
+            if self.request is None:
+                raise TransportException("Can't read without write on legacy Bridge")
+            try:
+                LOG.log(DUMP_PACKETS, f"calling with message: {self.request}")
+                text = (await self._call("call", data=self.request)).decode()
+            finally:
+                self.request = None
+        else:
+            text = (await self._call("read")).decode()
+        LOG.log(DUMP_PACKETS, f"received message: {text}")
+        data = bytes.fromhex(text)
+        headerlen = struct.calcsize(">HL")
+        msg_type, datalen = struct.unpack(">HL", data[:headerlen])
+        return msg_type, data[headerlen : headerlen + datalen]
+
+
+class ExecutorTransport(AsyncTransport):
+    """Async shim around a blocking `Transport`, e.g. HID or WebUSB.
+
+    Every operation runs on a dedicated worker thread, so operations on one device
+    stay ordered and blocking reads do not occupy the event loop.
+    """
+
+    def __init__(self, transport: Transport) -> None:
+        self.transport = transport
+        self.PATH_PREFIX = transport.PATH_PREFIX
+        self.executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"trezor-{transport.PATH_PREFIX}"
+        )
+
+    def get_path(self) -> str:
+        return self.transport.get_path()
+
+    async def _run(self, func: Any, *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+
+    async def begin_session(self) -> None:
+        await self._run(self.transport.begin_session)
+
+    async def end_session(self) -> None:
+        await self._run(self.transport.end_session)
+
+    async def read(self) -> MessagePayload:
+        return await self._run(self.transport.read)
+
+    async def write(self, message_type: int, message_data: bytes) -> None:
+        await self._run(self.transport.write, message_type, message_data)
+
+
+async def get_async_transport(
+    path: Optional[str] = None, prefix_search: bool = False
+) -> AsyncTransport:
+    """Find a device and return an asynchronous transport for it.
+
+    UDP and Bridge paths get native asyncio transports. Other transports are
+    looked up with `trezorlib.transport.get_transport` in a worker thread and
+    wrapped in an `ExecutorTransport`.
+    """
+    if path is not None and path.startswith(AsyncUdpTransport.PATH_PREFIX + ":"):
+        transport = AsyncUdpTransport(path[len(AsyncUdpTransport.PATH_PREFIX) + 1 :])
+        await transport.open()
+        try:
+            if not await transport.ping():
+                raise TransportException(f"No Trezor device found at address {path}")
+        finally:
+            transport.close()
+        return transport
+
+    if path is not None and path.startswith(AsyncBridgeTransport.PATH_PREFIX + ":"):
+        for device in await AsyncBridgeTransport.enumerate():
+            if device.get_path() == path or (
+                prefix_search and device.get_path().startswith(path)
+            ):
+                return device
+        raise TransportException(f"Could not find device by path: {path}")
+
+    loop = asyncio.get_running_loop()
+    transport = await loop.run_in_executor(None, get_transport, path, prefix_search)
+    return ExecutorTransport(transport)
@@ -17,17 +17,27 @@
 import warnings
 from copy import copy
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, AnyStr, List, Optional, Sequence, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AnyStr,
+    Callable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
 # TypedDict is not available in typing for python < 3.8
 from typing_extensions import Protocol, TypedDict
 
-from . import exceptions, messages
-from .tools import expect, prepare_message_bytes, session
+from . import exceptions, messages, protobuf
+from .tools import expect, prepare_message_bytes, run_flow, session
 
 if TYPE_CHECKING:
     from .client import TrezorClient
-    from .tools import Address
+    from .tools import Address, Flow
     from .protobuf import MessageType
 
     class ScriptSig(TypedDict):
@@ -73,6 +83,18 @@ if TYPE_CHECKING:
             ...
 
 
+T = TypeVar("T", bound="protobuf.MessageType")
+
+# Maximum encoded size of the items in one TxAck. The device receives messages into a
+# buffer of 8 KiB, the rest is left for the message headers.
+TXACK_MAX_ITEMS_SIZE = 8000
+
+# Maximum number of addresses in one BatchGetAddresses, enforced by the device.
+MAX_ADDRESS_BATCH = 100
+# Number of consecutive unused addresses after which discovery stops (BIP-44).
+DEFAULT_GAP_LIMIT = 20
+
+
 def from_json(json_dict: "Transaction") -> messages.TransactionType:
     def make_input(vin: "Vin") -> messages.TxInputType:
         if "coinbase" in vin:
@@ -172,6 +194,59 @@ def get_authenticated_address(
     )
 
 
+@expect(messages.Addresses, field="addresses", ret_type=list)
+def get_addresses(
+    client: "TrezorClient",
+    coin_name: str,
+    n: "Address",
+    start_index: int = 0,
+    count: int = 1,
+    change: int = 0,
+    script_type: messages.InputScriptType = messages.InputScriptType.SPENDADDRESS,
+) -> "MessageType":
+    """Get the addresses of `count` consecutive indexes of the account at `n`."""
+    return client.call(
+        messages.BatchGetAddresses(
+            address_n=n,
+            coin_name=coin_name,
+            script_type=script_type,
+            change=change,
+            start_index=start_index,
+            count=count,
+        )
+    )
+
+
+def discover_addresses(
+    client: "TrezorClient",
+    coin_name: str,
+    n: "Address",
+    is_used: Callable[[str], bool],
+    change: int = 0,
+    script_type: messages.InputScriptType = messages.InputScriptType.SPENDADDRESS,
+    gap_limit: int = DEFAULT_GAP_LIMIT,
+    batch_size: int = MAX_ADDRESS_BATCH,
+) -> List[str]:
+    """Scan the addresses of the account at `n` until `gap_limit` consecutive ones
+    are unused according to `is_used`.
+
+    Returns the addresses up to and including the last used one, so the length of the
+    result is the index of the first fresh address.
+    """
+    found: List[str] = []
+    last_used = -1
+    while len(found) <= last_used + gap_limit:
+        count = min(batch_size, last_used + gap_limit + 1 - len(found))
+        batch = get_addresses(
+            client, coin_name, n, len(found), count, change, script_type
+        )
+        for address in batch:
+            if is_used(address):
+                last_used = len(found)
+            found.append(address)
+    return found[: last_used + 1]
+
+
 @expect(messages.OwnershipId, field="ownership_id", ret_type=bytes)
 def get_ownership_id(
     client: "TrezorClient",
@@ -267,6 +342,38 @@ def verify_message(
     return isinstance(resp, messages.Success)
 
 
+def prepare_sign_tx(
+    coin_name: str,
+    inputs: Sequence[messages.TxInputType],
+    outputs: Sequence[messages.TxOutputType],
+    details: Optional[messages.SignTx] = None,
+    **kwargs: Any,
+) -> messages.SignTx:
+    """Build the `SignTx` message that starts signing, see `sign_tx`."""
+    if details is not None:
+        warnings.warn(
+            "'details' argument is deprecated, use kwargs instead",
+            DeprecationWarning,
+            stacklevel=3,
+        )
+        signtx = details
+        signtx.coin_name = coin_name
+        signtx.inputs_count = len(inputs)
+        signtx.outputs_count = len(outputs)
+
+    else:
+        signtx = messages.SignTx(
+            coin_name=coin_name,
+            inputs_count=len(inputs),
+            outputs_count=len(outputs),
+        )
+        for name, value in kwargs.items():
+            if hasattr(signtx, name):
+                setattr(signtx, name, value)
+
+    return signtx
+
+
 @session
 def sign_tx(
     client: "TrezorClient",
@@ -279,6 +386,7 @@ def sign_tx(
     preauthorized: bool = False,
     unlock_path: Optional[List[int]] = None,
     unlock_path_mac: Optional[bytes] = None,
+    batch: bool = False,
     **kwargs: Any,
 ) -> Tuple[Sequence[Optional[bytes]], bytes]:
     """Sign a Bitcoin-like transaction.
@@ -291,43 +399,65 @@ def sign_tx(
     must correspond to a field in the `SignTx` data type. Note that some fields
     (`inputs_count`, `outputs_count`, `coin_name`) will be inferred from the arguments
     and cannot be overriden by kwargs.
+
+    With `batch`, the inputs and outputs are sent in batches whenever the device asks
+    for several of them at once (see `messages.Capability.TxAckBatch`).
     """
-    if prev_txes is None:
-        prev_txes = {}
+    signtx = prepare_sign_tx(coin_name, inputs, outputs, details, **kwargs)
+    return run_flow(
+        client,
+        sign_tx_flow(
+            signtx,
+            inputs,
+            outputs,
+            prev_txes,
+            payment_reqs,
+            preauthorized,
+            unlock_path,
+            unlock_path_mac,
+            batch,
+        ),
+    )
 
-    if details is not None:
-        warnings.warn(
-            "'details' argument is deprecated, use kwargs instead",
-            DeprecationWarning,
-            stacklevel=2,
-        )
-        signtx = details
-        signtx.coin_name = coin_name
-        signtx.inputs_count = len(inputs)
-        signtx.outputs_count = len(outputs)
 
-    else:
-        signtx = messages.SignTx(
-            coin_name=coin_name,
-            inputs_count=len(inputs),
-            outputs_count=len(outputs),
-        )
-        for name, value in kwargs.items():
-            if hasattr(signtx, name):
-                setattr(signtx, name, value)
+def _batch(items: Sequence[T], index: int, count: Optional[int]) -> List[T]:
+    """Take up to `count` consecutive items starting at `index` which fit in a TxAck."""
+    batch = [items[index]]
+    size = len(protobuf.dump_message_buffer(items[index]))
+    for item in items[index + 1 : index + (count or 1)]:
+        # field tag and length prefix
+        size += len(protobuf.dump_message_buffer(item)) + 4
+        if size > TXACK_MAX_ITEMS_SIZE:
+            break
+        batch.append(item)
+    return batch
+
+
+def sign_tx_flow(
+    signtx: messages.SignTx,
+    inputs: Sequence[messages.TxInputType],
+    outputs: Sequence[messages.TxOutputType],
+    prev_txes: Optional["TxCacheType"] = None,
+    payment_reqs: Sequence[messages.TxAckPaymentRequest] = (),
+    preauthorized: bool = False,
+    unlock_path: Optional[List[int]] = None,
+    unlock_path_mac: Optional[bytes] = None,
+    batch: bool = False,
+) -> "Flow[Tuple[Sequence[Optional[bytes]], bytes]]":
+    """Message flow of `sign_tx`, for use with any client."""
+    if prev_txes is None:
+        prev_txes = {}
 
     if unlock_path:
-        res = client.call(
-            messages.UnlockPath(address_n=unlock_path, mac=unlock_path_mac)
-        )
+        res = yield messages.UnlockPath(address_n=unlock_path, mac=unlock_path_mac)
         if not isinstance(res, messages.UnlockedPathRequest):
             raise exceptions.TrezorException("Unexpected message")
     elif preauthorized:
-        res = client.call(messages.DoPreauthorized())
+        res = yield messages.DoPreauthorized()
         if not isinstance(res, messages.PreauthorizedRequest):
             raise exceptions.TrezorException("Unexpected message")
 
-    res = client.call(signtx)
+    res = yield signtx
 
     # Prepare structure for signatures
     signatures: List[Optional[bytes]] = [None] * len(inputs)
@@ -386,25 +516,31 @@ def sign_tx(
         if res.request_type == R.TXPAYMENTREQ:
             assert res.details.request_index is not None
             msg = payment_reqs[res.details.request_index]
-            res = client.call(msg)
+            res = yield msg
         else:
             msg = messages.TransactionType()
+            # the device accepts up to request_count consecutive inputs or outputs
+            count = res.details.request_count if batch else None
             if res.request_type == R.TXMETA:
                 msg = copy_tx_meta(current_tx)
             elif res.request_type in (R.TXINPUT, R.TXORIGINPUT):
                 assert res.details.request_index is not None
-                msg.inputs = [current_tx.inputs[res.details.request_index]]
+                msg.inputs = _batch(current_tx.inputs, res.details.request_index, count)
             elif res.request_type == R.TXOUTPUT:
                 assert res.details.request_index is not None
                 if res.details.tx_hash:
-                    msg.bin_outputs = [
-                        current_tx.bin_outputs[res.details.request_index]
-                    ]
+                    msg.bin_outputs = _batch(
+                        current_tx.bin_outputs, res.details.request_index, count
+                    )
                 else:
-                    msg.outputs = [current_tx.outputs[res.details.request_index]]
+                    msg.outputs = _batch(
+                        current_tx.outputs, res.details.request_index, count
+                    )
             elif res.request_type == R.TXORIGOUTPUT:
                 assert res.details.request_index is not None
-                msg.outputs = [current_tx.outputs[res.details.request_index]]
+                msg.outputs = _batch(
+                    current_tx.outputs, res.details.request_index, count
+                )
             elif res.request_type == R.TXEXTRADATA:
                 assert res.details.extra_data_offset is not None
                 assert res.details.extra_data_len is not None
@@ -416,7 +552,7 @@ def sign_tx(
                     f"Unknown request type - {res.request_type}."
                 )
 
-            res = client.call(messages.TxAck(tx=msg))
+            res = yield messages.TxAck(tx=msg)
 
     if not isinstance(res, messages.TxRequest):
         raise exceptions.TrezorException("Unexpected message")
@@ -454,8 +590,8 @@ def authorize_coinjoin(
 
 @expect(messages.SignedPsbt, field="psbt", ret_type=bytes)
 def sign_taproot(
-        client: "TrezorClient",
-        coin_name: str,
-        psbt: bytes,
+    client: "TrezorClient",
+    coin_name: str,
+    psbt: bytes,
 ) -> "MessageType":
     return client.call(messages.SignPsbt(coin_name=coin_name, psbt=psbt))
@@ -359,6 +359,7 @@ def sign_tx(client: "TrezorClient", json_file: TextIO) -> None:
         inputs,
         outputs,
         prev_txes=prev_txes,
+        batch=messages.Capability.TxAckBatch in client.features.capabilities,
         **details,
     )
 
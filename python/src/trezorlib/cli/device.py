@@ -410,15 +410,47 @@ def update_res(
             click.echo(f"Update failed: {e}")
             sys.exit(3)
 
+
+@cli.command()
+# fmt: off
+@click.option("-d", "--directory", required=True, type=click.Path(exists=True, file_okay=False), help="The directory of the resources to sync")
+# fmt: on
+@with_client
+def sync_res(client: "TrezorClient", directory: str) -> None:
+    """Update the internal static resources that changed in a directory."""
+    files = {}
+    for root, _dirs, names in os.walk(directory):
+        for name in names:
+            path = os.path.join(root, name)
+            rel_path = os.path.relpath(path, directory).replace(os.sep, "/")
+            with open(path, "rb") as f:
+                files[rel_path] = f.read()
+    try:
+        with click.progressbar(
+            label="Syncing", length=sum(map(len, files.values())), show_eta=False
+        ) as bar:
+            sent = device.sync_res(client, files, progress_update=bar.update)
+    except exceptions.Cancelled:
+        click.echo("Upload aborted on device.")
+        return
+    except exceptions.TrezorException as e:
+        click.echo(f"Update failed: {e}")
+        sys.exit(3)
+    click.echo(f"{len(sent)} of {len(files)} files updated")
+
 @cli.command()
 # fmt: off
 @click.option("-p", "--path_dir", help="The path of dir to enum")
+@click.option("--with-hash", is_flag=True, help="Show the blake2s hash of the files")
 # fmt: on
 @with_client
-def list_dir(client: "TrezorClient", path_dir: str) -> None:
-    files_info = device.list_dir(client, path_dir)
+def list_dir(client: "TrezorClient", path_dir: str, with_hash: bool) -> None:
+    files_info = device.list_dir(client, path_dir, with_hash=with_hash)
     for info in files_info:
-        click.echo(f"file_name {info.name} with size {info.size} bytes")
+        line = f"file_name {info.name} with size {info.size} bytes"
+        if info.hash:
+            line += f", hash {info.hash.hex()}"
+        click.echo(line)
 
 @cli.command()
 @click.argument("enable", type=ChoiceType({"on": True, "off": False}), required=False)
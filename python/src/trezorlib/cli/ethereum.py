@@ -549,10 +549,17 @@ def sign_message(client: "TrezorClient", address: str, message: str) -> Dict[str
     default=True,
     help="Be compatible with Metamask's signTypedData_v4 implementation",
 )
+@click.option(
+    "-b", "--bulk-values", is_flag=True, help="Send several values in one message"
+)
 @click.argument("file", type=click.File("r"))
 @with_client
 def sign_typed_data(
-    client: "TrezorClient", address: str, metamask_v4_compat: bool, file: TextIO
+    client: "TrezorClient",
+    address: str,
+    metamask_v4_compat: bool,
+    bulk_values: bool,
+    file: TextIO,
 ) -> Dict[str, str]:
     """Sign typed data (EIP-712) with Ethereum address.
 
@@ -570,6 +577,7 @@ def sign_typed_data(
         data,
         metamask_v4_compat=metamask_v4_compat,
         definitions=defs,
+        bulk_values=bulk_values,
     )
     output = {
         "address": ret.address,
@@ -16,6 +16,7 @@
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Iterable, List, Optional, Tuple
 from urllib.parse import urlparse
 
@@ -414,16 +415,51 @@ def cli() -> None:
     """Firmware commands."""
 
 
+def verify_directory(path: str) -> None:
+    """Validate all firmware images (`*.bin`) in a directory.
+
+    Images are memory-mapped and their code hashed in parallel. Unsigned images are
+    reported as failures. Exits with code 4 if any image fails to validate.
+    """
+    filenames = sorted(
+        name
+        for name in os.listdir(path)
+        if name.endswith(".bin") and os.path.isfile(os.path.join(path, name))
+    )
+    if not filenames:
+        click.echo(f"No firmware images found in {path}")
+        sys.exit(2)
+
+    failed = 0
+    with ThreadPoolExecutor() as executor:
+        for name in filenames:
+            try:
+                version, fingerprint = firmware.validate_file(
+                    os.path.join(path, name), executor=executor
+                )
+                click.echo(f"{name}: {version.name} {fingerprint.hex()} OK")
+            except firmware.Unsigned:
+                failed += 1
+                click.echo(f"{name}: FAILED (no signatures found)")
+            except (ValueError, firmware.FirmwareIntegrityError) as e:
+                failed += 1
+                click.echo(f"{name}: FAILED ({e})")
+
+    click.echo(f"{len(filenames) - failed} of {len(filenames)} images are valid.")
+    if failed:
+        sys.exit(4)
+
+
 @cli.command()
 # fmt: off
-@click.argument("filename", type=click.File("rb"))
+@click.argument("filename", type=click.Path(exists=True, allow_dash=True))
 @click.option("-c", "--check-device", is_flag=True, help="Validate device compatibility")
 @click.option("--fingerprint", help="Expected firmware fingerprint in hex")
 @click.pass_obj
 # fmt: on
 def verify(
     obj: "TrezorConnection",
-    filename: BinaryIO,
+    filename: str,
     check_device: bool,
     fingerprint: Optional[str],
 ) -> None:
@@ -432,8 +468,19 @@ def verify(
     By default the device is not checked and does not need to be connected.
     Its validation must be specified.
 
+    If FILENAME is a directory, all `*.bin` images in it are verified in batch.
+    Device checks and fingerprints are not supported in this mode.
+
     In case of validation failure exits with the appropriate exit code.
     """
+    if os.path.isdir(filename):
+        if check_device or fingerprint:
+            raise click.ClickException(
+                "--check-device and --fingerprint can't be used with a directory"
+            )
+        verify_directory(filename)
+        return
+
     # Deciding if to take the device into account
     bootloader_onev2: Optional[bool]
     trezor_major_version: Optional[int]
@@ -445,7 +492,8 @@ def verify(
         bootloader_onev2 = None
         trezor_major_version = None
 
-    firmware_data = filename.read()
+    with click.open_file(filename, "rb") as f:
+        firmware_data = f.read()
     validate_firmware(
         firmware_data=firmware_data,
         fingerprint=fingerprint,
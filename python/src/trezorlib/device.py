@@ -15,9 +15,10 @@
 # If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
 
 import os
+import posixpath
 import time
 from hashlib import blake2s
-from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from . import messages
 from .exceptions import Cancelled, TrezorException
@@ -321,6 +322,8 @@ def upload_res(
 
 
 DATA_CHUNK_SIZE = 16 * 1024
+RES_DIR = "1:/res"
+BOOTLOADER_NAME = "bootloader.bin"
 
 
 @session
@@ -339,6 +342,8 @@ def update_res(
             data_length=data_len,
             initial_data_chunk=initial_data,
             hash=digest,
+            # lets the device skip an identical file and resume a partial one
+            file_hash=blake2s(data).digest(),
         )
     )
     progress_update(len(initial_data))
@@ -358,14 +363,53 @@ def update_res(
         raise RuntimeError(f"Unexpected message {resp}")
 
 @session
-def list_dir(client: "TrezorClient", path_dir: str) -> Sequence[messages.FileInfo]:
-    resp = client.call(messages.ListResDir(path=path_dir))
+def list_dir(
+    client: "TrezorClient", path_dir: str, with_hash: bool = False
+) -> Sequence[messages.FileInfo]:
+    resp = client.call(messages.ListResDir(path=path_dir, with_hash=with_hash))
     if isinstance(resp, messages.FileInfoList):
         return resp.files
     else:
         raise RuntimeError(f"Unexpected message {resp}")
 
 
+@session
+def sync_res(
+    client: "TrezorClient",
+    files: Dict[str, bytes],
+    progress_update: Callable[[int], Any] = lambda _: None,
+) -> List[str]:
+    """Update the internal static resources in `files`, a mapping of file names
+    relative to the resource directory to their content.
+
+    The directories are listed with the hashes of their files first, and the files the
+    device already has are not sent again. Returns the names of the files sent.
+    """
+    if BOOTLOADER_NAME in files:
+        raise ValueError("The bootloader has to be updated with update_res")
+    manifest: Dict[str, Tuple[int, Optional[bytes]]] = {}
+    for dir_name in sorted({posixpath.dirname(name) for name in files}):
+        path_dir = posixpath.join(RES_DIR, dir_name) if dir_name else RES_DIR
+        try:
+            listing = list_dir(client, path_dir, with_hash=True)
+        except TrezorException:
+            # the directory does not exist yet
+            continue
+        for info in listing:
+            manifest[posixpath.join(dir_name, info.name)] = (info.size, info.hash)
+
+    sent = []
+    for name, data in files.items():
+        size, digest = manifest.get(name, (None, None))
+        # earlier firmware does not hash empty files
+        if size == len(data) and (size == 0 or digest == blake2s(data).digest()):
+            progress_update(len(data))
+            continue
+        update_res(client, name, data, progress_update=progress_update)
+        sent.append(name)
+    return sent
+
+
 @expect(messages.Success, field="message", ret_type=str)
 @session
 def set_busy(client: "TrezorClient", expiry_ms: Optional[int]) -> "MessageType":
@@ -15,14 +15,24 @@
 # If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
 
 import re
-from typing import TYPE_CHECKING, Any, AnyStr, Dict, List, Optional, Tuple
-
-from . import definitions, exceptions, messages
-from .tools import expect, prepare_message_bytes, session, unharden
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AnyStr,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from . import definitions, exceptions, messages, protobuf
+from .tools import expect, prepare_message_bytes, run_flow, session, unharden
 
 if TYPE_CHECKING:
     from .client import TrezorClient
-    from .tools import Address
+    from .tools import Address, Flow
     from .protobuf import MessageType
 
 
@@ -215,20 +225,28 @@ def sign_tx(
         definitions=definitions,
     )
 
-    if data is None:
-        data = b""
+    return run_flow(client, sign_tx_flow(msg, data or b""))
+
+
+def sign_tx_flow(
+    msg: "Union[messages.EthereumSignTx, messages.EthereumSignTxEIP1559]",
+    data: bytes,
+) -> "Flow[Tuple[int, bytes, bytes]]":
+    """Message flow of `sign_tx` and `sign_tx_eip1559`, for use with any client.
 
+    `msg` is sent with the first chunk of `data`, the rest is sent as requested.
+    """
     msg.data_length = len(data)
     data, chunk = data[1024:], data[:1024]
     msg.data_initial_chunk = chunk
 
-    response = client.call(msg)
+    response = yield msg
     assert isinstance(response, messages.EthereumTxRequest)
 
     while response.data_length is not None:
         data_length = response.data_length
         data, chunk = data[data_length:], data[:data_length]
-        response = client.call(messages.EthereumTxAck(data_chunk=chunk))
+        response = yield messages.EthereumTxAck(data_chunk=chunk)
         assert isinstance(response, messages.EthereumTxRequest)
 
     assert response.signature_v is not None
@@ -237,8 +255,9 @@ def sign_tx(
 
     # https://github.com/trezor/trezor-core/pull/311
     # only signature bit returned. recalculate signature_v
-    if response.signature_v <= 1:
-        response.signature_v += 2 * chain_id + 35
+    if isinstance(msg, messages.EthereumSignTx) and response.signature_v <= 1:
+        assert msg.chain_id is not None
+        response.signature_v += 2 * msg.chain_id + 35
 
     return response.signature_v, response.signature_r, response.signature_s
 
@@ -259,8 +278,6 @@ def sign_tx_eip1559(
     access_list: Optional[List[messages.EthereumAccessList]] = None,
     definitions: Optional[messages.EthereumDefinitions] = None,
 ) -> Tuple[int, bytes, bytes]:
-    length = len(data)
-    data, chunk = data[1024:], data[:1024]
     msg = messages.EthereumSignTxEIP1559(
         address_n=n,
         nonce=int_to_big_endian(nonce),
@@ -271,24 +288,10 @@ def sign_tx_eip1559(
         max_gas_fee=int_to_big_endian(max_gas_fee),
         max_priority_fee=int_to_big_endian(max_priority_fee),
         access_list=access_list,
-        data_length=length,
-        data_initial_chunk=chunk,
+        data_length=len(data),
         definitions=definitions,
     )
-
-    response = client.call(msg)
-    assert isinstance(response, messages.EthereumTxRequest)
-
-    while response.data_length is not None:
-        data_length = response.data_length
-        data, chunk = data[data_length:], data[:data_length]
-        response = client.call(messages.EthereumTxAck(data_chunk=chunk))
-        assert isinstance(response, messages.EthereumTxRequest)
-
-    assert response.signature_v is not None
-    assert response.signature_r is not None
-    assert response.signature_s is not None
-    return response.signature_v, response.signature_r, response.signature_s
+    return run_flow(client, sign_tx_flow(msg, data))
 
 
 @expect(messages.EthereumMessageSignature)
@@ -307,6 +310,107 @@ def sign_message(
     )
 
 
+def _typed_data_value(data: Dict[str, Any], member_path: List[int]) -> bytes:
+    """Encode the value at `member_path` of the typed data, as the device expects it."""
+    types = data["types"]
+    root_index = member_path[0]
+    # Index 0 is for the domain data, 1 is for the actual message
+    if root_index == 0:
+        member_typename = "EIP712Domain"
+        member_data = data["domain"]
+    elif root_index == 1:
+        member_typename = data["primaryType"]
+        member_data = data["message"]
+    else:
+        raise ValueError("Root index can only be 0 or 1")
+
+    # It can be asking for a nested structure (the member path being [X, Y, Z, ...])
+    # TODO: what to do when the value is missing (for example in recursive types)?
+    for index in member_path[1:]:
+        if isinstance(member_data, dict):
+            member_def = types[member_typename][index]
+            member_typename = member_def["type"]
+            member_data = member_data[member_def["name"]]
+        elif isinstance(member_data, list):
+            member_typename = typeof_array(member_typename)
+            member_data = member_data[index]
+
+    # If we were asked for a list, first sending its length and we will be receiving
+    # requests for individual elements later
+    if isinstance(member_data, list):
+        # Sending the length as uint16
+        return len(member_data).to_bytes(2, "big")
+    else:
+        return encode_data(member_data, member_typename)
+
+
+def _typed_data_member_paths(
+    types: Dict[str, Any], type_name: str, value: Dict[str, Any], path: List[int]
+) -> Iterator[List[int]]:
+    """Generate the member paths of the values of a struct, in the order of encoding."""
+    for index, member in enumerate(types[type_name]):
+        member_path = path + [index]
+        member_type = member["type"]
+        member_value = value[member["name"]]
+        if member_type in types:
+            yield from _typed_data_member_paths(
+                types, member_type, member_value, member_path
+            )
+        elif is_array(member_type):
+            # the device asks for the length of dynamic arrays first
+            if parse_array_n(member_type) is None:
+                yield member_path
+            entry_type = typeof_array(member_type)
+            for i, entry in enumerate(member_value):
+                if entry_type in types:
+                    yield from _typed_data_member_paths(
+                        types, entry_type, entry, member_path + [i]
+                    )
+                else:
+                    yield member_path + [i]
+        else:
+            yield member_path
+
+
+class _TypedDataValues:
+    """Values of the typed data in the order in which the device hashes them."""
+
+    def __init__(self, data: Dict[str, Any]) -> None:
+        self.data = data
+        types = data["types"]
+        self.paths = list(
+            _typed_data_member_paths(types, "EIP712Domain", data["domain"], [0])
+        )
+        if data["primaryType"] != "EIP712Domain":
+            self.paths += _typed_data_member_paths(
+                types, data["primaryType"], data["message"], [1]
+            )
+        self.positions = {tuple(path): i for i, path in enumerate(self.paths)}
+
+    def chunk(
+        self, member_path: List[int], max_size: int
+    ) -> List[messages.EthereumTypedDataValue]:
+        """Get the value at `member_path` and as many of the following as fit."""
+        first = messages.EthereumTypedDataValue(
+            member_path=member_path, value=_typed_data_value(self.data, member_path)
+        )
+        values = [first]
+        size = len(protobuf.dump_message_buffer(first))
+        position = self.positions.get(tuple(member_path))
+        if position is None:
+            return values
+        for path in self.paths[position + 1 :]:
+            value = messages.EthereumTypedDataValue(
+                member_path=path, value=_typed_data_value(self.data, path)
+            )
+            # field tag and length prefix
+            size += len(protobuf.dump_message_buffer(value)) + 4
+            if size > max_size:
+                break
+            values.append(value)
+        return values
+
+
 @expect(messages.EthereumTypedDataSignature)
 def sign_typed_data(
     client: "TrezorClient",
@@ -315,7 +419,13 @@ def sign_typed_data(
     *,
     metamask_v4_compat: bool = True,
     definitions: Optional[messages.EthereumDefinitions] = None,
+    bulk_values: bool = False,
 ) -> "MessageType":
+    """Sign EIP-712 typed data.
+
+    With `bulk_values`, the values are sent several at a time whenever the device
+    supports it, instead of one per request.
+    """
     data = sanitize_typed_data(data)
     types = data["types"]
 
@@ -324,6 +434,7 @@ def sign_typed_data(
         primary_type=data["primaryType"],
         metamask_v4_compat=metamask_v4_compat,
         definitions=definitions,
+        bulk_values=bulk_values or None,
     )
     response = client.call(request)
     if isinstance(response, messages.EthereumGnosisSafeTxRequest):
@@ -360,39 +471,22 @@ def sign_typed_data(
         response = client.call(request)
 
     # Sending the whole message that should be signed
+    values: Optional[_TypedDataValues] = None
     while isinstance(response, messages.EthereumTypedDataValueRequest):
-        root_index = response.member_path[0]
-        # Index 0 is for the domain data, 1 is for the actual message
-        if root_index == 0:
-            member_typename = "EIP712Domain"
-            member_data = data["domain"]
-        elif root_index == 1:
-            member_typename = data["primaryType"]
-            member_data = data["message"]
-        else:
+        if response.member_path[0] not in (0, 1):
             client.cancel()
             raise exceptions.TrezorException("Root index can only be 0 or 1")
 
-        # It can be asking for a nested structure (the member path being [X, Y, Z, ...])
-        # TODO: what to do when the value is missing (for example in recursive types)?
-        for index in response.member_path[1:]:
-            if isinstance(member_data, dict):
-                member_def = types[member_typename][index]
-                member_typename = member_def["type"]
-                member_data = member_data[member_def["name"]]
-            elif isinstance(member_data, list):
-                member_typename = typeof_array(member_typename)
-                member_data = member_data[index]
-
-        # If we were asked for a list, first sending its length and we will be receiving
-        # requests for individual elements later
-        if isinstance(member_data, list):
-            # Sending the length as uint16
-            encoded_data = len(member_data).to_bytes(2, "big")
+        if response.max_chunk_size is not None:
+            # The device accepts the following values along with the requested one
+            if values is None:
+                values = _TypedDataValues(data)
+            request = messages.EthereumTypedDataValuesAck(
+                values=values.chunk(response.member_path, response.max_chunk_size)
+            )
         else:
-            encoded_data = encode_data(member_data, member_typename)
-
-        request = messages.EthereumTypedDataValueAck(value=encoded_data)
+            encoded_data = _typed_data_value(data, response.member_path)
+            request = messages.EthereumTypedDataValueAck(value=encoded_data)
         response = client.call(request)
 
     return response
@@ -15,9 +15,13 @@
 # If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
 
 import hashlib
+import mmap
+import os
+from concurrent.futures import Executor
+from contextlib import contextmanager
 from enum import Enum
 from hashlib import blake2s
-from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Iterator, List, Optional, Tuple, Union
 
 import construct as c
 import ecdsa
@@ -73,6 +77,9 @@ ONEV2_CHUNK_SIZE = 1024 * 64
 V2_CHUNK_SIZE = 1024 * 256
 FIREMWARE_SIZE_LIMIT = V2_CHUNK_SIZE * 16
 
+# upper bound on the size of a firmware header, for parsing headers alone
+HEADER_PARSE_SIZE = 4096
+
 
 def _transform_vendor_trust(data: bytes) -> bytes:
     """Byte-swap and bit-invert the VendorTrust field.
@@ -263,6 +270,21 @@ LegacyFirmware = c.Struct(
     "embedded_onev2" / c.RestreamData(c.this.code, c.Optional(FirmwareImage)),
 )
 
+
+"""Header of the legacy firmware image, without the code block."""
+LegacyFirmwareHeader = c.Struct(
+    "magic" / c.Const(b"TRZR"),
+    "code_length" / c.Int32ul,
+    "key_indexes" / c.Int8ul[V1_SIGNATURE_SLOTS],  # pylint: disable=E1136
+    "flags" / c.BitStruct(
+        c.Padding(7),
+        "restore_storage" / c.Flag,
+    ),
+    "_reserved" / c.Padding(52),
+    "signatures" / c.Bytes(64)[V1_SIGNATURE_SLOTS],
+    "_end_offset" / c.Tell,
+)
+
 # fmt: on
 
 
@@ -295,6 +317,101 @@ def parse(data: bytes) -> ParsedFirmware:
     return version, fw
 
 
+def _parse_image_view(data: memoryview, offset: int = 0) -> c.Container:
+    """Parse the header of a `FirmwareImage` at `offset`, without copying the code."""
+    header = FirmwareHeader.parse(bytes(data[offset : offset + HEADER_PARSE_SIZE]))
+    # make offsets absolute, as if the whole of `data` was parsed
+    header._start_offset += offset
+    header._end_offset += offset
+    code_offset = header._end_offset
+    code_end = code_offset + header.code_length
+    if code_end != len(data):
+        raise ValueError("Firmware code length does not match the image size")
+    return c.Container(
+        header=header, _code_offset=code_offset, code=data[code_offset:code_end]
+    )
+
+
+def parse_view(data: Union[bytes, memoryview, mmap.mmap]) -> ParsedFirmware:
+    """Parse a firmware image like `parse`, without copying the code block.
+
+    Only the headers go through `construct`. The `code` fields of the result are
+    memoryviews into `data`, which must stay unchanged while the result is in use.
+    """
+    view = memoryview(data)
+    magic = bytes(view[:4])
+    if magic == b"TRZR":
+        version = FirmwareFormat.TREZOR_ONE
+    elif magic == b"OKTV":
+        version = FirmwareFormat.TREZOR_T
+    elif magic == b"OKTF":
+        version = FirmwareFormat.TREZOR_ONE_V2
+    else:
+        raise ValueError("Unrecognized firmware image type")
+
+    try:
+        if version == FirmwareFormat.TREZOR_ONE:
+            fw = LegacyFirmwareHeader.parse(bytes(view[:HEADER_PARSE_SIZE]))
+            code_end = fw._end_offset + fw.code_length
+            if code_end != len(view):
+                raise ValueError("Firmware code length does not match the image size")
+            fw.code = view[fw._end_offset : code_end]
+            try:
+                fw.embedded_onev2 = _parse_image_view(fw.code)
+            except Exception:
+                fw.embedded_onev2 = None
+        elif version == FirmwareFormat.TREZOR_T:
+            header_len = int.from_bytes(view[4:8], "little")
+            vendor_header = VendorHeader.parse(bytes(view[:header_len]))
+            image = _parse_image_view(view, vendor_header.header_len)
+            fw = c.Container(vendor_header=vendor_header, image=image)
+        else:
+            fw = _parse_image_view(view)
+    except Exception as e:
+        raise FirmwareIntegrityError("Invalid firmware image") from e
+    return version, fw
+
+
+@contextmanager
+def map_file(path: Union[str, "os.PathLike[str]"]) -> Iterator[ParsedFirmware]:
+    """Memory-map a firmware file and parse it with `parse_view`.
+
+    The file is never read into memory as a whole. The parsed image is only
+    guaranteed to be valid inside the `with` block.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # empty files can't be mapped
+            yield parse_view(b"")
+            return
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield parse_view(mapped)
+        finally:
+            try:
+                mapped.close()
+            except BufferError:
+                # views into the mapping are still alive, it will be unmapped
+                # when the last of them is gone
+                pass
+
+
+def validate_file(
+    path: Union[str, "os.PathLike[str]"],
+    allow_unsigned: bool = False,
+    executor: Optional[Executor] = None,
+) -> Tuple[FirmwareFormat, bytes]:
+    """Validate a firmware file without loading it into memory.
+
+    Code chunks are hashed in parallel if an `executor` is provided. Returns the
+    firmware format and fingerprint. Raises `FirmwareIntegrityError` if the image is
+    not valid.
+    """
+    with map_file(path) as (version, fw):
+        validate(version, fw, allow_unsigned, executor=executor)
+        return version, digest(version, fw)
+
+
 def digest_onev1(fw: c.Container) -> bytes:
     return hashlib.sha256(fw.code).digest()
 
@@ -355,31 +472,44 @@ def calculate_code_hashes(
     hash_function: Callable = blake2s,
     chunk_size: int = V2_CHUNK_SIZE,
     padding_byte: Optional[bytes] = None,
+    executor: Optional[Executor] = None,
 ) -> Tuple[List[bytes], int]:
+    """Calculate hashes of the code chunks, as stored in the firmware header.
 
+    If an `executor` is provided, the chunks are hashed in parallel. `hashlib`
+    releases the GIL, so a `ThreadPoolExecutor` is sufficient.
+    """
     chunk_size = V2_CHUNK_SIZE if len(code) <= FIREMWARE_SIZE_LIMIT else V2_CHUNK_SIZE*2
-    hashes = []
+    code_view = memoryview(code)
+    chunks = []
     # End offset for each chunk. Normally this would be (i+1)*chunk_size for i-th chunk,
     # but the first chunk is shorter by code_offset, so all end offsets are shifted.
     ends = [(i + 1) * chunk_size - code_offset for i in range(16)]
     start = 0
     for end in ends:
-        chunk = code[start:end]
+        chunk: Union[bytes, memoryview] = code_view[start:end]
         # padding for last non-empty chunk
         if padding_byte is not None and start < len(code) and end > len(code):
-            chunk += padding_byte[0:1] * (end - start - len(chunk))
+            chunk = bytes(chunk) + padding_byte[0:1] * (end - start - len(chunk))
+        chunks.append(chunk)
+        start = end
 
+    def hash_chunk(chunk: Union[bytes, memoryview]) -> bytes:
         if not chunk:
-            hashes.append(b"\0" * 32)
-        else:
-            hashes.append(hash_function(chunk).digest())
+            return b"\0" * 32
+        return hash_function(chunk).digest()
 
-        start = end
+    if executor is None:
+        hashes = [hash_chunk(chunk) for chunk in chunks]
+    else:
+        hashes = list(executor.map(hash_chunk, chunks))
 
     return hashes, 0 if chunk_size == V2_CHUNK_SIZE else chunk_size
 
 
-def validate_code_hashes(fw: c.Container, version: FirmwareFormat) -> None:
+def validate_code_hashes(
+    fw: c.Container, version: FirmwareFormat, executor: Optional[Executor] = None
+) -> None:
     hash_function: Callable
     padding_byte: Optional[bytes]
     if version == FirmwareFormat.TREZOR_ONE_V2:
@@ -394,13 +524,20 @@ def validate_code_hashes(fw: c.Container, version: FirmwareFormat) -> None:
         padding_byte = None
 
     expected_hashes, chunk_size = calculate_code_hashes(
-        image.code, image._code_offset, hash_function, chunk_size, padding_byte
+        image.code,
+        image._code_offset,
+        hash_function,
+        chunk_size,
+        padding_byte,
+        executor=executor,
     )
     if expected_hashes != image.header.hashes:
         raise FirmwareIntegrityError("Invalid firmware data.")
 
 
-def validate_onev2(fw: c.Container, allow_unsigned: bool = False) -> None:
+def validate_onev2(
+    fw: c.Container, allow_unsigned: bool = False, executor: Optional[Executor] = None
+) -> None:
     try:
         check_sig_v1(
             digest_onev2(fw),
@@ -411,20 +548,26 @@ def validate_onev2(fw: c.Container, allow_unsigned: bool = False) -> None:
         if not allow_unsigned:
             raise
 
-    validate_code_hashes(fw, FirmwareFormat.TREZOR_ONE_V2)
+    validate_code_hashes(fw, FirmwareFormat.TREZOR_ONE_V2, executor)
 
 
-def validate_onev1(fw: c.Container, allow_unsigned: bool = False) -> None:
+def validate_onev1(
+    fw: c.Container, allow_unsigned: bool = False, executor: Optional[Executor] = None
+) -> None:
     try:
         check_sig_v1(digest_onev1(fw), fw.key_indexes, fw.signatures)
     except Unsigned:
         if not allow_unsigned:
             raise
     if fw.embedded_onev2:
-        validate_onev2(fw.embedded_onev2, allow_unsigned)
+        validate_onev2(fw.embedded_onev2, allow_unsigned, executor)
 
 
-def validate_v2(fw: c.Container, skip_vendor_header: bool = False) -> None:
+def validate_v2(
+    fw: c.Container,
+    skip_vendor_header: bool = False,
+    executor: Optional[Executor] = None,
+) -> None:
     vendor_fingerprint = header_digest(fw.vendor_header)
     fingerprint = digest_v2(fw)
 
@@ -461,7 +604,7 @@ def validate_v2(fw: c.Container, skip_vendor_header: bool = False) -> None:
     # XXX expiry is not used now
     # if time.gmtime(fw.image.header.expiry) < now:
     #     raise ValueError("Firmware header expired.")
-    validate_code_hashes(fw, FirmwareFormat.TREZOR_T)
+    validate_code_hashes(fw, FirmwareFormat.TREZOR_T, executor)
 
 
 def digest(version: FirmwareFormat, fw: c.Container) -> bytes:
@@ -476,14 +619,17 @@ def digest(version: FirmwareFormat, fw: c.Container) -> bytes:
 
 
 def validate(
-    version: FirmwareFormat, fw: c.Container, allow_unsigned: bool = False
+    version: FirmwareFormat,
+    fw: c.Container,
+    allow_unsigned: bool = False,
+    executor: Optional[Executor] = None,
 ) -> None:
     if version == FirmwareFormat.TREZOR_ONE:
-        return validate_onev1(fw, allow_unsigned)
+        return validate_onev1(fw, allow_unsigned, executor)
     elif version == FirmwareFormat.TREZOR_ONE_V2:
-        return validate_onev2(fw, allow_unsigned)
+        return validate_onev2(fw, allow_unsigned, executor)
     elif version == FirmwareFormat.TREZOR_T:
-        return validate_v2(fw)
+        return validate_v2(fw, executor=executor)
     else:
         raise ValueError("Unrecognized firmware version")
 
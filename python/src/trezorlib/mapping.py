@@ -14,7 +14,6 @@
 # You should have received a copy of the License along with this library.
 # If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
 
-import io
 from types import ModuleType
 from typing import Dict, Optional, Tuple, Type, TypeVar
 
@@ -60,15 +59,12 @@ class ProtobufMapping:
         if wire_type is None:
             raise ValueError("Cannot encode class without wire type")
 
-        buf = io.BytesIO()
-        protobuf.dump_message(buf, msg)
-        return wire_type, buf.getvalue()
+        return wire_type, protobuf.dump_message_buffer(msg)
 
     def decode(self, msg_wire_type: int, msg_bytes: bytes) -> protobuf.MessageType:
         """Deserialize a protobuf message into a Python class."""
         cls = self.type_to_class[msg_wire_type]
-        buf = io.BytesIO(msg_bytes)
-        return protobuf.load_message(buf, cls)
+        return protobuf.load_message_buffer(msg_bytes, cls)
 
     @classmethod
     def from_module(cls: Type[T], module: ModuleType) -> T:
@@ -106,6 +106,8 @@ class MessageType(IntEnum):
     AuthorizeCoinJoin = 51
     SignPsbt = 10052
     SignedPsbt = 10053
+    BatchGetAddresses = 10054
+    Addresses = 10055
     CipherKeyValue = 23
     CipheredKeyValue = 48
     SignIdentity = 53
@@ -182,6 +184,7 @@ class MessageType(IntEnum):
     EthereumGnosisSafeTxAck = 20118
     EthereumGnosisSafeTxRequest = 20119
     EthereumSignTxEIP7702OneKey = 20120
+    EthereumTypedDataValuesAck = 20121
     NEMGetAddress = 67
     NEMAddress = 68
     NEMSignTx = 69
@@ -699,6 +702,7 @@ class Capability(IntEnum):
     PassphraseEntry = 17
     AttachToPin = 18
     EthereumTypedData = 1000
+    TxAckBatch = 1001
 
 
 class SdProtectOperationType(IntEnum):
@@ -1898,6 +1902,49 @@ class Address(protobuf.MessageType):
         self.mac = mac
 
 
+class BatchGetAddresses(protobuf.MessageType):
+    MESSAGE_WIRE_TYPE = 10054
+    FIELDS = {
+        1: protobuf.Field("address_n", "uint32", repeated=True, required=False),
+        2: protobuf.Field("coin_name", "string", repeated=False, required=False),
+        3: protobuf.Field("script_type", "InputScriptType", repeated=False, required=False),
+        4: protobuf.Field("change", "uint32", repeated=False, required=False),
+        5: protobuf.Field("start_index", "uint32", repeated=False, required=False),
+        6: protobuf.Field("count", "uint32", repeated=False, required=False),
+    }
+
+    def __init__(
+        self,
+        *,
+        address_n: Optional[Sequence["int"]] = None,
+        coin_name: Optional["str"] = 'Bitcoin',
+        script_type: Optional["InputScriptType"] = InputScriptType.SPENDADDRESS,
+        change: Optional["int"] = 0,
+        start_index: Optional["int"] = 0,
+        count: Optional["int"] = 1,
+    ) -> None:
+        self.address_n: Sequence["int"] = address_n if address_n is not None else []
+        self.coin_name = coin_name
+        self.script_type = script_type
+        self.change = change
+        self.start_index = start_index
+        self.count = count
+
+
+class Addresses(protobuf.MessageType):
+    MESSAGE_WIRE_TYPE = 10055
+    FIELDS = {
+        1: protobuf.Field("addresses", "string", repeated=True, required=False),
+    }
+
+    def __init__(
+        self,
+        *,
+        addresses: Optional[Sequence["str"]] = None,
+    ) -> None:
+        self.addresses: Sequence["str"] = addresses if addresses is not None else []
+
+
 class GetOwnershipId(protobuf.MessageType):
     MESSAGE_WIRE_TYPE = 43
     FIELDS = {
@@ -2385,6 +2432,62 @@ class TxAckPrevExtraData(protobuf.MessageType):
         self.tx = tx
 
 
+class TxAckInputs(protobuf.MessageType):
+    MESSAGE_WIRE_TYPE = 22
+    FIELDS = {
+        1: protobuf.Field("tx", "TxAckInputsWrapper", repeated=False, required=True),
+    }
+
+    def __init__(
+        self,
+        *,
+        tx: "TxAckInputsWrapper",
+    ) -> None:
+        self.tx = tx
+
+
+class TxAckOutputs(protobuf.MessageType):
+    MESSAGE_WIRE_TYPE = 22
+    FIELDS = {
+        1: protobuf.Field("tx", "TxAckOutputsWrapper", repeated=False, required=True),
+    }
+
+    def __init__(
+        self,
+        *,
+        tx: "TxAckOutputsWrapper",
+    ) -> None:
+        self.tx = tx
+
+
+class TxAckPrevInputs(protobuf.MessageType):
+    MESSAGE_WIRE_TYPE = 22
+    FIELDS = {
+        1: protobuf.Field("tx", "TxAckPrevInputsWrapper", repeated=False, required=True),
+    }
+
+    def __init__(
+        self,
+        *,
+        tx: "TxAckPrevInputsWrapper",
+    ) -> None:
+        self.tx = tx
+
+
+class TxAckPrevOutputs(protobuf.MessageType):
+    MESSAGE_WIRE_TYPE = 22
+    FIELDS = {
+        1: protobuf.Field("tx", "TxAckPrevOutputsWrapper", repeated=False, required=True),
+    }
+
+    def __init__(
+        self,
+        *,
+        tx: "TxAckPrevOutputsWrapper",
+    ) -> None:
+        self.tx = tx
+
+
 class GetOwnershipProof(protobuf.MessageType):
     MESSAGE_WIRE_TYPE = 49
     FIELDS = {
@@ -2550,6 +2653,7 @@ class TxRequestDetailsType(protobuf.MessageType):
         2: protobuf.Field("tx_hash", "bytes", repeated=False, required=False),
         3: protobuf.Field("extra_data_len", "uint32", repeated=False, required=False),
         4: protobuf.Field("extra_data_offset", "uint32", repeated=False, required=False),
+        5: protobuf.Field("request_count", "uint32", repeated=False, required=False),
     }
 
     def __init__(
@@ -2559,11 +2663,13 @@ class TxRequestDetailsType(protobuf.MessageType):
         tx_hash: Optional["bytes"] = None,
         extra_data_len: Optional["int"] = None,
         extra_data_offset: Optional["int"] = None,
+        request_count: Optional["int"] = None,
     ) -> None:
         self.request_index = request_index
         self.tx_hash = tx_hash
         self.extra_data_len = extra_data_len
         self.extra_data_offset = extra_data_offset
+        self.request_count = request_count
 
 
 class TxRequestSerializedType(protobuf.MessageType):
@@ -2903,6 +3009,62 @@ class TxAckPrevExtraDataWrapper(protobuf.MessageType):
         self.extra_data_chunk = extra_data_chunk
 
 
+class TxAckInputsWrapper(protobuf.MessageType):
+    MESSAGE_WIRE_TYPE = None
+    FIELDS = {
+        2: protobuf.Field("inputs", "TxInput", repeated=True, required=False),
+    }
+
+    def __init__(
+        self,
+        *,
+        inputs: Optional[Sequence["TxInput"]] = None,
+    ) -> None:
+        self.inputs: Sequence["TxInput"] = inputs if inputs is not None else []
+
+
+class TxAckOutputsWrapper(protobuf.MessageType):
+    MESSAGE_WIRE_TYPE = None
+    FIELDS = {
+        5: protobuf.Field("outputs", "TxOutput", repeated=True, required=False),
+    }
+
+    def __init__(
+        self,
+        *,
+        outputs: Optional[Sequence["TxOutput"]] = None,
+    ) -> None:
+        self.outputs: Sequence["TxOutput"] = outputs if outputs is not None else []
+
+
+class TxAckPrevInputsWrapper(protobuf.MessageType):
+    MESSAGE_WIRE_TYPE = None
+    FIELDS = {
+        2: protobuf.Field("inputs", "PrevInput", repeated=True, required=False),
+    }
+
+    def __init__(
+        self,
+        *,
+        inputs: Optional[Sequence["PrevInput"]] = None,
+    ) -> None:
+        self.inputs: Sequence["PrevInput"] = inputs if inputs is not None else []
+
+
+class TxAckPrevOutputsWrapper(protobuf.MessageType):
+    MESSAGE_WIRE_TYPE = None
+    FIELDS = {
+        3: protobuf.Field("outputs", "PrevOutput", repeated=True, required=False),
+    }
+
+    def __init__(
+        self,
+        *,
+        outputs: Optional[Sequence["PrevOutput"]] = None,
+    ) -> None:
+        self.outputs: Sequence["PrevOutput"] = outputs if outputs is not None else []
+
+
 class FirmwareErase(protobuf.MessageType):
     MESSAGE_WIRE_TYPE = 6
     FIELDS = {
@@ -5512,6 +5674,7 @@ class ResourceUpdate(protobuf.MessageType):
         2: protobuf.Field("data_length", "uint32", repeated=False, required=True),
         3: protobuf.Field("initial_data_chunk", "bytes", repeated=False, required=True),
         4: protobuf.Field("hash", "bytes", repeated=False, required=False),
+        5: protobuf.Field("file_hash", "bytes", repeated=False, required=False),
     }
 
     def __init__(
@@ -5521,25 +5684,30 @@ class ResourceUpdate(protobuf.MessageType):
         data_length: "int",
         initial_data_chunk: "bytes",
         hash: Optional["bytes"] = None,
+        file_hash: Optional["bytes"] = None,
     ) -> None:
         self.file_name = file_name
         self.data_length = data_length
         self.initial_data_chunk = initial_data_chunk
         self.hash = hash
+        self.file_hash = file_hash
 
 
 class ListResDir(protobuf.MessageType):
     MESSAGE_WIRE_TYPE = 10023
     FIELDS = {
         1: protobuf.Field("path", "string", repeated=False, required=True),
+        2: protobuf.Field("with_hash", "bool", repeated=False, required=False),
     }
 
     def __init__(
         self,
         *,
         path: "str",
+        with_hash: Optional["bool"] = None,
     ) -> None:
         self.path = path
+        self.with_hash = with_hash
 
 
 class FileInfoList(protobuf.MessageType):
@@ -5656,6 +5824,7 @@ class FileInfo(protobuf.MessageType):
     FIELDS = {
         1: protobuf.Field("name", "string", repeated=False, required=True),
         2: protobuf.Field("size", "uint64", repeated=False, required=True),
+        3: protobuf.Field("hash", "bytes", repeated=False, required=False),
     }
 
     def __init__(
@@ -5663,9 +5832,11 @@ class FileInfo(protobuf.MessageType):
         *,
         name: "str",
         size: "int",
+        hash: Optional["bytes"] = None,
     ) -> None:
         self.name = name
         self.size = size
+        self.hash = hash
 
 
 class DebugLinkDecision(protobuf.MessageType):
@@ -6981,6 +7152,7 @@ class EthereumSignTypedData(protobuf.MessageType):
         2: protobuf.Field("primary_type", "string", repeated=False, required=True),
         3: protobuf.Field("metamask_v4_compat", "bool", repeated=False, required=False),
         4: protobuf.Field("definitions", "EthereumDefinitions", repeated=False, required=False),
+        5: protobuf.Field("bulk_values", "bool", repeated=False, required=False),
     }
 
     def __init__(
@@ -6990,11 +7162,13 @@ class EthereumSignTypedData(protobuf.MessageType):
         address_n: Optional[Sequence["int"]] = None,
         metamask_v4_compat: Optional["bool"] = True,
         definitions: Optional["EthereumDefinitions"] = None,
+        bulk_values: Optional["bool"] = None,
     ) -> None:
         self.address_n: Sequence["int"] = address_n if address_n is not None else []
         self.primary_type = primary_type
         self.metamask_v4_compat = metamask_v4_compat
         self.definitions = definitions
+        self.bulk_values = bulk_values
 
 
 class EthereumTypedDataStructRequest(protobuf.MessageType):
@@ -7029,14 +7203,17 @@ class EthereumTypedDataValueRequest(protobuf.MessageType):
     MESSAGE_WIRE_TYPE = 467
     FIELDS = {
         1: protobuf.Field("member_path", "uint32", repeated=True, required=False),
+        2: protobuf.Field("max_chunk_size", "uint32", repeated=False, required=False),
     }
 
     def __init__(
         self,
         *,
         member_path: Optional[Sequence["int"]] = None,
+        max_chunk_size: Optional["int"] = None,
     ) -> None:
         self.member_path: Sequence["int"] = member_path if member_path is not None else []
+        self.max_chunk_size = max_chunk_size
 
 
 class EthereumTypedDataValueAck(protobuf.MessageType):
@@ -7053,6 +7230,20 @@ class EthereumTypedDataValueAck(protobuf.MessageType):
         self.value = value
 
 
+class EthereumTypedDataValuesAck(protobuf.MessageType):
+    MESSAGE_WIRE_TYPE = 20121
+    FIELDS = {
+        1: protobuf.Field("values", "EthereumTypedDataValue", repeated=True, required=False),
+    }
+
+    def __init__(
+        self,
+        *,
+        values: Optional[Sequence["EthereumTypedDataValue"]] = None,
+    ) -> None:
+        self.values: Sequence["EthereumTypedDataValue"] = values if values is not None else []
+
+
 class EthereumStructMember(protobuf.MessageType):
     MESSAGE_WIRE_TYPE = None
     FIELDS = {
@@ -7093,6 +7284,23 @@ class EthereumFieldType(protobuf.MessageType):
         self.struct_name = struct_name
 
 
+class EthereumTypedDataValue(protobuf.MessageType):
+    MESSAGE_WIRE_TYPE = None
+    FIELDS = {
+        1: protobuf.Field("member_path", "uint32", repeated=True, required=False),
+        2: protobuf.Field("value", "bytes", repeated=False, required=True),
+    }
+
+    def __init__(
+        self,
+        *,
+        value: "bytes",
+        member_path: Optional[Sequence["int"]] = None,
+    ) -> None:
+        self.member_path: Sequence["int"] = member_path if member_path is not None else []
+        self.value = value
+
+
 class EthereumGetPublicKeyOneKey(protobuf.MessageType):
     MESSAGE_WIRE_TYPE = 20100
     FIELDS = {
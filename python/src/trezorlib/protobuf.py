@@ -189,6 +189,9 @@ class _MessageTypeMeta(type):
 class MessageType(metaclass=_MessageTypeMeta):
     MESSAGE_WIRE_TYPE: Optional[int] = None
 
+    # compiled codec plan, see `get_message_plan`
+    _PLAN: Optional["_MessagePlan"] = None
+
     FIELDS: Dict[int, Field] = {}
 
     @classmethod
@@ -244,9 +247,7 @@ class MessageType(metaclass=_MessageTypeMeta):
         return f"<{self.__class__.__name__}: {d}>"
 
     def ByteSize(self) -> int:
-        data = BytesIO()
-        dump_message(data, self)
-        return len(data.getvalue())
+        return len(dump_message_buffer(self))
 
 
 class LimitedReader:
@@ -263,16 +264,6 @@ class LimitedReader:
             return nread
 
 
-class CountingWriter:
-    def __init__(self) -> None:
-        self.size = 0
-
-    def write(self, buf: bytes) -> int:
-        nwritten = len(buf)
-        self.size += nwritten
-        return nwritten
-
-
 def get_field_type_object(
     field: Field,
 ) -> Optional[Union[Type[MessageType], Type[IntEnum]]]:
@@ -416,76 +407,348 @@ def load_message(reader: Reader, msg_type: Type[MT]) -> MT:
 
 
 def dump_message(writer: Writer, msg: "MessageType") -> None:
-    repvalue = [0]
-    mtype = msg.__class__
+    writer.write(dump_message_buffer(msg))
+
+
+# Compiled codec
+#
+# `load_message` interprets `FIELDS` for every value it reads from a stream.
+# The functions below compile `FIELDS` into a flat plan once per message class (on
+# first use) and then operate directly on byte buffers. Submessages are serialized
+# in a single pass, so the cost of encoding does not grow with nesting depth.
+
+_KIND_UINT = 0
+_KIND_SINT = 1
+_KIND_BOOL = 2
+_KIND_ENUM = 3
+_KIND_BYTES = 4
+_KIND_STRING = 5
+_KIND_MESSAGE = 6
+_KIND_UNKNOWN = 7
+
+_INT_BOUNDS = {
+    "uint32": (0, 2**32),
+    "uint64": (0, 2**64),
+    "sint32": (-(2**31), 2**31),
+    "sint64": (-(2**63), 2**63),
+}
+
+
+def _uvarint_bytes(n: int) -> bytes:
+    buf = BytesIO()
+    dump_uvarint(buf, n)
+    return buf.getvalue()
+
+
+class _FieldPlan:
+    __slots__ = (
+        "tag",
+        "name",
+        "field",
+        "kind",
+        "wire_type",
+        "key",
+        "repeated",
+        "required",
+        "type_object",
+        "enum_values",
+        "low",
+        "high",
+    )
+
+    def __init__(self, tag: int, field: Field) -> None:
+        self.tag = tag
+        self.name = field.name
+        self.field = field
+        self.repeated = field.repeated
+        self.required = field.required
+        self.type_object: Any = None
+        self.enum_values: frozenset = frozenset()
+        self.low, self.high = _INT_BOUNDS.get(field.type, (0, 0))
+
+        if field.type.startswith("uint"):
+            self.kind = _KIND_UINT
+        elif field.type.startswith("sint"):
+            self.kind = _KIND_SINT
+        elif field.type == "bool":
+            self.kind = _KIND_BOOL
+        elif field.type == "bytes":
+            self.kind = _KIND_BYTES
+        elif field.type == "string":
+            self.kind = _KIND_STRING
+        else:
+            field_type_object = get_field_type_object(field)
+            self.type_object = field_type_object
+            if safe_issubclass(field_type_object, MessageType):
+                self.kind = _KIND_MESSAGE
+            elif safe_issubclass(field_type_object, IntEnum):
+                self.kind = _KIND_ENUM
+                self.enum_values = frozenset(field_type_object.__members__.values())
+            else:
+                self.kind = _KIND_UNKNOWN
+
+        if self.kind in (_KIND_BYTES, _KIND_STRING, _KIND_MESSAGE):
+            self.wire_type = WIRE_TYPE_LENGTH
+        else:
+            # the wire type of unknown fields is never used, they fail before that
+            self.wire_type = WIRE_TYPE_INT
+        self.key = _uvarint_bytes((tag << 3) | self.wire_type)
+
+
+class _MessagePlan:
+    __slots__ = ("fields", "by_tag", "template", "repeated_names", "required_names")
+
+    def __init__(self, msg_type: Type["MessageType"]) -> None:
+        self.fields = [_FieldPlan(tag, field) for tag, field in msg_type.FIELDS.items()]
+        self.by_tag = {f.tag: f for f in self.fields}
+        # initial instance dict, in the same order MessageType.__init__ would use
+        self.template: Dict[str, Any] = {}
+        for f in self.fields:
+            if f.repeated:
+                self.template[f.name] = None  # replaced by a fresh list
+            elif f.required:
+                self.template[f.name] = REQUIRED_FIELD_PLACEHOLDER
+            else:
+                self.template[f.name] = f.field.default
+        self.repeated_names = [f.name for f in self.fields if f.repeated]
+        self.required_names = [
+            f.name for f in self.fields if f.required and not f.repeated
+        ]
+
+
+def get_message_plan(msg_type: Type["MessageType"]) -> _MessagePlan:
+    """Return the compiled codec plan of `msg_type`, building it on first use."""
+    plan = msg_type.__dict__.get("_PLAN")
+    if plan is None:
+        plan = _MessagePlan(msg_type)
+        msg_type._PLAN = plan
+    return plan
+
+
+def _read_uvarint(
+    buffer: Union[bytes, memoryview], pos: int, end: int
+) -> Tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        if pos >= end:
+            raise IOError("Interrupted UVarint")
+        byte = buffer[pos]
+        pos += 1
+        result += (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
 
-    for ftag, field in mtype.FIELDS.items():
-        fvalue = getattr(msg, field.name, None)
+
+def _decode_int_value(f: _FieldPlan, value: int) -> Any:
+    kind = f.kind
+    if kind == _KIND_UINT:
+        if not f.low <= value < f.high:
+            LOG.info(
+                f"On field {f.name}: value {value} out of range for {f.field.type}"
+            )
+        return value
+
+    if kind == _KIND_SINT:
+        value = uint_to_sint(value)
+        if not f.low <= value < f.high:
+            LOG.info(
+                f"On field {f.name}: value {value} out of range for {f.field.type}"
+            )
+        return value
+
+    if kind == _KIND_BOOL:
+        return bool(value)
+
+    if kind == _KIND_ENUM:
+        try:
+            return f.type_object(value)
+        except ValueError as e:
+            # treat enum errors as warnings
+            LOG.info(f"On field {f.name}: {e}")
+            return value
+
+    raise TypeError  # not a varint field or unknown type
+
+
+def _load_fields(
+    buffer: Union[bytes, memoryview], pos: int, end: int, msg_type: Type[MT]
+) -> MT:
+    plan = get_message_plan(msg_type)
+    by_tag = plan.by_tag
+    msg_dict = plan.template.copy()
+    for name in plan.repeated_names:
+        msg_dict[name] = []
+
+    while pos < end:
+        fkey, pos = _read_uvarint(buffer, pos, end)
+        ftag = fkey >> 3
+        wtype = fkey & 7
+
+        f = by_tag.get(ftag)
+        if f is None:  # unknown field, skip it
+            if wtype == WIRE_TYPE_INT:
+                _, pos = _read_uvarint(buffer, pos, end)
+            elif wtype == WIRE_TYPE_LENGTH:
+                ivalue, pos = _read_uvarint(buffer, pos, end)
+                pos += ivalue
+                if pos > end:
+                    raise ValueError("Interrupted value of unknown field")
+            else:
+                raise ValueError
+            continue
+
+        if f.kind == _KIND_UNKNOWN:
+            raise ValueError(f"Unrecognized type for field {f.name}")
+
+        if wtype == WIRE_TYPE_LENGTH and f.wire_type == WIRE_TYPE_INT and f.repeated:
+            # packed array
+            length, pos = _read_uvarint(buffer, pos, end)
+            packed_end = pos + length
+            if packed_end > end:
+                raise IOError("Interrupted packed array")
+            values = msg_dict[f.name]
+            while pos < packed_end:
+                ivalue, pos = _read_uvarint(buffer, pos, packed_end)
+                values.append(_decode_int_value(f, ivalue))
+            continue
+
+        if wtype != f.wire_type:
+            raise ValueError(f"Field {f.name} received value does not match schema")
+
+        if wtype == WIRE_TYPE_INT:
+            ivalue, pos = _read_uvarint(buffer, pos, end)
+            value = _decode_int_value(f, ivalue)
+        else:
+            length, pos = _read_uvarint(buffer, pos, end)
+            field_end = pos + length
+            if field_end > end:
+                raise IOError(f"Interrupted value of field {f.name}")
+            if f.kind == _KIND_BYTES:
+                value = bytes(buffer[pos:field_end])
+            elif f.kind == _KIND_STRING:
+                value = bytes(buffer[pos:field_end]).decode()
+            else:
+                value = _load_fields(buffer, pos, field_end, f.type_object)
+            pos = field_end
+
+        if f.repeated:
+            msg_dict[f.name].append(value)
+        else:
+            msg_dict[f.name] = value
+
+    for name in plan.required_names:
+        if msg_dict[name] is REQUIRED_FIELD_PLACEHOLDER:
+            raise ValueError(f"Did not receive value for field {name}")
+
+    msg = msg_type.__new__(msg_type)
+    msg.__dict__.update(msg_dict)
+    return msg
+
+
+def load_message_buffer(
+    buffer: Union[bytes, bytearray, memoryview], msg_type: Type[MT]
+) -> MT:
+    """Decode a complete serialized message from `buffer`.
+
+    Equivalent to `load_message(BytesIO(buffer), msg_type)`, but uses the compiled
+    plan of `msg_type` and does not copy the input.
+    """
+    if not isinstance(buffer, memoryview):
+        buffer = memoryview(buffer)
+    return _load_fields(buffer, 0, len(buffer), msg_type)
+
+
+def _append_uvarint(out: bytearray, n: int) -> None:
+    if n < 0:
+        raise ValueError("Cannot dump signed value, convert it to unsigned first.")
+    while n > 0x7F:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _dump_fields(out: bytearray, msg: "MessageType") -> None:
+    for f in get_message_plan(msg.__class__).fields:
+        fvalue = getattr(msg, f.name, None)
 
         if fvalue is REQUIRED_FIELD_PLACEHOLDER:
-            raise ValueError(f"Required value of field {field.name} was not provided")
+            raise ValueError(f"Required value of field {f.name} was not provided")
 
         if fvalue is None:
             # not sending empty values
             continue
 
-        fkey = (ftag << 3) | field.wire_type
-
-        if not field.repeated:
-            repvalue[0] = fvalue
-            fvalue = repvalue
+        kind = f.kind
+        if kind == _KIND_UNKNOWN:
+            raise ValueError(f"Unrecognized type for field {f.name}")
 
-        for svalue in fvalue:
-            dump_uvarint(writer, fkey)
+        key = f.key
+        for svalue in fvalue if f.repeated else (fvalue,):
+            out += key
 
-            field_type_object = get_field_type_object(field)
-            if safe_issubclass(field_type_object, MessageType):
-                if not isinstance(svalue, field_type_object):
+            if kind == _KIND_UINT:
+                if not f.low <= svalue < f.high:
                     raise ValueError(
-                        f"Value {svalue} in field {field.name} is not {field_type_object.__name__}"
+                        f"Value {svalue} in field {f.name} does not fit into {f.field.type}"
                     )
-                counter = CountingWriter()
-                dump_message(counter, svalue)
-                dump_uvarint(writer, counter.size)
-                dump_message(writer, svalue)
+                _append_uvarint(out, svalue)
 
-            elif safe_issubclass(field_type_object, IntEnum):
-                if svalue not in field_type_object.__members__.values():
+            elif kind == _KIND_BYTES:
+                assert isinstance(svalue, (bytes, bytearray))
+                _append_uvarint(out, len(svalue))
+                out += svalue
+
+            elif kind == _KIND_MESSAGE:
+                if not isinstance(svalue, f.type_object):
                     raise ValueError(
-                        f"Value {svalue} in field {field.name} unknown for {field.type}"
+                        f"Value {svalue} in field {f.name} is not {f.type_object.__name__}"
                     )
-                dump_uvarint(writer, svalue)
+                # Serialize the submessage in place, behind a one-byte length
+                # placeholder, and patch in the real length afterwards. Lengths
+                # that need a longer varint are spliced in, which only moves the
+                # tail of the buffer instead of re-encoding the submessage.
+                start = len(out)
+                out.append(0)
+                _dump_fields(out, svalue)
+                size = len(out) - start - 1
+                if size <= 0x7F:
+                    out[start] = size
+                else:
+                    length = bytearray()
+                    _append_uvarint(length, size)
+                    out[start : start + 1] = length
 
-            elif field.type.startswith("uint"):
-                if not field.value_fits(svalue):
+            elif kind == _KIND_ENUM:
+                if svalue not in f.enum_values:
                     raise ValueError(
-                        f"Value {svalue} in field {field.name} does not fit into {field.type}"
+                        f"Value {svalue} in field {f.name} unknown for {f.field.type}"
                     )
-                dump_uvarint(writer, svalue)
+                _append_uvarint(out, svalue)
 
-            elif field.type.startswith("sint"):
-                if not field.value_fits(svalue):
+            elif kind == _KIND_SINT:
+                if not f.low <= svalue < f.high:
                     raise ValueError(
-                        f"Value {svalue} in field {field.name} does not fit into {field.type}"
+                        f"Value {svalue} in field {f.name} does not fit into {f.field.type}"
                     )
-                dump_uvarint(writer, sint_to_uint(svalue))
-
-            elif field.type == "bool":
-                dump_uvarint(writer, int(svalue))
+                _append_uvarint(out, sint_to_uint(svalue))
 
-            elif field.type == "bytes":
-                assert isinstance(svalue, (bytes, bytearray))
-                dump_uvarint(writer, len(svalue))
-                writer.write(svalue)
+            elif kind == _KIND_BOOL:
+                _append_uvarint(out, int(svalue))
 
-            elif field.type == "string":
+            else:  # _KIND_STRING
                 assert isinstance(svalue, str)
                 svalue_bytes = svalue.encode()
-                dump_uvarint(writer, len(svalue_bytes))
-                writer.write(svalue_bytes)
+                _append_uvarint(out, len(svalue_bytes))
+                out += svalue_bytes
 
-            else:
-                raise TypeError
+
+def dump_message_buffer(msg: "MessageType") -> bytes:
+    """Serialize `msg` into a bytes object, using the compiled plan of its class."""
+    out = bytearray()
+    _dump_fields(out, msg)
+    return bytes(out)
 
 
 def format_message(
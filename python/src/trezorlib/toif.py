@@ -14,10 +14,12 @@
 # You should have received a copy of the License along with this library.
 # If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
 
-import struct
+import sys
 import zlib
+from concurrent.futures import Executor
 from dataclasses import dataclass
-from typing import Sequence, Tuple
+from functools import lru_cache, partial
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 from typing_extensions import Literal
 
@@ -32,8 +34,12 @@ try:
 except ImportError:
     PIL_AVAILABLE = False
 
+try:
+    import numpy as np
 
-RGBPixel = Tuple[int, int, int]
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 
 def _compress(data: bytes) -> bytes:
@@ -45,72 +51,164 @@ def _decompress(data: bytes) -> bytes:
     return zlib.decompress(data, wbits=-10)
 
 
-def _from_pil_rgb(pixels: Sequence[RGBPixel], little_endian: bool) -> bytes:
-    data = bytearray()
-    for r, g, b in pixels:
-        c = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | ((b & 0xF8) >> 3)
-        if little_endian:
-            data += struct.pack("<H", c)
-        else:
-            data += struct.pack(">H", c)
+def _table(func: Callable[[int], int]) -> bytes:
+    return bytes(func(i) for i in range(256))
+
+
+def _or(a: bytes, b: bytes) -> bytes:
+    # bytewise OR of two equally long strings, done on big integers so that it
+    # does not have to go through the bytes one at a time
+    value = int.from_bytes(a, "little") | int.from_bytes(b, "little")
+    return value.to_bytes(len(a), "little")
+
+
+# translation tables of the pure Python implementation, "hi" and "lo" are the bytes
+# of an RGB565 pixel
+_R_HI = _table(lambda r: r & 0xF8)
+_G_HI = _table(lambda g: g >> 5)
+_G_LO = _table(lambda g: (g & 0x1C) << 3)
+_B_LO = _table(lambda b: b >> 3)
+_HI_R = _table(lambda hi: hi & 0xF8)
+_HI_G = _table(lambda hi: (hi & 0x07) << 5)
+_LO_G = _table(lambda lo: (lo & 0xE0) >> 3)
+_LO_B = _table(lambda lo: (lo & 0x1F) << 3)
+_HIGH_NIBBLE = _table(lambda p: p & 0xF0)
+_LOW_NIBBLE = _table(lambda p: p >> 4)
+_LOW_TO_HIGH = _table(lambda p: (p & 0x0F) << 4)
+
+
+@lru_cache(maxsize=None)
+def _premultiply_table() -> bytes:
+    # indexed by the native-endian 16-bit word of a grayscale-alpha pixel
+    if sys.byteorder == "little":
+        return bytes((i & 0xFF) * (i >> 8) // 255 for i in range(0x10000))
+    else:
+        return bytes((i >> 8) * (i & 0xFF) // 255 for i in range(0x10000))
+
+
+def _pack_grayscale(left: bytes, right: bytes, right_hi: bool) -> bytes:
+    if right_hi:
+        return _or(right.translate(_HIGH_NIBBLE), left.translate(_LOW_NIBBLE))
+    else:
+        return _or(left.translate(_HIGH_NIBBLE), right.translate(_LOW_NIBBLE))
+
+
+def _from_pil_rgb(pixels: bytes, little_endian: bool) -> bytes:
+    """Convert raw 8-bit RGB data to RGB565."""
+    if NUMPY_AVAILABLE:
+        rgb = np.frombuffer(pixels, dtype=np.uint8).reshape(-1, 3).astype(np.uint16)
+        c = ((rgb[:, 0] & 0xF8) << 8) | ((rgb[:, 1] & 0xFC) << 3) | (rgb[:, 2] >> 3)
+        return c.astype("<u2" if little_endian else ">u2").tobytes()
+
+    r, g, b = pixels[0::3], pixels[1::3], pixels[2::3]
+    hi = _or(r.translate(_R_HI), g.translate(_G_HI))
+    lo = _or(g.translate(_G_LO), b.translate(_B_LO))
+    data = bytearray(len(hi) * 2)
+    data[0::2], data[1::2] = (lo, hi) if little_endian else (hi, lo)
     return bytes(data)
 
 
 def _to_rgb(data: bytes, little_endian: bool) -> bytes:
-    res = bytearray()
-    for i in range(0, len(data), 2):
-        if little_endian:
-            (c,) = struct.unpack("<H", data[i : i + 2])
-        else:
-            (c,) = struct.unpack(">H", data[i : i + 2])
-        r = (c & 0xF800) >> 8
-        g = (c & 0x07E0) >> 3
-        b = (c & 0x001F) << 3
-        res += bytes((r, g, b))
+    """Convert RGB565 data to raw 8-bit RGB."""
+    if NUMPY_AVAILABLE:
+        c = np.frombuffer(data, dtype="<u2" if little_endian else ">u2")
+        rgb = np.empty((len(c), 3), dtype=np.uint8)
+        rgb[:, 0] = (c & 0xF800) >> 8
+        rgb[:, 1] = (c & 0x07E0) >> 3
+        rgb[:, 2] = (c & 0x001F) << 3
+        return rgb.tobytes()
+
+    if little_endian:
+        lo, hi = data[0::2], data[1::2]
+    else:
+        hi, lo = data[0::2], data[1::2]
+    res = bytearray(len(hi) * 3)
+    res[0::3] = hi.translate(_HI_R)
+    res[1::3] = _or(hi.translate(_HI_G), lo.translate(_LO_G))
+    res[2::3] = lo.translate(_LO_B)
     return bytes(res)
 
 
-def _from_pil_grayscale(pixels: Sequence[int], right_hi: bool) -> bytes:
-    data = bytearray()
-    for i in range(0, len(pixels), 2):
-        left, right = pixels[i], pixels[i + 1]
+def _from_pil_grayscale(pixels: bytes, right_hi: bool) -> bytes:
+    """Pack raw 8-bit grayscale data to two pixels per byte."""
+    if NUMPY_AVAILABLE:
+        p = np.frombuffer(pixels, dtype=np.uint8).reshape(-1, 2)
+        left, right = p[:, 0], p[:, 1]
         if right_hi:
-            c = (right & 0xF0) | ((left & 0xF0) >> 4)
+            c = (right & 0xF0) | (left >> 4)
         else:
-            c = (left & 0xF0) | ((right & 0xF0) >> 4)
-        data += struct.pack(">B", c)
-    return bytes(data)
+            c = (left & 0xF0) | (right >> 4)
+        return c.tobytes()
 
+    return _pack_grayscale(pixels[0::2], pixels[1::2], right_hi)
 
-def _from_pil_grayscale_alpha(
-    pixels: Sequence[Tuple[int, int]], right_hi: bool
-) -> bytes:
-    data = bytearray()
-    for i in range(0, len(pixels), 2):
-        left_w_alpha, right_w_alpha = pixels[i], pixels[i + 1]
-        left = int((left_w_alpha[0] * left_w_alpha[1]) / 255)
-        right = int((right_w_alpha[0] * right_w_alpha[1]) / 255)
-        if right_hi:
-            c = (right & 0xF0) | ((left & 0xF0) >> 4)
-        else:
-            c = (left & 0xF0) | ((right & 0xF0) >> 4)
-        data += struct.pack(">B", c)
-    return bytes(data)
+
+def _from_pil_grayscale_alpha(pixels: bytes, right_hi: bool) -> bytes:
+    """Pack raw 8-bit grayscale-alpha data to two premultiplied pixels per byte."""
+    if NUMPY_AVAILABLE:
+        la = np.frombuffer(pixels, dtype=np.uint8).reshape(-1, 2).astype(np.uint16)
+        # same as int(value * alpha / 255) for all 8-bit values
+        premultiplied = (la[:, 0] * la[:, 1] // 255).astype(np.uint8)
+        return _from_pil_grayscale(premultiplied.tobytes(), right_hi)
+
+    table = _premultiply_table()
+    premultiplied = bytes(map(table.__getitem__, memoryview(pixels).cast("H")))
+    return _pack_grayscale(premultiplied[0::2], premultiplied[1::2], right_hi)
 
 
 def _to_grayscale(data: bytes, right_hi: bool) -> bytes:
-    res = bytearray()
-    for pixel in data:
-        if right_hi:
-            right = pixel & 0xF0
-            left = (pixel & 0x0F) << 4
-        else:
-            left = pixel & 0xF0
-            right = (pixel & 0x0F) << 4
-        res += bytes((left, right))
+    """Unpack two grayscale pixels per byte to raw 8-bit grayscale data."""
+    if NUMPY_AVAILABLE:
+        p = np.frombuffer(data, dtype=np.uint8)
+        res = np.empty((len(p), 2), dtype=np.uint8)
+        high, low = p & 0xF0, (p & 0x0F) << 4
+        res[:, 0], res[:, 1] = (low, high) if right_hi else (high, low)
+        return res.tobytes()
+
+    high, low = data.translate(_HIGH_NIBBLE), data.translate(_LOW_TO_HIGH)
+    res = bytearray(len(data) * 2)
+    res[0::2], res[1::2] = (low, high) if right_hi else (high, low)
     return bytes(res)
 
 
+_DECODERS: Dict[
+    firmware.ToifMode, Tuple[Literal["L", "RGB"], Callable[[bytes], bytes]]
+] = {
+    firmware.ToifMode.grayscale: ("L", partial(_to_grayscale, right_hi=False)),
+    firmware.ToifMode.grayscale_eh: ("L", partial(_to_grayscale, right_hi=True)),
+    firmware.ToifMode.full_color: ("RGB", partial(_to_rgb, little_endian=False)),
+    firmware.ToifMode.full_color_le: ("RGB", partial(_to_rgb, little_endian=True)),
+}
+
+# (PIL mode, legacy_format) -> TOIF mode and conversion
+_ENCODERS = {
+    ("L", False): (
+        firmware.ToifMode.grayscale_eh,
+        partial(_from_pil_grayscale, right_hi=True),
+    ),
+    ("L", True): (
+        firmware.ToifMode.grayscale,
+        partial(_from_pil_grayscale, right_hi=False),
+    ),
+    ("LA", False): (
+        firmware.ToifMode.grayscale_eh,
+        partial(_from_pil_grayscale_alpha, right_hi=True),
+    ),
+    ("LA", True): (
+        firmware.ToifMode.grayscale,
+        partial(_from_pil_grayscale_alpha, right_hi=False),
+    ),
+    ("RGB", False): (
+        firmware.ToifMode.full_color_le,
+        partial(_from_pil_rgb, little_endian=True),
+    ),
+    ("RGB", True): (
+        firmware.ToifMode.full_color,
+        partial(_from_pil_rgb, little_endian=False),
+    ),
+}
+
+
 @dataclass
 class Toif:
     mode: firmware.ToifMode
@@ -134,27 +232,10 @@ class Toif:
             )
 
     def to_image(self) -> "Image.Image":
-        if not PIL_AVAILABLE:
-            raise RuntimeError(
-                "PIL is not available. Please install via 'pip install Pillow'"
-            )
-
-        uncompressed = _decompress(self.data)
-
-        pil_mode: Literal["L", "RGB"]
-        if self.mode is firmware.ToifMode.grayscale:
-            pil_mode = "L"
-            raw_data = _to_grayscale(uncompressed, right_hi=False)
-        elif self.mode is firmware.ToifMode.grayscale_eh:
-            pil_mode = "L"
-            raw_data = _to_grayscale(uncompressed, right_hi=True)
-        elif self.mode is firmware.ToifMode.full_color:
-            pil_mode = "RGB"
-            raw_data = _to_rgb(uncompressed, little_endian=False)
-        else:  # self.mode is firmware.ToifMode.full_color_le:
-            pil_mode = "RGB"
-            raw_data = _to_rgb(uncompressed, little_endian=True)
+        _check_pil()
 
+        pil_mode, convert = _DECODERS[self.mode]
+        raw_data = convert(_decompress(self.data))
         return Image.frombuffer(pil_mode, self.size, raw_data, "raw", pil_mode, 0, 1)
 
     def to_bytes(self) -> bytes:
@@ -178,16 +259,16 @@ def load(filename: str) -> Toif:
         return from_bytes(f.read())
 
 
-def from_image(
-    image: "Image.Image",
-    background: Tuple[int, int, int, int] = (0, 0, 0, 255),
-    legacy_format: bool = False,
-) -> Toif:
+def _check_pil() -> None:
     if not PIL_AVAILABLE:
         raise RuntimeError(
             "PIL is not available. Please install via 'pip install Pillow'"
         )
 
+
+def _prepare_image(
+    image: "Image.Image", background: Tuple[int, int, int, int]
+) -> "Image.Image":
     if image.mode == "RGBA":
         img_background = Image.new("RGBA", image.size, background)
         blend = Image.alpha_composite(img_background, image)
@@ -196,34 +277,51 @@ def from_image(
     if image.mode == "1":
         image = image.convert("L")
 
-    if image.mode == "L":
-        if image.size[0] % 2 != 0:
-            raise ValueError("Only even-width grayscale images are supported")
-        if not legacy_format:
-            toif_mode = firmware.ToifMode.grayscale_eh
-            toif_data = _from_pil_grayscale(image.getdata(), right_hi=True)
-        else:
-            toif_mode = firmware.ToifMode.grayscale
-            toif_data = _from_pil_grayscale(image.getdata(), right_hi=False)
-    elif image.mode == "LA":
-        toif_mode = firmware.ToifMode.grayscale
-        if image.size[0] % 2 != 0:
-            raise ValueError("Only even-width grayscale images are supported")
-        if not legacy_format:
-            toif_mode = firmware.ToifMode.grayscale_eh
-            toif_data = _from_pil_grayscale_alpha(image.getdata(), right_hi=True)
-        else:
-            toif_mode = firmware.ToifMode.grayscale
-            toif_data = _from_pil_grayscale_alpha(image.getdata(), right_hi=False)
-    elif image.mode == "RGB":
-        if not legacy_format:
-            toif_mode = firmware.ToifMode.full_color_le
-            toif_data = _from_pil_rgb(image.getdata(), little_endian=True)
-        else:
-            toif_mode = firmware.ToifMode.full_color
-            toif_data = _from_pil_rgb(image.getdata(), little_endian=False)
-    else:
-        raise ValueError(f"Unsupported image mode: {image.mode}")
+    if image.mode in ("L", "LA") and image.size[0] % 2 != 0:
+        raise ValueError("Only even-width grayscale images are supported")
+
+    return image
+
 
-    data = _compress(toif_data)
+def from_image(
+    image: "Image.Image",
+    background: Tuple[int, int, int, int] = (0, 0, 0, 255),
+    legacy_format: bool = False,
+) -> Toif:
+    _check_pil()
+
+    image = _prepare_image(image, background)
+    if (image.mode, legacy_format) not in _ENCODERS:
+        raise ValueError(f"Unsupported image mode: {image.mode}")
+    toif_mode, convert = _ENCODERS[image.mode, legacy_format]
+    data = _compress(convert(image.tobytes()))
     return Toif(toif_mode, image.size, data)
+
+
+def from_images(
+    images: Iterable["Image.Image"],
+    background: Tuple[int, int, int, int] = (0, 0, 0, 255),
+    legacy_format: bool = False,
+    executor: Optional[Executor] = None,
+) -> List[Toif]:
+    """Convert a set of images, e.g. an icon set, to TOIF.
+
+    If an `executor` is provided, the images are converted in parallel. In a thread
+    pool, only the compression and the NumPy pixel conversion overlap; the pure
+    Python conversion used without NumPy does not.
+    """
+    convert = partial(from_image, background=background, legacy_format=legacy_format)
+    if executor is None:
+        return [convert(image) for image in images]
+    else:
+        return list(executor.map(convert, images))
+
+
+def to_images(
+    toifs: Iterable[Toif], executor: Optional[Executor] = None
+) -> List["Image.Image"]:
+    """Convert a set of TOIF images to PIL images, see `from_images`."""
+    if executor is None:
+        return [toi.to_image() for toi in toifs]
+    else:
+        return list(executor.map(Toif.to_image, toifs))
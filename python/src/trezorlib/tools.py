@@ -25,6 +25,7 @@ from typing import (
     AnyStr,
     Callable,
     Dict,
+    Generator,
     List,
     NewType,
     Optional,
@@ -48,6 +49,10 @@ if TYPE_CHECKING:
     P = ParamSpec("P")
     R = TypeVar("R")
 
+    # A message flow yields requests for the device and receives the responses.
+    # It can be driven by either a synchronous or an asynchronous client.
+    Flow = Generator[MessageType, MessageType, R]
+
 HARDENED_FLAG = 1 << 31
 
 Address = NewType("Address", List[int])
@@ -311,6 +316,17 @@ def session(
     return wrapped_f
 
 
+def run_flow(client: "TrezorClient", flow: "Flow[R]") -> "R":
+    """Drive a message flow through `client.call` and return its result."""
+    __tracebackhide__ = True  # for pytest # pylint: disable=W0612
+    try:
+        request = next(flow)
+        while True:
+            request = flow.send(client.call(request))
+    except StopIteration as e:
+        return e.value
+
+
 # de-camelcasifier
 # https://stackoverflow.com/a/1176023/222189
 
@@ -15,8 +15,12 @@
 # If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
 
 import logging
+import threading
+import time
+from dataclasses import dataclass, field
 from typing import (
     TYPE_CHECKING,
+    Dict,
     Iterable,
     List,
     Optional,
@@ -35,6 +39,12 @@ if TYPE_CHECKING:
 
 LOG = logging.getLogger(__name__)
 
+# how long to wait for a single transport to enumerate its devices, in seconds
+ENUMERATE_TIMEOUT = 5.0
+
+# how long enumeration results may be reused, in seconds; 0 disables the cache
+ENUMERATE_CACHE_TTL = 0.0
+
 UDEV_RULES_STR = """
 Do you have udev rules installed?
 https://github.com/trezor/trezor-common/blob/master/udev/51-trezor.rules
@@ -99,6 +109,15 @@ class Transport:
     ) -> Iterable["T"]:
         raise NotImplementedError
 
+    @classmethod
+    def devices_changed(cls) -> bool:
+        """Check whether devices were connected or removed since the last call.
+
+        Used to invalidate cached enumeration results. Transports that can't detect
+        hotplug events return False and rely on the cache TTL.
+        """
+        return False
+
     @classmethod
     def find_by_path(cls: Type["T"], path: str, prefix_search: bool = False) -> "T":
         for device in cls.enumerate():
@@ -127,21 +146,132 @@ def all_transports() -> Iterable[Type["Transport"]]:
     return set(t for t in transports if t.ENABLED)
 
 
+@dataclass
+class EnumerationResult:
+    """Outcome of enumerating a single transport."""
+
+    transport: Type["Transport"]
+    devices: List["Transport"] = field(default_factory=list)
+    elapsed: float = 0.0
+    error: Optional[str] = None
+    cached: bool = False
+
+
+# (transport, models) -> (timestamp, devices)
+_ENUMERATION_CACHE: Dict[tuple, Tuple[float, List["Transport"]]] = {}
+_ENUMERATION_CACHE_LOCK = threading.Lock()
+
+
+def invalidate_enumeration_cache() -> None:
+    """Forget all cached enumeration results."""
+    with _ENUMERATION_CACHE_LOCK:
+        _ENUMERATION_CACHE.clear()
+
+
+def _enumerate_one(
+    transport: Type["Transport"], models: Optional[Iterable["TrezorModel"]]
+) -> EnumerationResult:
+    start = time.monotonic()
+    result = EnumerationResult(transport)
+    try:
+        result.devices = list(transport.enumerate(models))
+    except NotImplementedError:
+        result.error = "device enumeration not implemented"
+    except Exception as e:
+        result.error = f"{e.__class__.__name__}: {e}"
+    result.elapsed = time.monotonic() - start
+    return result
+
+
+def enumerate_transports(
+    models: Optional[Iterable["TrezorModel"]] = None,
+    timeout: Optional[float] = None,
+    cache_ttl: Optional[float] = None,
+) -> List[EnumerationResult]:
+    """Enumerate all enabled transports concurrently.
+
+    Every transport gets `timeout` seconds (default `ENUMERATE_TIMEOUT`). A transport
+    that does not finish in time is reported with an error and its devices are
+    skipped. Its daemon thread is left running and does not delay exiting. With a
+    positive `cache_ttl` (default `ENUMERATE_CACHE_TTL`), results younger than
+    `cache_ttl` seconds are reused unless the transport reports a hotplug event.
+    """
+    if timeout is None:
+        timeout = ENUMERATE_TIMEOUT
+    if cache_ttl is None:
+        cache_ttl = ENUMERATE_CACHE_TTL
+    models_key = tuple(models) if models is not None else None
+
+    results: Dict[Type["Transport"], EnumerationResult] = {}
+    pending = []
+    now = time.monotonic()
+    for transport in sorted(all_transports(), key=lambda t: t.__name__):
+        key = (transport, models_key)
+        with _ENUMERATION_CACHE_LOCK:
+            if transport.devices_changed():
+                for stale in [k for k in _ENUMERATION_CACHE if k[0] is transport]:
+                    del _ENUMERATION_CACHE[stale]
+            cached = _ENUMERATION_CACHE.get(key)
+        if cached is not None and now - cached[0] < cache_ttl:
+            results[transport] = EnumerationResult(
+                transport, list(cached[1]), cached=True
+            )
+        else:
+            pending.append(transport)
+
+    if pending:
+        finished: Dict[Type["Transport"], EnumerationResult] = {}
+
+        def run(transport: Type["Transport"]) -> None:
+            finished[transport] = _enumerate_one(transport, models_key)
+
+        # daemon threads, so that a transport which hangs does not block the exit
+        threads = [
+            (t, threading.Thread(target=run, args=(t,), daemon=True)) for t in pending
+        ]
+        for _, thread in threads:
+            thread.start()
+        # the timeouts run in parallel, so measure them from a common start
+        deadline = time.monotonic() + timeout
+        for transport, thread in threads:
+            thread.join(max(deadline - time.monotonic(), 0))
+            result = finished.get(transport)
+            if result is None:
+                result = EnumerationResult(
+                    transport, elapsed=timeout, error=f"timed out after {timeout}s"
+                )
+            results[transport] = result
+            if result.error is None and cache_ttl > 0:
+                with _ENUMERATION_CACHE_LOCK:
+                    _ENUMERATION_CACHE[(transport, models_key)] = (
+                        now,
+                        list(result.devices),
+                    )
+
+    ordered = [results[t] for t in sorted(results, key=lambda t: t.__name__)]
+    for result in ordered:
+        name = result.transport.__name__
+        if result.error is not None:
+            LOG.error(f"Failed to enumerate {name}. {result.error}")
+        elif result.cached:
+            LOG.info(f"Enumerating {name}: {len(result.devices)} devices (cached)")
+        else:
+            LOG.info(
+                f"Enumerating {name}: found {len(result.devices)} devices "
+                f"in {result.elapsed * 1000:.0f} ms"
+            )
+    return ordered
+
+
 def enumerate_devices(
     models: Optional[Iterable["TrezorModel"]] = None,
+    timeout: Optional[float] = None,
+    cache_ttl: Optional[float] = None,
 ) -> Sequence["Transport"]:
+    """Enumerate devices on all enabled transports, see `enumerate_transports`."""
     devices: List["Transport"] = []
-    for transport in all_transports():
-        name = transport.__name__
-        try:
-            found = list(transport.enumerate(models))
-            LOG.info(f"Enumerating {name}: found {len(found)} devices")
-            devices.extend(found)
-        except NotImplementedError:
-            LOG.error(f"{name} does not implement device enumeration")
-        except Exception as e:
-            excname = e.__class__.__name__
-            LOG.error(f"Failed to enumerate {name}. {excname}: {e}")
+    for result in enumerate_transports(models, timeout=timeout, cache_ttl=cache_ttl):
+        devices.extend(result.devices)
     return devices
 
 
@@ -19,6 +19,7 @@ import struct
 from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from ..log import DUMP_PACKETS
 from . import DeviceIsBusy, MessagePayload, Transport, TransportException
@@ -33,9 +34,41 @@ TREZORD_ORIGIN_HEADER = {"Origin": "https://python.trezor.io"}
 
 TREZORD_VERSION_MODERN = (2, 0, 25)
 
-CONNECTION = requests.Session()
+# Number of keep-alive connections kept open to the Bridge. Reads block on the
+# Bridge side, so one connection per device in use is a reasonable minimum.
+DEFAULT_POOL_SIZE = 4
+
+
+def make_connection(pool_size: int = DEFAULT_POOL_SIZE) -> requests.Session:
+    """Create a keep-alive HTTP session suitable for talking to the Bridge."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+CONNECTION = make_connection()
 CONNECTION.headers.update(TREZORD_ORIGIN_HEADER)
 
+# result of is_legacy_bridge() per Bridge URL
+LEGACY_BRIDGE_CACHE: Dict[str, bool] = {}
+
+
+def set_connection(session: Optional[requests.Session] = None) -> None:
+    """Replace the HTTP session used for all Bridge calls.
+
+    Any `requests.Session`-compatible object can be plugged in, e.g. to change the
+    pool size, add retries or route through a proxy. Without an argument, a fresh
+    default session is created.
+    """
+    global CONNECTION
+    if session is None:
+        session = make_connection()
+    session.headers.update(TREZORD_ORIGIN_HEADER)
+    CONNECTION = session
+    LEGACY_BRIDGE_CACHE.clear()
+
 
 class BridgeException(TransportException):
     def __init__(self, path: str, status: int, message: str) -> None:
@@ -54,9 +87,14 @@ def call_bridge(path: str, data: Optional[str] = None) -> requests.Response:
 
 
 def is_legacy_bridge() -> bool:
-    config = call_bridge("configure").json()
-    version_tuple = tuple(map(int, config["version"].split(".")))
-    return version_tuple < TREZORD_VERSION_MODERN
+    """Check the Bridge version. The result is cached for the running process."""
+    legacy = LEGACY_BRIDGE_CACHE.get(TREZORD_HOST)
+    if legacy is None:
+        config = call_bridge("configure").json()
+        version_tuple = tuple(map(int, config["version"].split(".")))
+        legacy = version_tuple < TREZORD_VERSION_MODERN
+        LEGACY_BRIDGE_CACHE[TREZORD_HOST] = legacy
+    return legacy
 
 
 class BridgeHandle:
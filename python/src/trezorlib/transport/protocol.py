@@ -16,7 +16,7 @@
 
 import logging
 import struct
-from typing import Tuple
+from typing import List, Tuple
 
 from typing_extensions import Protocol as StructuralType
 
@@ -24,6 +24,10 @@ from . import MessagePayload, Transport
 
 REPLEN = 64
 
+# Upper bound for preallocating the receive buffer from the header length.
+# Longer messages are still received, the buffer just grows as data arrives.
+MAX_PREALLOC = 16 * 1024 * 1024
+
 V2_FIRST_CHUNK = 0x01
 V2_NEXT_CHUNK = 0x02
 V2_BEGIN_SESSION = 0x03
@@ -42,6 +46,10 @@ class Handle(StructuralType):
     Functionally we gain nothing from making this an (abstract) base class for handle
     implementations, so this definition is for type hinting purposes only. You can,
     but don't have to, inherit from it.
+
+    A handle may additionally implement `write_chunks(chunks)`, which submits a whole
+    sequence of 64-byte chunks at once. Protocols use it when available, otherwise
+    they fall back to calling `write_chunk` for every chunk.
     """
 
     def open(self) -> None:
@@ -128,42 +136,80 @@ class ProtocolV1(Protocol):
     HEADER_LEN = struct.calcsize(">HL")
 
     def write(self, message_type: int, message_data: bytes) -> None:
+        chunks = self.frame(message_type, message_data)
+        write_chunks = getattr(self.handle, "write_chunks", None)
+        if write_chunks is not None:
+            write_chunks(chunks)
+        else:
+            for chunk in chunks:
+                self.handle.write_chunk(chunk)
+
+    @classmethod
+    def frame(cls, message_type: int, message_data: bytes) -> List[bytes]:
+        """Split a message into 64-byte reports: "?" followed by 63 bytes of data,
+        the last report zero-padded."""
         header = struct.pack(">HL", message_type, len(message_data))
-        buffer = bytearray(b"##" + header + message_data)
-
-        while buffer:
-            # Report ID, data padded to 63 bytes
-            chunk = b"?" + buffer[: REPLEN - 1]
-            chunk = chunk.ljust(REPLEN, b"\x00")
-            self.handle.write_chunk(chunk)
-            buffer = buffer[63:]
+        buffer = memoryview(b"##" + header + bytes(message_data))
+        payload_len = REPLEN - 1
+
+        chunks = [
+            b"?" + buffer[i : i + payload_len]
+            for i in range(0, len(buffer) - payload_len + 1, payload_len)
+        ]
+        tail = len(buffer) % payload_len
+        if tail:
+            chunks.append((b"?" + buffer[-tail:]).ljust(REPLEN, b"\x00"))
+        return chunks
 
     def read(self) -> MessagePayload:
-        buffer = bytearray()
         # Read header with first part of message data
         msg_type, datalen, first_chunk = self.read_first()
-        buffer.extend(first_chunk)
 
-        # Read the rest of the message
-        while len(buffer) < datalen:
-            buffer.extend(self.read_next())
+        buffer = bytearray(min(datalen, MAX_PREALLOC))
+        view = memoryview(buffer)
+        received = min(len(first_chunk), datalen)
+        buffer[:received] = first_chunk[:received]
 
-        return msg_type, buffer[:datalen]
+        # Read the rest of the message
+        while received < datalen:
+            chunk = self.read_next()
+            chunk_len = min(len(chunk), datalen - received)
+            end = received + chunk_len
+            if end > len(buffer):
+                # header claimed more than MAX_PREALLOC, grow geometrically
+                view.release()
+                buffer.extend(
+                    bytes(min(datalen, max(end, 2 * len(buffer))) - len(buffer))
+                )
+                view = memoryview(buffer)
+            view[received:end] = chunk[:chunk_len]
+            received = end
+
+        view.release()
+        return msg_type, buffer
 
     def read_first(self) -> Tuple[int, int, bytes]:
-        chunk = self.handle.read_chunk()
+        return self.parse_first(self.handle.read_chunk())
+
+    def read_next(self) -> bytes:
+        return self.parse_next(self.handle.read_chunk())
+
+    @classmethod
+    def parse_first(cls, chunk: bytes) -> Tuple[int, int, bytes]:
+        """Parse the first report of a message into type, length and initial data."""
         if chunk[:3] != b"?##":
             raise RuntimeError("Unexpected magic characters")
         try:
-            msg_type, datalen = struct.unpack(">HL", chunk[3 : 3 + self.HEADER_LEN])
+            msg_type, datalen = struct.unpack(">HL", chunk[3 : 3 + cls.HEADER_LEN])
         except Exception:
             raise RuntimeError("Cannot parse header")
 
-        data = chunk[3 + self.HEADER_LEN :]
+        data = chunk[3 + cls.HEADER_LEN :]
         return msg_type, datalen, data
 
-    def read_next(self) -> bytes:
-        chunk = self.handle.read_chunk()
+    @staticmethod
+    def parse_next(chunk: bytes) -> bytes:
+        """Return the data of a continuation report."""
         if chunk[:1] != b"?":
             raise RuntimeError("Unexpected magic characters")
         return chunk[1:]
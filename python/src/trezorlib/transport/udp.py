@@ -17,7 +17,7 @@
 import logging
 import socket
 import time
-from typing import TYPE_CHECKING, Iterable, Optional
+from typing import TYPE_CHECKING, Iterable, Optional, Sequence
 
 from ..log import DUMP_PACKETS
 from . import TransportException
@@ -133,6 +133,18 @@ class UdpTransport(ProtocolBasedTransport):
         LOG.log(DUMP_PACKETS, f"sending packet: {chunk.hex()}")
         self.socket.sendall(chunk)
 
+    def write_chunks(self, chunks: Sequence[bytes]) -> None:
+        # every report is its own datagram, but skip the per-call overhead
+        assert self.socket is not None
+        send = self.socket.send
+        dump = LOG.isEnabledFor(DUMP_PACKETS)
+        for chunk in chunks:
+            if len(chunk) != 64:
+                raise TransportException("Unexpected data length")
+            if dump:
+                LOG.log(DUMP_PACKETS, f"sending packet: {chunk.hex()}")
+            send(chunk)
+
     def read_chunk(self) -> bytes:
         assert self.socket is not None
         while True:
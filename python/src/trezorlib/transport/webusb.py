@@ -18,7 +18,9 @@ import atexit
 import logging
 import sys
 import time
-from typing import Iterable, List, Optional
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Iterable, List, Optional, Sequence
 
 from ..log import DUMP_PACKETS
 from ..models import TREZORS, TrezorModel
@@ -41,13 +43,61 @@ DEBUG_INTERFACE = 1
 DEBUG_ENDPOINT = 2
 
 
+@dataclass
+class TransferStats:
+    """Bytes moved by a handle and the time spent waiting for them."""
+
+    bytes_written: int = 0
+    bytes_read: int = 0
+    write_time: float = 0.0
+    read_time: float = 0.0
+
+    @property
+    def write_speed(self) -> float:
+        """Achieved write throughput in bytes/s."""
+        return self.bytes_written / self.write_time if self.write_time else 0.0
+
+    @property
+    def read_speed(self) -> float:
+        """Achieved read throughput in bytes/s."""
+        return self.bytes_read / self.read_time if self.read_time else 0.0
+
+
 class WebUsbHandle:
-    def __init__(self, device: "usb1.USBDevice", debug: bool = False) -> None:
+    """WebUSB handle, optionally using asynchronous libusb transfers.
+
+    With `async_transfers` set to N > 0, up to N reports are kept in flight in each
+    direction: N interrupt IN transfers stay armed while the handle is open, and
+    `write_chunks` queues up to N OUT transfers at a time. Events are processed
+    through the libusb `context`, which is required in this mode.
+    """
+
+    def __init__(
+        self,
+        device: "usb1.USBDevice",
+        debug: bool = False,
+        context: Optional["usb1.USBContext"] = None,
+        async_transfers: int = 0,
+    ) -> None:
         self.device = device
         self.interface = DEBUG_INTERFACE if debug else INTERFACE
         self.endpoint = DEBUG_ENDPOINT if debug else ENDPOINT
         self.count = 0
         self.handle: Optional["usb1.USBDeviceHandle"] = None
+        self.context = context
+        self.async_transfers = async_transfers
+        self.stats = TransferStats()
+
+        if async_transfers and context is None:
+            raise ValueError("Asynchronous transfers require a libusb context")
+
+        self._reading = False
+        self._read_transfers: List["usb1.USBTransfer"] = []
+        self._read_queue: Deque[bytes] = deque()
+        self._write_transfers: Deque["usb1.USBTransfer"] = deque()
+        self._writes_pending = 0
+        self._transfer_error: Optional[TransportException] = None
+        self._read_error: Optional[TransportException] = None
 
     def open(self) -> None:
         self.handle = self.device.open()
@@ -62,33 +112,144 @@ class WebUsbHandle:
         except usb1.USBErrorAccess as e:
             raise DeviceIsBusy(self.device) from e
 
+        if self.async_transfers:
+            self._start_transfers()
+
     def close(self) -> None:
         if self.handle is not None:
+            if self.async_transfers:
+                self._stop_transfers()
             self.handle.releaseInterface(self.interface)
             self.handle.close()
         self.handle = None
 
     def write_chunk(self, chunk: bytes) -> None:
+        self.write_chunks((chunk,))
+
+    def write_chunks(self, chunks: Sequence[bytes]) -> None:
+        """Write several chunks, in a single interrupt transfer in synchronous mode.
+
+        The host controller splits the transfer into 64-byte packets, which the device
+        receives as separate reports.
+        """
         assert self.handle is not None
-        if len(chunk) != 64:
-            raise TransportException(f"Unexpected chunk size: {len(chunk)}")
-        LOG.log(DUMP_PACKETS, f"writing packet: {chunk.hex()}")
-        self.handle.interruptWrite(self.endpoint, chunk)
+        dump = LOG.isEnabledFor(DUMP_PACKETS)
+        for chunk in chunks:
+            if len(chunk) != 64:
+                raise TransportException(f"Unexpected chunk size: {len(chunk)}")
+            if dump:
+                LOG.log(DUMP_PACKETS, f"writing packet: {chunk.hex()}")
+
+        start = time.monotonic()
+        if self.async_transfers:
+            self._write_async(chunks)
+        else:
+            self.handle.interruptWrite(self.endpoint, b"".join(chunks))
+        self.stats.write_time += time.monotonic() - start
+        self.stats.bytes_written += 64 * len(chunks)
 
     def read_chunk(self) -> bytes:
         assert self.handle is not None
-        endpoint = 0x80 | self.endpoint
-        while True:
-            chunk = self.handle.interruptRead(endpoint, 64)
-            if chunk:
-                break
-            else:
-                time.sleep(0.001)
+        start = time.monotonic()
+        if self.async_transfers:
+            chunk = self._read_async()
+        else:
+            endpoint = 0x80 | self.endpoint
+            while True:
+                chunk = self.handle.interruptRead(endpoint, 64)
+                if chunk:
+                    break
+                else:
+                    time.sleep(0.001)
+        self.stats.read_time += time.monotonic() - start
         LOG.log(DUMP_PACKETS, f"read packet: {chunk.hex()}")
         if len(chunk) != 64:
             raise TransportException(f"Unexpected chunk size: {len(chunk)}")
+        self.stats.bytes_read += len(chunk)
         return chunk
 
+    def _start_transfers(self) -> None:
+        assert self.handle is not None
+        self._read_queue.clear()
+        self._transfer_error = None
+        self._read_error = None
+        self._reading = True
+        for _ in range(self.async_transfers):
+            transfer = self.handle.getTransfer()
+            transfer.setInterrupt(0x80 | self.endpoint, 64, callback=self._on_read)
+            transfer.submit()
+            self._read_transfers.append(transfer)
+
+            transfer = self.handle.getTransfer()
+            self._write_transfers.append(transfer)
+
+    def _stop_transfers(self) -> None:
+        assert self.context is not None
+        self._reading = False
+        for transfer in self._read_transfers:
+            if transfer.isSubmitted():
+                transfer.cancel()
+        while any(t.isSubmitted() for t in self._read_transfers) or (
+            self._writes_pending
+        ):
+            self.context.handleEvents()
+        for transfer in self._read_transfers + list(self._write_transfers):
+            transfer.close()
+        self._read_transfers.clear()
+        self._write_transfers.clear()
+
+    def _on_read(self, transfer: "usb1.USBTransfer") -> None:
+        status = transfer.getStatus()
+        if status == usb1.TRANSFER_COMPLETED:
+            length = transfer.getActualLength()
+            if length:
+                self._read_queue.append(bytes(transfer.getBuffer()[:length]))
+            if self._reading:
+                transfer.submit()
+        elif self._reading and self._read_error is None:
+            # The transfer is not resubmitted, so the error is kept until the handle
+            # is reopened and raised to every reader, instead of leaving them waiting
+            # for a report that can no longer arrive.
+            self._read_error = TransportException(
+                f"USB read transfer failed with status {status}"
+            )
+
+    def _on_write(self, transfer: "usb1.USBTransfer") -> None:
+        self._writes_pending -= 1
+        self._write_transfers.append(transfer)
+        status = transfer.getStatus()
+        if status != usb1.TRANSFER_COMPLETED and self._transfer_error is None:
+            self._transfer_error = TransportException(
+                f"USB write transfer failed with status {status}"
+            )
+
+    def _raise_transfer_error(self) -> None:
+        if self._transfer_error is not None:
+            error, self._transfer_error = self._transfer_error, None
+            raise error
+
+    def _write_async(self, chunks: Sequence[bytes]) -> None:
+        assert self.context is not None
+        queue = deque(chunks)
+        while queue or self._writes_pending:
+            while queue and self._write_transfers:
+                transfer = self._write_transfers.popleft()
+                transfer.setInterrupt(
+                    self.endpoint, queue.popleft(), callback=self._on_write
+                )
+                transfer.submit()
+                self._writes_pending += 1
+            self.context.handleEvents()
+            self._raise_transfer_error()
+
+    def _read_async(self) -> bytes:
+        assert self.context is not None
+        while not self._read_queue:
+            if self._read_error is not None:
+                raise self._read_error
+            self.context.handleEvents()
+        return self._read_queue.popleft()
+
 
 class WebUsbTransport(ProtocolBasedTransport):
     """
@@ -98,15 +259,28 @@ class WebUsbTransport(ProtocolBasedTransport):
     PATH_PREFIX = "webusb"
     ENABLED = USB_IMPORTED
     context = None
+    # number of reports kept in flight per direction, 0 for blocking transfers
+    ASYNC_TRANSFERS = 0
+    # Hotplug events are dispatched on a context of their own. Handling events on
+    # `context` would also run the completion callbacks of asynchronous transfers
+    # on the enumerating thread.
+    hotplug_context = None
+    _hotplug_supported = False
+    _hotplug_event = False
 
     def __init__(
         self,
         device: "usb1.USBDevice",
         handle: Optional[WebUsbHandle] = None,
         debug: bool = False,
+        async_transfers: Optional[int] = None,
     ) -> None:
         if handle is None:
-            handle = WebUsbHandle(device, debug)
+            if async_transfers is None:
+                async_transfers = self.ASYNC_TRANSFERS
+            handle = WebUsbHandle(
+                device, debug, context=self.context, async_transfers=async_transfers
+            )
 
         self.device = device
         self.handle = handle
@@ -118,13 +292,40 @@ class WebUsbTransport(ProtocolBasedTransport):
         return f"{self.PATH_PREFIX}:{dev_to_str(self.device)}"
 
     @classmethod
-    def enumerate(
-        cls, models: Optional[Iterable["TrezorModel"]] = None, usb_reset: bool = False
-    ) -> Iterable["WebUsbTransport"]:
+    def _open_context(cls) -> "usb1.USBContext":
         if cls.context is None:
             cls.context = usb1.USBContext()
             cls.context.open()
             atexit.register(cls.context.close)  # type: ignore [Param spec "_P@register" has no bound value]
+            if usb1.hasCapability(usb1.CAP_HAS_HOTPLUG):
+                cls.hotplug_context = usb1.USBContext()
+                cls.hotplug_context.open()
+                atexit.register(cls.hotplug_context.close)  # type: ignore [Param spec "_P@register" has no bound value]
+                cls.hotplug_context.hotplugRegisterCallback(cls._on_hotplug, flags=0)
+                cls._hotplug_supported = True
+        return cls.context
+
+    @classmethod
+    def _on_hotplug(cls, context: "usb1.USBContext", device: Any, event: int) -> bool:
+        cls._hotplug_event = True
+        return False  # keep the callback registered
+
+    @classmethod
+    def devices_changed(cls) -> bool:
+        # without hotplug support, callers fall back to the cache TTL
+        if not cls._hotplug_supported:
+            return False
+        # dispatch pending hotplug events without blocking
+        assert cls.hotplug_context is not None
+        cls.hotplug_context.handleEventsTimeout(0)
+        changed, cls._hotplug_event = cls._hotplug_event, False
+        return changed
+
+    @classmethod
+    def enumerate(
+        cls, models: Optional[Iterable["TrezorModel"]] = None, usb_reset: bool = False
+    ) -> Iterable["WebUsbTransport"]:
+        cls._open_context()
 
         if models is None:
             models = TREZORS
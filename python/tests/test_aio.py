@@ -0,0 +1,221 @@
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+import asyncio
+
+import pytest
+
+from trezorlib import mapping, messages
+from trezorlib.aio import AsyncTrezorClient, AsyncUdpTransport, btc as aio_btc
+from trezorlib.aio.transport import _HttpConnection
+from trezorlib.tools import parse_path
+from trezorlib.transport.protocol import ProtocolV1
+
+MAPPING = mapping.DEFAULT_MAPPING
+
+
+class FakeEmulator(asyncio.DatagramProtocol):
+    """Just enough of an emulator to answer a few messages over UDP."""
+
+    def __init__(self, name, hang_on=()):
+        self.name = name
+        self.hang_on = hang_on
+        self.received = []
+        self.buffer = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        if data == b"PINGPING":
+            self.transport.sendto(b"PONGPONG", addr)
+            return
+
+        if self.buffer is None:
+            msg_type, datalen, chunk = ProtocolV1.parse_first(data)
+            self.buffer = (msg_type, datalen, bytearray(chunk))
+        else:
+            self.buffer[2].extend(ProtocolV1.parse_next(data))
+
+        msg_type, datalen, buffer = self.buffer
+        if len(buffer) >= datalen:
+            self.buffer = None
+            msg = MAPPING.decode(msg_type, bytes(buffer[:datalen]))
+            self.received.append(msg)
+            response = self.respond(msg)
+            if response is not None:
+                for chunk in ProtocolV1.frame(*MAPPING.encode(response)):
+                    self.transport.sendto(chunk, addr)
+
+    def respond(self, msg):
+        if isinstance(msg, self.hang_on):
+            return None
+        if isinstance(msg, (messages.Initialize, messages.GetFeatures)):
+            return messages.Features(
+                vendor="trezor.io",
+                model="T",
+                major_version=2,
+                minor_version=5,
+                patch_version=3,
+                label=self.name,
+            )
+        if isinstance(msg, messages.GetAddress):
+            return messages.ButtonRequest(code=messages.ButtonRequestType.Address)
+        if isinstance(msg, messages.ButtonAck):
+            # a long response, to exercise multi-chunk messages
+            return messages.Address(address=self.name * 40)
+        if isinstance(msg, messages.Cancel):
+            return messages.Failure(code=messages.FailureType.ActionCancelled)
+        return messages.Failure(code=messages.FailureType.UnexpectedMessage)
+
+
+class SilentUI:
+    def button_request(self, br):
+        pass
+
+    def get_pin(self, code=None):
+        raise AssertionError("unexpected PIN request")
+
+    def get_passphrase(self, available_on_device):
+        raise AssertionError("unexpected passphrase request")
+
+
+async def start_emulators(count, **kwargs):
+    loop = asyncio.get_running_loop()
+    emulators = []
+    for i in range(count):
+        transport, emulator = await loop.create_datagram_endpoint(
+            lambda i=i: FakeEmulator(f"emu{i}", **kwargs),
+            local_addr=("127.0.0.1", 0),
+        )
+        host, port = transport.get_extra_info("sockname")
+        emulators.append((emulator, f"{host}:{port}"))
+    return emulators
+
+
+def test_concurrent_emulators():
+    async def run():
+        emulators = await start_emulators(4)
+
+        async def get_address(emulator, path):
+            client = await AsyncTrezorClient.create(AsyncUdpTransport(path), SilentUI())
+            assert client.features.label == emulator.name
+            return await aio_btc.get_address(
+                client, "Bitcoin", parse_path("m/84h/0h/0h/0/0"), show_display=True
+            )
+
+        try:
+            results = await asyncio.gather(
+                *(get_address(emulator, path) for emulator, path in emulators)
+            )
+        finally:
+            for emulator, _ in emulators:
+                emulator.transport.close()
+
+        for (emulator, _), address in zip(emulators, results):
+            assert address == emulator.name * 40
+            assert [type(m) for m in emulator.received] == [
+                messages.Initialize,
+                messages.GetAddress,
+                messages.ButtonAck,
+            ]
+
+    asyncio.run(run())
+
+
+def test_cancel_sends_cancel_message():
+    async def run():
+        [(emulator, path)] = await start_emulators(1, hang_on=(messages.GetAddress,))
+        client = await AsyncTrezorClient.create(AsyncUdpTransport(path), SilentUI())
+
+        task = asyncio.ensure_future(
+            aio_btc.get_address(client, "Bitcoin", parse_path("m/84h/0h/0h/0/0"))
+        )
+        while len(emulator.received) < 2:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert isinstance(emulator.received[-1], messages.Cancel)
+        # the connection is usable afterwards
+        features = await client.refresh_features()
+        assert features.label == emulator.name
+        emulator.transport.close()
+
+    asyncio.run(run())
+
+
+class FakeBridge:
+    """Answers the first request of every connection, then drops it unanswered."""
+
+    def __init__(self):
+        self.requests = []
+
+    async def handle(self, reader, writer):
+        answered = False
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line == b"\r\n":
+                    break
+                key, _, value = line.decode().partition(":")
+                if key.lower() == "content-length":
+                    length = int(value)
+            await reader.readexactly(length)
+            self.requests.append(request_line.split()[1].decode())
+            if answered:
+                break
+            answered = True
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\n[]")
+            await writer.drain()
+        writer.close()
+
+
+@pytest.mark.parametrize(
+    "path, retried",
+    (
+        ("enumerate", True),
+        ("debug/listen", True),
+        ("acquire/1/null", False),
+        ("call/1", False),
+        ("post/1", False),
+    ),
+)
+def test_bridge_retry_after_request_sent(path, retried):
+    async def run():
+        bridge = FakeBridge()
+        server = await asyncio.start_server(bridge.handle, "127.0.0.1", 0)
+        host, port = server.sockets[0].getsockname()
+        connection = _HttpConnection(f"http://{host}:{port}")
+        try:
+            assert await connection.post("configure") == (200, b"[]")
+            if retried:
+                assert await connection.post(path) == (200, b"[]")
+            else:
+                with pytest.raises(ConnectionError):
+                    await connection.post(path)
+        finally:
+            connection.close()
+            server.close()
+        return bridge.requests
+
+    requests = asyncio.run(run())
+    assert requests == ["/configure"] + ["/" + path] * (2 if retried else 1)
@@ -17,7 +17,7 @@
 import json
 from decimal import Decimal
 
-from trezorlib import btc
+from trezorlib import btc, messages
 
 
 # https://btc1.trezor.io/api/tx-specific/f5e735549daeb480d4348f2574b8967a4f149715edb220a742d8bb654d668348
@@ -235,3 +235,103 @@ def test_coinbase_from_json():
     assert coinbase.prev_hash == b"\x00" * 32
     assert coinbase.prev_index == 2 ** 32 - 1
     assert coinbase.script_sig.hex() == tx_dict["vin"][0]["coinbase"]
+
+
+def _tx_request(request_type, index, count=None, tx_hash=None):
+    return messages.TxRequest(
+        request_type=request_type,
+        details=messages.TxRequestDetailsType(
+            request_index=index, request_count=count, tx_hash=tx_hash
+        ),
+    )
+
+
+def _start_flow(inputs, outputs, prev_txes=None, batch=True):
+    signtx = btc.prepare_sign_tx("Bitcoin", inputs, outputs)
+    flow = btc.sign_tx_flow(signtx, inputs, outputs, prev_txes, batch=batch)
+    assert next(flow) is signtx
+    return flow
+
+
+def test_sign_tx_flow_batch():
+    R = messages.RequestType
+    inputs = [messages.TxInputType(prev_hash=bytes(32), prev_index=i) for i in range(5)]
+    outputs = [messages.TxOutputType(amount=i, address="x") for i in range(3)]
+    flow = _start_flow(inputs, outputs)
+
+    ack = flow.send(_tx_request(R.TXINPUT, 0, 2))
+    assert ack.tx.inputs == inputs[0:2]
+    ack = flow.send(_tx_request(R.TXINPUT, 3, 16))
+    assert ack.tx.inputs == inputs[3:5]
+    ack = flow.send(_tx_request(R.TXOUTPUT, 1))
+    assert ack.tx.outputs == outputs[1:2]
+    ack = flow.send(_tx_request(R.TXOUTPUT, 0, 16))
+    assert ack.tx.outputs == outputs
+
+
+def test_sign_tx_flow_batch_prev():
+    R = messages.RequestType
+    prev_hash = b"\x01" * 32
+    prevtx = messages.TransactionType(
+        bin_outputs=[
+            messages.TxOutputBinType(amount=i, script_pubkey=bytes(22))
+            for i in range(4)
+        ]
+    )
+    inputs = [messages.TxInputType(prev_hash=prev_hash, prev_index=0)]
+    flow = _start_flow(inputs, [], {prev_hash: prevtx})
+
+    ack = flow.send(_tx_request(R.TXOUTPUT, 1, 2, prev_hash))
+    assert ack.tx.bin_outputs == prevtx.bin_outputs[1:3]
+
+
+def test_sign_tx_flow_batch_size():
+    R = messages.RequestType
+    # each input takes about 1 kB
+    inputs = [
+        messages.TxInputType(prev_hash=bytes(32), prev_index=i, script_sig=bytes(1000))
+        for i in range(16)
+    ]
+    flow = _start_flow(inputs, [])
+
+    ack = flow.send(_tx_request(R.TXINPUT, 0, 16))
+    assert 1 < len(ack.tx.inputs) < 16
+    assert ack.tx.inputs == inputs[: len(ack.tx.inputs)]
+
+
+def test_sign_tx_flow_no_batch():
+    R = messages.RequestType
+    inputs = [messages.TxInputType(prev_hash=bytes(32), prev_index=i) for i in range(5)]
+    flow = _start_flow(inputs, [], batch=False)
+
+    ack = flow.send(_tx_request(R.TXINPUT, 0, 16))
+    assert ack.tx.inputs == inputs[0:1]
+
+
+class AddressClient:
+    """Answers BatchGetAddresses with made up addresses."""
+
+    def __init__(self):
+        self.requests = []
+
+    def call(self, msg):
+        self.requests.append((msg.start_index, msg.count))
+        indexes = range(msg.start_index, msg.start_index + msg.count)
+        return messages.Addresses(addresses=[f"addr{i}" for i in indexes])
+
+
+def test_discover_addresses():
+    client = AddressClient()
+    used = {"addr3", "addr25"}
+    found = btc.discover_addresses(
+        client, "Bitcoin", [], used.__contains__, gap_limit=10, batch_size=8
+    )
+    # addr25 is beyond the gap after addr3
+    assert found == [f"addr{i}" for i in range(4)]
+    assert client.requests == [(0, 8), (8, 6)]
+
+
+def test_discover_addresses_unused():
+    client = AddressClient()
+    assert btc.discover_addresses(client, "Bitcoin", [], lambda _: False) == []
+    assert client.requests == [(0, btc.DEFAULT_GAP_LIMIT)]
@@ -0,0 +1,104 @@
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+import posixpath
+from hashlib import blake2s
+
+import pytest
+
+from trezorlib import device, messages
+
+# what the device asks for in one ResourceRequest
+WINDOW = 64 * 1024
+
+
+class ResourceClient:
+    """Keeps the resource directory and asks for the data in windows."""
+
+    def __init__(self, files):
+        self.files = dict(files)
+        self.messages = []
+        self.pending = None
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def call(self, msg):
+        self.messages.append(type(msg).__name__)
+        if isinstance(msg, messages.ListResDir):
+            directory = msg.path[len(device.RES_DIR) :].strip("/")
+            return messages.FileInfoList(
+                files=[
+                    messages.FileInfo(
+                        name=posixpath.basename(name),
+                        size=len(data),
+                        # no hash of empty files, as in earlier firmware
+                        hash=blake2s(data).digest() if msg.with_hash and data else None,
+                    )
+                    for name, data in self.files.items()
+                    if posixpath.dirname(name) == directory
+                ]
+            )
+        if isinstance(msg, messages.ResourceUpdate):
+            assert msg.file_hash is not None
+            self.pending = msg, bytearray(msg.initial_data_chunk)
+        else:
+            assert isinstance(msg, messages.ResourceAck)
+            assert blake2s(msg.data_chunk).digest() == msg.hash
+            self.pending[1].extend(msg.data_chunk)
+
+        update, data = self.pending
+        if len(data) < update.data_length:
+            length = min(WINDOW, update.data_length - len(data))
+            return messages.ResourceRequest(offset=len(data), data_length=length)
+        assert blake2s(data).digest() == update.file_hash
+        self.files[update.file_name] = bytes(data)
+        return messages.Success(message="Success")
+
+
+def test_update_res():
+    client = ResourceClient({})
+    data = bytes(range(256)) * 1000
+    device.update_res(client, "icon.toif", data)
+    assert client.files["icon.toif"] == data
+    # 16 KiB in ResourceUpdate, then one window per ResourceAck
+    assert client.messages.count("ResourceAck") == 4
+
+
+def test_sync_res():
+    stored = {"a.toif": b"a" * 100, "empty": b"", "icons/b.toif": b"b" * 100}
+    client = ResourceClient(stored)
+    bundle = {
+        "a.toif": b"a" * 100,
+        "empty": b"",
+        "icons/b.toif": b"B" * 100,
+        "icons/c.toif": b"c" * 20000,
+    }
+
+    assert device.sync_res(client, bundle) == ["icons/b.toif", "icons/c.toif"]
+    assert client.files == bundle
+    assert client.messages.count("ListResDir") == 2
+
+    # nothing is sent the second time
+    assert device.sync_res(client, bundle) == []
+
+
+def test_sync_res_bootloader():
+    with pytest.raises(ValueError):
+        device.sync_res(ResourceClient({}), {device.BOOTLOADER_NAME: b""})
@@ -0,0 +1,86 @@
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+from trezorlib import ethereum
+
+DATA = {
+    "types": {
+        "EIP712Domain": [
+            {"name": "name", "type": "string"},
+            {"name": "chainId", "type": "uint256"},
+        ],
+        "Person": [
+            {"name": "name", "type": "string"},
+            {"name": "wallets", "type": "address[]"},
+        ],
+        "Group": [
+            {"name": "members", "type": "Person[]"},
+            {"name": "scores", "type": "uint8[2]"},
+            {"name": "owner", "type": "Person"},
+        ],
+    },
+    "primaryType": "Group",
+    "domain": {"name": "Groups", "chainId": 1},
+    "message": {
+        "members": [
+            {"name": "Cow", "wallets": ["0x" + "11" * 20, "0x" + "22" * 20]},
+            {"name": "Bob", "wallets": []},
+        ],
+        "scores": [3, 4],
+        "owner": {"name": "Alice", "wallets": ["0x" + "33" * 20]},
+    },
+}
+
+
+def test_typed_data_member_paths():
+    values = ethereum._TypedDataValues(DATA)
+    assert values.paths == [
+        [0, 0],
+        [0, 1],
+        [1, 0],  # length of members
+        [1, 0, 0, 0],
+        [1, 0, 0, 1],  # length of members[0].wallets
+        [1, 0, 0, 1, 0],
+        [1, 0, 0, 1, 1],
+        [1, 0, 1, 0],
+        [1, 0, 1, 1],
+        [1, 1, 0],  # scores have a fixed length
+        [1, 1, 1],
+        [1, 2, 0],
+        [1, 2, 1],
+        [1, 2, 1, 0],
+    ]
+    # the values are the same as when they are requested one by one
+    for path in values.paths:
+        (value,) = values.chunk(path, 0)
+        assert value.member_path == path
+        assert value.value == ethereum._typed_data_value(DATA, path)
+
+
+def test_typed_data_values_chunk():
+    values = ethereum._TypedDataValues(DATA)
+
+    chunk = values.chunk([1, 0, 0, 1], 4096)
+    assert [value.member_path for value in chunk] == values.paths[4:]
+
+    chunk = values.chunk([1, 0, 0, 1], 60)
+    assert 1 < len(chunk) < len(values.paths) - 4
+    assert [value.member_path for value in chunk] == values.paths[4 : 4 + len(chunk)]
+
+    # the length of an array comes before its entries
+    chunk = values.chunk([1, 0], 4096)
+    assert chunk[0].value == (2).to_bytes(2, "big")
+    assert chunk[1].member_path == [1, 0, 0, 0]
@@ -0,0 +1,173 @@
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+
+import construct as c
+import pytest
+from click.testing import CliRunner
+
+from trezorlib import cosi, firmware
+from trezorlib.cli.firmware import cli
+
+PRIVKEY = hashlib.sha256(b"test vendor key").digest()
+PUBKEY = cosi.pubkey_from_privkey(PRIVKEY)
+
+
+def sign(digest):
+    nonce, commit = cosi.get_nonce(PRIVKEY, digest)
+    signature = cosi.sign_with_privkey(digest, PRIVKEY, PUBKEY, nonce, commit)
+    return cosi.combine_sig(commit, [signature])
+
+
+def make_image(code_size):
+    vendor_header = c.Container(
+        magic=b"OKTV",
+        header_len=1024,
+        expiry=0,
+        version=c.Container(major=1, minor=0),
+        sig_m=1,
+        trust=c.Container(
+            show_vendor_string=False,
+            require_user_click=False,
+            red_background=False,
+            delay=0,
+        ),
+        pubkeys=[PUBKEY],
+        text="test vendor",
+        image=c.Container(
+            format=firmware.ToifMode.full_color, width=1, height=1, data=bytes(8)
+        ),
+        sigmask=1,
+        signature=bytes(64),
+    )
+    vendor_header.signature = sign(firmware.header_digest(vendor_header))
+
+    version = c.Container(major=2, minor=0, patch=0, build=0)
+    code = bytes(i % 251 for i in range(code_size))
+    header = c.Container(
+        magic=firmware.HeaderType.FIRMWARE,
+        header_len=1024,
+        expiry=0,
+        code_length=len(code),
+        version=version,
+        fix_version=version,
+        onekey_version=version,
+        hash_block=0,
+        hashes=[],
+        purpose=0,
+        se_minimum_version=version,
+        build_id=bytes(16),
+        sigmask=1,
+        signature=bytes(64),
+    )
+    header.hashes, _ = firmware.calculate_code_hashes(code, 2048)
+    header.signature = sign(firmware.header_digest(header))
+    return (
+        firmware.VendorHeader.build(vendor_header)
+        + firmware.FirmwareHeader.build(header)
+        + code
+    )
+
+
+@pytest.fixture
+def test_keys(monkeypatch):
+    monkeypatch.setattr(firmware, "V2_BOOTLOADER_KEYS", [PUBKEY])
+    monkeypatch.setattr(firmware, "V2_SIGS_REQUIRED", 1)
+
+
+def public_fields(container):
+    return {k: v for k, v in container.items() if not k.startswith("_")}
+
+
+@pytest.mark.parametrize("code_size", (1000, 300_000, 5_000_000))
+def test_parse_view(code_size):
+    data = make_image(code_size)
+    version, fw = firmware.parse(data)
+    version_view, fw_view = firmware.parse_view(data)
+
+    assert version_view == version == firmware.FirmwareFormat.TREZOR_T
+    assert public_fields(fw_view.vendor_header) == public_fields(fw.vendor_header)
+    assert public_fields(fw_view.image.header) == public_fields(fw.image.header)
+    assert fw_view.image._code_offset == fw.image._code_offset
+    assert isinstance(fw_view.image.code, memoryview)
+    assert fw_view.image.code == fw.image.code
+    assert firmware.digest(version, fw_view) == firmware.digest(version, fw)
+
+
+def test_parse_view_errors():
+    data = make_image(1000)
+    with pytest.raises(ValueError):
+        firmware.parse_view(b"")
+    with pytest.raises(firmware.FirmwareIntegrityError):
+        firmware.parse_view(data[:-1])
+    with pytest.raises(firmware.FirmwareIntegrityError):
+        firmware.parse_view(data + b"\0")
+
+
+@pytest.mark.parametrize("code_size", (0, 1000, 5_000_000))
+@pytest.mark.parametrize("padding_byte", (None, b"\xff"))
+def test_parallel_code_hashes(code_size, padding_byte):
+    code = bytes(i % 251 for i in range(code_size))
+    expected = firmware.calculate_code_hashes(code, 2048, padding_byte=padding_byte)
+    with ThreadPoolExecutor(4) as executor:
+        hashes = firmware.calculate_code_hashes(
+            memoryview(code), 2048, padding_byte=padding_byte, executor=executor
+        )
+    assert hashes == expected
+
+
+def test_validate_file(tmp_path, test_keys):
+    path = tmp_path / "firmware.bin"
+    data = make_image(300_000)
+    path.write_bytes(data)
+
+    version, fw = firmware.parse(data)
+    firmware.validate(version, fw)
+    with ThreadPoolExecutor(4) as executor:
+        assert firmware.validate_file(path, executor=executor) == (
+            version,
+            firmware.digest(version, fw),
+        )
+
+    corrupted = bytearray(data)
+    corrupted[-1] ^= 1
+    path.write_bytes(corrupted)
+    with pytest.raises(firmware.FirmwareIntegrityError):
+        firmware.validate_file(path)
+
+
+def test_verify_directory(tmp_path, test_keys):
+    data = make_image(300_000)
+    (tmp_path / "a.bin").write_bytes(data)
+    (tmp_path / "b.bin").write_bytes(data[:-1] + bytes([data[-1] ^ 1]))
+    (tmp_path / "c.bin").write_bytes(b"garbage")
+    (tmp_path / "notes.txt").write_bytes(b"not an image")
+
+    result = CliRunner().invoke(cli, ["verify", str(tmp_path)])
+    assert result.exit_code == 4
+    lines = result.output.splitlines()
+    assert lines[0].startswith("a.bin: TREZOR_T ")
+    assert lines[0].endswith(" OK")
+    assert lines[1] == "b.bin: FAILED (Invalid firmware data.)"
+    assert lines[2] == "c.bin: FAILED (Unrecognized firmware image type)"
+    assert lines[3] == "1 of 3 images are valid."
+
+    (tmp_path / "b.bin").unlink()
+    (tmp_path / "c.bin").unlink()
+    result = CliRunner().invoke(cli, ["verify", str(tmp_path)])
+    assert result.exit_code == 0
@@ -0,0 +1,216 @@
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+import logging
+from enum import IntEnum
+from io import BytesIO
+
+import pytest
+
+from trezorlib import messages, protobuf
+
+MESSAGE_CLASSES = sorted(
+    (
+        cls
+        for cls in vars(messages).values()
+        if protobuf.safe_issubclass(cls, protobuf.MessageType)
+        and cls is not protobuf.MessageType
+        and cls.__module__ == messages.__name__
+    ),
+    key=lambda cls: cls.__name__,
+)
+
+SAMPLE_VALUES = {
+    "uint32": 0xFFFF_FFFF,
+    "uint64": 0xFFFF_FFFF_FFFF_FFFF,
+    "sint32": -(2**31),
+    "sint64": 2**63 - 1,
+    "bool": True,
+    "bytes": b"\x00\xca\xfe",
+    "string": "Příliš žluťoučký kůň",
+}
+
+
+def sample_message(msg_type, depth=0):
+    kwargs = {}
+    for field in msg_type.FIELDS.values():
+        field_type_object = protobuf.get_field_type_object(field)
+        if protobuf.safe_issubclass(field_type_object, protobuf.MessageType):
+            # only keep filling in optional submessages up to a reasonable depth
+            if depth >= 3 and not field.required:
+                continue
+            value = sample_message(field_type_object, depth + 1)
+        elif protobuf.safe_issubclass(field_type_object, IntEnum):
+            value = list(field_type_object)[-1]
+        else:
+            value = SAMPLE_VALUES[field.type]
+
+        kwargs[field.name] = [value, value] if field.repeated else value
+    return msg_type(**kwargs)
+
+
+def dump_reference(writer, msg):
+    """The writer-based encoder `dump_message_buffer` replaced, kept as a reference."""
+    for ftag, field in msg.FIELDS.items():
+        fvalue = getattr(msg, field.name, None)
+        if fvalue is None:
+            continue
+
+        fkey = (ftag << 3) | field.wire_type
+        if not field.repeated:
+            fvalue = [fvalue]
+
+        field_type_object = protobuf.get_field_type_object(field)
+        for svalue in fvalue:
+            protobuf.dump_uvarint(writer, fkey)
+
+            if protobuf.safe_issubclass(field_type_object, protobuf.MessageType):
+                sub = BytesIO()
+                dump_reference(sub, svalue)
+                protobuf.dump_uvarint(writer, len(sub.getvalue()))
+                writer.write(sub.getvalue())
+            elif field.type.startswith("sint"):
+                protobuf.dump_uvarint(writer, protobuf.sint_to_uint(svalue))
+            elif field.type == "bytes":
+                protobuf.dump_uvarint(writer, len(svalue))
+                writer.write(svalue)
+            elif field.type == "string":
+                svalue_bytes = svalue.encode()
+                protobuf.dump_uvarint(writer, len(svalue_bytes))
+                writer.write(svalue_bytes)
+            else:  # uint, bool, enum
+                protobuf.dump_uvarint(writer, int(svalue))
+
+
+def dump_streaming(msg):
+    writer = BytesIO()
+    dump_reference(writer, msg)
+    return writer.getvalue()
+
+
+@pytest.mark.parametrize("msg_type", MESSAGE_CLASSES, ids=lambda c: c.__name__)
+def test_compiled_roundtrip(msg_type):
+    msg = sample_message(msg_type)
+
+    encoded = protobuf.dump_message_buffer(msg)
+    assert encoded == dump_streaming(msg)
+    writer = BytesIO()
+    protobuf.dump_message(writer, msg)
+    assert writer.getvalue() == encoded
+
+    decoded = protobuf.load_message_buffer(encoded, msg_type)
+    assert decoded == msg
+    assert decoded == protobuf.load_message(BytesIO(encoded), msg_type)
+    assert list(decoded.__dict__) == list(msg.__dict__)
+
+    if not any(f.required for f in msg_type.FIELDS.values()):
+        assert protobuf.load_message_buffer(b"", msg_type) == msg_type()
+
+
+def test_compiled_memoryview():
+    msg = messages.TxAckPrevMeta(
+        tx=messages.PrevTx(
+            version=2, lock_time=0, inputs_count=1, outputs_count=2, extra_data_len=0
+        )
+    )
+    encoded = protobuf.dump_message_buffer(msg)
+    padded = memoryview(b"\xff" + encoded + b"\xff")[1:-1]
+    assert protobuf.load_message_buffer(padded, messages.TxAckPrevMeta) == msg
+
+
+def test_compiled_plan_cached():
+    protobuf.dump_message_buffer(messages.Initialize())
+    plan = protobuf.get_message_plan(messages.Initialize)
+    assert protobuf.get_message_plan(messages.Initialize) is plan
+    assert messages.Initialize.__dict__["_PLAN"] is plan
+    assert protobuf.get_message_plan(messages.Ping) is not plan
+
+
+def test_compiled_errors(caplog):
+    caplog.set_level(logging.INFO)
+
+    with pytest.raises(ValueError, match="does not fit into uint32"):
+        protobuf.dump_message_buffer(
+            messages.TxInputType(prev_hash=b"", prev_index=2**32)
+        )
+
+    with pytest.raises(ValueError, match="unknown for"):
+        protobuf.dump_message_buffer(
+            messages.TxInputType(prev_hash=b"", prev_index=0, script_type=99)  # type: ignore
+        )
+
+    with pytest.raises(ValueError, match="was not provided"):
+        with pytest.deprecated_call():
+            protobuf.dump_message_buffer(messages.TxAckPrevMeta())
+
+    with pytest.raises(ValueError, match="Did not receive value for field"):
+        protobuf.load_message_buffer(b"", messages.TxAckPrevMeta)
+
+    # wire type mismatch
+    with pytest.raises(ValueError, match="does not match schema"):
+        protobuf.load_message_buffer(b"\x08\x00", messages.Ping)
+
+    # truncated varint
+    with pytest.raises(IOError):
+        protobuf.load_message_buffer(b"\x10\x80", messages.Ping)
+
+    # unknown fields are skipped
+    msg = protobuf.load_message_buffer(b"\xf8\x07\x01\xfa\x07\x02ab", messages.Ping)
+    assert msg == messages.Ping()
+
+    # truncated unknown field
+    with pytest.raises(ValueError, match="unknown field"):
+        protobuf.load_message_buffer(b"\xf8\x07\x01\xfa\x07\x05ab", messages.Ping)
+
+    # unknown enum values are logged and kept as plain integers
+    msg = protobuf.load_message_buffer(
+        b"\x12\x00\x18\x00\x30\x63", messages.TxInputType
+    )
+    assert msg.script_type == 99
+    assert caplog.records
+
+
+class NestedBlob(protobuf.MessageType):
+    FIELDS = {
+        1: protobuf.Field("blob", "bytes"),
+        2: protobuf.Field("inner", "NestedBlob"),
+    }
+
+
+@pytest.fixture
+def nested_blob(monkeypatch):
+    # the field type is looked up in the messages module by name
+    monkeypatch.setattr(messages, "NestedBlob", NestedBlob, raising=False)
+
+
+@pytest.mark.parametrize(
+    "blob_size, inner_size",
+    ((0, 2), (100, 102), (127, 129), (128, 131), (20_000, 20_004)),
+)
+def test_nested_lengths(nested_blob, blob_size, inner_size):
+    msg = NestedBlob(blob=b"\xaa" * blob_size)
+    for _ in range(8):
+        msg = NestedBlob(blob=b"\x55", inner=msg)
+
+    encoded = protobuf.dump_message_buffer(msg)
+    assert msg.ByteSize() == len(encoded)
+    # decode with the independent streaming decoder
+    assert protobuf.load_message(BytesIO(encoded), NestedBlob) == msg
+
+    inner = msg
+    for _ in range(8):
+        inner = inner.inner
+    assert inner.ByteSize() == inner_size
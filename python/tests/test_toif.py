@@ -0,0 +1,141 @@
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+import random
+import struct
+
+import pytest
+
+from trezorlib import firmware, toif
+
+# the pixel-by-pixel conversions the vectorized ones must match
+
+
+def ref_from_rgb(pixels, little_endian):
+    data = bytearray()
+    for i in range(0, len(pixels), 3):
+        r, g, b = pixels[i : i + 3]
+        c = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | ((b & 0xF8) >> 3)
+        data += struct.pack("<H" if little_endian else ">H", c)
+    return bytes(data)
+
+
+def ref_to_rgb(data, little_endian):
+    res = bytearray()
+    for i in range(0, len(data), 2):
+        (c,) = struct.unpack("<H" if little_endian else ">H", data[i : i + 2])
+        res += bytes(((c & 0xF800) >> 8, (c & 0x07E0) >> 3, (c & 0x001F) << 3))
+    return bytes(res)
+
+
+def ref_from_grayscale(pixels, right_hi):
+    data = bytearray()
+    for i in range(0, len(pixels), 2):
+        left, right = pixels[i], pixels[i + 1]
+        if right_hi:
+            data.append((right & 0xF0) | ((left & 0xF0) >> 4))
+        else:
+            data.append((left & 0xF0) | ((right & 0xF0) >> 4))
+    return bytes(data)
+
+
+def ref_from_grayscale_alpha(pixels, right_hi):
+    premultiplied = [
+        int((pixels[i] * pixels[i + 1]) / 255) for i in range(0, len(pixels), 2)
+    ]
+    return ref_from_grayscale(premultiplied, right_hi)
+
+
+def ref_to_grayscale(data, right_hi):
+    res = bytearray()
+    for pixel in data:
+        high, low = pixel & 0xF0, (pixel & 0x0F) << 4
+        res += bytes((low, high) if right_hi else (high, low))
+    return bytes(res)
+
+
+@pytest.fixture(params=["numpy", "bytes"])
+def implementation(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(toif, "NUMPY_AVAILABLE", False)
+
+
+def random_bytes(length):
+    rng = random.Random(length)
+    return bytes(rng.getrandbits(8) for _ in range(length))
+
+
+ALL_PAIRS = bytes(i for v in range(256) for a in range(256) for i in (v, a))
+
+
+@pytest.mark.parametrize("flag", (True, False))
+def test_conversions(implementation, flag):
+    rgb = random_bytes(3 * 1000)
+    assert toif._from_pil_rgb(rgb, flag) == ref_from_rgb(rgb, flag)
+
+    rgb565 = random_bytes(2 * 1000)
+    assert toif._to_rgb(rgb565, flag) == ref_to_rgb(rgb565, flag)
+
+    gray = random_bytes(1000)
+    assert toif._from_pil_grayscale(gray, flag) == ref_from_grayscale(gray, flag)
+    assert toif._to_grayscale(gray, flag) == ref_to_grayscale(gray, flag)
+
+    # every value and alpha combination
+    assert toif._from_pil_grayscale_alpha(ALL_PAIRS, flag) == ref_from_grayscale_alpha(
+        ALL_PAIRS, flag
+    )
+
+
+def test_conversions_empty(implementation):
+    assert toif._from_pil_rgb(b"", True) == b""
+    assert toif._to_rgb(b"", False) == b""
+    assert toif._from_pil_grayscale(b"", True) == b""
+    assert toif._from_pil_grayscale_alpha(b"", True) == b""
+    assert toif._to_grayscale(b"", False) == b""
+
+
+def test_from_images(implementation):
+    Image = pytest.importorskip("PIL.Image")
+    images = [
+        Image.frombytes("RGB", (5, 3), random_bytes(5 * 3 * 3)),
+        Image.frombytes("L", (4, 4), random_bytes(4 * 4)),
+        Image.frombytes("RGBA", (3, 3), random_bytes(3 * 3 * 4)),
+        Image.frombytes("LA", (6, 1), random_bytes(6 * 2)),
+        Image.frombytes("L", (2, 7), random_bytes(2 * 7)),
+    ]
+
+    for legacy_format in (True, False):
+        toifs = toif.from_images(images, legacy_format=legacy_format)
+        assert toifs == [
+            toif.from_image(im, legacy_format=legacy_format) for im in images
+        ]
+
+    assert [t.mode for t in toifs] == [
+        firmware.ToifMode.full_color_le,
+        firmware.ToifMode.grayscale_eh,
+        firmware.ToifMode.full_color_le,
+        firmware.ToifMode.grayscale_eh,
+        firmware.ToifMode.grayscale_eh,
+    ]
+    decoded = toif.to_images(toifs)
+    assert [im.tobytes() for im in decoded] == [t.to_image().tobytes() for t in toifs]
+    # grayscale loses the low nibble only
+    assert decoded[1].tobytes() == bytes(p & 0xF0 for p in images[1].tobytes())
+
+    with pytest.raises(ValueError):
+        toif.from_images([Image.new("L", (3, 2))])
@@ -15,10 +15,24 @@
 # If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
 
 import importlib
+import json
+import struct
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest import mock
 
-from trezorlib.transport import all_transports
+import pytest
+
+import trezorlib.transport as transport_module
+from trezorlib.transport import (
+    Transport,
+    TransportException,
+    all_transports,
+    protocol as protocol_module,
+)
 from trezorlib.transport.bridge import BridgeTransport
+from trezorlib.transport.protocol import ProtocolV1
 
 
 def test_disabled_transport():
@@ -53,3 +67,413 @@ def test_transport_dependencies():
     with mock.patch.dict("sys.modules", {"hid": mock.Mock()}):
         importlib.reload(hid_transport)
         assert hid_transport.HidTransport.ENABLED
+
+
+class FakeHandle:
+    """In-memory loopback handle: written chunks are read back in order."""
+
+    def __init__(self):
+        self.chunks = []
+        self.writes = 0
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def write_chunk(self, chunk):
+        assert len(chunk) == 64
+        self.writes += 1
+        self.chunks.append(bytes(chunk))
+
+    def read_chunk(self):
+        return self.chunks.pop(0)
+
+
+class FakeBatchHandle(FakeHandle):
+    def write_chunks(self, chunks):
+        assert all(len(chunk) == 64 for chunk in chunks)
+        self.writes += 1
+        self.chunks.extend(bytes(chunk) for chunk in chunks)
+
+
+@pytest.mark.parametrize("handle_class", (FakeHandle, FakeBatchHandle))
+@pytest.mark.parametrize("size", (0, 1, 55, 56, 57, 118, 119, 120, 5000))
+def test_protocol_v1_roundtrip(handle_class, size):
+    handle = handle_class()
+    protocol = ProtocolV1(handle)
+    data = bytes(i & 0xFF for i in range(size))
+
+    protocol.write(0x1234, data)
+    # 2 bytes of magic, 6 bytes of header, 63 bytes of payload per report
+    expected_chunks = max(1, -(-(size + 8) // 63))
+    assert len(handle.chunks) == expected_chunks
+    assert handle.writes == (1 if handle_class is FakeBatchHandle else expected_chunks)
+    assert handle.chunks[0][:9] == b"?##\x12\x34" + size.to_bytes(4, "big")
+
+    msg_type, msg_data = protocol.read()
+    assert msg_type == 0x1234
+    assert msg_data == data
+    assert not handle.chunks
+
+
+def test_protocol_v1_frame_matches_legacy():
+    data = bytes(range(256)) * 3
+    buffer = bytearray(b"##" + struct.pack(">HL", 17, len(data)) + data)
+    legacy = []
+    while buffer:
+        legacy.append(bytes((b"?" + buffer[:63]).ljust(64, b"\x00")))
+        buffer = buffer[63:]
+    assert ProtocolV1.frame(17, data) == legacy
+
+
+def test_protocol_v1_large_header(monkeypatch):
+    monkeypatch.setattr(protocol_module, "MAX_PREALLOC", 100)
+    handle = FakeBatchHandle()
+    protocol = ProtocolV1(handle)
+    data = b"\xab" * 1000
+    protocol.write(1, data)
+    assert protocol.read() == (1, data)
+
+
+class FakeUsbTransfer:
+    def __init__(self, usb):
+        self.usb = usb
+        self.submitted = False
+        self.cancelled = False
+        self.closed = False
+
+    def setInterrupt(self, endpoint, buffer_or_len, callback=None):
+        self.endpoint = endpoint
+        self.buffer = bytearray(buffer_or_len)
+        self.callback = callback
+        self.length = 0
+
+    def submit(self):
+        assert not self.submitted and not self.closed
+        self.submitted = True
+        self.cancelled = False
+        self.usb.pending.append(self)
+
+    def isSubmitted(self):
+        return self.submitted
+
+    def cancel(self):
+        self.cancelled = True
+
+    def getStatus(self):
+        return self.status
+
+    def getActualLength(self):
+        return self.length
+
+    def getBuffer(self):
+        return self.buffer
+
+    def close(self):
+        self.closed = True
+
+    def complete(self, status):
+        self.usb.pending.remove(self)
+        self.submitted = False
+        self.status = status
+        self.callback(self)
+
+
+class FakeUsb:
+    """Loopback stand-in for a usb1 context, device and device handle.
+
+    Every report written to the OUT endpoint is returned on the IN endpoint.
+    """
+
+    def __init__(self):
+        self.pending = []
+        self.reports = []
+        self.max_writes_in_flight = 0
+        # status of reads completed without a report, None to keep them pending
+        self.read_status = None
+
+    # usb1.USBDevice
+    def open(self):
+        return self
+
+    # usb1.USBDeviceHandle
+    def claimInterface(self, interface):
+        pass
+
+    def releaseInterface(self, interface):
+        pass
+
+    def close(self):
+        pass
+
+    def getTransfer(self):
+        return FakeUsbTransfer(self)
+
+    # usb1.USBContext
+    def handleEvents(self):
+        import usb1
+
+        writes = [t for t in self.pending if not t.endpoint & 0x80]
+        self.max_writes_in_flight = max(self.max_writes_in_flight, len(writes))
+        for transfer in list(self.pending):
+            if transfer.cancelled:
+                transfer.complete(usb1.TRANSFER_CANCELLED)
+            elif transfer in writes:
+                self.reports.append(bytes(transfer.buffer))
+                transfer.complete(usb1.TRANSFER_COMPLETED)
+            elif self.reports:
+                transfer.buffer[:] = self.reports.pop(0)
+                transfer.length = len(transfer.buffer)
+                transfer.complete(usb1.TRANSFER_COMPLETED)
+            elif self.read_status is not None:
+                transfer.complete(self.read_status)
+
+
+def test_webusb_async_transfers():
+    pytest.importorskip("usb1")
+    from trezorlib.transport.webusb import WebUsbHandle
+
+    usb = FakeUsb()
+    handle = WebUsbHandle(usb, context=usb, async_transfers=4)
+    protocol = ProtocolV1(handle)
+    protocol.begin_session()
+
+    data = bytes(i & 0xFF for i in range(5000))
+    protocol.write(7, data)
+    assert usb.max_writes_in_flight == 4
+    assert protocol.read() == (7, data)
+
+    protocol.end_session()
+    assert not usb.pending
+    assert handle.stats.bytes_written == handle.stats.bytes_read == 80 * 64
+    assert handle.stats.write_speed > 0
+
+
+@pytest.mark.parametrize("status", ("TRANSFER_STALL", "TRANSFER_CANCELLED"))
+def test_webusb_async_read_error(status):
+    usb1 = pytest.importorskip("usb1")
+    from trezorlib.transport.webusb import WebUsbHandle
+
+    usb = FakeUsb()
+    handle = WebUsbHandle(usb, context=usb, async_transfers=4)
+    handle.open()
+    usb.read_status = getattr(usb1, status)
+
+    # every reader gets the error, none of them waits for a report forever
+    for _ in range(2):
+        with pytest.raises(TransportException, match="read transfer failed"):
+            handle.read_chunk()
+
+    handle.close()
+    assert not usb.pending
+
+    # reopening arms new transfers
+    usb.read_status = None
+    handle.open()
+    handle.write_chunk(b"\x3f" * 64)
+    assert handle.read_chunk() == b"\x3f" * 64
+    handle.close()
+
+
+class StubBridgeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0))).decode()
+        action = self.path.strip("/").split("/")[0]
+        self.server.calls.append(action)
+        if action == "configure":
+            response = json.dumps({"version": "2.0.33"})
+        elif action == "enumerate":
+            response = json.dumps([{"path": "1", "session": None}])
+        elif action == "acquire":
+            response = json.dumps({"session": "1"})
+        elif action == "post":
+            self.server.messages.append(body)
+            response = ""
+        elif action == "read":
+            response = self.server.messages.pop(0)
+        else:
+            response = "{}"
+        data = response.encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class StubBridge(ThreadingHTTPServer):
+    """Echoing bridge that counts the TCP connections it accepts."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StubBridgeHandler)
+        self.connections = 0
+        self.calls = []
+        self.messages = []
+
+    def process_request(self, request, client_address):
+        self.connections += 1
+        super().process_request(request, client_address)
+
+
+@pytest.fixture
+def stub_bridge(monkeypatch):
+    from trezorlib.transport import bridge
+
+    server = StubBridge()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(
+        bridge, "TREZORD_HOST", "http://127.0.0.1:%d" % server.server_port
+    )
+    bridge.set_connection()
+    yield server
+    server.shutdown()
+    server.server_close()
+    bridge.set_connection()
+
+
+def test_bridge_keepalive(stub_bridge):
+    for _ in range(3):
+        [transport] = BridgeTransport.enumerate()
+    assert not transport.legacy
+
+    transport.begin_session()
+    for i in range(5):
+        transport.write(i, b"hello" * i)
+        assert transport.read() == (i, b"hello" * i)
+    transport.end_session()
+
+    assert stub_bridge.calls.count("configure") == 1
+    assert stub_bridge.calls.count("enumerate") == 3
+    assert stub_bridge.connections == 1
+
+
+def make_fake_transport(name, delay=0.0, devices=("a",), fail=False):
+    class FakeTransport(Transport):
+        PATH_PREFIX = name
+        ENABLED = True
+        calls = 0
+        changed = False
+
+        def __init__(self, path):
+            self.path = path
+
+        def get_path(self):
+            return f"{name}:{self.path}"
+
+        @classmethod
+        def enumerate(cls, models=None):
+            cls.calls += 1
+            time.sleep(delay)
+            if fail:
+                raise RuntimeError("no such thing")
+            return [cls(d) for d in devices]
+
+        @classmethod
+        def devices_changed(cls):
+            changed, cls.changed = cls.changed, False
+            return changed
+
+    FakeTransport.__name__ = name
+    return FakeTransport
+
+
+@pytest.fixture
+def fake_transports(monkeypatch):
+    transports = []
+    monkeypatch.setattr(transport_module, "all_transports", lambda: transports)
+    transport_module.invalidate_enumeration_cache()
+    yield transports
+    transport_module.invalidate_enumeration_cache()
+
+
+def test_enumerate_parallel(fake_transports):
+    fake_transports.extend(
+        [
+            make_fake_transport("slow1", delay=0.3),
+            make_fake_transport("slow2", delay=0.3, devices=("b", "c")),
+            make_fake_transport("broken", fail=True),
+        ]
+    )
+    start = time.monotonic()
+    results = transport_module.enumerate_transports()
+    assert time.monotonic() - start < 0.5
+
+    assert [r.transport.__name__ for r in results] == ["broken", "slow1", "slow2"]
+    assert results[0].error == "RuntimeError: no such thing"
+    assert all(r.elapsed >= 0.3 for r in results[1:])
+    paths = [str(d) for d in transport_module.enumerate_devices()]
+    assert paths == ["slow1:a", "slow2:b", "slow2:c"]
+
+
+def test_enumerate_timeout(fake_transports):
+    fake_transports.extend(
+        [make_fake_transport("fast"), make_fake_transport("hang", delay=1.0)]
+    )
+    start = time.monotonic()
+    results = transport_module.enumerate_transports(timeout=0.2)
+    assert time.monotonic() - start < 0.5
+    fast, hang = results
+    assert [str(d) for d in fast.devices] == ["fast:a"]
+    assert hang.devices == []
+    assert "timed out" in hang.error
+    # the hanging enumeration does not keep the interpreter alive
+    running = [t for t in threading.enumerate() if t is not threading.main_thread()]
+    assert running and all(t.daemon for t in running)
+
+
+def test_enumerate_cache(fake_transports):
+    usb, bridge = make_fake_transport("usb"), make_fake_transport("bridge")
+    fake_transports.extend([usb, bridge])
+
+    transport_module.enumerate_devices(cache_ttl=60)
+    results = transport_module.enumerate_transports(cache_ttl=60)
+    assert all(r.cached for r in results)
+    assert usb.calls == bridge.calls == 1
+
+    # a hotplug event invalidates only the affected transport
+    usb.changed = True
+    transport_module.enumerate_devices(cache_ttl=60)
+    assert (usb.calls, bridge.calls) == (2, 1)
+
+    # expired entries and disabled cache
+    transport_module.enumerate_devices(cache_ttl=0.1)
+    assert (usb.calls, bridge.calls) == (2, 1)
+    time.sleep(0.15)
+    transport_module.enumerate_devices(cache_ttl=0.1)
+    assert (usb.calls, bridge.calls) == (3, 2)
+    transport_module.enumerate_devices()
+    assert (usb.calls, bridge.calls) == (4, 3)
+
+
+def test_webusb_hotplug_context(monkeypatch):
+    usb1 = pytest.importorskip("usb1")
+    from trezorlib.transport.webusb import WebUsbTransport
+
+    monkeypatch.setattr(usb1, "USBContext", mock.MagicMock)
+    monkeypatch.setattr(usb1, "hasCapability", lambda cap: True)
+    monkeypatch.setattr(WebUsbTransport, "context", None)
+    monkeypatch.setattr(WebUsbTransport, "hotplug_context", None)
+    monkeypatch.setattr(WebUsbTransport, "_hotplug_supported", False)
+    monkeypatch.setattr(transport_module.webusb.atexit, "register", lambda f: None)
+
+    context = WebUsbTransport._open_context()
+    hotplug_context = WebUsbTransport.hotplug_context
+    assert hotplug_context is not None and hotplug_context is not context
+    hotplug_context.hotplugRegisterCallback.assert_called_once()
+
+    monkeypatch.setattr(WebUsbTransport, "_hotplug_event", True)
+    assert WebUsbTransport.devices_changed()
+    assert not WebUsbTransport.devices_changed()
+    # events of the transfers on the shared context are left to their owner
+    assert hotplug_context.handleEventsTimeout.call_count == 2
+    context.handleEventsTimeout.assert_not_called()
+    context.handleEvents.assert_not_called()
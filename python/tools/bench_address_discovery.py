@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+"""Measure the addresses per second of account discovery, one GetAddress per address
+against BatchGetAddresses.
+
+Requires an emulator (or a device with debuglink) loaded with any seed.
+"""
+
+import time
+from typing import Callable, List, Tuple
+
+import click
+
+from trezorlib import btc, messages
+from trezorlib.debuglink import TrezorClientDebugLink
+from trezorlib.tools import parse_path
+from trezorlib.transport import get_transport
+
+COIN = "Testnet"
+S = messages.InputScriptType
+ACCOUNTS = (
+    ("p2pkh", "m/44h/1h/0h", S.SPENDADDRESS),
+    ("p2sh-segwit", "m/49h/1h/0h", S.SPENDP2SHWITNESS),
+    ("segwit", "m/84h/1h/0h", S.SPENDWITNESS),
+    ("taproot", "m/86h/1h/0h", S.SPENDTAPROOT),
+)
+
+
+def single(
+    client: TrezorClientDebugLink, account: List[int], script_type: S, count: int
+) -> List[str]:
+    return [
+        btc.get_address(client, COIN, account + [0, i], script_type=script_type)
+        for i in range(count)
+    ]
+
+
+def batched(
+    client: TrezorClientDebugLink, account: List[int], script_type: S, count: int
+) -> List[str]:
+    result: List[str] = []
+    while len(result) < count:
+        size = min(btc.MAX_ADDRESS_BATCH, count - len(result))
+        result += btc.get_addresses(
+            client, COIN, account, len(result), size, script_type=script_type
+        )
+    return result
+
+
+def measure(fetch: Callable[..., List[str]], *args: object) -> Tuple[List[str], float]:
+    start = time.perf_counter()
+    result = fetch(*args)
+    return result, time.perf_counter() - start
+
+
+@click.command()
+@click.option("-p", "--path", help="Transport path of the emulator")
+@click.option("-n", "--count", type=int, default=200, help="Addresses per account")
+def main(path: str, count: int) -> None:
+    """Derive COUNT receiving addresses of each script type."""
+    client = TrezorClientDebugLink(get_transport(path))
+    click.echo(f"{'script type':<12} {'single':>12} {'batched':>12} {'speedup':>8}")
+    for name, account, script_type in ACCOUNTS:
+        account_n = parse_path(account)
+        expected, t_single = measure(single, client, account_n, script_type, count)
+        result, t_batched = measure(batched, client, account_n, script_type, count)
+        assert result == expected
+        click.echo(
+            f"{name:<12} {count / t_single:>8.1f} a/s {count / t_batched:>8.1f} a/s "
+            f"{t_single / t_batched:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
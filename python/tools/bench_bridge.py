@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+"""Benchmark Bridge round trips with and without HTTP keep-alive.
+
+A local stub Bridge plays a device that signs a Bitcoin transaction, so the numbers
+show the per-message HTTP overhead of `btc.sign_tx` over `BridgeTransport`.
+"""
+
+import struct
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+
+import click
+import requests
+
+from trezorlib import btc, mapping, messages
+from trezorlib.client import TrezorClient
+from trezorlib.tools import parse_path
+from trezorlib.transport import bridge
+
+MAPPING = mapping.DEFAULT_MAPPING
+RequestType = messages.RequestType
+
+
+class ScriptedDevice:
+    """Answers `SignTx` by asking for every input and output twice."""
+
+    def __init__(self) -> None:
+        self.requests: List[messages.TxRequest] = []
+
+    def respond(self, msg: messages.MessageType) -> messages.MessageType:
+        if isinstance(msg, messages.Initialize):
+            return messages.Features(
+                vendor="trezor.io",
+                model="T",
+                major_version=2,
+                minor_version=5,
+                patch_version=3,
+            )
+        if isinstance(msg, messages.SignTx):
+            self.requests = [
+                messages.TxRequest(
+                    request_type=request_type,
+                    details=messages.TxRequestDetailsType(request_index=i),
+                )
+                for _ in range(2)
+                for request_type, count in (
+                    (RequestType.TXINPUT, msg.inputs_count),
+                    (RequestType.TXOUTPUT, msg.outputs_count),
+                )
+                for i in range(count)
+            ]
+            self.requests.append(
+                messages.TxRequest(request_type=RequestType.TXFINISHED)
+            )
+            # each signature is sent with the request following its input
+            first = msg.inputs_count + msg.outputs_count
+            for i in range(msg.inputs_count):
+                self.requests[
+                    first + i + 1
+                ].serialized = messages.TxRequestSerializedType(
+                    signature_index=i, signature=b"\x30" * 71
+                )
+        if isinstance(msg, (messages.SignTx, messages.TxAck)):
+            return self.requests.pop(0)
+        return messages.Failure(code=messages.FailureType.UnexpectedMessage)
+
+
+class StubBridgeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # like trezord, otherwise delayed ACKs dominate the keep-alive timings
+    disable_nagle_algorithm = True
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0))).decode()
+        action = self.path.strip("/").split("/")[0]
+        server: StubBridge = self.server  # type: ignore [assignment]
+        if action == "configure":
+            response = '{"version": "2.0.33"}'
+        elif action == "enumerate":
+            response = '[{"path": "1", "session": null}]'
+        elif action == "acquire":
+            response = '{"session": "1"}'
+        elif action == "post":
+            data = bytes.fromhex(body)
+            msg_type, datalen = struct.unpack(">HL", data[:6])
+            msg = MAPPING.decode(msg_type, data[6 : 6 + datalen])
+            server.responses.append(server.device.respond(msg))
+            response = ""
+        elif action == "read":
+            msg_type, data = MAPPING.encode(server.responses.pop(0))
+            response = (struct.pack(">HL", msg_type, len(data)) + data).hex()
+        else:
+            response = "{}"
+
+        encoded = response.encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(encoded)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+class StubBridge(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), StubBridgeHandler)
+        self.device = ScriptedDevice()
+        self.responses: List[messages.MessageType] = []
+        self.connections = 0
+
+    def process_request(self, request, client_address) -> None:  # type: ignore
+        self.connections += 1
+        super().process_request(request, client_address)
+
+
+class NullUI:
+    def button_request(self, br: messages.ButtonRequest) -> None:
+        pass
+
+    def get_pin(self, code: Optional[int] = None) -> str:
+        raise RuntimeError("unexpected PIN request")
+
+    def get_passphrase(self, available_on_device: bool) -> str:
+        raise RuntimeError("unexpected passphrase request")
+
+
+def sign_one(client: TrezorClient, inputs: int, outputs: int) -> None:
+    tx_inputs = [
+        messages.TxInputType(
+            address_n=parse_path(f"m/84h/0h/0h/0/{i}"),
+            prev_hash=bytes(32),
+            prev_index=i,
+            amount=100_000,
+            script_type=messages.InputScriptType.SPENDWITNESS,
+        )
+        for i in range(inputs)
+    ]
+    tx_outputs = [
+        messages.TxOutputType(
+            address="bc1qannfxke2tfd4l7vhepehpvt05y83v3qsf6nfkk",
+            amount=1_000,
+            script_type=messages.OutputScriptType.PAYTOADDRESS,
+        )
+        for _ in range(outputs)
+    ]
+    btc.sign_tx(client, "Bitcoin", tx_inputs, tx_outputs)
+
+
+def run(server: StubBridge, keepalive: bool, n: int, inputs: int, outputs: int) -> None:
+    session = bridge.make_connection()
+    if not keepalive:
+        session.headers["Connection"] = "close"
+    bridge.set_connection(session)
+
+    server.connections = 0
+    [transport] = bridge.BridgeTransport.enumerate()
+    client = TrezorClient(transport, NullUI())
+
+    start = time.perf_counter()
+    for _ in range(n):
+        sign_one(client, inputs, outputs)
+    elapsed = time.perf_counter() - start
+
+    label = "keep-alive" if keepalive else "no keep-alive"
+    click.echo(
+        f"{label:>14}: {elapsed / n * 1000:8.2f} ms/tx, "
+        f"{server.connections} connections total"
+    )
+
+
+@click.command()
+@click.option("-n", "--count", default=50, help="Transactions to sign")
+@click.option("-i", "--inputs", default=2, help="Inputs per transaction")
+@click.option("-o", "--outputs", default=2, help="Outputs per transaction")
+def main(count: int, inputs: int, outputs: int) -> None:
+    server = StubBridge()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    bridge.TREZORD_HOST = f"http://127.0.0.1:{server.server_port}"
+    try:
+        for keepalive in (False, True):
+            run(server, keepalive, count, inputs, outputs)
+    except requests.ConnectionError as e:
+        raise click.ClickException(str(e))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
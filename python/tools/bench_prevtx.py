@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+"""Count the TxAck round trips of signing N inputs that spend K previous transactions.
+
+Requires an emulator (or a device with debuglink) loaded with any seed. The previous
+transactions are made up: each one pays to N/K addresses of the loaded wallet, so the
+device verifies them like real ones.
+
+With --batch, the inputs and outputs are sent several at a time whenever the device
+asks for them so (see `messages.Capability.TxAckBatch`).
+"""
+
+import struct
+import time
+from collections import Counter
+from typing import Dict, List, Tuple
+
+import click
+
+from trezorlib import btc, messages
+from trezorlib.debuglink import TrezorClientDebugLink
+from trezorlib.tools import hash_160, parse_path, tx_hash
+from trezorlib.transport import get_transport
+
+COIN = "Testnet"
+AMOUNT = 100_000
+FEE = 10_000
+R = messages.RequestType
+
+
+def compact_size(n: int) -> bytes:
+    if n < 253:
+        return struct.pack("<B", n)
+    elif n < 0x1_0000:
+        return struct.pack("<BH", 253, n)
+    else:
+        return struct.pack("<BL", 254, n)
+
+
+def serialize_prevtx(tx: messages.TransactionType) -> bytes:
+    data = struct.pack("<L", tx.version)
+    data += compact_size(len(tx.inputs))
+    for txi in tx.inputs:
+        data += txi.prev_hash[::-1] + struct.pack("<L", txi.prev_index)
+        data += compact_size(len(txi.script_sig)) + txi.script_sig
+        data += struct.pack("<L", txi.sequence)
+    data += compact_size(len(tx.bin_outputs))
+    for txo in tx.bin_outputs:
+        data += struct.pack("<Q", txo.amount)
+        data += compact_size(len(txo.script_pubkey)) + txo.script_pubkey
+    data += struct.pack("<L", tx.lock_time)
+    return data
+
+
+def make_transaction(
+    client: TrezorClientDebugLink, n: int, k: int
+) -> Tuple[
+    List[messages.TxInputType],
+    List[messages.TxOutputType],
+    Dict[bytes, messages.TransactionType],
+]:
+    """Make N inputs spending the outputs of K previous transactions in turn."""
+    paths = [parse_path(f"m/84h/1h/0h/0/{i}") for i in range(n)]
+    scripts = [
+        b"\x00\x14"
+        + hash_160(btc.get_public_node(client, path, coin_name=COIN).node.public_key)
+        for path in paths
+    ]
+
+    prev_txes: Dict[bytes, messages.TransactionType] = {}
+    prev_hashes = []
+    for j in range(k):
+        prevtx = messages.TransactionType(
+            version=2,
+            lock_time=0,
+            inputs=[
+                messages.TxInputType(
+                    prev_hash=struct.pack(">L", j) * 8,
+                    prev_index=0,
+                    script_sig=b"",
+                    sequence=0xFFFF_FFFF,
+                )
+            ],
+            bin_outputs=[
+                messages.TxOutputBinType(amount=AMOUNT, script_pubkey=script)
+                for script in scripts[j::k]
+            ],
+        )
+        prev_hash = tx_hash(serialize_prevtx(prevtx))
+        prev_txes[prev_hash] = prevtx
+        prev_hashes.append(prev_hash)
+
+    inputs = [
+        messages.TxInputType(
+            address_n=path,
+            prev_hash=prev_hashes[i % k],
+            prev_index=i // k,
+            amount=AMOUNT,
+            script_type=messages.InputScriptType.SPENDWITNESS,
+        )
+        for i, path in enumerate(paths)
+    ]
+    outputs = [
+        messages.TxOutputType(
+            address_n=parse_path("m/84h/1h/0h/1/0"),
+            amount=n * AMOUNT - FEE,
+            script_type=messages.OutputScriptType.PAYTOWITNESS,
+        )
+    ]
+    return inputs, outputs, prev_txes
+
+
+def sign(
+    client: TrezorClientDebugLink,
+    inputs: List[messages.TxInputType],
+    outputs: List[messages.TxOutputType],
+    prev_txes: Dict[bytes, messages.TransactionType],
+    batch: bool,
+) -> Counter:
+    """Sign the transaction and count the TxAck round trips by request type."""
+    signtx = btc.prepare_sign_tx(COIN, inputs, outputs)
+    flow = btc.sign_tx_flow(signtx, inputs, outputs, prev_txes, batch=batch)
+    counts: Counter = Counter()
+    try:
+        request = next(flow)
+        while True:
+            response = client.call(request)
+            if (
+                isinstance(response, messages.TxRequest)
+                and response.request_type != R.TXFINISHED
+            ):
+                prev = response.details and response.details.tx_hash in prev_txes
+                counts["prevtx" if prev else "tx"] += 1
+            request = flow.send(response)
+    except StopIteration:
+        pass
+    return counts
+
+
+@click.command()
+@click.option("-p", "--path", help="Transport path of the emulator")
+@click.option(
+    "-n", "--inputs", "counts", multiple=True, type=int, default=(10, 50), help="N"
+)
+@click.option(
+    "-k", "--prev-txes", "distinct", multiple=True, type=int, default=(1, 5), help="K"
+)
+@click.option("-b", "--batch", is_flag=True, help="Send inputs and outputs in batches")
+def main(
+    path: str, counts: Tuple[int, ...], distinct: Tuple[int, ...], batch: bool
+) -> None:
+    """Sign transactions with N inputs spending K distinct previous transactions."""
+    client = TrezorClientDebugLink(get_transport(path))
+    click.echo(
+        f"{'N':>4} {'K':>4} {'TxAcks':>8} {'prevtx':>8} {'per input':>10} {'time':>8}"
+    )
+    for n in counts:
+        for k in distinct:
+            if k > n:
+                continue
+            inputs, outputs, prev_txes = make_transaction(client, n, k)
+            start = time.perf_counter()
+            acks = sign(client, inputs, outputs, prev_txes, batch)
+            elapsed = time.perf_counter() - start
+            total = sum(acks.values())
+            click.echo(
+                f"{n:>4} {k:>4} {total:>8} {acks['prevtx']:>8} "
+                f"{total / n:>10.1f} {elapsed:>7.2f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
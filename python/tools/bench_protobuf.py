@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+"""Benchmark protobuf encoding and decoding of messages nested 1-8 levels deep.
+
+With single-pass serialization the time per encoded byte should stay flat as the
+nesting depth grows.
+"""
+
+import timeit
+from io import BytesIO
+
+import click
+
+from trezorlib import messages, protobuf
+
+
+class BenchNested(protobuf.MessageType):
+    FIELDS = {
+        1: protobuf.Field("index", "uint32"),
+        2: protobuf.Field("payload", "bytes"),
+        3: protobuf.Field("children", "BenchNested", repeated=True),
+    }
+
+
+# message types are resolved through the messages module
+messages.BenchNested = BenchNested  # type: ignore [Cannot assign member]
+
+
+def build(depth: int, fanout: int, payload: bytes) -> BenchNested:
+    children = []
+    if depth > 1:
+        children = [build(depth - 1, fanout, payload) for _ in range(fanout)]
+    return BenchNested(index=depth, payload=payload, children=children)
+
+
+def per_call(func, iterations: int) -> float:
+    return min(timeit.repeat(func, number=iterations, repeat=3)) / iterations
+
+
+@click.command()
+@click.option("-n", "--iterations", type=int, default=200, help="Calls per sample")
+@click.option("-f", "--fanout", type=int, default=1, help="Children per level")
+@click.option("-p", "--payload-size", type=int, default=32, help="Bytes per level")
+def cli(iterations: int, fanout: int, payload_size: int) -> None:
+    """Measure encode, ByteSize and decode times for nested messages."""
+    payload = bytes(range(256)) * (payload_size // 256 + 1)
+    payload = payload[:payload_size]
+
+    click.echo(
+        f"{'depth':>5} {'size':>9} {'encode us':>10} {'ByteSize us':>12} "
+        f"{'decode us':>10} {'encode ns/B':>12}"
+    )
+    for depth in range(1, 9):
+        msg = build(depth, fanout, payload)
+        encoded = protobuf.dump_message_buffer(msg)
+        assert protobuf.load_message(BytesIO(encoded), BenchNested) == msg
+
+        t_encode = per_call(lambda: protobuf.dump_message_buffer(msg), iterations)
+        t_size = per_call(msg.ByteSize, iterations)
+        t_decode = per_call(
+            lambda: protobuf.load_message_buffer(encoded, BenchNested), iterations
+        )
+        click.echo(
+            f"{depth:>5} {len(encoded):>9} {t_encode * 1e6:>10.1f} "
+            f"{t_size * 1e6:>12.1f} {t_decode * 1e6:>10.1f} "
+            f"{t_encode * 1e9 / len(encoded):>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+"""Measure pushing a bundle of static resources to the device twice in a row.
+
+Requires a OneKey Pro, the emulator does not handle ResourceUpdate. The files of the
+bundle are left in the resource directory of the device, named bench-NN.bin.
+"""
+
+import os
+import time
+from typing import Dict
+
+import click
+
+from trezorlib import device
+from trezorlib.client import TrezorClient
+from trezorlib.transport import get_transport
+from trezorlib.ui import ClickUI
+
+
+@click.command()
+@click.option("-p", "--path", help="Transport path of the device")
+@click.option(
+    "-n", "--files", "count", type=int, default=20, help="Files in the bundle"
+)
+@click.option("-s", "--size", type=int, default=100 * 1024, help="Size of each file")
+def main(path: str, count: int, size: int) -> None:
+    """Push COUNT random files of SIZE bytes, then the same bundle again."""
+    client = TrezorClient(get_transport(path), ui=ClickUI())
+    bundle: Dict[str, bytes] = {
+        f"bench-{i:02}.bin": os.urandom(size) for i in range(count)
+    }
+
+    for label in ("first", "second"):
+        start = time.perf_counter()
+        sent = device.sync_res(client, bundle)
+        elapsed = time.perf_counter() - start
+        click.echo(f"{label:<7} {len(sent):>3} files sent {elapsed:>8.2f}s")
+
+
+if __name__ == "__main__":
+    main()
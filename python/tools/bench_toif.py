@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+"""Measure converting the UI resources of the firmware to TOIF and back.
+
+Requires Pillow, NumPy is used when it is installed.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, List, Tuple, TypeVar
+
+import click
+from PIL import Image
+
+from trezorlib import toif
+
+RES_DIR = Path(__file__).resolve().parents[2] / "core/src/trezor/lvglui/res"
+SUPPORTED_MODES = ("1", "L", "LA", "RGB", "RGBA")
+
+T = TypeVar("T")
+
+
+def load_images(directory: Path) -> List[Image.Image]:
+    images = []
+    for path in sorted(directory.rglob("*")):
+        if path.suffix.lower() not in (".png", ".jpg"):
+            continue
+        image = Image.open(path)
+        if image.mode not in SUPPORTED_MODES:
+            image = image.convert("RGBA")
+        if image.mode in ("L", "LA") and image.size[0] % 2:
+            image = image.convert("RGB")
+        image.load()
+        images.append(image)
+    return images
+
+
+def measure(func: Callable[[], T], rounds: int) -> Tuple[T, float]:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+@click.command()
+@click.option(
+    "-d",
+    "--directory",
+    type=click.Path(exists=True, file_okay=False),
+    default=str(RES_DIR),
+    help="Directory with the images",
+)
+@click.option("-r", "--rounds", type=int, default=3, help="Best of ROUNDS")
+def main(directory: str, rounds: int) -> None:
+    """Convert all PNG and JPEG images in DIRECTORY."""
+    images = load_images(Path(directory))
+    pixels = sum(im.size[0] * im.size[1] for im in images)
+    click.echo(f"{len(images)} images, {pixels / 1e6:.1f} Mpx")
+
+    implementations = ["bytes"]
+    if toif.NUMPY_AVAILABLE:
+        implementations.append("numpy")
+
+    expected = None
+    click.echo(
+        f"{'':<8} {'encode':>10} {'parallel':>10} {'decode':>10} {'parallel':>10}"
+    )
+    with ThreadPoolExecutor() as executor:
+        for name in implementations:
+            toif.NUMPY_AVAILABLE = name == "numpy"
+            toifs, encode = measure(lambda: toif.from_images(images), rounds)
+            parallel, encode_parallel = measure(
+                lambda: toif.from_images(images, executor=executor), rounds
+            )
+            _, decode = measure(lambda: toif.to_images(toifs), rounds)
+            _, decode_parallel = measure(
+                lambda: toif.to_images(toifs, executor=executor), rounds
+            )
+            assert parallel == toifs
+            if expected is None:
+                expected = toifs
+            assert toifs == expected
+            click.echo(
+                f"{name:<8} {encode:>9.3f}s {encode_parallel:>9.3f}s "
+                f"{decode:>9.3f}s {decode_parallel:>9.3f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+"""Benchmark ProtocolV1 framing throughput against an in-process loopback handle.
+
+Only the host-side framing cost is measured, there is no actual I/O.
+"""
+
+import time
+from collections import deque
+from typing import Deque, Sequence
+
+import click
+
+from trezorlib.transport.protocol import ProtocolV1
+
+
+class LoopbackHandle:
+    def __init__(self) -> None:
+        self.chunks: Deque[bytes] = deque()
+
+    def open(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def write_chunk(self, chunk: bytes) -> None:
+        self.chunks.append(chunk)
+
+    def read_chunk(self) -> bytes:
+        return self.chunks.popleft()
+
+
+class BatchLoopbackHandle(LoopbackHandle):
+    def write_chunks(self, chunks: Sequence[bytes]) -> None:
+        self.chunks.extend(chunks)
+
+
+def throughput(protocol: ProtocolV1, data: bytes, min_time: float) -> tuple:
+    write_time = read_time = 0.0
+    rounds = 0
+    while write_time + read_time < min_time:
+        start = time.perf_counter()
+        protocol.write(0, data)
+        mid = time.perf_counter()
+        _, received = protocol.read()
+        end = time.perf_counter()
+        assert len(received) == len(data)
+        write_time += mid - start
+        read_time += end - mid
+        rounds += 1
+    total = len(data) * rounds
+    return total / write_time, total / read_time
+
+
+@click.command()
+@click.option("-t", "--min-time", type=float, default=0.5, help="Seconds per sample")
+def cli(min_time: float) -> None:
+    """Measure ProtocolV1 write/read throughput for growing message sizes."""
+    click.echo(
+        f"{'size':>10} {'write MB/s':>11} {'read MB/s':>10} {'batch write MB/s':>17}"
+    )
+    for size in (1 << 10, 16 << 10, 256 << 10, 1 << 20, 4 << 20):
+        data = bytes(size)
+        write, read = throughput(ProtocolV1(LoopbackHandle()), data, min_time)
+        batch, _ = throughput(ProtocolV1(BatchLoopbackHandle()), data, min_time)
+        click.echo(
+            f"{size:>10} {write / 1e6:>11.1f} {read / 1e6:>10.1f} {batch / 1e6:>17.1f}"
+        )
+
+
+if __name__ == "__main__":
+    cli()
@@ -16,13 +16,15 @@ class Norcow:
     def __init__(self):
         self.sectors = None
         self.active_sector = 0
+        # key -> offset of the item in the active sector, deleted items excluded
+        self.index = {}
 
     def init(self):
         if self.sectors:
             for sector in range(consts.NORCOW_SECTOR_COUNT):
                 if self.sectors[sector][:8] == consts.NORCOW_MAGIC_AND_VERSION:
                     self.active_sector = sector
-                    self.active_offset = len(consts.NORCOW_MAGIC_AND_VERSION)
+                    self._rebuild_index()
                     break
         else:
             self.wipe()
@@ -38,6 +40,7 @@ class Norcow:
         self.sectors[sector][:8] = consts.NORCOW_MAGIC_AND_VERSION
         self.active_sector = sector
         self.active_offset = len(consts.NORCOW_MAGIC_AND_VERSION)
+        self.index = {}
 
     def get(self, key: int) -> bytes:
         value, _ = self._find_item(key)
@@ -96,10 +99,15 @@ class Norcow:
         return True
 
     def _delete_old(self, pos: int, value: bytes):
+        key, _ = self._read_item(pos)
+        if self.index.get(key) == pos:
+            del self.index[key]
         wiped_data = b"\x00" * len(value)
         self._write(pos, 0x0000, wiped_data)
 
     def _append(self, key: int, value: bytes):
+        if key != 0x0000:
+            self.index[key] = self.active_offset
         self.active_offset += self._write(self.active_offset, key, value)
 
     def _write(self, pos: int, key: int, new_value: bytes) -> int:
@@ -110,31 +118,34 @@ class Norcow:
         return len(data)
 
     def _find_item(self, key: int) -> (bytes, int):
-        offset = len(consts.NORCOW_MAGIC_AND_VERSION)
-        value = False
-        pos = offset
-        while True:
-            try:
-                k, v = self._read_item(offset)
-                if k == key:
-                    value = v
-                    pos = offset
-            except ValueError:
-                break
-            offset = offset + self._norcow_item_length(v)
+        pos = self.index.get(key)
+        if pos is None:
+            return False, len(consts.NORCOW_MAGIC_AND_VERSION)
+        _, value = self._read_item(pos)
         return value, pos
 
-    def _get_all_keys(self) -> (bytes, int):
+    def _get_all_keys(self) -> set:
+        return set(self.index)
+
+    def _scan(self) -> (dict, int):
+        """
+        Reads the active sector item by item. Returns the offsets of the last
+        item of each key, deleted items excluded, and the offset of the free space.
+        """
         offset = len(consts.NORCOW_MAGIC_AND_VERSION)
-        keys = set()
+        index = {}
         while True:
             try:
                 k, v = self._read_item(offset)
-                keys.add(k)
             except ValueError:
                 break
+            if k != 0x0000:
+                index[k] = offset
             offset = offset + self._norcow_item_length(v)
-        return keys
+        return index, offset
+
+    def _rebuild_index(self):
+        self.index, self.active_offset = self._scan()
 
     def _norcow_item_length(self, data: bytes) -> int:
         # APP_ID, KEY_ID, LENGTH, DATA, ALIGNMENT
@@ -151,16 +162,8 @@ class Norcow:
         return key, value
 
     def _compact(self):
-        offset = len(consts.NORCOW_MAGIC_AND_VERSION)
-        data = list()
-        while True:
-            try:
-                k, v = self._read_item(offset)
-                if k != 0x00:
-                    data.append((k, v))
-            except ValueError:
-                break
-            offset = offset + self._norcow_item_length(v)
+        # the items are copied in the order in which they are stored
+        data = [self._read_item(pos) for pos in sorted(self.index.values())]
         sector = self.active_sector
         self.wipe((sector + 1) % consts.NORCOW_SECTOR_COUNT)
         for key, value in data:
@@ -173,6 +176,7 @@ class Norcow:
         ]:
             raise RuntimeError("Norcow: set_sectors called with invalid data length")
         self.sectors = [bytearray(sector) for sector in data]
+        self._rebuild_index()
 
     def _dump(self):
         return [bytes(sector) for sector in self.sectors]
@@ -1,3 +1,5 @@
+import random
+
 import pytest
 
 from ..src import consts, norcow
@@ -157,3 +159,46 @@ def test_norcow_compact():
 
     assert n.get(0x0101) == b"hello"
     assert n.get(0x0103) == b"123456789x"
+
+
+def test_norcow_index():
+    rng = random.Random(0)
+    n = norcow.Norcow()
+    n.init()
+    model = {}
+    keys = [0x0101, 0x0102, 0x0203, 0x0304, 0x8001, 0x8102]
+    for i in range(3000):
+        key = rng.choice(keys)
+        op = rng.random()
+        if op < 0.6:
+            value = bytes(rng.getrandbits(8) for _ in range(rng.randrange(0, 3000)))
+            n.set(key, value)
+            model[key] = value
+        elif op < 0.8:
+            assert n.delete(key) == (key in model)
+            model.pop(key, None)
+        elif key in model:
+            # clearing bits is done in place
+            value = bytes(b & rng.getrandbits(8) for b in model[key])
+            if value and rng.random() < 0.5:
+                n.replace(key, value)
+            else:
+                n.set(key, value)
+            model[key] = value
+
+        # the index matches a full scan of the sector
+        assert (n.index, n.active_offset) == n._scan()
+        assert n._get_all_keys() == set(model)
+        for k in keys:
+            assert n.get(k) == model.get(k, False)
+
+    # the index is rebuilt from a dump
+    n2 = norcow.Norcow()
+    n2._set_sectors(n._dump())
+    n2.init()
+    assert n2.active_sector == n.active_sector
+    assert (n2.index, n2.active_offset) == (n.index, n.active_offset)
+    n2.set(0x0405, b"new")
+    assert n2.get(0x0405) == b"new"
+    for k in keys:
+        assert n2.get(k) == model.get(k, False)
@@ -17,7 +17,7 @@
 from __future__ import annotations
 
 import os
-from typing import TYPE_CHECKING, Generator
+from typing import TYPE_CHECKING, Any, Generator
 
 import pytest
 
@@ -76,9 +76,9 @@ def emulator(request: pytest.FixtureRequest) -> Generator["Emulator", None, None
 
         Guarantees to be unique because each worker has a different name.
         gw0=>20000, gw1=>20003, gw2=>20006, etc.
+        Without xdist, the only process takes the port of gw0.
         """
-        worker_id = os.getenv("PYTEST_XDIST_WORKER")
-        assert worker_id is not None
+        worker_id = os.getenv("PYTEST_XDIST_WORKER", "gw0")
         assert worker_id.startswith("gw")
         # One emulator instance occupies 3 consecutive ports:
         # 1. normal link, 2. debug link and 3. webauthn fake interface
@@ -90,6 +90,16 @@ def emulator(request: pytest.FixtureRequest) -> Generator["Emulator", None, None
         yield emu
 
 
+@pytest.fixture(scope="session")
+def emulator_snapshot(emulator: "Emulator") -> bytes:
+    """Storage of the emulator as it was before running any test.
+
+    When a test crashes the emulator, the next test restores this snapshot
+    instead of failing the rest of the worker's shard.
+    """
+    return emulator.get_storage()
+
+
 @pytest.fixture(scope="session")
 def _raw_client(request: pytest.FixtureRequest) -> Client:
     # In case tests run in parallel, each process has its own emulator/client.
@@ -174,6 +184,13 @@ def client(
             "  pytest -m 'not sd_card' <test path>"
         )
 
+    if request.session.config.getoption("control_emulators"):
+        emulator = request.getfixturevalue("emulator")
+        snapshot = request.getfixturevalue("emulator_snapshot")
+        if not emulator.is_running():
+            emulator.restore_storage(snapshot)
+        _raw_client = emulator.client
+
     test_ui = request.config.getoption("ui")
 
     _raw_client.reset_debug_features()
@@ -240,9 +257,14 @@ def client(
     _raw_client.close()
 
 
+def _is_xdist_worker(config: "Config") -> bool:
+    return hasattr(config, "workerinput")
+
+
 def pytest_sessionstart(session: pytest.Session) -> None:
     ui_tests.read_fixtures()
-    if session.config.getoption("ui"):
+    # the xdist controller clears the report before starting the workers
+    if session.config.getoption("ui") and not _is_xdist_worker(session.config):
         testreport.clear_dir()
 
 
@@ -253,7 +275,20 @@ def _should_write_ui_report(exitstatus: pytest.ExitCode) -> bool:
     return exitstatus in (pytest.ExitCode.OK, pytest.ExitCode.TESTS_FAILED)
 
 
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node: Any, error: Any) -> None:
+    """Called on the xdist controller when a worker finishes."""
+    output = getattr(node, "workeroutput", {}).get("ui_tests")
+    if output is not None:
+        ui_tests.merge_worker_output(output)
+
+
 def pytest_sessionfinish(session: pytest.Session, exitstatus: pytest.ExitCode) -> None:
+    if _is_xdist_worker(session.config):
+        # fixtures are written by the controller from the results of all workers
+        session.config.workeroutput["ui_tests"] = ui_tests.worker_output()  # type: ignore [attribute is set by xdist]
+        return
+
     if not _should_write_ui_report(exitstatus):
         return
 
@@ -136,10 +136,6 @@ def test_send_bch_nochange(client: Client):
                 request_output(0, TXHASH_502e85),
                 request_output(1, TXHASH_502e85),
                 request_input(1),
-                request_meta(TXHASH_502e85),
-                request_input(0, TXHASH_502e85),
-                request_output(0, TXHASH_502e85),
-                request_output(1, TXHASH_502e85),
                 request_input(0),
                 request_input(1),
                 request_output(0),
@@ -193,10 +189,6 @@ def test_send_bch_oldaddr(client: Client):
                 request_output(0, TXHASH_502e85),
                 request_output(1, TXHASH_502e85),
                 request_input(1),
-                request_meta(TXHASH_502e85),
-                request_input(0, TXHASH_502e85),
-                request_output(0, TXHASH_502e85),
-                request_output(1, TXHASH_502e85),
                 request_input(0),
                 request_input(1),
                 request_output(0),
@@ -502,10 +494,6 @@ def test_send_bch_external_presigned(client: Client):
                 request_output(0, TXHASH_502e85),
                 request_output(1, TXHASH_502e85),
                 request_input(1),
-                request_meta(TXHASH_502e85),
-                request_input(0, TXHASH_502e85),
-                request_output(0, TXHASH_502e85),
-                request_output(1, TXHASH_502e85),
                 request_input(0),
                 request_input(1),
                 request_output(0),
@@ -0,0 +1,108 @@
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+import pytest
+
+from trezorlib import btc, messages
+from trezorlib.debuglink import TrezorClientDebugLink as Client
+from trezorlib.exceptions import TrezorFailure
+from trezorlib.tools import parse_path
+
+S = messages.InputScriptType
+
+VECTORS = (  # coin, account, script_type
+    ("Bitcoin", "m/44h/0h/0h", S.SPENDADDRESS),
+    ("Bitcoin", "m/49h/0h/0h", S.SPENDP2SHWITNESS),
+    ("Bitcoin", "m/84h/0h/0h", S.SPENDWITNESS),
+    ("Bitcoin", "m/86h/0h/0h", S.SPENDTAPROOT),
+    ("Testnet", "m/84h/1h/1h", S.SPENDWITNESS),
+    pytest.param("Bcash", "m/44h/145h/0h", S.SPENDADDRESS, marks=pytest.mark.altcoin),
+    pytest.param(
+        "Groestlcoin", "m/84h/17h/0h", S.SPENDWITNESS, marks=pytest.mark.altcoin
+    ),
+)
+
+
+@pytest.mark.parametrize("coin, account, script_type", VECTORS)
+@pytest.mark.parametrize("change", (0, 1))
+def test_batch_getaddress(
+    client: Client, coin: str, account: str, script_type, change: int
+):
+    address_n = parse_path(account)
+    addresses = btc.get_addresses(
+        client, coin, address_n, 5, 4, change=change, script_type=script_type
+    )
+    assert addresses == [
+        btc.get_address(client, coin, address_n + [change, i], script_type=script_type)
+        for i in range(5, 9)
+    ]
+
+
+def test_batch_getaddress_size(client: Client):
+    address_n = parse_path("m/84h/0h/0h")
+    addresses = btc.get_addresses(
+        client,
+        "Bitcoin",
+        address_n,
+        0,
+        btc.MAX_ADDRESS_BATCH,
+        script_type=S.SPENDWITNESS,
+    )
+    assert len(set(addresses)) == btc.MAX_ADDRESS_BATCH
+
+    for count in (0, btc.MAX_ADDRESS_BATCH + 1):
+        with pytest.raises(TrezorFailure, match="Batch size"):
+            btc.get_addresses(
+                client, "Bitcoin", address_n, 0, count, script_type=S.SPENDWITNESS
+            )
+
+
+@pytest.mark.parametrize(
+    "account, change, start_index, script_type",
+    (
+        ("m/84h/0h/0h", 0, 0x8000_0000 - 1, S.SPENDWITNESS),  # hardened index
+        ("m/84h/0h/0h", 0x8000_0000, 0, S.SPENDWITNESS),  # hardened change
+        ("m/84h/0h/0h", 0, 0, S.SPENDMULTISIG),  # multisig
+    ),
+)
+def test_batch_getaddress_invalid(
+    client: Client, account: str, change: int, start_index: int, script_type
+):
+    with pytest.raises(TrezorFailure):
+        btc.get_addresses(
+            client,
+            "Bitcoin",
+            parse_path(account),
+            start_index,
+            2,
+            change=change,
+            script_type=script_type,
+        )
+
+
+def test_discover_addresses(client: Client):
+    address_n = parse_path("m/84h/1h/0h")
+    used = {
+        btc.get_address(
+            client, "Testnet", address_n + [0, i], script_type=S.SPENDWITNESS
+        )
+        for i in (0, 7, 26)
+    }
+    found = btc.discover_addresses(
+        client, "Testnet", address_n, used.__contains__, script_type=S.SPENDWITNESS
+    )
+    assert len(found) == 27
+    assert used <= set(found)
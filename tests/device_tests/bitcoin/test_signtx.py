@@ -14,6 +14,7 @@
 # You should have received a copy of the License along with this library.
 # If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
 
+import time
 from datetime import datetime, timezone
 
 import pytest
@@ -26,6 +27,7 @@ from trezorlib.tools import H_, parse_path
 from ...tx_cache import TxCache
 from .signtx import (
     assert_tx_matches,
+    forge_prevtx,
     request_finished,
     request_input,
     request_meta,
@@ -398,14 +400,6 @@ def test_two_two(client: Client):
                 request_output(0, TXHASH_ac4ca0),
                 request_output(1, TXHASH_ac4ca0),
                 request_input(1),
-                request_meta(TXHASH_ac4ca0),
-                request_input(0, TXHASH_ac4ca0),
-                request_output(0, TXHASH_ac4ca0),
-                request_output(1, TXHASH_ac4ca0),
-                request_input(0),
-                request_input(1),
-                request_output(0),
-                request_output(1),
                 request_input(0),
                 request_input(1),
                 request_output(0),
@@ -461,6 +455,120 @@ def test_lots_of_inputs(client: Client):
     )
 
 
+@pytest.mark.slow
+@pytest.mark.parametrize("n_inputs", (10, 100))
+def test_legacy_inputs_round_trips(client: Client, record_property, n_inputs: int):
+    # Legacy inputs are signed in batches of 64, each from one pass over the
+    # transaction, so the number of round trips grows linearly with the inputs.
+    paths = [parse_path(f"m/44h/1h/0h/0/{i}") for i in range(n_inputs)]
+    prev_hash, prev_tx = forge_prevtx(
+        [(btc.get_address(client, "Testnet", path), 100_000) for path in paths],
+        network="testnet",
+    )
+    inputs = [
+        messages.TxInputType(
+            address_n=path,
+            amount=100_000,
+            prev_hash=prev_hash,
+            prev_index=i,
+        )
+        for i, path in enumerate(paths)
+    ]
+    out = messages.TxOutputType(
+        address_n=parse_path("m/44h/1h/0h/1/0"),
+        amount=n_inputs * 99_000,
+        script_type=messages.OutputScriptType.PAYTOADDRESS,
+    )
+
+    round_trips = 0
+
+    def count_round_trips(msg):
+        nonlocal round_trips
+        round_trips += 1
+        return msg
+
+    with client:
+        client.set_filter(messages.TxAck, count_round_trips)
+        start = time.monotonic()
+        btc.sign_tx(client, "Testnet", inputs, [out], prev_txes={prev_hash: prev_tx})
+        elapsed = time.monotonic() - start
+
+    passes = (n_inputs + 63) // 64
+    assert round_trips == (
+        (n_inputs + 1)  # step 1: inputs and outputs
+        + n_inputs  # step 3: inputs
+        + 2  # step 3: the previous transaction's meta and input
+        + n_inputs  # step 3: the previous transaction's outputs
+        + passes * (n_inputs + 1)  # step 4: sign the legacy inputs
+        + 1  # step 5: serialize the output
+    )
+    record_property("round_trips", round_trips)
+    record_property("seconds", round(elapsed, 2))
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("n_inputs", (10, 100))
+def test_batch_tx_ack(client: Client, record_property, n_inputs: int):
+    # With batching, the inputs and outputs are sent several at a time, but the
+    # signed transaction is the same.
+    assert messages.Capability.TxAckBatch in client.features.capabilities
+
+    paths = [parse_path(f"m/84h/1h/0h/0/{i}") for i in range(n_inputs)]
+    addresses = [
+        btc.get_address(
+            client, "Testnet", path, script_type=messages.InputScriptType.SPENDWITNESS
+        )
+        for path in paths
+    ]
+    prev_hash, prev_tx = forge_prevtx(
+        [(address, 100_000) for address in addresses], network="testnet"
+    )
+    inputs = [
+        messages.TxInputType(
+            address_n=path,
+            amount=100_000,
+            prev_hash=prev_hash,
+            prev_index=i,
+            script_type=messages.InputScriptType.SPENDWITNESS,
+        )
+        for i, path in enumerate(paths)
+    ]
+    out = messages.TxOutputType(
+        address_n=parse_path("m/84h/1h/0h/1/0"),
+        amount=n_inputs * 99_000,
+        script_type=messages.OutputScriptType.PAYTOWITNESS,
+    )
+
+    round_trips = 0
+
+    def count_round_trips(msg):
+        nonlocal round_trips
+        round_trips += 1
+        return msg
+
+    results = {}
+    for batch in (False, True):
+        round_trips = 0
+        with client:
+            client.set_filter(messages.TxAck, count_round_trips)
+            start = time.monotonic()
+            _, serialized_tx = btc.sign_tx(
+                client,
+                "Testnet",
+                inputs,
+                [out],
+                prev_txes={prev_hash: prev_tx},
+                batch=batch,
+            )
+            elapsed = time.monotonic() - start
+        results[batch] = serialized_tx, round_trips
+        record_property(f"round_trips_batch_{batch}", round_trips)
+        record_property(f"seconds_batch_{batch}", round(elapsed, 2))
+
+    assert results[True][0] == results[False][0]
+    assert results[True][1] < results[False][1]
+
+
 @pytest.mark.slow
 def test_lots_of_outputs(client: Client):
     # Tests if device implements serialization of len(outputs) correctly
@@ -802,14 +910,6 @@ def test_attack_change_outputs(client: Client):
                 request_output(0, TXHASH_ac4ca0),
                 request_output(1, TXHASH_ac4ca0),
                 request_input(1),
-                request_meta(TXHASH_ac4ca0),
-                request_input(0, TXHASH_ac4ca0),
-                request_output(0, TXHASH_ac4ca0),
-                request_output(1, TXHASH_ac4ca0),
-                request_input(0),
-                request_input(1),
-                request_output(0),
-                request_output(1),
                 request_input(0),
                 request_input(1),
                 request_output(0),
@@ -774,11 +774,6 @@ def test_multisig_mismatch_inputs_single(client: Client):
                 request_output(1, TXHASH_1c022d),
                 request_output(2, TXHASH_1c022d),
                 request_input(1),
-                request_meta(TXHASH_1c022d),
-                request_input(0, TXHASH_1c022d),
-                request_output(0, TXHASH_1c022d),
-                request_output(1, TXHASH_1c022d),
-                request_output(2, TXHASH_1c022d),
                 request_input(0),
                 request_input(1),
                 request_output(0),
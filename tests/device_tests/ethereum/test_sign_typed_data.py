@@ -14,9 +14,11 @@
 # You should have received a copy of the License along with this library.
 # If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
 
+import time
+
 import pytest
 
-from trezorlib import ethereum, exceptions
+from trezorlib import ethereum, exceptions, messages
 from trezorlib.debuglink import TrezorClientDebugLink as Client
 from trezorlib.tools import parse_path
 
@@ -42,6 +44,22 @@ def test_ethereum_sign_typed_data(client: Client, parameters, result):
         assert f"0x{ret.signature.hex()}" == result["sig"]
 
 
+@pytest.mark.skip_t1
+@parametrize_using_common_fixtures("ethereum/sign_typed_data.json")
+def test_ethereum_sign_typed_data_bulk_values(client: Client, parameters, result):
+    with client:
+        address_n = parse_path(parameters["path"])
+        ret = ethereum.sign_typed_data(
+            client,
+            address_n,
+            parameters["data"],
+            metamask_v4_compat=parameters["metamask_v4_compat"],
+            bulk_values=True,
+        )
+        assert ret.address == result["address"]
+        assert f"0x{ret.signature.hex()}" == result["sig"]
+
+
 @pytest.mark.skip_t2
 @parametrize_using_common_fixtures("ethereum/sign_typed_data.json")
 def test_ethereum_sign_typed_data_blind(client: Client, parameters, result):
@@ -159,3 +177,81 @@ def test_ethereum_sign_typed_data_cancel(client: Client):
             DATA,
             metamask_v4_compat=True,
         )
+
+
+# Permit2 batch of 200 token permits
+DATA_LARGE = {
+    "types": {
+        "EIP712Domain": [
+            {"name": "name", "type": "string"},
+            {"name": "chainId", "type": "uint256"},
+            {"name": "verifyingContract", "type": "address"},
+        ],
+        "PermitDetails": [
+            {"name": "token", "type": "address"},
+            {"name": "amount", "type": "uint160"},
+            {"name": "expiration", "type": "uint48"},
+            {"name": "nonce", "type": "uint48"},
+        ],
+        "PermitBatch": [
+            {"name": "details", "type": "PermitDetails[]"},
+            {"name": "spender", "type": "address"},
+            {"name": "sigDeadline", "type": "uint256"},
+        ],
+    },
+    "primaryType": "PermitBatch",
+    "domain": {
+        "name": "Permit2",
+        "chainId": 1,
+        "verifyingContract": "0x000000000022D473030F116dDEE9F6B43aC78BA3",
+    },
+    "message": {
+        "details": [
+            {
+                "token": f"0x{i:040x}",
+                "amount": 2**160 - 1,
+                "expiration": 2**48 - 1,
+                "nonce": i,
+            }
+            for i in range(200)
+        ],
+        "spender": "0x3fC91A3afd70395Cd496C647d5a6CC9D4B2b7FAD",
+        "sigDeadline": 2**48 - 1,
+    },
+}
+
+
+@pytest.mark.skip_t1
+@pytest.mark.slow
+def test_ethereum_sign_typed_data_bulk_values_round_trips(
+    client: Client, record_property
+):
+    round_trips = 0
+
+    def count_round_trips(msg):
+        nonlocal round_trips
+        round_trips += 1
+        return msg
+
+    results = {}
+    for bulk_values in (False, True):
+        round_trips = 0
+        with client:
+            client.set_filter(messages.EthereumTypedDataValueAck, count_round_trips)
+            client.set_filter(messages.EthereumTypedDataValuesAck, count_round_trips)
+            start = time.monotonic()
+            ret = ethereum.sign_typed_data(
+                client,
+                parse_path("m/44h/60h/0h/0/0"),
+                DATA_LARGE,
+                bulk_values=bulk_values,
+            )
+            elapsed = time.monotonic() - start
+        results[bulk_values] = ret.signature, round_trips
+        record_property(f"round_trips_bulk_{bulk_values}", round_trips)
+        record_property(f"seconds_bulk_{bulk_values}", round(elapsed, 2))
+
+    assert results[True][0] == results[False][0]
+    # 3 + 3 domain values, the array length, 4 values of each permit, 2 more values
+    assert results[False][1] == 6 + 1 + 4 * 200 + 2
+    assert results[True][1] < results[False][1] // 10
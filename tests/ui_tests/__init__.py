@@ -5,7 +5,7 @@ import re
 import shutil
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Generator, Optional, Set
+from typing import Any, Dict, Generator, Optional, Set
 
 import pytest
 from _pytest.outcomes import Failed
@@ -189,6 +189,31 @@ def write_fixtures_suggestion(
     )
 
 
+def worker_output() -> Dict[str, Any]:
+    """Results of an xdist worker, for the controller to merge them."""
+    return {
+        "model": MODEL,
+        "processed": sorted(PROCESSED),
+        "failed": sorted(FAILED_TESTS),
+        "actual_hashes": ACTUAL_HASHES,
+        "file_hashes": {t: FILE_HASHES[t] for t in PROCESSED if t in FILE_HASHES},
+    }
+
+
+def merge_worker_output(output: Dict[str, Any]) -> None:
+    """Merge the results of an xdist worker into the results of the controller.
+
+    Each worker only sees the tests of its own shard, so only the controller can
+    write fixtures.json or list the missing tests once all workers finished.
+    """
+    global MODEL
+    MODEL = output["model"] or MODEL
+    PROCESSED.update(output["processed"])
+    FAILED_TESTS.update(output["failed"])
+    ACTUAL_HASHES.update(output["actual_hashes"])
+    FILE_HASHES.update(output["file_hashes"])
+
+
 def _get_fixtures_content(
     fixtures: Dict[str, str], remove_missing: bool, only_passed_tests: bool = False
 ) -> str: